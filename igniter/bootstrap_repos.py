@@ -10,7 +10,11 @@ import tempfile
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
+import hmac
+import json
 import platform
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -77,6 +81,145 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+def sha256sum_stream(stream):
+    """Calculate sha256 for content of opened binary stream.
+
+    Args:
+        stream (BinaryIO): Stream to read, e.g. opened zip file member.
+
+    Returns:
+        str: hex encoded sha256
+
+    """
+    h = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def parse_checksums(checksums_data):
+    """Parse content of `checksums` file.
+
+    Args:
+        checksums_data (str): Lines in format `<sha256>:<file path>`.
+
+    Returns:
+        list[tuple[str, str]]: Checksums and relative paths of files.
+
+    """
+    return [
+        tuple(line.split(":", 1))
+        for line in checksums_data.splitlines() if line
+    ]
+
+
+def validate_checksums_parallel(validate_chunk, items):
+    """Validate checksums of items in multiple threads.
+
+    Items are split to a chunk per thread. Hashing releases GIL so
+    threads run in parallel and hide latency of network shares. Number of
+    threads can be changed with `OPENPYPE_VALIDATION_WORKERS` environment
+    variable.
+
+    Args:
+        validate_chunk (Callable[[list], Union[str, None]]): Validate
+            chunk of items and return error message of first invalid item.
+        items (list): Items to validate.
+
+    Returns:
+        Union[str, None]: Error message or None if all items are valid.
+
+    """
+    if not items:
+        return None
+
+    workers = int(
+        os.getenv("OPENPYPE_VALIDATION_WORKERS")
+        or min(32, (os.cpu_count() or 1) + 4)
+    )
+    workers = max(1, min(workers, len(items)))
+    if workers == 1:
+        return validate_chunk(items)
+
+    chunks = [items[idx::workers] for idx in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for error in executor.map(validate_chunk, chunks):
+            if error:
+                return error
+    return None
+
+
+def _get_validation_key():
+    """Secret key of this machine used to sign validation stamps."""
+    key_path = Path(
+        user_data_dir("openpype", "pypeclub")) / "validation_key"
+    try:
+        return key_path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    key_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Create file exclusively so concurrent processes use the same key
+        fd = os.open(str(key_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+    except FileExistsError:
+        return key_path.read_bytes()
+    key = secrets.token_bytes(32)
+    with os.fdopen(fd, "wb") as stream:
+        stream.write(key)
+    return key
+
+
+def _sign_manifest(manifest):
+    payload = json.dumps(manifest, sort_keys=True).encode("utf-8")
+    return hmac.new(
+        _get_validation_key(), payload, hashlib.sha256).hexdigest()
+
+
+def read_validation_stamp(stamp_path):
+    """Read manifest of validation stamp.
+
+    Args:
+        stamp_path (Path): Path to validation stamp.
+
+    Returns:
+        Union[dict, None]: Manifest or None if stamp does not exist or
+            its signature is not valid.
+
+    """
+    try:
+        data = json.loads(stamp_path.read_text())
+        manifest = data["manifest"]
+        signature = data["signature"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not hmac.compare_digest(signature, _sign_manifest(manifest)):
+        return None
+    return manifest
+
+
+def write_validation_stamp(stamp_path, manifest):
+    """Store signed manifest of validated version.
+
+    Failure to write the stamp is ignored, version will be validated
+    again next time.
+
+    Args:
+        stamp_path (Path): Path to validation stamp.
+        manifest (dict): Information about validated files.
+
+    """
+    data = {"manifest": manifest, "signature": _sign_manifest(manifest)}
+    temp_path = stamp_path.with_name(f"{stamp_path.name}.{os.getpid()}.tmp")
+    try:
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(data))
+        os.replace(temp_path, stamp_path)
+    except OSError:
+        pass
+
+
 class ZipFileLongPaths(ZipFile):
     def _extract_member(self, member, targetpath, pwd):
         return ZipFile._extract_member(
@@ -882,15 +1025,24 @@ class BootstrapRepos:
             zip_file.testzip()
             self._progress_callback(100)
 
-    def validate_openpype_version(self, path: Path) -> tuple:
+    def validate_openpype_version(
+        self, path: Path, deep: bool = None
+    ) -> tuple:
         """Validate version directory or zip file.
 
         This will load `checksums` file if present, calculate checksums
         of existing files in given path and compare. It will also compare
         lists of files together for missing files.
 
+        Successful validation is stored to signed validation stamp in local
+        data dir with modification times and sizes of validated files. Only
+        files which changed since last validation are checksummed again.
+
         Args:
             path (Path): Path to OpenPype version to validate.
+            deep (bool, optional): Ignore validation stamp and validate
+                checksums of all files. Enabled by `--deep-verify`
+                argument (`OPENPYPE_DEEP_VERIFY` environment variable).
 
         Returns:
             tuple(bool, str): with version validity as first item
@@ -902,26 +1054,46 @@ class BootstrapRepos:
         if not path.exists():
             return False, "Path doesn't exist"
 
+        if deep is None:
+            deep = os.getenv("OPENPYPE_DEEP_VERIFY") == "1"
+
+        stamp_path = self._get_validation_stamp_path(path)
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            return self._validate_zip(path, stamp_path, deep)
+        return self._validate_dir(path, stamp_path, deep)
+
+    def _get_validation_stamp_path(self, path: Path) -> Path:
+        """Path to validation stamp of version in local data dir.
+
+        Stamps are not stored next to versions because versions may be
+        on shared storage and stamps are signed by key of this machine.
+        """
+        path_hash = hashlib.sha256(
+            str(path.resolve()).encode("utf-8")
+        ).hexdigest()
+        return self.data_dir / "validated" / f"{path_hash}.json"
 
     @staticmethod
-    def _validate_zip(path: Path) -> tuple:
+    def _validate_zip(
+        path: Path, stamp_path: Path = None, deep: bool = False
+    ) -> tuple:
         """Validate content of zip file."""
+        zip_stat = path.stat()
+        zip_info = [zip_stat.st_mtime_ns, zip_stat.st_size]
+        if stamp_path and not deep:
+            manifest = read_validation_stamp(stamp_path)
+            if manifest and manifest.get("zip") == zip_info:
+                return True, "All ok (validated before)"
+
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
+                checksums_data = zip_file.read("checksums").decode("utf-8")
+            except (IOError, KeyError):
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
 
-            # split it to the list of tuples
-            checksums = [
-                tuple(line.split(":"))
-                for line in checksums_data.split("\n") if line
-            ]
+            checksums = parse_checksums(checksums_data)
 
             # get list of files in zip minus `checksums` file itself
             # and turn in to set to compare against list of files
@@ -934,26 +1106,41 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
-                try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+            missing = files_in_checksum.difference(files_in_zip)
+            if missing:
+                return False, f"Missing file [ {missing.pop()} ]"
+
+        # calculate and compare checksums in the zip file, each thread
+        #   uses own opened zip file
+        def _validate_chunk(chunk):
+            with ZipFile(path, "r") as chunk_zip_file:
+                for file_checksum, file_name in chunk:
+                    with chunk_zip_file.open(file_name) as stream:
+                        current = sha256sum_stream(stream)
+                    if current != file_checksum:
+                        return f"Invalid checksum on {file_name}"
+            return None
+
+        error = validate_checksums_parallel(_validate_chunk, checksums)
+        if error:
+            return False, error
 
+        if stamp_path:
+            write_validation_stamp(stamp_path, {"zip": zip_info})
         return True, "All ok"
 
     @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+    def _validate_dir(
+        path: Path, stamp_path: Path = None, deep: bool = False
+    ) -> tuple:
         """Validate checksums in a given path.
 
         Args:
             path (Path): path to folder to validate.
+            stamp_path (Path, optional): Path to validation stamp. Files
+                which did not change since last validation are not
+                checksummed.
+            deep (bool, optional): Ignore validation stamp.
 
         Returns:
             tuple(bool, str): returns status and reason as a bool
@@ -965,10 +1152,7 @@ class BootstrapRepos:
             # FIXME: This should be set to False sometimes in the future
             return True, "Cannot read checksums for archive."
         checksums_data = checksums_file.read_text()
-        checksums = [
-            tuple(line.split(":"))
-            for line in checksums_data.split("\n") if line
-        ]
+        checksums = parse_checksums(checksums_data)
 
         # compare file list against list of files from checksum file.
         # If difference exists, something is wrong and we invalidate directly
@@ -983,20 +1167,53 @@ class BootstrapRepos:
         if diff:
             return False, f"Missing files {diff}"
 
-        # calculate and compare checksums
+        checksums_hash = hashlib.sha256(
+            checksums_data.encode("utf-8")
+        ).hexdigest()
+        validated_files = {}
+        if stamp_path and not deep:
+            manifest = read_validation_stamp(stamp_path)
+            if manifest and manifest.get("checksums") == checksums_hash:
+                validated_files = manifest["files"]
+
+        # checksum only files which changed since last validation
+        files_info = {}
+        changed = []
         for file_checksum, file_name in checksums:
             if platform.system().lower() == "windows":
                 file_name = file_name.replace("/", "\\")
+            file_path = sanitize_long_path((path / file_name).as_posix())
             try:
-                current = sha256sum(
-                    sanitize_long_path((path / file_name).as_posix())
-                )
+                file_stat = os.stat(file_path)
             except FileNotFoundError:
                 return False, f"Missing file [ {file_name} ]"
 
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+            file_info = [file_stat.st_mtime_ns, file_stat.st_size]
+            files_info[file_name] = file_info
+            if validated_files.get(file_name) != file_info:
+                changed.append((file_checksum, file_name, file_path))
+
+        def _validate_chunk(chunk):
+            for file_checksum, file_name, file_path in chunk:
+                try:
+                    current = sha256sum(file_path)
+                except FileNotFoundError:
+                    return f"Missing file [ {file_name} ]"
+                if current != file_checksum:
+                    return f"Invalid checksum on {file_name}"
+            return None
 
+        error = validate_checksums_parallel(_validate_chunk, changed)
+        if error:
+            return False, error
+
+        if stamp_path and changed:
+            write_validation_stamp(
+                stamp_path,
+                {"checksums": checksums_hash, "files": files_info}
+            )
+        if not changed:
+            return True, "All ok (validated before)"
         return True, "All ok"
 
     @staticmethod
@@ -33,6 +33,8 @@ class AliasedGroup(click.Group):
               help="list all detected versions.")
 @click.option("--validate-version", expose_value=False,
               help="validate given version integrity")
+@click.option("--deep-verify", is_flag=True, expose_value=False,
+              help="validate checksums of all files of used version")
 @click.option("--debug", is_flag=True, expose_value=False,
               help="Enable debug")
 @click.option("--verbose", expose_value=False,
@@ -360,16 +362,21 @@ def repack_version(directory):
     "--dirpath", help="Directory where package is stored", default=None)
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def pack_project(project, dirpath, dbonly):
+@click.option(
+    "--codec",
+    help="Compression codec (none, gzip or zstd). Fastest available is used"
+    " by default.",
+    default=None)
+def pack_project(project, dirpath, dbonly, codec):
     """Create a package of project with all files and database dump."""
 
     if AYON_SERVER_ENABLED:
         raise RuntimeError("AYON does not support 'pack-project' command.")
-    PypeCommands().pack_project(project, dirpath, dbonly)
+    PypeCommands().pack_project(project, dirpath, dbonly, codec)
 
 
 @main.command()
-@click.option("--zipfile", help="Path to zip file")
+@click.option("--zipfile", help="Path to package directory or zip file")
 @click.option(
     "--root", help="Replace root which was stored in project", default=None
 )
@@ -382,6 +389,17 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.command()
+@click.argument("paths", nargs=-1, required=True)
+def prewarm_ocio_cache(paths):
+    """Store introspection data of OCIO configs to on-disk cache.
+
+    Cached data are used by hosts without PyOpenColorIO instead of
+    launching subprocess.
+    """
+    PypeCommands().prewarm_ocio_cache(paths)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
@@ -37,6 +37,7 @@ from .entities import (
     get_representations,
     get_representation_parents,
     get_representations_parents,
+    get_representations_last_versions,
     get_archived_representations,
 
     get_thumbnail,
@@ -48,6 +49,13 @@ from .entities import (
     get_asset_name_identifier,
 )
 
+from .entity_cache import (
+    enable_entities_cache,
+    disable_entities_cache,
+    invalidate_entities_cache,
+    entities_cache,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
@@ -97,6 +105,7 @@ __all__ = (
     "get_representations",
     "get_representation_parents",
     "get_representations_parents",
+    "get_representations_last_versions",
     "get_archived_representations",
 
     "get_thumbnail",
@@ -105,6 +114,11 @@ __all__ = (
 
     "get_workfile_info",
 
+    "enable_entities_cache",
+    "disable_entities_cache",
+    "invalidate_entities_cache",
+    "entities_cache",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
@@ -0,0 +1,341 @@
+"""Opt-in identity map cache of entity documents.
+
+Cache is disabled by default. When enabled, queries of entities by their
+ids are served from memory and only missing documents are queried from
+database. Cached documents are stored per project and are invalidated
+after lifetime expires, or explicitly by operations session commit.
+
+Cache is used only by Mongo entities implementation.
+
+There is also always enabled cache of versions and last versions of
+representations with short lifetime used by
+'get_representations_last_versions'.
+
+Example:
+    >>> with entities_cache():
+    ...     repre_docs = list(get_representations(project_name, repre_ids))
+    ...     parents = get_representations_parents(project_name, repre_docs)
+"""
+
+import copy
+import time
+import threading
+import contextlib
+
+
+def project_document_fields(doc, fields):
+    """Reduce document to passed fields.
+
+    Mimics Mongo projection. Fields can use dot notation to reduce nested
+    dictionaries. Key '_id' is always kept.
+
+    Args:
+        doc (dict[str, Any]): Full document.
+        fields (Optional[Iterable[str]]): Fields to keep. Full copy of the
+            document is returned if 'None' is passed.
+
+    Returns:
+        dict[str, Any]: New document with requested fields.
+    """
+
+    if not fields:
+        return copy.deepcopy(doc)
+
+    output = {"_id": doc["_id"]}
+    for field in fields:
+        keys = field.split(".")
+        src = doc
+        found = True
+        for key in keys:
+            if not isinstance(src, dict) or key not in src:
+                found = False
+                break
+            src = src[key]
+
+        if not found:
+            continue
+
+        dst = output
+        for key in keys[:-1]:
+            dst = dst.setdefault(key, {})
+        dst[keys[-1]] = copy.deepcopy(src)
+    return output
+
+
+class _ProjectEntitiesCache(object):
+    def __init__(self):
+        self.docs_by_id = {}
+        self.project_doc = None
+
+
+class EntitiesCache(object):
+    """Cache of full entity documents by project name and entity id.
+
+    Args:
+        lifetime (Optional[float]): Lifetime of cached documents in seconds.
+    """
+
+    default_lifetime = 60
+
+    def __init__(self, lifetime=None):
+        if lifetime is None:
+            lifetime = self.default_lifetime
+        self._lifetime = lifetime
+        self._lock = threading.Lock()
+        self._projects = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _is_valid(self, item):
+        return (time.time() - item[1]) <= self._lifetime
+
+    def _get_project_cache(self, project_name):
+        project_cache = self._projects.get(project_name)
+        if project_cache is None:
+            project_cache = _ProjectEntitiesCache()
+            self._projects[project_name] = project_cache
+        return project_cache
+
+    def get_docs(self, project_name, entity_ids):
+        """Get cached documents by ids.
+
+        Args:
+            project_name (str): Project name.
+            entity_ids (Iterable[Any]): Entity ids.
+
+        Returns:
+            tuple[list[dict[str, Any]], list[Any]]: Cached documents and ids
+                which are not cached.
+        """
+
+        docs = []
+        missing_ids = []
+        with self._lock:
+            docs_by_id = self._get_project_cache(project_name).docs_by_id
+            for entity_id in entity_ids:
+                item = docs_by_id.get(entity_id)
+                if item is not None and self._is_valid(item):
+                    docs.append(item[0])
+                else:
+                    missing_ids.append(entity_id)
+            self.hits += len(docs)
+            self.misses += len(missing_ids)
+        return docs, missing_ids
+
+    def add_docs(self, project_name, docs):
+        """Add full documents to cache.
+
+        Args:
+            project_name (str): Project name.
+            docs (Iterable[dict[str, Any]]): Full entity documents.
+        """
+
+        now = time.time()
+        with self._lock:
+            docs_by_id = self._get_project_cache(project_name).docs_by_id
+            for doc in docs:
+                docs_by_id[doc["_id"]] = (doc, now)
+
+    def get_project_doc(self, project_name):
+        with self._lock:
+            item = self._get_project_cache(project_name).project_doc
+            if item is not None and self._is_valid(item):
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+        return None
+
+    def set_project_doc(self, project_name, project_doc):
+        with self._lock:
+            project_cache = self._get_project_cache(project_name)
+            project_cache.project_doc = (project_doc, time.time())
+
+    def invalidate(self, project_name=None, entity_ids=None):
+        """Remove cached documents.
+
+        Args:
+            project_name (Optional[str]): Project name. All projects are
+                invalidated if not passed.
+            entity_ids (Optional[Iterable[Any]]): Ids of entities to
+                invalidate. Whole project is invalidated if not passed.
+        """
+
+        with self._lock:
+            if project_name is None:
+                self._projects.clear()
+                return
+
+            if entity_ids is None:
+                self._projects.pop(project_name, None)
+                return
+
+            project_cache = self._projects.get(project_name)
+            if project_cache is None:
+                return
+
+            for entity_id in entity_ids:
+                project_cache.docs_by_id.pop(entity_id, None)
+                project_doc_item = project_cache.project_doc
+                if (
+                    project_doc_item is not None
+                    and project_doc_item[0]["_id"] == entity_id
+                ):
+                    project_cache.project_doc = None
+
+
+class LastVersionsCache(object):
+    """Cache of versions and last versions of representations.
+
+    Items are stored by project name and stringified representation id.
+    The cache is always enabled, but it has short lifetime as new versions
+    can be published from other processes.
+
+    Args:
+        lifetime (Optional[float]): Lifetime of cached items in seconds.
+    """
+
+    default_lifetime = 10
+
+    def __init__(self, lifetime=None):
+        if lifetime is None:
+            lifetime = self.default_lifetime
+        self._lifetime = lifetime
+        self._lock = threading.Lock()
+        self._items_by_project = {}
+
+    def get_items(self, project_name, representation_ids):
+        """Get cached items by representation ids.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            tuple[dict[str, dict[str, Any]], list[str]]: Cached items by
+                representation id and ids which are not cached.
+        """
+
+        output = {}
+        missing_ids = []
+        now = time.time()
+        with self._lock:
+            items = self._items_by_project.get(project_name) or {}
+            for repre_id in representation_ids:
+                item = items.get(repre_id)
+                if item is not None and (now - item[1]) <= self._lifetime:
+                    output[repre_id] = copy.deepcopy(item[0])
+                else:
+                    missing_ids.append(repre_id)
+        return output, missing_ids
+
+    def set_items(self, project_name, items_by_repre_id):
+        now = time.time()
+        with self._lock:
+            items = self._items_by_project.setdefault(project_name, {})
+            for repre_id, item in items_by_repre_id.items():
+                items[repre_id] = (copy.deepcopy(item), now)
+
+    def invalidate(self, project_name=None):
+        with self._lock:
+            if project_name is None:
+                self._items_by_project.clear()
+            else:
+                self._items_by_project.pop(project_name, None)
+
+
+_cache_state = {
+    "cache": None,
+    "last_versions_cache": LastVersionsCache(),
+}
+
+
+def get_last_versions_cache():
+    """Cache of versions and last versions of representations.
+
+    Returns:
+        LastVersionsCache: Cache object.
+    """
+
+    return _cache_state["last_versions_cache"]
+
+
+def invalidate_last_versions_cache(project_name=None):
+    """Invalidate cached last versions.
+
+    Args:
+        project_name (Optional[str]): Project name. All projects are
+            invalidated if not passed.
+    """
+
+    _cache_state["last_versions_cache"].invalidate(project_name)
+
+
+def get_entities_cache():
+    """Entities cache if is enabled.
+
+    Returns:
+        Union[EntitiesCache, None]: Cache object or None if cache is
+            disabled.
+    """
+
+    return _cache_state["cache"]
+
+
+def enable_entities_cache(lifetime=None):
+    """Enable entities cache.
+
+    Cache is kept if is already enabled.
+
+    Args:
+        lifetime (Optional[float]): Lifetime of cached documents in seconds.
+
+    Returns:
+        EntitiesCache: Enabled cache.
+    """
+
+    cache = _cache_state["cache"]
+    if cache is None:
+        cache = EntitiesCache(lifetime)
+        _cache_state["cache"] = cache
+    return cache
+
+
+def disable_entities_cache():
+    """Disable entities cache and drop all cached documents."""
+
+    _cache_state["cache"] = None
+
+
+def invalidate_entities_cache(project_name=None, entity_ids=None):
+    """Invalidate cached documents if cache is enabled.
+
+    Args:
+        project_name (Optional[str]): Project name. All projects are
+            invalidated if not passed.
+        entity_ids (Optional[Iterable[Any]]): Ids of entities to
+            invalidate. Whole project is invalidated if not passed.
+    """
+
+    cache = _cache_state["cache"]
+    if cache is not None:
+        cache.invalidate(project_name, entity_ids)
+
+
+@contextlib.contextmanager
+def entities_cache(lifetime=None):
+    """Enable entities cache in a context.
+
+    Cache is disabled when context ends, unless it was already enabled
+    before.
+
+    Args:
+        lifetime (Optional[float]): Lifetime of cached documents in seconds.
+    """
+
+    was_enabled = _cache_state["cache"] is not None
+    cache = enable_entities_cache(lifetime)
+    try:
+        yield cache
+    finally:
+        if not was_enabled:
+            disable_entities_cache()
@@ -7,9 +7,17 @@ from .mongo import (
     get_project_database,
     get_project_connection,
     load_json_file,
+    write_documents_lines,
+    iter_documents_lines,
+    iter_project_documents,
     replace_project_documents,
     store_project_documents,
 )
+from .texture_hashes import (
+    get_texture_hashes_collection,
+    find_texture_paths_by_hashes,
+    register_texture_hashes,
+)
 
 
 __all__ = (
@@ -21,6 +29,13 @@ __all__ = (
     "get_project_database",
     "get_project_connection",
     "load_json_file",
+    "write_documents_lines",
+    "iter_documents_lines",
+    "iter_project_documents",
     "replace_project_documents",
     "store_project_documents",
+
+    "get_texture_hashes_collection",
+    "find_texture_paths_by_hashes",
+    "register_texture_hashes",
 )
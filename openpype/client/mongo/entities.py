@@ -12,6 +12,12 @@ import collections
 import six
 from bson.objectid import ObjectId
 
+from openpype.client.entity_cache import (
+    get_entities_cache,
+    get_last_versions_cache,
+    project_document_fields,
+)
+
 from .mongo import get_project_database, get_project_connection
 
 PatternType = type(re.compile(""))
@@ -68,6 +74,54 @@ def convert_ids(in_ids):
     return list(_output)
 
 
+def _get_cached_docs_by_ids(project_name, entity_ids, entity_types, fields):
+    """Entity documents by ids using entities cache.
+
+    Cached documents are used and missing documents are queried in single
+    query.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        entity_ids (Iterable[ObjectId]): Converted entity ids.
+        entity_types (Iterable[str]): Allowed entity types.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+
+    Returns:
+        Union[list[dict[str, Any]], None]: Entity documents or None if cache
+            is disabled.
+    """
+
+    cache = get_entities_cache()
+    if cache is None:
+        return None
+
+    docs, missing_ids = cache.get_docs(project_name, entity_ids)
+    if missing_ids:
+        # Query full documents so they can be cached
+        conn = get_project_connection(project_name)
+        missing_docs = list(conn.find({"_id": {"$in": missing_ids}}))
+        cache.add_docs(project_name, missing_docs)
+        docs.extend(missing_docs)
+
+    return [
+        project_document_fields(doc, fields)
+        for doc in docs
+        if doc.get("type") in entity_types
+    ]
+
+
+def _get_cached_doc_by_id(project_name, entity_id, entity_types, fields):
+    docs = _get_cached_docs_by_ids(
+        project_name, [entity_id], entity_types, fields
+    )
+    if docs is None:
+        return False
+    if docs:
+        return docs[0]
+    return None
+
+
 def get_projects(active=True, inactive=False, fields=None):
     """Yield all project entity documents.
 
@@ -131,6 +185,17 @@ def get_project(project_name, active=True, inactive=True, fields=None):
             {"data.active": False},
         ]
 
+    cache = get_entities_cache()
+    if cache is not None and active and inactive:
+        project_doc = cache.get_project_doc(project_name)
+        if project_doc is None:
+            conn = get_project_connection(project_name)
+            project_doc = conn.find_one(query_filter)
+            if project_doc is None:
+                return None
+            cache.set_project_doc(project_name, project_doc)
+        return project_document_fields(project_doc, fields)
+
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
 
@@ -169,6 +234,12 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     if not asset_id:
         return None
 
+    asset_doc = _get_cached_doc_by_id(
+        project_name, asset_id, ["asset"], fields
+    )
+    if asset_doc is not False:
+        return asset_doc
+
     query_filter = {"type": "asset", "_id": asset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
@@ -252,6 +323,13 @@ def _get_assets(
             return []
         query_filter["_id"] = {"$in": asset_ids}
 
+        if asset_names is None and parent_ids is None:
+            asset_docs = _get_cached_docs_by_ids(
+                project_name, asset_ids, asset_types, fields
+            )
+            if asset_docs is not None:
+                return asset_docs
+
     if asset_names is not None:
         if not asset_names:
             return []
@@ -403,6 +481,12 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     if not subset_id:
         return None
 
+    subset_doc = _get_cached_doc_by_id(
+        project_name, subset_id, ["subset"], fields
+    )
+    if subset_doc is not False:
+        return subset_doc
+
     query_filters = {"type": "subset", "_id": subset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filters, _prepare_fields(fields))
@@ -491,6 +575,17 @@ def get_subsets(
             return []
         query_filter["_id"] = {"$in": subset_ids}
 
+        if (
+            asset_ids is None
+            and subset_names is None
+            and names_by_asset_ids is None
+        ):
+            subset_docs = _get_cached_docs_by_ids(
+                project_name, subset_ids, subset_types, fields
+            )
+            if subset_docs is not None:
+                return subset_docs
+
     if subset_names is not None:
         if not subset_names:
             return []
@@ -567,6 +662,12 @@ def get_version_by_id(project_name, version_id, fields=None):
     if not version_id:
         return None
 
+    version_doc = _get_cached_doc_by_id(
+        project_name, version_id, ["version", "hero_version"], fields
+    )
+    if version_doc is not False:
+        return version_doc
+
     query_filter = {
         "type": {"$in": ["version", "hero_version"]},
         "_id": version_id
@@ -675,6 +776,13 @@ def _get_versions(
             return []
         query_filter["_id"] = {"$in": version_ids}
 
+        if subset_ids is None and versions is None:
+            version_docs = _get_cached_docs_by_ids(
+                project_name, version_ids, version_types, fields
+            )
+            if version_docs is not None:
+                return version_docs
+
     if versions is not None:
         versions = list(versions)
         if not versions:
@@ -1016,6 +1124,105 @@ def get_last_version_by_subset_name(
     )
 
 
+def get_representations_last_versions(project_name, representation_ids):
+    """Version and last version of subset for each passed representation.
+
+    Representations and their versions are queried by ids and last versions
+    of their subsets by single aggregation. Result is cached for a short time
+    (see 'LastVersionsCache').
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        representation_ids (Iterable[Union[str, ObjectId]]): Representation
+            ids.
+
+    Returns:
+        dict[str, dict[str, Any]]: Information by stringified representation
+            id. Each item contains 'version_id', 'version_type', 'subset_id'
+            and 'last_version_id'. Values are 'None' if version or last
+            version was not found. Representations which were not found
+            are not in output.
+    """
+
+    repre_ids = convert_ids(representation_ids)
+    if not repre_ids:
+        return {}
+
+    cache = get_last_versions_cache()
+    output, missing_ids = cache.get_items(
+        project_name, [str(repre_id) for repre_id in repre_ids]
+    )
+    if not missing_ids:
+        return output
+
+    conn = get_project_connection(project_name)
+    repre_docs = conn.find(
+        {
+            "type": "representation",
+            "_id": {"$in": [ObjectId(repre_id) for repre_id in missing_ids]}
+        },
+        {"parent": True}
+    )
+    version_ids_by_repre_id = {
+        str(repre_doc["_id"]): repre_doc["parent"]
+        for repre_doc in repre_docs
+    }
+
+    version_docs_by_id = {}
+    if version_ids_by_repre_id:
+        version_docs = conn.find(
+            {
+                "type": {"$in": ["version", "hero_version"]},
+                "_id": {"$in": list(set(version_ids_by_repre_id.values()))}
+            },
+            {"type": True, "parent": True}
+        )
+        version_docs_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in version_docs
+        }
+
+    subset_ids = {
+        version_doc["parent"]
+        for version_doc in version_docs_by_id.values()
+    }
+    last_version_ids_by_subset_id = {}
+    if subset_ids:
+        aggregation_pipeline = [
+            # Find all versions of those subsets
+            {"$match": {
+                "type": "version",
+                "parent": {"$in": list(subset_ids)}
+            }},
+            # Sorting versions all together
+            {"$sort": {"name": 1}},
+            # Group them by "parent", but only take the last
+            {"$group": {
+                "_id": "$parent",
+                "last_version_id": {"$last": "$_id"}
+            }}
+        ]
+        last_version_ids_by_subset_id = {
+            item["_id"]: item["last_version_id"]
+            for item in conn.aggregate(aggregation_pipeline)
+        }
+
+    new_items = {}
+    for repre_id, version_id in version_ids_by_repre_id.items():
+        version_doc = version_docs_by_id.get(version_id) or {}
+        subset_id = version_doc.get("parent")
+        new_items[repre_id] = {
+            "version_id": version_doc.get("_id"),
+            "version_type": version_doc.get("type"),
+            "subset_id": subset_id,
+            "last_version_id": last_version_ids_by_subset_id.get(subset_id),
+        }
+
+    cache.set_items(project_name, new_items)
+    output.update(new_items)
+    return output
+
+
 def get_representation_by_id(project_name, representation_id, fields=None):
     """Representation entity data by its id.
 
@@ -1035,11 +1242,18 @@ def get_representation_by_id(project_name, representation_id, fields=None):
         return None
 
     repre_types = ["representation", "archived_representation"]
+    representation_id = convert_id(representation_id)
+    repre_doc = _get_cached_doc_by_id(
+        project_name, representation_id, repre_types, fields
+    )
+    if repre_doc is not False:
+        return repre_doc
+
     query_filter = {
         "type": {"$in": repre_types}
     }
     if representation_id is not None:
-        query_filter["_id"] = convert_id(representation_id)
+        query_filter["_id"] = representation_id
 
     conn = get_project_connection(project_name)
 
@@ -1162,6 +1376,18 @@ def _get_representations(
             return default_output
         query_filter["_id"] = {"$in": representation_ids}
 
+        if (
+            representation_names is None
+            and version_ids is None
+            and names_by_version_ids is None
+            and context_filters is None
+        ):
+            repre_docs = _get_cached_docs_by_ids(
+                project_name, representation_ids, repre_types, fields
+            )
+            if repre_docs is not None:
+                return repre_docs
+
     if representation_names is not None:
         if not representation_names:
             return default_output
@@ -18,6 +18,10 @@ else:
     from urllib.parse import urlparse, parse_qs
 
 
+# Number of documents fetched or inserted at once when streaming documents
+DOCUMENTS_BATCH_SIZE = 1000
+
+
 class MongoEnvNotSet(Exception):
     pass
 
@@ -55,6 +59,46 @@ def load_json_file(filepath):
     return loads("".join(content))
 
 
+def write_documents_lines(docs, stream):
+    """Write mongo documents to a text stream as json lines.
+
+    Each document is stored as canonical json string on a separate line so
+    documents can be written and read one by one without loading whole
+    content to memory.
+
+    Args:
+        docs (Iterable[dict[str, Any]]): Documents to write.
+        stream (io.TextIOBase): Text stream where documents are written.
+
+    Returns:
+        int: Number of written documents.
+    """
+
+    count = 0
+    for doc in docs:
+        stream.write(documents_to_json(doc))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def iter_documents_lines(stream):
+    """Iterate over mongo documents stored as json lines in a text stream.
+
+    Args:
+        stream (io.TextIOBase): Text stream with json lines created by
+            'write_documents_lines'.
+
+    Returns:
+        Iterable[dict[str, Any]]: Loaded documents.
+    """
+
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield loads(line)
+
+
 def get_project_database_name():
     """Name of database name where projects are available.
 
@@ -285,6 +329,32 @@ def get_collection_documents(database_name, collection_name, as_json=False):
     return output
 
 
+def iter_collection_documents(
+    database_name, collection_name, batch_size=None
+):
+    """Iterate over all documents in a collection.
+
+    Documents are fetched from mongo in batches so whole collection does not
+    have to be loaded to memory.
+
+    Args:
+        database_name (str): Name of database where to look for collection.
+        collection_name (str): Name of collection where to look for collection.
+        batch_size (Optional[int]): Number of documents fetched from server
+            at once. Default: 'DOCUMENTS_BATCH_SIZE'
+
+    Returns:
+        Iterable[dict[str, Any]]: Cursor of collection documents.
+    """
+
+    if not batch_size:
+        batch_size = DOCUMENTS_BATCH_SIZE
+    client = OpenPypeMongoConnection.get_mongo_client()
+    return client[database_name][collection_name].find(
+        {}, batch_size=batch_size
+    )
+
+
 def store_collection(filepath, database_name, collection_name):
     """Store collection documents to a json file.
 
@@ -304,25 +374,50 @@ def store_collection(filepath, database_name, collection_name):
         stream.write(content)
 
 
-def replace_collection_documents(docs, database_name, collection_name):
+def replace_collection_documents(
+    docs, database_name, collection_name, chunk_size=None
+):
     """Replace all documents in a collection with passed documents.
 
+    Documents are inserted in chunks so passed documents can be a generator
+    which is not loaded to memory at once.
+
     Warnings:
         All existing documents in collection will be removed if there are any.
 
     Args:
-        docs (list[dict[str, Any]]): New documents.
+        docs (Iterable[dict[str, Any]]): New documents.
         database_name (str): Name of database where to look for collection.
         collection_name (str): Name of collection where new documents are
             uploaded.
+        chunk_size (Optional[int]): Number of documents inserted at once.
+            Default: 'DOCUMENTS_BATCH_SIZE'
+
+    Returns:
+        int: Number of inserted documents.
     """
 
+    if not chunk_size:
+        chunk_size = DOCUMENTS_BATCH_SIZE
     client = OpenPypeMongoConnection.get_mongo_client()
     database = client[database_name]
     if collection_name in database.list_collection_names():
         database.drop_collection(collection_name)
     col = database[collection_name]
-    col.insert_many(docs)
+
+    count = 0
+    chunk = []
+    for doc in docs:
+        chunk.append(doc)
+        if len(chunk) >= chunk_size:
+            col.insert_many(chunk, ordered=False)
+            count += len(chunk)
+            chunk = []
+
+    if chunk:
+        col.insert_many(chunk, ordered=False)
+        count += len(chunk)
+    return count
 
 
 def restore_collection(filepath, database_name, collection_name):
@@ -395,6 +490,25 @@ def get_project_documents(project_name, database_name=None):
     return get_collection_documents(database_name, project_name)
 
 
+def iter_project_documents(project_name, database_name=None, batch_size=None):
+    """Iterate over all documents in project collection.
+
+    Args:
+        project_name (str): Name of project.
+        database_name (Optional[str]): Name of mongo database where to look for
+            project.
+        batch_size (Optional[int]): Number of documents fetched from server
+            at once.
+
+    Returns:
+        Iterable[dict[str, Any]]: Documents in project collection.
+    """
+
+    if not database_name:
+        database_name = get_project_database_name()
+    return iter_collection_documents(database_name, project_name, batch_size)
+
+
 def store_project_documents(project_name, filepath, database_name=None):
     """Store project documents to a file as json string.
 
@@ -411,7 +525,9 @@ def store_project_documents(project_name, filepath, database_name=None):
     store_collection(filepath, database_name, project_name)
 
 
-def replace_project_documents(project_name, docs, database_name=None):
+def replace_project_documents(
+    project_name, docs, database_name=None, chunk_size=None
+):
     """Replace documents in mongo with passed documents.
 
     Warnings:
@@ -419,14 +535,20 @@ def replace_project_documents(project_name, docs, database_name=None):
 
     Args:
         project_name (str): Name of project.
-        docs (list[dict[str, Any]]): Documents to restore.
+        docs (Iterable[dict[str, Any]]): Documents to restore.
         database_name (Optional[str]): Name of mongo database where project
             collection will be created.
+        chunk_size (Optional[int]): Number of documents inserted at once.
+
+    Returns:
+        int: Number of inserted documents.
     """
 
     if not database_name:
         database_name = get_project_database_name()
-    replace_collection_documents(docs, database_name, project_name)
+    return replace_collection_documents(
+        docs, database_name, project_name, chunk_size
+    )
 
 
 def restore_project_documents(project_name, filepath, database_name=None):
@@ -12,8 +12,12 @@ from openpype.client.operations_base import (
     DeleteOperation,
     BaseOperationsSession
 )
+from openpype.client.entity_cache import (
+    invalidate_entities_cache,
+    invalidate_last_versions_cache,
+)
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import get_project, convert_id
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -506,6 +510,13 @@ class MongoOperationsSession(BaseOperationsSession):
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
 
+            # Remove changed entities from entities cache
+            invalidate_entities_cache(
+                project_name,
+                [convert_id(operation.entity_id) for operation in operations]
+            )
+            invalidate_last_versions_cache(project_name)
+
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
 
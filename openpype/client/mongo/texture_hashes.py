@@ -0,0 +1,135 @@
+"""Index of published textures by their source hash.
+
+Processed textures (e.g. '.tx' or '.rstexbin') are published with hash of
+source file and processing arguments. The hash is stored to version
+document in 'data.sourceHashes' which can't be indexed because hashes are
+used as keys. This index stores one document per published texture path
+in 'texture_hashes' collection of OpenPype database, so all hashes of an
+instance can be resolved with one indexed query.
+
+Versions published before the index existed are looked up in project
+collection, also with one query, and found paths are added to the index.
+"""
+
+import os
+import datetime
+
+from pymongo import UpdateOne
+
+from .mongo import OpenPypeMongoConnection, get_project_connection
+
+TEXTURE_HASHES_COLLECTION = "texture_hashes"
+
+_indexed_collections = set()
+
+
+def get_texture_hashes_collection():
+    """Collection with index of texture hashes.
+
+    Indexes of collection are created on first call.
+
+    Returns:
+        pymongo.collection.Collection: Texture hashes collection.
+    """
+
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    collection = mongo_client[database_name][TEXTURE_HASHES_COLLECTION]
+    if database_name not in _indexed_collections:
+        collection.create_index(
+            [("project", 1), ("hash", 1), ("path", 1)],
+            unique=True
+        )
+        _indexed_collections.add(database_name)
+    return collection
+
+
+def _find_legacy_texture_paths(project_name, texture_hashes):
+    keys = [
+        "data.sourceHashes.{}".format(texture_hash)
+        for texture_hash in texture_hashes
+    ]
+    version_docs = get_project_connection(project_name).find(
+        {
+            "type": "version",
+            "$or": [{key: {"$exists": True}} for key in keys]
+        },
+        {key: True for key in keys}
+    )
+
+    output = {}
+    for version_doc in version_docs:
+        source_hashes = version_doc["data"]["sourceHashes"]
+        for texture_hash, path in source_hashes.items():
+            paths = output.setdefault(texture_hash, [])
+            if path not in paths:
+                paths.append(path)
+    return output
+
+
+def find_texture_paths_by_hashes(
+    project_name, texture_hashes, use_legacy_data=True
+):
+    """Find published texture paths by source hashes.
+
+    Args:
+        project_name (str): Name of project.
+        texture_hashes (Iterable[str]): Source hashes of textures.
+        use_legacy_data (Optional[bool]): Look for hashes missing in index
+            also in version documents.
+
+    Returns:
+        dict[str, list[str]]: Published paths by texture hash. Newest paths
+            are first. Hashes which were not published are not in output.
+    """
+
+    texture_hashes = set(texture_hashes)
+    if not texture_hashes:
+        return {}
+
+    output = {}
+    docs = (
+        get_texture_hashes_collection()
+        .find(
+            {"project": project_name, "hash": {"$in": list(texture_hashes)}},
+            {"hash": True, "path": True}
+        )
+        .sort("created", -1)
+    )
+    for doc in docs:
+        output.setdefault(doc["hash"], []).append(doc["path"])
+
+    missing_hashes = texture_hashes - set(output)
+    if use_legacy_data and missing_hashes:
+        legacy_paths = _find_legacy_texture_paths(
+            project_name, missing_hashes
+        )
+        if legacy_paths:
+            register_texture_hashes(project_name, legacy_paths)
+            output.update(legacy_paths)
+    return output
+
+
+def register_texture_hashes(project_name, paths_by_hash):
+    """Add published texture paths to index.
+
+    Args:
+        project_name (str): Name of project.
+        paths_by_hash (dict[str, Union[str, list[str]]]): Published path or
+            paths by texture hash, e.g. 'sourceHashes' of instance.
+    """
+
+    now = datetime.datetime.now()
+    operations = []
+    for texture_hash, paths in paths_by_hash.items():
+        if not isinstance(paths, (list, tuple, set)):
+            paths = [paths]
+        for path in paths:
+            operations.append(UpdateOne(
+                {"project": project_name, "hash": texture_hash, "path": path},
+                {"$set": {"created": now}},
+                upsert=True
+            ))
+
+    if operations:
+        get_texture_hashes_collection().bulk_write(operations, ordered=False)
@@ -1,9 +1,13 @@
 import collections
 
 from openpype.client.mongo.operations import CURRENT_THUMBNAIL_SCHEMA
+from openpype.client.entity_cache import get_last_versions_cache
 
 from .utils import get_ayon_server_api_connection
-from .openpype_comp import get_folders_with_tasks
+from .openpype_comp import (
+    get_folders_with_tasks,
+    get_representations_last_versions as _get_repres_last_versions,
+)
 from .conversion_utils import (
     project_fields_v3_to_v4,
     convert_v4_project_to_v3,
@@ -457,6 +461,27 @@ def get_last_version_by_subset_name(
     )
 
 
+def get_representations_last_versions(project_name, representation_ids):
+    representation_ids = {
+        str(repre_id)
+        for repre_id in representation_ids
+        if repre_id
+    }
+    if not representation_ids:
+        return {}
+
+    cache = get_last_versions_cache()
+    output, missing_ids = cache.get_items(project_name, representation_ids)
+    if not missing_ids:
+        return output
+
+    con = get_ayon_server_api_connection()
+    new_items = _get_repres_last_versions(con, project_name, missing_ids)
+    cache.set_items(project_name, new_items)
+    output.update(new_items)
+    return output
+
+
 def get_output_link_versions(project_name, version_id, fields=None):
     if not version_id:
         return []
@@ -157,3 +157,73 @@ def get_folders_with_tasks(
         if isinstance(folder_data, six.string_types):
             folder["data"] = json.loads(folder_data)
         yield folder
+
+
+def representations_last_versions_graphql_query():
+    query = GraphQlQuery("RepresentationsLastVersions")
+    project_name_var = query.add_variable("projectName", "String!")
+    repre_ids_var = query.add_variable("representationIds", "[String!]")
+
+    project_field = query.add_field("project")
+    project_field.set_filter("name", project_name_var)
+
+    repres_field = project_field.add_field_with_edges("representations")
+    repres_field.set_filter("ids", repre_ids_var)
+    repres_field.add_field("id")
+
+    version_field = repres_field.add_field("version")
+    version_field.add_field("id")
+    version_field.add_field("version")
+
+    product_field = version_field.add_field("product")
+    product_field.add_field("id")
+    latest_version_field = product_field.add_field("latestVersion")
+    latest_version_field.add_field("id")
+    return query
+
+
+def get_representations_last_versions(con, project_name, representation_ids):
+    """Query versions and last versions of representations from server.
+
+    Representation, its version, product and last version of the product
+    are received by single GraphQl query.
+
+    Args:
+        con (ServerAPI): Connection to server.
+        project_name (str): Name of project where representations are.
+        representation_ids (Iterable[str]): Representation ids.
+
+    Returns:
+        dict[str, dict[str, Any]]: Information by representation id in
+            v3 compatible format. Each item contains 'version_id',
+            'version_type', 'subset_id' and 'last_version_id'.
+    """
+
+    representation_ids = set(representation_ids)
+    if not project_name or not representation_ids:
+        return {}
+
+    query = representations_last_versions_graphql_query()
+    query.set_variable_value("projectName", project_name)
+    query.set_variable_value("representationIds", list(representation_ids))
+
+    parsed_data = query.query(con)
+    output = {}
+    for repre in parsed_data["project"]["representations"]:
+        version = repre.get("version") or {}
+        product = version.get("product") or {}
+        latest_version = product.get("latestVersion") or {}
+        version_type = None
+        if version:
+            # Hero versions have negative version number
+            version_type = "version"
+            if version["version"] < 0:
+                version_type = "hero_version"
+
+        output[repre["id"]] = {
+            "version_id": version.get("id"),
+            "version_type": version_type,
+            "subset_id": product.get("id"),
+            "last_version_id": latest_version.get("id"),
+        }
+    return output
@@ -6,6 +6,7 @@ import datetime
 
 from bson.objectid import ObjectId
 
+from openpype.client.entity_cache import invalidate_last_versions_cache
 from openpype.client.operations_base import (
     REMOVED_VALUE,
     CreateOperation,
@@ -732,6 +733,9 @@ class OperationsSession(BaseOperationsSession):
                 )
                 results.append(result.data)
 
+        for project_name in operations_by_project.keys():
+            invalidate_last_versions_cache(project_name)
+
         for result in results:
             if result.get("success"):
                 continue
@@ -6,6 +6,7 @@ from collections import OrderedDict
 import contextlib
 import json
 import logging
+import multiprocessing
 import os
 import tempfile
 import six
@@ -23,6 +24,7 @@ from openpype.lib import (
     ToolNotFoundError,
 )
 
+from openpype.client.mongo import find_texture_paths_by_hashes
 from openpype.pipeline import legacy_io, publish, KnownPublishError
 from openpype.hosts.maya.api import lib
 from openpype import AYON_SERVER_ENABLED
@@ -64,8 +66,9 @@ def find_paths_by_hash(texture_hash):
             "AYON."
         )
 
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
+    return find_texture_paths_by_hashes(
+        legacy_io.active_project(), [texture_hash]
+    ).get(texture_hash, [])
 
 
 @contextlib.contextmanager
@@ -123,12 +126,29 @@ class TextureProcessor:
         """
         pass
 
+    def prepare_environment(self, color_management):
+        """Prepare process environment before textures are processed.
+
+        Called once before textures are processed, possibly in multiple
+        threads, so 'process' does not have to modify 'os.environ'.
+
+        Args:
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            None
+
+        """
+        pass
+
     @abstractmethod
     def process(self,
                 source,
                 colorspace,
                 color_management,
-                staging_dir):
+                staging_dir,
+                threads=None):
         """Process the `source` texture.
 
         Must be implemented on inherited class.
@@ -143,6 +163,8 @@ class TextureProcessor:
             color_management (dict): Maya Color management data from
                 `lib.get_color_management_preferences`
             staging_dir (str): Output directory to write to.
+            threads (Optional[int]): Threads the processing can use, all
+                cores if not set.
 
         Returns:
             TextureResult: The resulting texture information.
@@ -150,6 +172,28 @@ class TextureProcessor:
         """
         pass
 
+    def get_hashed_result(self,
+                          source,
+                          colorspace,
+                          color_management):
+        """Get result of processing without processing the texture.
+
+        Used to find texture processed by previous publishes with the same
+        hash. Path of the result is not known and is set to None.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            Union[TextureResult, None]: The resulting texture information
+                or None if processed texture can't be reused.
+
+        """
+        return None
+
     def __repr__(self):
         # Log instance as class name
         return self.__class__.__name__
@@ -160,11 +204,24 @@ class MakeRSTexBin(TextureProcessor):
 
     extension = ".rstexbin"
 
+    def prepare_environment(self, color_management):
+        if not color_management["enabled"] or os.getenv("OCIO"):
+            return
+
+        config_path = color_management["config"]
+        if os.path.exists(config_path):
+            self.log.debug(
+                "OCIO environment variable not set."
+                "Setting it with OCIO config from Maya."
+            )
+            os.environ["OCIO"] = config_path
+
     def process(self,
                 source,
                 colorspace,
                 color_management,
-                staging_dir):
+                staging_dir,
+                threads=None):
 
         texture_processor_path = self.get_redshift_tool(
             "redshiftTextureProcessor"
@@ -184,19 +241,12 @@ class MakeRSTexBin(TextureProcessor):
                 raise RuntimeError("OCIO config not found at: "
                                    "{}".format(config_path))
 
-            if not os.getenv("OCIO"):
-                self.log.debug(
-                    "OCIO environment variable not set."
-                    "Setting it with OCIO config from Maya."
-                )
-                os.environ["OCIO"] = config_path
-
             self.log.debug("converting colorspace {0} to redshift render "
                            "colorspace".format(colorspace))
             subprocess_args.extend(["-cs", colorspace])
 
-        hash_args = ["rstex"]
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash = self.get_hashed_result(
+            source, colorspace, color_management).file_hash
 
         # Redshift stores the output texture next to the input but with
         # the extension replaced to `.rstexbin`
@@ -218,6 +268,18 @@ class MakeRSTexBin(TextureProcessor):
             transfer_mode=COPY
         )
 
+    def get_hashed_result(self,
+                          source,
+                          colorspace,
+                          color_management):
+        hash_args = ["rstex"]
+        return TextureResult(
+            path=None,
+            file_hash=source_hash(source, *hash_args),
+            colorspace=colorspace,
+            transfer_mode=COPY
+        )
+
     @staticmethod
     def get_redshift_tool(tool_name):
         """Path to redshift texture processor.
@@ -280,7 +342,8 @@ class MakeTX(TextureProcessor):
                 source,
                 colorspace,
                 color_management,
-                staging_dir):
+                staging_dir,
+                threads=None):
         """Process the texture.
 
         This function requires the `maketx` executable to be available in an
@@ -292,6 +355,8 @@ class MakeTX(TextureProcessor):
             color_management (dict): Maya Color management data from
                 `lib.get_color_management_preferences`
             staging_dir (str): Output directory to write to.
+            threads (Optional[int]): Threads used by maketx process, all
+                cores are used if not set.
 
         Returns:
             TextureResult: The resulting texture information.
@@ -315,36 +380,9 @@ class MakeTX(TextureProcessor):
                 transfer_mode=COPY
             )
 
-        # Hardcoded default arguments for maketx conversion based on Arnold's
-        # txManager in Maya
-        args = [
-            # unpremultiply before conversion (recommended when alpha present)
-            "--unpremult",
-            # use oiio-optimized settings for tile-size, planarconfig, metadata
-            "--oiio",
-            "--filter", "lanczos3",
-        ]
-        if color_management["enabled"]:
-            config_path = color_management["config"]
-            if not os.path.exists(config_path):
-                raise RuntimeError("OCIO config not found at: "
-                                   "{}".format(config_path))
-
-            render_colorspace = color_management["rendering_space"]
-
-            self.log.debug("tx: converting colorspace {0} "
-                          "-> {1}".format(colorspace,
-                                          render_colorspace))
-            args.extend(["--colorconvert", colorspace, render_colorspace])
-            args.extend(["--colorconfig", config_path])
-
-        else:
-            # Maya Color management is disabled. We cannot rely on an OCIO
-            self.log.debug("tx: Maya color management is disabled. No color "
-                           "conversion will be applied to .tx conversion for: "
-                           "{}".format(source))
-            # Assume linear
-            render_colorspace = "linear"
+        args, render_colorspace = self._get_conversion_args(
+            source, colorspace, color_management
+        )
 
         # Note: The texture hash is only reliable if we include any potential
         # conversion arguments provide to e.g. `maketx`
@@ -353,8 +391,8 @@ class MakeTX(TextureProcessor):
 
         # Ensure folder exists
         resources_dir = os.path.join(staging_dir, "resources")
-        if not os.path.exists(resources_dir):
-            os.makedirs(resources_dir)
+        # Other textures can create the folder at the same time
+        os.makedirs(resources_dir, exist_ok=True)
 
         self.log.debug("Generating .tx file for %s .." % source)
 
@@ -370,6 +408,9 @@ class MakeTX(TextureProcessor):
         subprocess_args.extend(args)
         if self.extra_args:
             subprocess_args.extend(self.extra_args)
+        # Threads don't affect the output so they are not part of the hash
+        if threads and "--threads" not in self.extra_args:
+            subprocess_args.extend(["--threads", str(threads)])
 
         # Add source hash attribute after other arguments for log readability
         # Note: argument is excluded from the hash since it is the hash itself
@@ -403,6 +444,59 @@ class MakeTX(TextureProcessor):
             transfer_mode=COPY
         )
 
+    def _get_conversion_args(self, source, colorspace, color_management):
+        """Arguments for maketx conversion and resulting colorspace."""
+        # Hardcoded default arguments for maketx conversion based on Arnold's
+        # txManager in Maya
+        args = [
+            # unpremultiply before conversion (recommended when alpha present)
+            "--unpremult",
+            # use oiio-optimized settings for tile-size, planarconfig, metadata
+            "--oiio",
+            "--filter", "lanczos3",
+        ]
+        if color_management["enabled"]:
+            config_path = color_management["config"]
+            if not os.path.exists(config_path):
+                raise RuntimeError("OCIO config not found at: "
+                                   "{}".format(config_path))
+
+            render_colorspace = color_management["rendering_space"]
+
+            self.log.debug("tx: converting colorspace {0} "
+                           "-> {1}".format(colorspace,
+                                           render_colorspace))
+            args.extend(["--colorconvert", colorspace, render_colorspace])
+            args.extend(["--colorconfig", config_path])
+
+        else:
+            # Maya Color management is disabled. We cannot rely on an OCIO
+            self.log.debug("tx: Maya color management is disabled. No color "
+                           "conversion will be applied to .tx conversion for: "
+                           "{}".format(source))
+            # Assume linear
+            render_colorspace = "linear"
+        return args, render_colorspace
+
+    def get_hashed_result(self,
+                          source,
+                          colorspace,
+                          color_management):
+        # Source '.tx' files are not processed
+        if os.path.splitext(source)[1] == ".tx":
+            return None
+
+        args, render_colorspace = self._get_conversion_args(
+            source, colorspace, color_management
+        )
+        hash_args = ["maketx"] + args + self.extra_args
+        return TextureResult(
+            path=None,
+            file_hash=source_hash(source, *hash_args),
+            colorspace=render_colorspace,
+            transfer_mode=COPY
+        )
+
     @staticmethod
     def _has_arnold():
         """Return whether the arnold package is available and importable."""
@@ -429,6 +523,13 @@ class ExtractLook(publish.Extractor):
     scene_type = "ma"
     look_data_type = "json"
 
+    # Copy textures processed by previous publishes with the same source
+    #   hash instead of processing them again
+    reuse_processed_textures = True
+    # Amount of textures processed at the same time, textures are processed
+    #   serially if is set to 1 and value lower than 1 uses number of CPUs
+    texture_max_workers = 1
+
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
 
@@ -638,6 +739,14 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        texture_results = self._process_textures(
+            instance,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management
+        )
+
         # Process all resource's individual files
         processed_files = {}
         transfers = []
@@ -678,14 +787,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -779,8 +881,207 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
+    def _get_texture_max_workers(self, jobs_count):
+        """Number of textures which can be processed at the same time."""
+        max_workers = self.texture_max_workers
+        if max_workers is None or max_workers < 1:
+            max_workers = multiprocessing.cpu_count()
+        return max(1, min(max_workers, jobs_count))
+
+    def _process_textures(self,
+                          instance,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management):
+        """Process all texture files of the instance.
+
+        Each source file is processed only once, with colorspace of first
+        resource using it. Files with the same processing hash, and files
+        already processed by previous publishes, are not processed again.
+        Remaining files are processed concurrently based on
+        'texture_max_workers'.
+
+        Returns:
+            dict[str, TextureResult]: Results by normalized source path.
+        """
+        if len(processors) > 1:
+            raise KnownPublishError(
+                "More than one texture processor not supported. "
+                "Current processors enabled: {}".format(processors)
+            )
+
+        colorspaces_by_filepath = OrderedDict()
+        for resource in instance.data["resources"]:
+            for filepath in resource["files"]:
+                filepath = os.path.normpath(filepath)
+                if filepath not in colorspaces_by_filepath:
+                    colorspaces_by_filepath[filepath] = resource["color_space"]
+
+        hashed_results = {}
+        if processors:
+            processor = processors[0]
+            hashed_results = {
+                filepath: processor.get_hashed_result(
+                    filepath, colorspace, color_management
+                )
+                for filepath, colorspace in colorspaces_by_filepath.items()
+            }
+
+        output = self._get_published_textures(instance, hashed_results)
+
+        # Skip jobs with the same processing hash
+        jobs = []
+        duplicates = {}
+        filepaths_by_hash = {}
+        for filepath, colorspace in colorspaces_by_filepath.items():
+            if filepath in output:
+                continue
+            hashed_result = hashed_results.get(filepath)
+            if hashed_result is not None:
+                texture_hash = hashed_result.file_hash
+                if texture_hash in filepaths_by_hash:
+                    duplicates[filepath] = filepaths_by_hash[texture_hash]
+                    continue
+                filepaths_by_hash[texture_hash] = filepath
+            jobs.append((filepath, colorspace))
+
+        max_workers = self._get_texture_max_workers(len(jobs))
+        threads = None
+        if max_workers > 1:
+            # Split available CPUs between concurrently running processes
+            threads = max(1, multiprocessing.cpu_count() // max_workers)
+
+        # Environment must not be changed from multiple threads
+        for processor in processors:
+            processor.prepare_environment(color_management)
+
+        def process_job(job):
+            filepath, colorspace = job
+            return self._process_texture(
+                filepath,
+                processors=processors,
+                staging_dir=staging_dir,
+                force_copy=force_copy,
+                color_management=color_management,
+                colorspace=colorspace,
+                threads=threads
+            )
+
+        if jobs:
+            self.log.info("Processing {} textures with {} workers".format(
+                len(jobs), max_workers
+            ))
+
+        for finished_count, (idx, result) in enumerate(
+            self._run_texture_jobs(jobs, process_job, max_workers), 1
+        ):
+            output[jobs[idx][0]] = result
+            self._log_texture_progress(finished_count, len(jobs))
+
+        for filepath, src_filepath in duplicates.items():
+            self.log.debug("Texture {} has same hash as {}".format(
+                filepath, src_filepath
+            ))
+            output[filepath] = output[src_filepath]
+        return output
+
+    def _log_texture_progress(self, finished_count, total):
+        # Log only each 10 percent of processed textures
+        step = max(1, total // 10)
+        if finished_count % step == 0 or finished_count == total:
+            self.log.info("Processed textures {}/{}".format(
+                finished_count, total
+            ))
+
+    @staticmethod
+    def _run_texture_jobs(jobs, func, max_workers):
+        """Run texture jobs, concurrently if more workers are allowed.
+
+        When a job fails, jobs which did not start yet are cancelled and the
+        error is raised after running jobs are finished.
+
+        Yields:
+            tuple[int, TextureResult]: Index of finished job and its result.
+        """
+        if max_workers <= 1 or len(jobs) < 2:
+            for idx, job in enumerate(jobs):
+                yield idx, func(job)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(func, job): idx
+                for idx, job in enumerate(jobs)
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _get_published_textures(self, instance, hashed_results):
+        """Find textures processed by previous publishes.
+
+        Hashes of all textures of the instance are resolved with one query.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            hashed_results (dict[str, Union[TextureResult, None]]): Results
+                of processor without path by source file path.
+
+        Returns:
+            dict[str, TextureResult]: Results with path to published
+                processed texture by source file path.
+        """
+        if not self.reuse_processed_textures or AYON_SERVER_ENABLED:
+            return {}
+
+        texture_hashes = {
+            result.file_hash
+            for result in hashed_results.values()
+            if result is not None
+        }
+        if not texture_hashes:
+            return {}
+
+        paths_by_hash = find_texture_paths_by_hashes(
+            instance.context.data["projectName"], texture_hashes
+        )
+        output = {}
+        for filepath, result in hashed_results.items():
+            if result is None:
+                continue
+            paths = paths_by_hash.get(result.file_hash) or []
+            path = next((p for p in paths if os.path.exists(p)), None)
+            if path:
+                self.log.debug(
+                    "Using already processed texture {} for {}".format(
+                        path, filepath
+                    )
+                )
+                result.path = path
+                output[filepath] = result
+
+        self.log.debug("Found {}/{} already processed textures".format(
+            len(output), len(hashed_results)
+        ))
+        return output
+
     def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
+        """Return the first found filepath from a texture hash.
+
+        Args:
+            texture_hash (str): Hash of source file from 'source_hash'.
+
+        Returns:
+            Union[str, None]: Path to published file with the same hash which
+                exists on disk.
+        """
 
         # If source has been published before with the same settings,
         # then don't reprocess but hardlink from the original
@@ -801,7 +1102,8 @@ class ExtractLook(publish.Extractor):
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         threads=None):
         """Process a single texture file on disk for publishing.
 
         This will:
@@ -822,6 +1124,8 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            threads (Optional[int]): Threads the processor can use, all
+                cores if not set.
 
         Returns:
             TextureResult: The texture result information.
@@ -841,7 +1145,8 @@ class ExtractLook(publish.Extractor):
             processed_result = processor.process(filepath,
                                                  colorspace,
                                                  color_management,
-                                                 staging_dir)
+                                                 staging_dir,
+                                                 threads=threads)
             if not processed_result:
                 raise RuntimeError("Texture Processor {} returned "
                                    "no result.".format(processor))
@@ -855,7 +1160,10 @@ class ExtractLook(publish.Extractor):
         # No texture processing for this file
         texture_hash = source_hash(filepath)
         if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+            # Published files are looked up by the hash. Previously the
+            #   source path was passed instead which never matched, so
+            #   unchanged textures were always copied.
+            existing = self._get_existing_hashed_texture(texture_hash)
             if existing:
                 self.log.debug("Found hash in database, preparing hardlink..")
                 return TextureResult(
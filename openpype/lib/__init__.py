@@ -144,6 +144,7 @@ from .applications import (
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
 )
 
 from .path_tools import (
@@ -262,6 +263,7 @@ __all__ = [
 
     "prepare_template_data",
     "source_hash",
+    "source_hash_from_stat",
 
     "format_file_size",
     "collect_frames",
@@ -0,0 +1,182 @@
+"""Snapshots of farm launch environments.
+
+Each task of OpenPype render job on Deadline starts OpenPype process with
+'extractenvironments' command to prepare environments of application. The
+result is the same for all tasks with the same context, settings and
+OpenPype version so it can be computed only once and reused.
+
+Snapshot directory is content addressed by a key made of project, asset,
+task, application, environment group, settings version and OpenPype
+version. The directory is resolved on submission and passed to job in
+'OPENPYPE_ENV_SNAPSHOT' environment variable. First task of a job which
+does not find a snapshot for its platform computes environments on demand
+and stores them there, following tasks (also of other jobs with the same
+key) reuse the snapshot. Snapshots are removed when settings are saved.
+
+Snapshots are stored only if 'OPENPYPE_ENV_SNAPSHOTS_ROOT' environment
+variable with path to a directory shared by workstations and render nodes
+is set.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+from openpype.settings.lib import (
+    get_system_last_saved_info,
+    get_project_last_saved_info,
+)
+
+from .log import Logger
+from .openpype_version import get_openpype_version
+
+ENV_SNAPSHOTS_ROOT_KEY = "OPENPYPE_ENV_SNAPSHOTS_ROOT"
+ENV_SNAPSHOT_KEY = "OPENPYPE_ENV_SNAPSHOT"
+# Change when content of snapshots changes
+ENV_SNAPSHOT_VERSION = 1
+
+
+def get_env_snapshots_root():
+    """Root directory of environment snapshots.
+
+    Returns:
+        Union[str, None]: Path to directory or None if snapshots are not
+            enabled.
+    """
+
+    return os.environ.get(ENV_SNAPSHOTS_ROOT_KEY) or None
+
+
+def get_settings_version(project_name):
+    """Version of settings which affect environments of a project.
+
+    Version is made of timestamps of last save of system settings, studio
+    project settings and project settings.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        str: Settings version.
+    """
+
+    infos = (
+        get_system_last_saved_info(),
+        get_project_last_saved_info(None),
+        get_project_last_saved_info(project_name),
+    )
+    return "|".join(info.timestamp or "" for info in infos)
+
+
+def get_env_snapshot_key(
+    project_name,
+    asset_name,
+    task_name,
+    app_name,
+    env_group=None,
+    settings_version=None,
+    openpype_version=None
+):
+    """Key of environment snapshot.
+
+    Args:
+        project_name (str): Name of project.
+        asset_name (str): Name of asset.
+        task_name (str): Name of task.
+        app_name (str): Full name of application, e.g. 'maya/2024'.
+        env_group (Optional[str]): Environment group.
+        settings_version (Optional[str]): Version of settings. Current
+            version from 'get_settings_version' is used if not passed.
+        openpype_version (Optional[str]): OpenPype version. Current version
+            is used if not passed.
+
+    Returns:
+        str: Hash of snapshot key.
+    """
+
+    if settings_version is None:
+        settings_version = get_settings_version(project_name)
+
+    if openpype_version is None:
+        openpype_version = get_openpype_version()
+
+    key_data = [
+        ENV_SNAPSHOT_VERSION,
+        project_name,
+        asset_name,
+        task_name,
+        app_name,
+        env_group,
+        settings_version,
+        openpype_version,
+    ]
+    return hashlib.sha256(
+        json.dumps(key_data).encode("utf-8")
+    ).hexdigest()
+
+
+def get_env_snapshot_dir(
+    project_name, asset_name, task_name, app_name, env_group=None
+):
+    """Directory of environment snapshot for passed context.
+
+    Directory does not have to exist. It contains a json file for each
+    platform named '<platform>.json' (e.g. 'linux.json') when snapshot was
+    created.
+
+    Args:
+        project_name (str): Name of project.
+        asset_name (str): Name of asset.
+        task_name (str): Name of task.
+        app_name (str): Full name of application, e.g. 'maya/2024'.
+        env_group (Optional[str]): Environment group.
+
+    Returns:
+        Union[str, None]: Path to snapshot directory or None if snapshots
+            are not enabled.
+    """
+
+    root = get_env_snapshots_root()
+    if not root:
+        return None
+
+    key = get_env_snapshot_key(
+        project_name, asset_name, task_name, app_name, env_group
+    )
+    return os.path.join(root, project_name, key)
+
+
+def clear_env_snapshots(project_name=None):
+    """Remove environment snapshots.
+
+    Args:
+        project_name (Optional[str]): Remove only snapshots of the project.
+            All snapshots are removed if not passed.
+    """
+
+    root = get_env_snapshots_root()
+    if not root or not os.path.isdir(root):
+        return
+
+    if project_name:
+        dirpaths = [os.path.join(root, project_name)]
+    else:
+        dirpaths = [
+            os.path.join(root, dirname)
+            for dirname in os.listdir(root)
+        ]
+
+    log = Logger.get_logger("EnvSnapshots")
+    for dirpath in dirpaths:
+        if not os.path.isdir(dirpath):
+            continue
+        try:
+            shutil.rmtree(dirpath)
+        except Exception:
+            log.warning(
+                "Failed to remove environment snapshots \"{}\"".format(
+                    dirpath
+                ),
+                exc_info=True
+            )
@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import errno
+import threading
 import six
 
 from openpype.lib import create_hard_link
@@ -47,14 +48,41 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can be processed concurrently with a thread pool when
+    'max_workers' is higher than 1. That helps on network storages where
+    transfer of many files is limited by latency of each file operation
+    rather than by bandwidth. Larger files are transferred first.
+
+    Calling `process()` again after a failure continues with transfers that
+    were not finished yet.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow replacement of
+            queued transfer to same destination.
+        max_workers (Optional[int]): Amount of threads used to process
+            transfers. Transfers are processed serially when not set.
+        progress_callback (Optional[Callable[[str, str, int, int], None]]):
+            Called after each finished transfer with source path,
+            destination path, count of finished transfers and count of all
+            transfers.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Hardlink file and copy it if hardlink can't be created
+    MODE_HARDLINK_OR_COPY = 2
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        progress_callback=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -70,15 +98,29 @@ class FileTransaction(object):
         # Backup file location mapping to original locations
         self._backup_to_original = {}
 
+        # Destination file paths that a transfer was started to, file can
+        #   be partially transferred if transfer failed
+        self._started_transfers = set()
+
         self._allow_queue_replacements = allow_queue_replacements
 
+        self._max_workers = max_workers or 1
+        self._progress_callback = progress_callback
+        # Lock used for shared data when processed in threads
+        self._lock = threading.Lock()
+        # Folders which are known to exist
+        self._created_folders = set()
+        # Count of finished transfers in current process
+        self._finished_count = 0
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
         """
 
         opts = {"mode": mode}
@@ -110,41 +152,198 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
+        # Skip transfers which were already done in previous process call
+        transferred = set(self._transferred)
+        transfers = [
+            (dst, src, opts)
+            for dst, (src, opts) in self._transfers.items()
+            if dst not in transferred
+        ]
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_concurrent(transfers)
+            return
+
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
+        same_path_dsts = set()
+        for dst, src, _ in transfers:
+            if self._backup_destination(src, dst):
+                same_path_dsts.add(dst)
+
+        # Copy the files to transfer
+        total = len(transfers)
+        self._finished_count = 0
+        for dst, src, opts in transfers:
+            self._transfer(src, dst, opts, dst in same_path_dsts, total)
+
+    def _process_concurrent(self, transfers):
+        from concurrent.futures import ThreadPoolExecutor
+
+        total = len(transfers)
+        self._finished_count = 0
+        self.log.debug("Processing {} transfers using {} workers".format(
+            total, self._max_workers
+        ))
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            # Backup any existing files and get size of source files
+            backup_results = self._wait_for_futures([
+                executor.submit(self._backup_destination, src, dst, True)
+                for dst, src, _ in transfers
+            ])
+
+            # Start with the largest files so the transfer does not end
+            #   waiting for a single large file
+            items = sorted(
+                zip(transfers, backup_results),
+                key=lambda item: item[1][1],
+                reverse=True
+            )
+
+            # Copy the files to transfer
+            self._wait_for_futures([
+                executor.submit(
+                    self._transfer, src, dst, opts, path_same, total
+                )
+                for (dst, src, opts), (path_same, _) in items
+            ])
+
+    def _wait_for_futures(self, futures):
+        """Wait for futures and re-raise first error.
+
+        Pending futures are cancelled on first error and running futures
+        are finished so rollback has complete information.
+        """
+
+        results = []
+        exc_info = None
+        for future in futures:
+            if exc_info is not None:
+                break
+
+            try:
+                results.append(future.result())
+            except Exception:
+                exc_info = sys.exc_info()
+
+        if exc_info is None:
+            return results
+
+        for future in futures:
+            future.cancel()
+
+        # Wait for running transfers
+        for future in futures:
+            if future.cancelled():
                 continue
+            try:
+                future.result()
+            except Exception:
+                pass
+        six.reraise(*exc_info)
+
+    def _backup_destination(self, src, dst, with_size=False):
+        """Backup existing destination file.
 
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            with_size (bool): Return also size of source file.
+
+        Returns:
+            Union[bool, tuple[bool, int]]: Source and destination are the
+                same file, and size of source file if requested.
+        """
+
+        self.log.debug("Checking file ... {} -> {}".format(src, dst))
+        path_same = self._same_paths(src, dst)
+        output = path_same
+        if with_size:
+            try:
+                size = os.path.getsize(src)
+            except OSError:
+                size = 0
+            output = (path_same, size)
+
+        if path_same or not os.path.exists(dst):
+            return output
+
+        # Backup original file
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        with self._lock:
+            is_partial = (
+                dst in self._started_transfers
+                or backup in self._backup_to_original
+                or os.path.exists(backup)
+            )
+            if is_partial and os.path.exists(backup):
+                self._backup_to_original[backup] = dst
+
+        if is_partial:
+            # Destination is partially transferred file from failed transfer
+            #   when 'process' is called again. Original file, if there was
+            #   any, was already backed up and the backup must be kept.
+            self.log.debug(
+                "Removing partially transferred file: {}".format(dst))
+            os.remove(dst)
+            return output
+
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        with self._lock:
             self._backup_to_original[backup] = dst
+        return output
+
+    def _transfer(self, src, dst, opts, path_same, total):
+        if path_same:
             self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
+                "Source and destination are same files {} -> {}".format(
+                    src, dst))
+            self._on_transfer_finished(src, dst, total)
+            return
 
-        # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        self._create_folder_for_file(dst)
 
-            self._create_folder_for_file(dst)
+        with self._lock:
+            self._started_transfers.add(dst)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK_OR_COPY:
+            self._hardlink_or_copy(src, dst)
 
+        with self._lock:
             self._transferred.append(dst)
+        self._on_transfer_finished(src, dst, total)
+
+    def _hardlink_or_copy(self, src, dst):
+        self.log.debug("Hardlinking file ... {} -> {}".format(src, dst))
+        try:
+            create_hard_link(src, dst)
+            return
+
+        except OSError as exc:
+            # Copy file only if hardlink can't be created
+            # EXDEV - cross drive path
+            # EINVAL - wrong format, must be NTFS
+            if exc.errno not in (errno.EXDEV, errno.EINVAL):
+                raise
+
+        self.log.debug("Copying file ... {} -> {}".format(src, dst))
+        copyfile(src, dst)
+
+    def _on_transfer_finished(self, src, dst, total):
+        with self._lock:
+            self._finished_count += 1
+            finished_count = self._finished_count
+
+        if self._progress_callback is not None:
+            self._progress_callback(src, dst, finished_count, total)
 
     def finalize(self):
         # Delete any backed up files
@@ -168,6 +367,18 @@ class FileTransaction(object):
                     "Failed to rollback created file: {}".format(path),
                     exc_info=True)
 
+        # Remove partially transferred files of failed transfers
+        for path in self._started_transfers:
+            if path in self._transferred or not os.path.exists(path):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                errors += 1
+                self.log.error(
+                    "Failed to remove partial file: {}".format(path),
+                    exc_info=True)
+
         # Rollback the backups
         for backup, original in self._backup_to_original.items():
             try:
@@ -197,6 +408,9 @@ class FileTransaction(object):
 
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
+        if dirname in self._created_folders:
+            return
+
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -206,6 +420,9 @@ class FileTransaction(object):
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
 
+        with self._lock:
+            self._created_folders.add(dirname)
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
         if os.path.exists(src) and os.path.exists(dst):
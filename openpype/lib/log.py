@@ -23,6 +23,12 @@ import time
 import traceback
 import threading
 import copy
+import atexit
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
@@ -34,10 +40,8 @@ from . import Terminal
 
 try:
     import log4mongo
-    from log4mongo.handlers import MongoHandler
 except ImportError:
     log4mongo = None
-    MongoHandler = type("NOT_SET", (), {})
 
 # Check for `unicode` in builtins
 USE_UNICODE = hasattr(__builtins__, "unicode")
@@ -151,7 +155,7 @@ class MongoFormatter(logging.Formatter):
         """Formats LogRecord into python dictionary."""
         # Standard document
         document = {
-            'timestamp': datetime.datetime.now(),
+            'timestamp': datetime.datetime.fromtimestamp(record.created),
             'level': record.levelname,
             'thread': record.thread,
             'threadName': record.threadName,
@@ -182,6 +186,209 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class _FlushRequest(object):
+    def __init__(self):
+        self.event = threading.Event()
+
+
+class BufferedMongoHandler(logging.Handler):
+    """Handler writing log records to Mongo from background thread.
+
+    Records are only put to a queue on the logging thread. Documents are
+    created by writer thread which stores them with 'insert_many' when
+    'buffer_size' records are collected or 'flush_interval' seconds passed.
+
+    When queue is full records are dropped, records of level 'ERROR' and
+    higher wait up to 'error_put_timeout' seconds. Count of dropped records
+    is stored with next written batch.
+
+    Handler is shared by all loggers. Queue and writer thread are created
+    again in forked subprocess.
+
+    Args:
+        database_name (str): Name of database with logs.
+        collection_name (str): Name of collection with logs.
+        buffer_size (Optional[int]): Max number of documents written at
+            once.
+        flush_interval (Optional[float]): Max time in seconds for which are
+            records buffered.
+        max_queue_size (Optional[int]): Max number of records waiting to be
+            written.
+    """
+
+    error_put_timeout = 1.0
+    close_timeout = 5.0
+
+    def __init__(
+        self,
+        database_name,
+        collection_name,
+        buffer_size=100,
+        flush_interval=1.0,
+        max_queue_size=10000
+    ):
+        super(BufferedMongoHandler, self).__init__()
+        self.database_name = database_name
+        self.collection_name = collection_name
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+
+        self._collection = None
+        self._writer_lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+        self._dropped = 0
+        self._closed = False
+
+    def _get_collection(self):
+        if self._collection is None:
+            client = Logger.get_log_mongo_connection()
+            self._collection = (
+                client[self.database_name][self.collection_name]
+            )
+        return self._collection
+
+    def _ensure_writer(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        with self._writer_lock:
+            if self._pid == pid:
+                return
+            # Thread and queue (and its locks) of parent process are not
+            #   usable in forked process
+            self._queue = queue.Queue(self.max_queue_size)
+            self._collection = None
+            self._dropped = 0
+            self._thread = threading.Thread(
+                target=self._writer_loop, name="MongoLogWriter"
+            )
+            self._thread.daemon = True
+            self._thread.start()
+            self._pid = pid
+
+    def _prepare_record(self, record):
+        # Resolve message now in case arguments are changed later
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def emit(self, record):
+        if self._closed:
+            return
+
+        self._ensure_writer()
+        try:
+            record = self._prepare_record(record)
+            if record.levelno >= logging.ERROR:
+                self._queue.put(record, timeout=self.error_put_timeout)
+            else:
+                self._queue.put_nowait(record)
+
+        except queue.Full:
+            self._dropped += 1
+
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Wait until queued records are written."""
+        if self._pid != os.getpid() or self._closed:
+            return
+
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=self.close_timeout)
+        except queue.Full:
+            return
+        request.event.wait(self.close_timeout)
+
+    def close(self):
+        if not self._closed and self._pid == os.getpid():
+            self._closed = True
+            try:
+                self._queue.put(None, timeout=self.close_timeout)
+            except queue.Full:
+                pass
+            self._thread.join(self.close_timeout)
+        super(BufferedMongoHandler, self).close()
+
+    def _writer_loop(self):
+        stop = False
+        while not stop:
+            records = []
+            flush_requests = []
+            item = self._queue.get()
+            deadline = time.time() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                    break
+
+                if isinstance(item, _FlushRequest):
+                    flush_requests.append(item)
+                    break
+
+                records.append(item)
+                timeout = deadline - time.time()
+                if len(records) >= self.buffer_size or timeout <= 0:
+                    break
+
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+            self._write_records(records)
+            for request in flush_requests:
+                request.event.set()
+
+    def _write_records(self, records):
+        documents = []
+        if self._dropped:
+            dropped, self._dropped = self._dropped, 0
+            documents.append(self._create_dropped_document(dropped))
+
+        for record in records:
+            try:
+                documents.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+
+        if not documents:
+            return
+
+        try:
+            self._get_collection().insert_many(documents, ordered=False)
+        except Exception:
+            self._collection = None
+            Terminal.echo("Failed to write {} logs to Mongo: {}".format(
+                len(documents), sys.exc_info()[1]
+            ))
+
+    def _create_dropped_document(self, dropped):
+        document = {
+            "timestamp": datetime.datetime.now(),
+            "level": "WARNING",
+            "thread": None,
+            "threadName": threading.current_thread().name,
+            "message": (
+                "{} log records were dropped because log queue was full"
+            ).format(dropped),
+            "loggerName": __name__,
+            "fileName": __file__,
+            "module": __name__,
+            "method": "_write_records",
+            "lineNumber": None
+        }
+        document.update(Logger.get_process_data())
+        return document
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -222,6 +429,8 @@ class Logger:
 
     # Data same for all record documents
     process_data = None
+    # Handler shared by all loggers
+    _mongo_handler = None
     # Cached process name or ability to set different process name
     _process_name = None
 
@@ -238,7 +447,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, BufferedMongoHandler):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -285,22 +494,15 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
-
-        return MongoHandler(**kwargs)
+        if cls._mongo_handler is None:
+            handler = BufferedMongoHandler(
+                cls.log_database_name, cls.log_collection_name
+            )
+            handler.setFormatter(MongoFormatter())
+            # Write buffered records before mongo connection is closed
+            atexit.register(handler.close)
+            cls._mongo_handler = handler
+        return cls._mongo_handler
 
     @classmethod
     def _get_console_handler(cls):
@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import numbers
+import threading
 import collections
 
 import six
@@ -10,6 +11,8 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Maximum amount of parsed templates kept in memory
+COMPILED_TEMPLATES_CACHE_SIZE = 1024
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -80,6 +83,91 @@ class TemplateUnsolved(Exception):
         )
 
 
+def _parse_template_parts(template):
+    """Split template string into formatting parts.
+
+    Args:
+        template (str): Template string.
+
+    Returns:
+        tuple[Union[str, FormattingPart, OptionalPart]]: Parsed parts.
+    """
+
+    parts = []
+    last_end_idx = 0
+    for item in KEY_PATTERN.finditer(template):
+        start, end = item.span()
+        if start > last_end_idx:
+            parts.append(template[last_end_idx:start])
+        parts.append(FormattingPart(template[start:end]))
+        last_end_idx = end
+
+    if last_end_idx < len(template):
+        parts.append(template[last_end_idx:len(template)])
+
+    new_parts = []
+    for part in parts:
+        if not isinstance(part, six.string_types):
+            new_parts.append(part)
+            continue
+
+        substr = ""
+        for char in part:
+            if char not in ("<", ">"):
+                substr += char
+            else:
+                if substr:
+                    new_parts.append(substr)
+                new_parts.append(char)
+                substr = ""
+        if substr:
+            new_parts.append(substr)
+
+    return tuple(StringTemplate.find_optional_parts(new_parts))
+
+
+class _CompiledTemplatesCache(object):
+    """Bounded LRU cache of parsed template parts by template string.
+
+    Parts are not modified during formatting so the same parts can be
+    shared by all 'StringTemplate' objects created from the same string.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._parts_by_template = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_parts(self, template):
+        with self._lock:
+            parts = self._parts_by_template.pop(template, None)
+            if parts is not None:
+                self.hits += 1
+                self._parts_by_template[template] = parts
+                return parts
+
+        parts = _parse_template_parts(template)
+        with self._lock:
+            self.misses += 1
+            self._parts_by_template[template] = parts
+            while len(self._parts_by_template) > self._max_size:
+                self._parts_by_template.popitem(last=False)
+        return parts
+
+    def clear(self):
+        with self._lock:
+            self._parts_by_template.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_compiled_templates_cache = _CompiledTemplatesCache(
+    COMPILED_TEMPLATES_CACHE_SIZE
+)
+
+
 class StringTemplate(object):
     """String that can be formatted."""
     def __init__(self, template):
@@ -89,37 +177,7 @@ class StringTemplate(object):
             ))
 
         self._template = template
-        parts = []
-        last_end_idx = 0
-        for item in KEY_PATTERN.finditer(template):
-            start, end = item.span()
-            if start > last_end_idx:
-                parts.append(template[last_end_idx:start])
-            parts.append(FormattingPart(template[start:end]))
-            last_end_idx = end
-
-        if last_end_idx < len(template):
-            parts.append(template[last_end_idx:len(template)])
-
-        new_parts = []
-        for part in parts:
-            if not isinstance(part, six.string_types):
-                new_parts.append(part)
-                continue
-
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
-
-        self._parts = self.find_optional_parts(new_parts)
+        self._parts = _compiled_templates_cache.get_parts(template)
 
     def __str__(self):
         return self.template
@@ -182,6 +240,73 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def _format_fast(self, data):
+        """Format template directly to string.
+
+        Fast path which does not collect used values, missing keys or
+        invalid types.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+
+        Returns:
+            Union[str, None]: Filled template or None if any required key
+                is missing or has invalid type.
+        """
+
+        output = []
+        for part in self._parts:
+            if isinstance(part, six.string_types):
+                output.append(part)
+                continue
+
+            value = part.format_value(data)
+            if value is not None:
+                output.append(value)
+            elif not isinstance(part, OptionalPart):
+                return None
+        return "".join(output)
+
+    def format_to_string(self, data, strict=True):
+        """Format template to string without building formatting result.
+
+        Full formatting is used only when template can't be solved to
+        get proper result or error.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+            strict (bool): Raise 'TemplateUnsolved' if template can't be
+                solved. Partially filled template is returned otherwise.
+
+        Returns:
+            str: Filled template.
+        """
+
+        output = self._format_fast(data)
+        if output is not None:
+            return output
+
+        if strict:
+            return str(self.format_strict(data))
+        return str(self.format(data))
+
+    def format_many(self, data_items, strict=True):
+        """Format template with multiple data.
+
+        Args:
+            data_items (Iterable[dict]): Data used to fill the template.
+            strict (bool): Raise 'TemplateUnsolved' if template can't be
+                solved with any of data.
+
+        Returns:
+            list[str]: Filled templates in order of passed data.
+        """
+
+        return [
+            self.format_to_string(data, strict)
+            for data in data_items
+        ]
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -192,6 +317,12 @@ class StringTemplate(object):
         objected_template = cls(template)
         return objected_template.format_strict(data)
 
+    @staticmethod
+    def clear_cache():
+        """Clear cache of parsed templates."""
+
+        _compiled_templates_cache.clear()
+
     @staticmethod
     def find_optional_parts(parts):
         new_parts = []
@@ -704,6 +835,17 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Parse the key only once, template parts are reused for all
+        #   formatting calls
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -732,17 +874,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -784,17 +923,7 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
-
-            formatted_value = self.template.format(**fill_data)
+            formatted_value = self._format_filled_value(used_keys, value)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
             result.add_output(formatted_value)
@@ -805,6 +934,40 @@ class FormattingPart:
 
         return result
 
+    def _format_filled_value(self, used_keys, value):
+        fill_data = {}
+        first_value = True
+        for used_key in reversed(used_keys):
+            if first_value:
+                first_value = False
+                fill_data[used_key] = value
+            else:
+                _fill_data = {used_key: fill_data}
+                fill_data = _fill_data
+
+        return self.template.format(**fill_data)
+
+    def format_value(self, data):
+        """Format the key directly to string.
+
+        Args:
+            data(dict): Data that should be used for formatting.
+
+        Returns:
+            Union[str, None]: Formatted value or None if key is missing in
+                data or value has invalid type.
+        """
+
+        value = data
+        for sub_key in self._key_subdict:
+            if not hasattr(value, "items") or sub_key not in value:
+                return None
+            value = value.get(sub_key)
+
+        if not self.validate_value_type(value):
+            return None
+        return self._format_filled_value(self._key_subdict, value)
+
 
 class OptionalPart:
     """Template part which contains optional formatting strings.
@@ -840,3 +1003,27 @@ class OptionalPart:
         if new_result.solved:
             result.add_output(new_result)
         return result
+
+    def format_value(self, data):
+        """Format the part directly to string.
+
+        Args:
+            data(dict): Data that should be used for formatting.
+
+        Returns:
+            Union[str, None]: Formatted value or None if the part can't be
+                solved.
+        """
+
+        output = []
+        for part in self._parts:
+            if isinstance(part, six.string_types):
+                output.append(part)
+                continue
+
+            value = part.format_value(data)
+            if value is not None:
+                output.append(value)
+            elif not isinstance(part, OptionalPart):
+                return None
+        return "".join(output)
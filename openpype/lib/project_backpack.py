@@ -5,33 +5,68 @@ WARNING:
         dependent on functionality here.
 
 Goal is to be able to create package of current state of project with related
-documents from mongo and files from disk to zip file and then be able
-to recreate the project based on the zip.
+documents from mongo and files from disk to a directory and then be able
+to recreate the project based on the package.
 
 This gives ability to create project where a changes and tests can be done.
 
+Package is a directory with metadata json file, mongo documents stored as
+json lines and project files split into multiple tar archives. Documents and
+archives are compressed with selected codec. Archives are packed and unpacked
+in multiple threads, each archive has manifest with checksums of its files
+and already packed archives are reused when packing of interrupted package
+is started again. Zip files created by previous versions can be still
+unpacked.
+
 Keep in mind that to be able to create a package of project has few
 requirements. Possible requirement should be listed in 'pack_project' function.
 """
 
 import os
+import io
 import json
+import gzip
+import hashlib
 import platform
 import tempfile
 import shutil
+import tarfile
 import datetime
 
 import zipfile
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from openpype.client.mongo import (
     load_json_file,
     get_project_connection,
+    iter_documents_lines,
+    iter_project_documents,
     replace_project_documents,
-    store_project_documents,
+    write_documents_lines,
 )
 
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
 PROJECT_FILES_DIR = "project_files"
+BACKPACK_VERSION = 2
+
+# Limits of files and bytes stored to one archive of project files
+ARCHIVE_MAX_FILES = 1000
+ARCHIVE_MAX_SIZE = 1024 ** 3
+# Number of archives packed or unpacked at once
+DEFAULT_WORKERS = 8
+
+GZIP_COMPRESS_LEVEL = 3
+ZSTD_COMPRESS_LEVEL = 3
+CODEC_EXTENSIONS = {
+    "none": "",
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
 
 
 def add_timestamp(filepath):
@@ -42,6 +77,73 @@ def add_timestamp(filepath):
     return new_base + ext
 
 
+def get_available_codecs():
+    """Codecs which can be used for compression of package.
+
+    Codec 'zstd' is available only if 'zstandard' python module is installed.
+
+    Returns:
+        list[str]: Names of available codecs.
+    """
+
+    codecs = ["none", "gzip"]
+    if zstandard is not None:
+        codecs.append("zstd")
+    return codecs
+
+
+def get_default_codec():
+    """Fastest available codec.
+
+    Returns:
+        str: Name of codec.
+    """
+
+    if zstandard is not None:
+        return "zstd"
+    return "gzip"
+
+
+def open_codec_file(filepath, codec, mode):
+    """Open file compressed with a codec.
+
+    Args:
+        filepath (str): Path to a file.
+        codec (str): Name of codec. One of 'CODEC_EXTENSIONS' keys.
+        mode (str): Binary or text mode of file ('rb', 'wb', 'rt', 'wt').
+
+    Returns:
+        io.IOBase: Opened file stream.
+    """
+
+    kwargs = {}
+    if "t" in mode:
+        kwargs["encoding"] = "utf-8"
+
+    if codec == "none":
+        return io.open(filepath, mode, **kwargs)
+
+    if codec == "gzip":
+        if "w" in mode:
+            kwargs["compresslevel"] = GZIP_COMPRESS_LEVEL
+        return gzip.open(filepath, mode, **kwargs)
+
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError(
+                "Codec \"zstd\" requires 'zstandard' python module."
+            )
+        if "w" in mode:
+            kwargs["cctx"] = zstandard.ZstdCompressor(
+                level=ZSTD_COMPRESS_LEVEL
+            )
+        return zstandard.open(filepath, mode, **kwargs)
+
+    raise ValueError("Unknown codec \"{}\". Available codecs: {}".format(
+        codec, ", ".join(get_available_codecs())
+    ))
+
+
 def get_project_document(project_name, database_name=None):
     """Query project document.
 
@@ -61,32 +163,380 @@ def get_project_document(project_name, database_name=None):
     return col.find_one({"type": "project"})
 
 
-def _pack_files_to_zip(zip_stream, source_path, root_path):
-    """Pack files to a zip stream.
+def _create_dirs(dirpath):
+    # Directories can be created from multiple threads at once
+    try:
+        os.makedirs(dirpath)
+    except OSError:
+        if not os.path.isdir(dirpath):
+            raise
+
+
+def _write_json(filepath, data):
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "w") as stream:
+        json.dump(data, stream)
+    os.replace(tmp_path, filepath)
+
+
+def _read_json(filepath):
+    with open(filepath, "r") as stream:
+        return json.load(stream)
+
+
+class _HashingReader(object):
+    """Wrapper of file stream calculating checksum of read data."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._hash = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self._hash.update(data)
+        return data
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def export_project_documents(
+    project_name, filepath, codec=None, database_name=None
+):
+    """Store project documents to a compressed json lines file.
+
+    Documents are streamed from mongo to the file one by one.
+
+    Args:
+        project_name (str): Name of project to store.
+        filepath (str): Path to output file.
+        codec (Optional[str]): Codec used for compression.
+        database_name (Optional[str]): Name of mongo database where to look for
+            project.
+
+    Returns:
+        int: Number of stored documents.
+    """
+
+    if codec is None:
+        codec = get_default_codec()
+
+    tmp_path = filepath + ".tmp"
+    docs = iter_project_documents(project_name, database_name)
+    with open_codec_file(tmp_path, codec, "wt") as stream:
+        count = write_documents_lines(docs, stream)
+    os.replace(tmp_path, filepath)
+    return count
+
+
+def import_project_documents(
+    project_name, filepath, codec=None, database_name=None
+):
+    """Replace project documents with documents from json lines file.
+
+    Warnings:
+        Existing project collection is removed if exists in mongo.
+
+    Args:
+        project_name (str): Name of project.
+        filepath (str): Path to file created by 'export_project_documents'.
+        codec (Optional[str]): Codec used for compression of the file.
+        database_name (Optional[str]): Name of mongo database where project
+            collection will be created.
+
+    Returns:
+        int: Number of restored documents.
+    """
+
+    if codec is None:
+        codec = get_default_codec()
+
+    with open_codec_file(filepath, codec, "rt") as stream:
+        return replace_project_documents(
+            project_name, iter_documents_lines(stream), database_name
+        )
+
+
+def _iter_files(source_dir):
+    """Iterate over files in a directory in stable order.
 
     Args:
-        zip_stream (zipfile.ZipFile): Stream to a zipfile.
-        source_path (str): Path to a directory where files are.
-        root_path (str): Path to a directory which is used for calculation
-            of relative path.
+        source_dir (str): Path to a directory.
+
+    Returns:
+        Iterable[dict[str, Any]]: Relative path, size and modification time
+            of each file.
     """
 
-    for root, _, filenames in os.walk(source_path):
-        for filename in filenames:
+    for root, dirnames, filenames in os.walk(source_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
             filepath = os.path.join(root, filename)
-            # TODO add one more folder
-            archive_name = os.path.join(
-                PROJECT_FILES_DIR,
-                os.path.relpath(filepath, root_path)
+            stat = os.stat(filepath)
+            yield {
+                "path": os.path.relpath(
+                    filepath, source_dir).replace("\\", "/"),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+            }
+
+
+def _iter_archive_items(source_dir):
+    """Split files in a directory to archives.
+
+    Each archive has at most 'ARCHIVE_MAX_FILES' files and 'ARCHIVE_MAX_SIZE'
+    bytes unless a single file is bigger.
+    """
+
+    items = []
+    size = 0
+    for item in _iter_files(source_dir):
+        if items and (
+            len(items) >= ARCHIVE_MAX_FILES
+            or size + item["size"] > ARCHIVE_MAX_SIZE
+        ):
+            yield items
+            items = []
+            size = 0
+        items.append(item)
+        size += item["size"]
+
+    if items:
+        yield items
+
+
+def _get_archive_paths(files_dir, archive_name, codec):
+    archive_path = os.path.join(
+        files_dir, archive_name + ".tar" + CODEC_EXTENSIONS[codec]
+    )
+    manifest_path = os.path.join(files_dir, archive_name + ".json")
+    return archive_path, manifest_path
+
+
+def _is_archive_packed(archive_path, manifest_path, codec, items):
+    if not os.path.exists(archive_path) or not os.path.exists(manifest_path):
+        return None
+
+    try:
+        manifest = _read_json(manifest_path)
+    except ValueError:
+        return None
+
+    if manifest.get("codec") != codec:
+        return None
+
+    packed_items = manifest["files"]
+    if len(packed_items) != len(items):
+        return None
+
+    for packed_item, item in zip(packed_items, items):
+        for key in ("path", "size", "mtime"):
+            if packed_item[key] != item[key]:
+                return None
+    return packed_items
+
+
+def _pack_archive(source_dir, files_dir, archive_name, codec, items):
+    """Pack files to an archive and store manifest with their checksums.
+
+    Archive is reused if manifest of previous packing matches files.
+
+    Returns:
+        tuple[list[dict[str, Any]], bool]: Packed files with checksums and
+            if previously packed archive was reused.
+    """
+
+    archive_path, manifest_path = _get_archive_paths(
+        files_dir, archive_name, codec
+    )
+    packed_items = _is_archive_packed(
+        archive_path, manifest_path, codec, items
+    )
+    if packed_items is not None:
+        return packed_items, True
+
+    tmp_path = archive_path + ".tmp"
+    with open_codec_file(tmp_path, codec, "wb") as stream:
+        with tarfile.open(
+            fileobj=stream, mode="w|", dereference=True
+        ) as tar_stream:
+            for item in items:
+                filepath = os.path.join(source_dir, item["path"])
+                tarinfo = tar_stream.gettarinfo(filepath, item["path"])
+                with open(filepath, "rb") as file_stream:
+                    reader = _HashingReader(file_stream)
+                    tar_stream.addfile(tarinfo, reader)
+                item["size"] = tarinfo.size
+                item["sha256"] = reader.hexdigest()
+    os.replace(tmp_path, archive_path)
+
+    # Manifest is stored as last so archive is not reused when packing
+    #   was interrupted
+    _write_json(manifest_path, {"codec": codec, "files": items})
+    return items, False
+
+
+def pack_files(source_dir, files_dir, codec=None, max_workers=None):
+    """Pack files from a directory to compressed archives.
+
+    Files are split to multiple archives which are packed in threads. Each
+    archive has json manifest with relative paths, sizes, modification times
+    and checksums of the files. Archives which were already packed with
+    the same files are not packed again.
+
+    Args:
+        source_dir (str): Path to a directory with files.
+        files_dir (str): Path to a directory where archives are stored.
+        codec (Optional[str]): Codec used for compression.
+        max_workers (Optional[int]): Number of threads packing archives.
+
+    Returns:
+        dict[str, Any]: Names of archives, number of files, size of files
+            and number of reused archives.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    if codec is None:
+        codec = get_default_codec()
+
+    if codec not in CODEC_EXTENSIONS:
+        raise ValueError("Unknown codec \"{}\"".format(codec))
+
+    if not max_workers:
+        max_workers = DEFAULT_WORKERS
+
+    _create_dirs(files_dir)
+
+    archive_names = []
+    futures = []
+    with ThreadPoolExecutor(max_workers) as executor:
+        for idx, items in enumerate(_iter_archive_items(source_dir)):
+            archive_name = "{:0>5}".format(idx)
+            archive_names.append(archive_name)
+            futures.append(executor.submit(
+                _pack_archive,
+                source_dir, files_dir, archive_name, codec, items
+            ))
+
+        output = {
+            "archives": archive_names,
+            "files_count": 0,
+            "files_size": 0,
+            "reused": 0,
+        }
+        for future in futures:
+            items, reused = future.result()
+            output["files_count"] += len(items)
+            output["files_size"] += sum(item["size"] for item in items)
+            if reused:
+                output["reused"] += 1
+
+    # Remove archives from previous packing which are not used anymore
+    expected = set()
+    for archive_name in archive_names:
+        expected.update(
+            os.path.basename(path)
+            for path in _get_archive_paths(files_dir, archive_name, codec)
+        )
+    for filename in os.listdir(files_dir):
+        if filename not in expected:
+            os.remove(os.path.join(files_dir, filename))
+    return output
+
+
+def _unpack_archive(files_dir, archive_name, codec, destination_dir):
+    """Unpack files from an archive and validate their checksums.
+
+    Returns:
+        list[str]: Relative paths of files which are missing, are not
+            in manifest or have invalid checksum.
+    """
+
+    archive_path, manifest_path = _get_archive_paths(
+        files_dir, archive_name, codec
+    )
+    manifest = _read_json(manifest_path)
+    items_by_path = {
+        item["path"]: item
+        for item in manifest["files"]
+    }
+
+    invalid_paths = []
+    dst_root = os.path.join(os.path.normpath(destination_dir), "")
+    with open_codec_file(archive_path, codec, "rb") as stream:
+        with tarfile.open(fileobj=stream, mode="r|") as tar_stream:
+            for member in tar_stream:
+                if not member.isfile():
+                    continue
+
+                item = items_by_path.pop(member.name, None)
+                dst_path = os.path.normpath(
+                    os.path.join(destination_dir, member.name)
+                )
+                if item is None or not dst_path.startswith(dst_root):
+                    invalid_paths.append(member.name)
+                    continue
+
+                _create_dirs(os.path.dirname(dst_path))
+                reader = _HashingReader(tar_stream.extractfile(member))
+                with open(dst_path, "wb") as dst_stream:
+                    shutil.copyfileobj(reader, dst_stream)
+                os.utime(dst_path, (item["mtime"], item["mtime"]))
+
+                if reader.hexdigest() != item["sha256"]:
+                    invalid_paths.append(member.name)
+
+    invalid_paths.extend(items_by_path.keys())
+    return invalid_paths
+
+
+def unpack_files(
+    files_dir, destination_dir, archive_names, codec, max_workers=None
+):
+    """Unpack archives created by 'pack_files' to a directory.
+
+    Archives are unpacked in threads and checksums of unpacked files are
+    validated against manifests of archives.
+
+    Args:
+        files_dir (str): Path to a directory with archives.
+        destination_dir (str): Path to a directory where files are unpacked.
+        archive_names (list[str]): Names of archives to unpack.
+        codec (str): Codec used for compression of archives.
+        max_workers (Optional[int]): Number of threads unpacking archives.
+
+    Returns:
+        list[str]: Relative paths of files which are missing or are invalid.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not max_workers:
+        max_workers = DEFAULT_WORKERS
+
+    _create_dirs(destination_dir)
+    invalid_paths = []
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(
+                _unpack_archive,
+                files_dir, archive_name, codec, destination_dir
             )
-            zip_stream.write(filepath, archive_name)
+            for archive_name in archive_names
+        ]
+        for future in futures:
+            invalid_paths.extend(future.result())
+    return invalid_paths
 
 
 def pack_project(
     project_name,
     destination_dir=None,
     only_documents=False,
-    database_name=None
+    database_name=None,
+    codec=None,
+    max_workers=None,
 ):
     """Make a package of a project with mongo documents and files.
 
@@ -95,14 +545,21 @@ def pack_project(
     - project must have all templates starting with
         "{root[...]}/{project[name]}"
 
+    Package is a directory '{project_name}_backpack'. Packing continues with
+    already packed archives if package directory exists but packing did
+    not finish.
+
     Args:
         project_name (str): Project that should be packaged.
-        destination_dir (Optional[str]): Optional path where zip will be
+        destination_dir (Optional[str]): Optional path where package will be
             stored. Project's root is used if not passed.
         only_documents (Optional[bool]): Pack only Mongo documents and skip
             files.
         database_name (Optional[str]): Custom database name from which is
             project queried.
+        codec (Optional[str]): Codec used for compression. Fastest available
+            codec is used if not passed.
+        max_workers (Optional[int]): Number of threads packing files.
     """
 
     print("Creating package of project \"{}\"".format(project_name))
@@ -119,6 +576,14 @@ def pack_project(
             " when only documents should be packed."
         ))
 
+    if codec is None:
+        codec = get_default_codec()
+
+    if codec not in get_available_codecs():
+        raise ValueError("Codec \"{}\" is not available. Use one of {}".format(
+            codec, ", ".join(get_available_codecs())
+        ))
+
     root_path = None
     source_root = {}
     project_source_path = None
@@ -144,7 +609,7 @@ def pack_project(
         if not os.path.exists(project_source_path):
             raise ValueError("Didn't find source of project files")
 
-    # Determine zip filepath where data will be stored
+    # Determine directory where data will be stored
     if not destination_dir:
         destination_dir = root_path
 
@@ -154,55 +619,113 @@ def pack_project(
         )
 
     destination_dir = os.path.normpath(destination_dir)
-    if not os.path.exists(destination_dir):
-        os.makedirs(destination_dir)
+    package_dir = os.path.join(
+        destination_dir, "{}_backpack".format(project_name)
+    )
+    metadata_path = os.path.join(package_dir, METADATA_FILE_NAME + ".json")
 
-    zip_path = os.path.join(destination_dir, project_name + ".zip")
+    print("Project will be packaged into \"{}\"".format(package_dir))
+    # Rename already finished package, continue with unfinished package
+    if os.path.exists(metadata_path):
+        os.rename(package_dir, add_timestamp(package_dir))
+    elif os.path.exists(package_dir):
+        print("Continuing with unfinished package")
 
-    print("Project will be packaged into \"{}\"".format(zip_path))
-    # Rename already existing zip
-    if os.path.exists(zip_path):
-        dst_filepath = add_timestamp(zip_path)
-        os.rename(zip_path, dst_filepath)
+    _create_dirs(package_dir)
+
+    # Query all project documents and store them to json lines file
+    docs_filename = "{}.jsonl{}".format(
+        DOCUMENTS_FILE_NAME, CODEC_EXTENSIONS[codec]
+    )
+    print("Storing project documents")
+    docs_count = export_project_documents(
+        project_name,
+        os.path.join(package_dir, docs_filename),
+        codec,
+        database_name
+    )
+    print("Stored project documents ({})".format(docs_count))
+
+    files_info = {"archives": [], "files_count": 0, "files_size": 0}
+    if not only_documents:
+        print("Packing project files")
+        files_info = pack_files(
+            project_source_path,
+            os.path.join(package_dir, PROJECT_FILES_DIR),
+            codec,
+            max_workers
+        )
+        print("Packed {} files to {} archives ({} reused)".format(
+            files_info["files_count"],
+            len(files_info["archives"]),
+            files_info["reused"]
+        ))
 
-    # We can add more data
+    # Metadata are stored as last and mark finished package
     metadata = {
         "project_name": project_name,
         "root": source_root,
-        "version": 1
+        "version": BACKPACK_VERSION,
+        "codec": codec,
+        "documents": {
+            "filename": docs_filename,
+            "count": docs_count,
+        },
+        "files": {
+            "archives": files_info["archives"],
+            "count": files_info["files_count"],
+            "size": files_info["files_size"],
+        },
     }
-    # Create temp json file where metadata are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_metadata_json = s.name
+    _write_json(metadata_path, metadata)
 
-    with open(temp_metadata_json, "w") as stream:
-        json.dump(metadata, stream)
+    print("*** Packing finished ***")
 
-    # Create temp json file where database documents are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_docs_json = s.name
 
-    # Query all project documents and store them to temp json
-    store_project_documents(project_name, temp_docs_json, database_name)
+def _update_project_root(project_name, new_root, database_name):
+    """Change path of project root for current platform."""
 
-    print("Packing files into zip")
-    # Write all to zip file
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
-        # Add metadata file
-        zip_stream.write(temp_metadata_json, METADATA_FILE_NAME + ".json")
-        # Add database documents
-        zip_stream.write(temp_docs_json, DOCUMENTS_FILE_NAME + ".json")
+    project_doc = get_project_document(project_name, database_name)
+    roots = project_doc["config"]["roots"]
+    key = tuple(roots.keys())[0]
+    update_key = "config.roots.{}.{}".format(key, platform.system().lower())
+    collection = get_project_connection(project_name, database_name)
+    collection.update_one(
+        {"_id": project_doc["_id"]},
+        {"$set": {
+            update_key: new_root
+        }}
+    )
 
-        # Add project files to zip
-        if not only_documents:
-            _pack_files_to_zip(zip_stream, project_source_path, root_path)
 
-    print("Cleaning up")
-    # Cleanup
-    os.remove(temp_docs_json)
-    os.remove(temp_metadata_json)
+def _get_new_root(root_path, new_root):
+    # Skip change of root if is the same as the one stored in metadata
+    if (
+        new_root
+        and root_path
+        and (os.path.normpath(new_root) == os.path.normpath(root_path))
+    ):
+        return None
+    return new_root
 
-    print("*** Packing finished ***")
+
+def _prepare_project_files_dir(root_path, project_name):
+    """Path to project files directory, rename it if already exists."""
+
+    # Make sure root path exists
+    if not os.path.exists(root_path):
+        os.makedirs(root_path)
+
+    dst_project_files_dir = os.path.normpath(
+        os.path.join(root_path, project_name)
+    )
+    if os.path.exists(dst_project_files_dir):
+        new_path = add_timestamp(dst_project_files_dir)
+        print("Project folder already exists. Renamed \"{}\" -> \"{}\"".format(
+            dst_project_files_dir, new_path
+        ))
+        os.rename(dst_project_files_dir, new_path)
+    return dst_project_files_dir
 
 
 def _unpack_project_files(unzip_dir, root_path, project_name):
@@ -225,47 +748,19 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
     if not os.path.exists(src_project_files_dir):
         return
 
-    # Make sure root path exists
-    if not os.path.exists(root_path):
-        os.makedirs(root_path)
-
-    dst_project_files_dir = os.path.normpath(
-        os.path.join(root_path, project_name)
+    dst_project_files_dir = _prepare_project_files_dir(
+        root_path, project_name
     )
-    if os.path.exists(dst_project_files_dir):
-        new_path = add_timestamp(dst_project_files_dir)
-        print("Project folder already exists. Renamed \"{}\" -> \"{}\"".format(
-            dst_project_files_dir, new_path
-        ))
-        os.rename(dst_project_files_dir, new_path)
-
     print("Moving project files from temp \"{}\" -> \"{}\"".format(
         src_project_files_dir, dst_project_files_dir
     ))
     shutil.move(src_project_files_dir, dst_project_files_dir)
 
 
-def unpack_project(
-    path_to_zip, new_root=None, database_only=None, database_name=None
+def _unpack_project_zip(
+    path_to_zip, new_root, database_only, database_name
 ):
-    """Unpack project zip file to recreate project.
-
-    Args:
-        path_to_zip (str): Path to zip which was created using 'pack_project'
-            function.
-        new_root (str): Optional way how to set different root path for
-            unpacked project.
-        database_only (Optional[bool]): Unpack only database from zip.
-        database_name (str): Name of database where project will be recreated.
-    """
-
-    if database_only is None:
-        database_only = False
-
-    print("Unpacking project from zip {}".format(path_to_zip))
-    if not os.path.exists(path_to_zip):
-        print("Zip file does not exists: {}".format(path_to_zip))
-        return
+    """Unpack project from zip created by previous version of packing."""
 
     tmp_dir = tempfile.mkdtemp(prefix="unpack_")
     print("Zip is extracted to temp: {}".format(tmp_dir))
@@ -280,8 +775,7 @@ def unpack_project(
             zip_stream.extractall(tmp_dir)
 
     metadata_json_path = os.path.join(tmp_dir, METADATA_FILE_NAME + ".json")
-    with open(metadata_json_path, "r") as stream:
-        metadata = json.load(stream)
+    metadata = _read_json(metadata_json_path)
 
     docs_json_path = os.path.join(tmp_dir, DOCUMENTS_FILE_NAME + ".json")
     docs = load_json_file(docs_json_path)
@@ -294,32 +788,109 @@ def unpack_project(
     replace_project_documents(project_name, docs, database_name)
     print("Creating project documents ({})".format(len(docs)))
 
-    # Skip change of root if is the same as the one stored in metadata
-    if (
-        new_root
-        and (os.path.normpath(new_root) == os.path.normpath(root_path))
-    ):
-        new_root = None
-
+    new_root = _get_new_root(root_path, new_root)
     if new_root:
         print("Using different root path {}".format(new_root))
         root_path = new_root
-
-        project_doc = get_project_document(project_name)
-        roots = project_doc["config"]["roots"]
-        key = tuple(roots.keys())[0]
-        update_key = "config.roots.{}.{}".format(key, low_platform)
-        collection = get_project_connection(project_name, database_name)
-        collection.update_one(
-            {"_id": project_doc["_id"]},
-            {"$set": {
-                update_key: new_root
-            }}
-        )
+        _update_project_root(project_name, new_root, database_name)
 
     _unpack_project_files(tmp_dir, root_path, project_name)
 
     # CLeanup
     print("Cleaning up")
     shutil.rmtree(tmp_dir)
+
+
+def _unpack_project_package(
+    package_dir, new_root, database_only, database_name, max_workers
+):
+    """Unpack project from package directory created by 'pack_project'."""
+
+    metadata = _read_json(
+        os.path.join(package_dir, METADATA_FILE_NAME + ".json")
+    )
+    low_platform = platform.system().lower()
+    project_name = metadata["project_name"]
+    root_path = metadata["root"].get(low_platform)
+    codec = metadata["codec"]
+
+    # Drop existing collection
+    print("Creating project documents ({})".format(
+        metadata["documents"]["count"]
+    ))
+    import_project_documents(
+        project_name,
+        os.path.join(package_dir, metadata["documents"]["filename"]),
+        codec,
+        database_name
+    )
+
+    new_root = _get_new_root(root_path, new_root)
+    if new_root:
+        print("Using different root path {}".format(new_root))
+        root_path = new_root
+        _update_project_root(project_name, new_root, database_name)
+
+    archive_names = metadata["files"]["archives"]
+    if database_only or not archive_names:
+        return
+
+    dst_project_files_dir = _prepare_project_files_dir(
+        root_path, project_name
+    )
+    print("Unpacking project files ({}) to \"{}\"".format(
+        metadata["files"]["count"], dst_project_files_dir
+    ))
+    invalid_paths = unpack_files(
+        os.path.join(package_dir, PROJECT_FILES_DIR),
+        dst_project_files_dir,
+        archive_names,
+        codec,
+        max_workers
+    )
+    if invalid_paths:
+        for path in invalid_paths:
+            print("Invalid or missing file: {}".format(path))
+        raise RuntimeError(
+            "Package contains {} invalid or missing files.".format(
+                len(invalid_paths)
+            )
+        )
+
+
+def unpack_project(
+    path_to_zip,
+    new_root=None,
+    database_only=None,
+    database_name=None,
+    max_workers=None,
+):
+    """Unpack project package to recreate project.
+
+    Args:
+        path_to_zip (str): Path to package directory which was created using
+            'pack_project' function or to zip created by previous versions.
+        new_root (str): Optional way how to set different root path for
+            unpacked project.
+        database_only (Optional[bool]): Unpack only database from package.
+        database_name (str): Name of database where project will be recreated.
+        max_workers (Optional[int]): Number of threads unpacking files.
+    """
+
+    if database_only is None:
+        database_only = False
+
+    print("Unpacking project from {}".format(path_to_zip))
+    if not os.path.exists(path_to_zip):
+        print("Package does not exists: {}".format(path_to_zip))
+        return
+
+    if os.path.isdir(path_to_zip):
+        _unpack_project_package(
+            path_to_zip, new_root, database_only, database_name, max_workers
+        )
+    else:
+        _unpack_project_zip(
+            path_to_zip, new_root, database_only, database_name
+        )
     print("*** Unpack finished ***")
@@ -1,15 +1,21 @@
 import os
 import re
+import copy
+import shutil
+import hashlib
 import logging
 import json
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
+import multiprocessing
 
 import xml.etree.ElementTree
 
 from .execute import run_subprocess
+from .path_tools import create_hard_link
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
@@ -57,6 +63,14 @@ IMAGE_EXTENSIONS = {
     ".wbmp", ".webp", ".xr", ".xt", ".xbm", ".xcf", ".xpm", ".xwd"
 }
 
+# Maximum number of cached results of 'get_oiio_info_for_input'
+OIIO_INFO_CACHE_SIZE = 256
+# Directory where converted frames are cached (caching is disabled if empty)
+TRANSCODE_CACHE_DIR_ENV_KEY = "OPENPYPE_TRANSCODE_CACHE_DIR"
+
+_oiio_info_cache = collections.OrderedDict()
+_oiio_info_cache_lock = threading.Lock()
+
 VIDEO_EXTENSIONS = {
     ".3g2", ".3gp", ".amv", ".asf", ".avi", ".drc", ".f4a", ".f4b",
     ".f4p", ".f4v", ".flv", ".gif", ".gifv", ".m2v", ".m4p", ".m4v",
@@ -78,11 +92,55 @@ def get_transcode_temp_directory():
     )
 
 
+def _get_file_stat_key(filepath):
+    """Identifier of file content based on path, modification time and size.
+
+    Returns:
+        Union[tuple, None]: Key or None if file does not exist.
+    """
+
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return (os.path.abspath(filepath), stat.st_mtime, stat.st_size)
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Result is cached by file
+    path, modification time and size so the same file is not read
+    multiple times.
     """
+
+    cache_key = _get_file_stat_key(filepath)
+    if cache_key is not None:
+        cache_key += (subimages, )
+        with _oiio_info_cache_lock:
+            output = _oiio_info_cache.get(cache_key)
+            if output is not None:
+                # Move to the end as most recently used
+                _oiio_info_cache[cache_key] = _oiio_info_cache.pop(cache_key)
+                return copy.deepcopy(output)
+
+    output = _get_oiio_info_for_input(filepath, logger, subimages)
+    if cache_key is not None:
+        with _oiio_info_cache_lock:
+            _oiio_info_cache[cache_key] = output
+            while len(_oiio_info_cache) > OIIO_INFO_CACHE_SIZE:
+                _oiio_info_cache.popitem(last=False)
+    return copy.deepcopy(output)
+
+
+def clear_oiio_info_cache():
+    """Clear cached results of 'get_oiio_info_for_input'."""
+
+    with _oiio_info_cache_lock:
+        _oiio_info_cache.clear()
+
+
+def _get_oiio_info_for_input(filepath, logger, subimages):
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -656,10 +714,90 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_transcode_cache_path(cache_dir, input_path, cache_args):
+    """Path to cached converted file.
+
+    Cached file is identified by input path, its modification time and
+    size, and by conversion arguments.
+
+    Returns:
+        Union[str, None]: Path to cached file or None if input file does not
+            exist.
+    """
+
+    stat_key = _get_file_stat_key(input_path)
+    if stat_key is None:
+        return None
+    key_data = json.dumps([list(stat_key), cache_args])
+    cache_key = hashlib.sha1(key_data.encode("utf-8")).hexdigest()
+    return os.path.join(
+        cache_dir,
+        cache_key[:2],
+        cache_key + os.path.splitext(input_path)[1]
+    )
+
+
+def _link_or_copy_file(src_path, dst_path):
+    try:
+        create_hard_link(src_path, dst_path)
+    except (OSError, NotImplementedError):
+        shutil.copyfile(src_path, dst_path)
+
+
+def _convert_input_path_for_ffmpeg(
+    input_path, output_path, oiio_cmd, oiio_args, cache_dir, cache_args,
+    logger
+):
+    cache_path = None
+    if cache_dir:
+        cache_path = _get_transcode_cache_path(
+            cache_dir, input_path, cache_args
+        )
+
+    if cache_path and os.path.exists(cache_path):
+        logger.debug("Using cached conversion: {}".format(cache_path))
+        _link_or_copy_file(cache_path, output_path)
+        return
+
+    oiio_cmd = list(oiio_cmd)
+    oiio_cmd.extend(oiio_args[:1])
+    oiio_cmd.append(input_path)
+    oiio_cmd.extend(oiio_args[1:])
+    # Add last argument - path to output
+    oiio_cmd.extend(["-o", output_path])
+
+    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+    run_subprocess(oiio_cmd, logger=logger)
+
+    if not cache_path:
+        return
+
+    # Store converted file to cache
+    cache_subdir = os.path.dirname(cache_path)
+    tmp_cache_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        if not os.path.exists(cache_subdir):
+            os.makedirs(cache_subdir)
+        _link_or_copy_file(output_path, tmp_cache_path)
+        if os.path.exists(cache_path):
+            # Converted by other process in the meantime
+            os.remove(tmp_cache_path)
+        else:
+            os.rename(tmp_cache_path, cache_path)
+    except OSError:
+        logger.debug(
+            "Failed to cache converted file {}".format(output_path),
+            exc_info=True
+        )
+        if os.path.exists(tmp_cache_path):
+            os.remove(tmp_cache_path)
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,12 +810,19 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Files are converted concurrently in chunks of frames. Converted files
+    are cached in directory defined by 'OPENPYPE_TRANSCODE_CACHE_DIR'
+    environment variable, if is set, so repeated conversion of unchanged
+    input is not processed again.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of concurrently running
+            conversions. Number of CPUs is used if not passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -706,65 +851,108 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = get_oiio_tool_args(
-            "oiiotool",
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+    # Prepare subprocess arguments
+    oiio_cmd = get_oiio_tool_args(
+        "oiiotool",
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    )
+    # Add input compression if available
+    if compression:
+        oiio_cmd.extend(["--compression", compression])
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
+    # Arguments which are same for all input paths
+    #   - input path is added after first argument
+    oiio_args = [
+        input_arg,
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
-
-        # Add last argument - path to output
-        base_filename = os.path.basename(input_path)
-        output_path = os.path.join(output_dir, base_filename)
-        oiio_cmd.extend([
-            "-o", output_path
-        ])
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            oiio_args.extend(["--eraseattrib", attr_name])
+
+    cache_dir = os.environ.get(TRANSCODE_CACHE_DIR_ENV_KEY)
+    # Conversion arguments used to identify cached files
+    cache_args = [compression] + oiio_args
+
+    cpu_count = multiprocessing.cpu_count()
+    if not max_workers or max_workers < 1:
+        max_workers = cpu_count
+    max_workers = min(max_workers, len(input_paths))
+    if max_workers > 1:
+        # Split available CPUs between concurrently running conversions
+        oiio_cmd.extend(["--threads", str(max(1, cpu_count // max_workers))])
+
+    def convert_chunk(chunk_paths):
+        for input_path in chunk_paths:
+            output_path = os.path.join(
+                output_dir, os.path.basename(input_path)
+            )
+            _convert_input_path_for_ffmpeg(
+                input_path,
+                output_path,
+                oiio_cmd,
+                oiio_args,
+                cache_dir,
+                cache_args,
+                logger
+            )
+
+    if max_workers <= 1:
+        convert_chunk(input_paths)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Split frames to chunks of following frames, few chunks per worker
+    #   so workers are balanced when some frames take longer
+    chunk_size = max(1, len(input_paths) // (max_workers * 4))
+    chunks = [
+        input_paths[idx:idx + chunk_size]
+        for idx in range(0, len(input_paths), chunk_size)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(convert_chunk, chunk)
+            for chunk in chunks
+        ]
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
 
 
 # FFMPEG functions
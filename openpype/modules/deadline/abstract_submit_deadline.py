@@ -457,6 +457,7 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
         self.log.info("Using {} for render/export.".format(file_path))
 
         self.job_info = self.get_job_info()
+        self.add_env_snapshot_var(self.job_info)
         self.plugin_info = self.get_plugin_info()
         self.aux_files = self.get_aux_files()
 
@@ -468,6 +469,7 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             self.log.info("Splitting export and render in two jobs")
             self.log.info("Export job id: %s", job_id)
             render_job_info = self.get_job_info(dependency_job_ids=[job_id])
+            self.add_env_snapshot_var(render_job_info)
             render_plugin_info = self.get_plugin_info(job_type="render")
             payload = self.assemble_payload(
                 job_info=render_job_info,
@@ -476,6 +478,17 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             render_job_id = self.submit(payload)
             self.log.info("Render job id: %s", render_job_id)
 
+    def add_env_snapshot_var(self, job_info):
+        """Pass directory of environment snapshot to render job.
+
+        Args:
+            job_info (DeadlineJobInfo): Job info of submitted job.
+        """
+        snapshot_dir = self._instance.context.data.get("envSnapshotDir")
+        environment = job_info.EnvironmentKeyValue
+        if snapshot_dir and environment.get("OPENPYPE_RENDER_JOB") == "1":
+            environment["OPENPYPE_ENV_SNAPSHOT"] = snapshot_dir
+
     def process_submission(self):
         """Process data for submission.
 
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Collect directory of farm environment snapshot."""
+import pyblish.api
+
+from openpype import AYON_SERVER_ENABLED
+from openpype.lib.env_snapshots import get_env_snapshot_dir
+
+
+class CollectEnvSnapshot(pyblish.api.ContextPlugin):
+    """Collect directory of environment snapshot for render jobs.
+
+    Directory is passed to render jobs in 'OPENPYPE_ENV_SNAPSHOT'
+    environment variable. 'GlobalJobPreLoad' on Deadline reuses environments
+    stored in it instead of starting OpenPype process on each task.
+
+    Snapshots are enabled only if 'OPENPYPE_ENV_SNAPSHOTS_ROOT' is set.
+    """
+
+    order = pyblish.api.CollectorOrder + 0.4
+    label = "Collect Farm Environment Snapshot"
+    targets = ["local"]
+
+    def process(self, context):
+        if AYON_SERVER_ENABLED:
+            return
+
+        context_keys = (
+            context.data.get("projectName"),
+            context.data.get("asset"),
+            context.data.get("task"),
+            context.data.get("appName"),
+        )
+        if not all(context_keys):
+            self.log.debug(
+                "Context is not complete, skipping environment snapshot."
+            )
+            return
+
+        snapshot_dir = get_env_snapshot_dir(*context_keys, env_group="farm")
+        if snapshot_dir:
+            self.log.debug(
+                "Environment snapshot directory: {}".format(snapshot_dir)
+            )
+            context.data["envSnapshotDir"] = snapshot_dir
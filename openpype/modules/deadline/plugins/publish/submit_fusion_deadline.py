@@ -248,6 +248,10 @@ class FusionSubmitDeadline(
 
         environment[render_job_label] = "1"
 
+        env_snapshot_dir = instance.context.data.get("envSnapshotDir")
+        if env_snapshot_dir:
+            environment["OPENPYPE_ENV_SNAPSHOT"] = env_snapshot_dir
+
         payload["JobInfo"].update({
             "EnvironmentKeyValue%d" % index: "{key}={value}".format(
                 key=key,
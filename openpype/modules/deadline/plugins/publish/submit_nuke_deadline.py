@@ -414,6 +414,10 @@ class NukeSubmitDeadline(pyblish.api.InstancePlugin,
 
         environment[render_job_label] = "1"
 
+        env_snapshot_dir = instance.context.data.get("envSnapshotDir")
+        if env_snapshot_dir:
+            environment["OPENPYPE_ENV_SNAPSHOT"] = env_snapshot_dir
+
         # finally search replace in values of any key
         if self.env_search_replace_values:
             for key, value in environment.items():
@@ -23,6 +23,22 @@ VERSION_REGEX = re.compile(
     r"(?:\+(?P<buildmetadata>[a-zA-Z\d\-.]*))?"
 )
 
+# Environments which identify user or contain credentials must never be
+#   stored to environment snapshot shared between jobs of all users
+PRIVATE_ENV_KEYS = {
+    "FTRACK_API_USER",
+    "FTRACK_API_KEY",
+    "OPENPYPE_USERNAME",
+    "OPENPYPE_MONGO",
+    "AYON_API_KEY",
+    "USER",
+    "USERNAME",
+    "LOGNAME",
+}
+PRIVATE_ENV_KEY_REGEX = re.compile(
+    r"(API_KEY|PASSWORD|PASSWD|SECRET|TOKEN|CREDENTIAL)", re.IGNORECASE
+)
+
 
 class OpenPypeVersion:
     """Fake semver version class for OpenPype version purposes.
@@ -286,6 +302,235 @@ def get_requested_openpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def extract_openpype_environment(deadlinePlugin, job, exe):
+    """Run OpenPype process to extract environments of job context.
+
+    Returns:
+        dict[str, str]: Environments for rendering process.
+    """
+    # tempfile.TemporaryFile cannot be used because of locking
+    temp_file_name = "{}_{}.json".format(
+        datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
+        str(uuid.uuid1())
+    )
+    export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
+    print(">>> Temporary path: {}".format(export_url))
+
+    args = [
+        "--headless",
+        "extractenvironments",
+        export_url
+    ]
+
+    add_kwargs = {
+        "project": job.GetJobEnvironmentKeyValue("AVALON_PROJECT"),
+        "asset": job.GetJobEnvironmentKeyValue("AVALON_ASSET"),
+        "task": job.GetJobEnvironmentKeyValue("AVALON_TASK"),
+        "app": job.GetJobEnvironmentKeyValue("AVALON_APP_NAME"),
+        "envgroup": "farm"
+    }
+
+    if job.GetJobEnvironmentKeyValue('IS_TEST'):
+        args.append("--automatic-tests")
+
+    if all(add_kwargs.values()):
+        for key, value in add_kwargs.items():
+            args.extend(["--{}".format(key), value])
+    else:
+        raise RuntimeError((
+            "Missing required env vars: AVALON_PROJECT, AVALON_ASSET,"
+            " AVALON_TASK, AVALON_APP_NAME"
+        ))
+
+    openpype_mongo = job.GetJobEnvironmentKeyValue("OPENPYPE_MONGO")
+    if openpype_mongo:
+        # inject env var for OP extractenvironments
+        # SetEnvironmentVariable is important, not SetProcessEnv...
+        deadlinePlugin.SetEnvironmentVariable("OPENPYPE_MONGO",
+                                              openpype_mongo)
+
+    if not os.environ.get("OPENPYPE_MONGO"):
+        print(">>> Missing OPENPYPE_MONGO env var, process won't work")
+
+    os.environ["AVALON_TIMEOUT"] = "5000"
+
+    args_str = subprocess.list2cmdline(args)
+    print(">>> Executing: {} {}".format(exe, args_str))
+    process_exitcode = deadlinePlugin.RunProcess(
+        exe, args_str, os.path.dirname(exe), -1
+    )
+
+    if process_exitcode != 0:
+        raise RuntimeError(
+            "Failed to run OpenPype process to extract environments."
+        )
+
+    print(">>> Loading file ...")
+    with open(export_url) as fp:
+        contents = json.load(fp)
+
+    print(">>> Removing temporary file")
+    os.remove(export_url)
+
+    return contents
+
+
+def get_env_snapshot_path(job):
+    """Path to environment snapshot of job for current platform.
+
+    Snapshot directory is set on submission in 'OPENPYPE_ENV_SNAPSHOT'.
+
+    Returns:
+        Union[str, None]: Path to snapshot file or None if job does not use
+            snapshots.
+    """
+    snapshot_dir = job.GetJobEnvironmentKeyValue("OPENPYPE_ENV_SNAPSHOT")
+    if not snapshot_dir:
+        return None
+    return os.path.join(
+        snapshot_dir, "{}.json".format(platform.system().lower())
+    )
+
+
+def _is_private_env_key(key):
+    return key in PRIVATE_ENV_KEYS or bool(PRIVATE_ENV_KEY_REGEX.search(key))
+
+
+def _get_job_environment(job):
+    return {
+        key: job.GetJobEnvironmentKeyValue(key)
+        for key in job.GetJobEnvironmentKeys()
+    }
+
+
+def _get_env_extension(base_value, value):
+    """Prefix and suffix added to value by OpenPype.
+
+    Values like 'PATH' are extended by paths separated with 'os.pathsep'.
+    Only added parts are stored to snapshot so value of other machine
+    is kept.
+
+    Returns:
+        Union[tuple[str, str], None]: Prefix and suffix or None if value
+            is not extension of base value.
+    """
+    if not base_value:
+        return None
+    idx = value.find(base_value)
+    if idx < 0:
+        return None
+    prefix = value[:idx]
+    suffix = value[idx + len(base_value):]
+    if prefix and not prefix.endswith(os.pathsep):
+        return None
+    if suffix and not suffix.startswith(os.pathsep):
+        return None
+    return prefix, suffix
+
+
+def _get_reference_env(base_env, job_env):
+    """Environments to which snapshot changes are related.
+
+    Environments of the job are applied on top of environments of this
+    process, e.g. 'PATH' or 'NUKE_PATH' of the job are extended by OpenPype.
+    """
+    reference_env = dict(base_env)
+    reference_env.update(job_env)
+    return reference_env
+
+
+def save_env_snapshot(snapshot_path, exe, base_env, env, job_env):
+    """Store environments as changes of environments of the job.
+
+    Changes are related to environments of this process with environments
+    of the job applied on top of them. Snapshot is reused by following tasks
+    of jobs of any user with the same snapshot path so environments with
+    credentials or user identity are not stored. Failure to store the
+    snapshot does not fail the job.
+    """
+    reference_env = _get_reference_env(base_env, job_env)
+    snapshot = {
+        "executable": exe,
+        "set": {},
+        "extend": {},
+        "unset": [
+            key
+            for key in reference_env
+            if key not in env and not _is_private_env_key(key)
+        ]
+    }
+    for key, value in env.items():
+        if _is_private_env_key(key):
+            continue
+        reference_value = reference_env.get(key)
+        if value == reference_value:
+            continue
+        extension = _get_env_extension(reference_value, value)
+        if extension:
+            snapshot["extend"][key] = extension
+        else:
+            snapshot["set"][key] = value
+
+    print(">>> Storing environment snapshot {}".format(snapshot_path))
+    try:
+        snapshot_dir = os.path.dirname(snapshot_path)
+        if not os.path.exists(snapshot_dir):
+            os.makedirs(snapshot_dir)
+        # Write to temp file first so other tasks never read partial file
+        temp_path = "{}.{}.tmp".format(snapshot_path, uuid.uuid4().hex)
+        with open(temp_path, "w") as stream:
+            json.dump(snapshot, stream)
+        os.replace(temp_path, snapshot_path)
+    except Exception as exc:
+        print("!!! Failed to store environment snapshot: {}".format(exc))
+
+
+def load_env_snapshot(snapshot_path, exe, job_env):
+    """Environments for rendering process from snapshot.
+
+    Environments of the job are applied to environments of this process
+    and snapshot changes are applied on top of them.
+
+    Returns:
+        Union[dict[str, str], None]: Environments or None if snapshot is
+            not available.
+    """
+    if not snapshot_path or not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path) as stream:
+            snapshot = json.load(stream)
+    except Exception as exc:
+        print("!!! Failed to read environment snapshot: {}".format(exc))
+        return None
+
+    if snapshot.get("executable") != exe:
+        print(">>> Environment snapshot was created by other executable")
+        return None
+
+    print(">>> Using environment snapshot {}".format(snapshot_path))
+    env = _get_reference_env(os.environ, job_env)
+    for key in snapshot["unset"]:
+        if not _is_private_env_key(key):
+            env.pop(key, None)
+    env.update(
+        (key, value)
+        for key, value in snapshot["set"].items()
+        if not _is_private_env_key(key)
+    )
+    for key, (prefix, suffix) in snapshot["extend"].items():
+        if _is_private_env_key(key):
+            continue
+        value = env.get(key)
+        if value:
+            env[key] = prefix + value + suffix
+            continue
+        parts = [prefix.rstrip(os.pathsep), suffix.lstrip(os.pathsep)]
+        env[key] = os.pathsep.join(part for part in parts if part)
+    return env
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -321,66 +566,16 @@ def inject_openpype_environment(deadlinePlugin):
 
         print("--- OpenPype executable: {}".format(exe))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
-        args = [
-            "--headless",
-            "extractenvironments",
-            export_url
-        ]
-
-        add_kwargs = {
-            "project": job.GetJobEnvironmentKeyValue("AVALON_PROJECT"),
-            "asset": job.GetJobEnvironmentKeyValue("AVALON_ASSET"),
-            "task": job.GetJobEnvironmentKeyValue("AVALON_TASK"),
-            "app": job.GetJobEnvironmentKeyValue("AVALON_APP_NAME"),
-            "envgroup": "farm"
-        }
-
-        if job.GetJobEnvironmentKeyValue('IS_TEST'):
-            args.append("--automatic-tests")
-
-        if all(add_kwargs.values()):
-            for key, value in add_kwargs.items():
-                args.extend(["--{}".format(key), value])
-        else:
-            raise RuntimeError((
-                "Missing required env vars: AVALON_PROJECT, AVALON_ASSET,"
-                " AVALON_TASK, AVALON_APP_NAME"
-            ))
-
-        openpype_mongo = job.GetJobEnvironmentKeyValue("OPENPYPE_MONGO")
-        if openpype_mongo:
-            # inject env var for OP extractenvironments
-            # SetEnvironmentVariable is important, not SetProcessEnv...
-            deadlinePlugin.SetEnvironmentVariable("OPENPYPE_MONGO",
-                                                  openpype_mongo)
-
-        if not os.environ.get("OPENPYPE_MONGO"):
-            print(">>> Missing OPENPYPE_MONGO env var, process won't work")
-
-        os.environ["AVALON_TIMEOUT"] = "5000"
-
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
-        )
-
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run OpenPype process to extract environments."
-            )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
+        snapshot_path = get_env_snapshot_path(job)
+        job_env = _get_job_environment(job)
+        contents = load_env_snapshot(snapshot_path, exe, job_env)
+        if contents is None:
+            base_env = dict(os.environ)
+            contents = extract_openpype_environment(deadlinePlugin, job, exe)
+            if snapshot_path:
+                save_env_snapshot(
+                    snapshot_path, exe, base_env, contents, job_env
+                )
 
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
@@ -397,9 +592,6 @@ def inject_openpype_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
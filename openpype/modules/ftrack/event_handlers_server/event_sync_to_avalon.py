@@ -4,6 +4,7 @@ import json
 import time
 import datetime
 import atexit
+import threading
 import traceback
 
 from bson.objectid import ObjectId
@@ -78,6 +79,15 @@ class SyncToAvalonEvent(BaseEvent):
     created_entities = []
     report_splitter = {"type": "label", "value": "---"}
 
+    # Events which came in this time window (in seconds) are synchronized
+    #   together, in one pass per project. Value '0' disables coalescing.
+    # - events are marked as processed by event hub before they are
+    #   synchronized, so events waiting in the window are lost if the
+    #   processor is killed
+    coalesce_window = 0
+    # Pending events are synchronized right away when they reach this count
+    coalesce_max_events = 500
+
     def __init__(self, session):
         '''Expects a ftrack_api.Session instance'''
         # Debug settings
@@ -92,6 +102,13 @@ class SyncToAvalonEvent(BaseEvent):
         self.dbcon = AvalonMongoDB()
         # Set processing session to not use global
         self.set_process_session(session)
+
+        self._pending_events = []
+        self._pending_timer = None
+        self._pending_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        # Don't lose events waiting in coalescing window on exit
+        atexit.register(self.process_pending_events)
         super().__init__(session)
 
     def debug_logs(self):
@@ -597,10 +614,12 @@ class SyncToAvalonEvent(BaseEvent):
     def launch(self, session, event):
         """
             Main entry port for synchronization.
-            Goes through event (can contain multiple changes) and decides if
-            the event is interesting for us (interest_entTypes).
-            It separates changes into add|remove|update.
-            All task changes are handled together by refresh from Ftrack.
+            Events are collected for 'coalesce_window' seconds and then
+            merged and synchronized together (see 'merge_events').
+            Events which change auto sync of project or remove project
+            are synchronized right away after pending events.
+            Collected events are not passed to handlers with lower priority
+            until they are synchronized (see 'process_pending_events').
         Args:
             session (object): session to Ftrack
             event (dictionary): event content
@@ -608,6 +627,288 @@ class SyncToAvalonEvent(BaseEvent):
         Returns:
             (boolean or None)
         """
+        if self.coalesce_window <= 0 or self._is_coalesce_boundary(event):
+            self.process_pending_events()
+            with self._process_lock:
+                return self.sync_event(session, event)
+
+        with self._pending_lock:
+            self._pending_events.append(event)
+            process_now = (
+                len(self._pending_events) >= self.coalesce_max_events
+            )
+            if not process_now and self._pending_timer is None:
+                self._pending_timer = threading.Timer(
+                    self.coalesce_window, self.process_pending_events
+                )
+                self._pending_timer.daemon = True
+                self._pending_timer.start()
+
+        # Handlers with lower priority, e.g. synchronization of links,
+        #   expect that entities are already synchronized
+        event.stop()
+        if process_now:
+            self.process_pending_events()
+        return True
+
+    def _is_coalesce_boundary(self, event):
+        for ent_info in event["data"].get("entities") or []:
+            if ent_info.get("entityType") != "show":
+                continue
+            changes = ent_info.get("changes") or {}
+            if (
+                ent_info.get("action") == "remove"
+                or CUST_ATTR_AUTO_SYNC in changes
+            ):
+                return True
+        return False
+
+    def process_pending_events(self):
+        """Synchronize events collected in coalescing window.
+
+        Called from timer thread, so processing session is used instead of
+        session of event hub. Collected events are passed to handlers with
+        lower priority after synchronization.
+
+        Errors of synchronization are logged as warnings and are not raised,
+        because there is no event hub callback to propagate them to. Failure
+        of one merged event does not stop synchronization of other projects.
+        """
+        with self._process_lock:
+            with self._pending_lock:
+                events = self._pending_events
+                self._pending_events = []
+                if self._pending_timer is not None:
+                    self._pending_timer.cancel()
+                    self._pending_timer = None
+
+            if not events:
+                return
+
+            merged_events = self.merge_events(events)
+            self.log.debug("Synchronizing {} events in {} passes".format(
+                len(events), len(merged_events)
+            ))
+            for merged_event in merged_events:
+                try:
+                    self.sync_event(self.process_session, merged_event)
+                except Exception:
+                    self.log.warning(
+                        "Synchronization of events failed", exc_info=True
+                    )
+
+            self._launch_dependent_handlers(events)
+
+    def _launch_dependent_handlers(self, events):
+        """Pass events to handlers with lower priority.
+
+        Events were stopped in 'launch' so event hub did not pass them to
+        following subscribers.
+        """
+        subscribers = sorted(
+            (
+                subscriber
+                for subscriber in self.session.event_hub._subscribers
+                if subscriber.priority > self.priority
+            ),
+            key=lambda subscriber: subscriber.priority
+        )
+        for event in events:
+            event._stopped = False
+            for subscriber in subscribers:
+                if not subscriber.interested_in(event):
+                    continue
+                try:
+                    subscriber.callback(event)
+                except Exception:
+                    self.log.warning(
+                        "Handler {} failed to process event {}".format(
+                            subscriber, event["id"]
+                        ),
+                        exc_info=True
+                    )
+                if event.is_stopped():
+                    break
+
+    @staticmethod
+    def _get_event_project_id(event):
+        for ent_info in event["data"].get("entities") or []:
+            if ent_info.get("entityType") == "show":
+                return ent_info.get("entityId")
+            for parent in ent_info.get("parents") or []:
+                if parent.get("entityType") == "show":
+                    return parent.get("entityId")
+        return None
+
+    @staticmethod
+    def _merge_entity_changes(ent_info, new_ent_info):
+        """Merge changes of same entity and action from later event.
+
+        Keeps 'old' value from first change and 'new' value from last one.
+        """
+        keys = ent_info.setdefault("keys", [])
+        changes = ent_info.setdefault("changes", {})
+        for key in new_ent_info.get("keys") or []:
+            if key not in keys:
+                keys.append(key)
+
+        for key, change in (new_ent_info.get("changes") or {}).items():
+            prev_change = changes.get(key)
+            if prev_change is not None:
+                change = dict(change)
+                change["old"] = prev_change.get("old")
+            changes[key] = change
+
+        for key, value in new_ent_info.items():
+            if key not in ("keys", "changes"):
+                ent_info[key] = value
+
+    def merge_events(self, events):
+        """Merge events to one event per project.
+
+        Repeated updates or moves of an entity are merged into one entity
+        info. Updates and moves of added entities are skipped because added
+        entities are synchronized with current values from ftrack. Entities
+        which were added and removed in the same window are skipped too.
+        Task changes are kept as they are because they only mark parents
+        which have to refresh tasks.
+
+        Args:
+            events (list[ftrack_api.event.base.Event]): Events in order in
+                which they were received.
+
+        Returns:
+            list[ftrack_api.event.base.Event]: Merged events in order of
+                first event of each project.
+        """
+        events_by_project_id = collections.OrderedDict()
+        for event in events:
+            project_id = self._get_event_project_id(event)
+            events_by_project_id.setdefault(project_id, []).append(event)
+
+        output = []
+        for project_events in events_by_project_id.values():
+            infos_by_key = collections.OrderedDict()
+            for event in project_events:
+                for ent_info in event["data"].get("entities") or []:
+                    for _ent_info in self._split_move_info(ent_info):
+                        self._merge_entity_info(infos_by_key, _ent_info)
+
+            entities_info = []
+            for infos_by_action in infos_by_key.values():
+                for action, ent_info in infos_by_action.items():
+                    if action == "update":
+                        ent_info = self._remove_reverted_changes(ent_info)
+                    if ent_info is not None:
+                        entities_info.append(ent_info)
+
+            last_event = project_events[-1]
+            event_data = dict(last_event["data"])
+            event_data["entities"] = entities_info
+            output.append(ftrack_api.event.base.Event(
+                topic=last_event["topic"],
+                data=event_data,
+                source=last_event.get("source")
+            ))
+        return output
+
+    @staticmethod
+    def _split_move_info(ent_info):
+        """Separate update of other keys from move of entity."""
+        ent_info = copy.deepcopy(ent_info)
+        keys = ent_info.get("keys") or []
+        if ent_info.get("action") != "move" or len(keys) < 2:
+            return [ent_info]
+
+        changes = ent_info.get("changes") or {}
+        update_info = copy.deepcopy(ent_info)
+        update_info["action"] = "update"
+        update_info["keys"] = [key for key in keys if key != "parent_id"]
+        update_info["changes"] = {
+            key: value
+            for key, value in changes.items()
+            if key != "parent_id"
+        }
+        ent_info["keys"] = ["parent_id"]
+        ent_info["changes"] = {}
+        if "parent_id" in changes:
+            ent_info["changes"]["parent_id"] = changes["parent_id"]
+        return [ent_info, update_info]
+
+    def _merge_entity_info(self, infos_by_key, ent_info):
+        ftrack_id = ent_info.get("entityId")
+        entity_type = ent_info.get("entity_type") or ""
+        if (
+            not isinstance(ftrack_id, str)
+            or entity_type.lower() == "task"
+        ):
+            # Keep as is
+            infos_by_key[object()] = {None: ent_info}
+            return
+
+        action = ent_info.get("action")
+        infos_by_action = infos_by_key.get(ftrack_id)
+        if infos_by_action is None:
+            infos_by_key[ftrack_id] = {action: ent_info}
+            return
+
+        if "add" in infos_by_action:
+            # Added entity is synchronized from current state in ftrack
+            if action == "remove":
+                infos_by_key.pop(ftrack_id)
+            return
+
+        if action == "remove":
+            infos_by_action.clear()
+            infos_by_action[action] = ent_info
+            return
+
+        if "remove" in infos_by_action:
+            return
+
+        prev_ent_info = infos_by_action.get(action)
+        if prev_ent_info is None:
+            infos_by_action[action] = ent_info
+        else:
+            self._merge_entity_changes(prev_ent_info, ent_info)
+
+    @staticmethod
+    def _remove_reverted_changes(ent_info):
+        changes = ent_info.get("changes") or {}
+        reverted_keys = {
+            key
+            for key, change in changes.items()
+            if "old" in change and change.get("old") == change.get("new")
+        }
+        if not reverted_keys:
+            return ent_info
+
+        ent_info["keys"] = [
+            key
+            for key in ent_info.get("keys") or []
+            if key not in reverted_keys
+        ]
+        for key in reverted_keys:
+            changes.pop(key)
+        if not ent_info["keys"]:
+            return None
+        return ent_info
+
+    def sync_event(self, session, event):
+        """Synchronize changes from event to avalon.
+
+        Goes through event (can contain multiple changes) and decides if
+        the event is interesting for us (interest_entTypes).
+        It separates changes into add|remove|update.
+        All task changes are handled together by refresh from Ftrack.
+
+        Args:
+            session (ftrack_api.Session): Session to ftrack.
+            event (ftrack_api.event.base.Event): Event to synchronize.
+
+        Returns:
+            bool: Always True.
+        """
         # Try to commit and if any error happen then recreate session
         try:
             self.process_session.commit()
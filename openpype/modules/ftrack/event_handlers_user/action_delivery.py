@@ -20,9 +20,7 @@ from openpype.pipeline import Anatomy
 from openpype.pipeline.load import get_representation_path_with_anatomy
 from openpype.pipeline.delivery import (
     get_format_dict,
-    check_destination_path,
-    deliver_single_file,
-    deliver_sequence,
+    DeliveryPlanner,
 )
 
 
@@ -517,7 +515,6 @@ class Delivery(BaseAction):
 
     def real_launch(self, session, entities, event):
         self.log.info("Delivery action just started.")
-        report_items = collections.defaultdict(list)
 
         values = event["data"]["values"]
 
@@ -556,6 +553,13 @@ class Delivery(BaseAction):
         format_dict = get_format_dict(anatomy, location_path)
 
         datetime_data = get_datetime_data()
+        planner = DeliveryPlanner(
+            anatomy,
+            anatomy_name,
+            format_dict,
+            datetime_data,
+            self.log
+        )
         for repre in repres_to_deliver:
             source_path = repre.get("data", {}).get("path")
             debug_msg = "Processing representation {}".format(repre["_id"])
@@ -564,15 +568,6 @@ class Delivery(BaseAction):
             self.log.debug(debug_msg)
 
             anatomy_data = copy.deepcopy(repre["context"])
-            repre_report_items = check_destination_path(repre["_id"],
-                                                        anatomy,
-                                                        anatomy_data,
-                                                        datetime_data,
-                                                        anatomy_name)
-
-            if repre_report_items:
-                report_items.update(repre_report_items)
-                continue
 
             # Get source repre path
             frame = repre['context'].get('frame')
@@ -583,22 +578,19 @@ class Delivery(BaseAction):
             repre_path = get_representation_path_with_anatomy(repre, anatomy)
             # TODO add backup solution where root of path from component
             # is replaced with root
-            args = (
-                repre_path,
-                repre,
-                anatomy,
-                anatomy_name,
-                anatomy_data,
-                format_dict,
-                report_items,
-                self.log
-            )
             if not frame:
-                deliver_single_file(*args)
+                planner.add_file(repre_path, repre, anatomy_data)
             else:
-                deliver_sequence(*args)
-
-        return self.report(report_items)
+                planner.add_sequence(repre_path, repre, anatomy_data)
+
+        report = planner.execute()
+        self.log.info((
+            "Delivered {} files, {} files were already delivered,"
+            " {} different files already existed."
+        ).format(
+            len(report.delivered), len(report.skipped), len(report.existing)
+        ))
+        return self.report(report.to_report_items())
 
     def report(self, report_items):
         """Returns dict with final status of delivery (success, fail etc.)."""
@@ -60,7 +60,10 @@ class FtrackServer:
         self.session.close()
         self.session = None
 
-    def set_files(self, paths):
+    def set_files(self, paths, session=None):
+        if session is None:
+            session = self.session
+
         # Iterate all paths
         register_functions = []
         for path in paths:
@@ -105,7 +108,7 @@ class FtrackServer:
 
         for filepath, register_func in register_functions:
             try:
-                register_func(self.session)
+                register_func(session)
             except Exception:
                 self.log.warning(
                     "\"{}\" - register was not successful".format(filepath),
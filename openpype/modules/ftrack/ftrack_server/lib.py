@@ -111,16 +111,103 @@ class StorerEventHub(SocketBaseEventHub):
         )
 
 
+def get_event_shard_key(event):
+    """Key used to decide which processing thread handles the event.
+
+    Events of one project (or entity if project is not known) have the same
+    key so they're processed in order in which they were stored.
+
+    Args:
+        event (ftrack_api.event.base.Event): Ftrack event.
+
+    Returns:
+        Union[str, None]: Project or entity id. None if event does not
+            contain any entity.
+    """
+
+    data = event.get("data") or {}
+    entities_info = data.get("entities") or data.get("selection") or []
+    for entity_info in entities_info:
+        if entity_info.get("entityType") == "show":
+            return entity_info.get("entityId")
+        for parent in entity_info.get("parents") or []:
+            if parent.get("entityType") == "show":
+                return parent.get("entityId")
+
+    for entity_info in entities_info:
+        entity_id = entity_info.get("entityId")
+        if entity_id:
+            return entity_id
+    return None
+
+
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by event storer.
+
+    Stored events are processed by 'process_workers' threads. Events are
+    sharded by project id (see 'get_event_shard_key') so events of one
+    project are always processed by the same thread in order. Processing
+    is sequential by default. Number of threads can be changed with
+    'OPENPYPE_FTRACK_EVENT_WORKERS' environment variable.
+
+    Event handlers keep state on their instances and use session of event
+    hub, so each additional thread processes events with own session with
+    own registered event handlers. The session is created by
+    'shard_session_factory', events are processed in one thread if it is
+    not set.
+
+    Processed events are marked in Mongo in batches and old processed
+    events are removed periodically.
+    """
+
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Number of threads processing events
+    process_workers = 1
+    # Max number of loaded events which were not processed yet
+    max_pending_events = 100
+    # Interval in which processed events are marked in Mongo
+    processed_flush_interval = 1
+    # Interval and age of processed events cleanup
+    cleanup_interval = 60 * 60
+    cleanup_age = datetime.timedelta(days=3)
+    # Interval in which metrics are updated and logged
+    metrics_interval = 60
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        workers = os.environ.get("OPENPYPE_FTRACK_EVENT_WORKERS")
+        if workers:
+            self.process_workers = max(int(workers), 1)
+
+        # Callable creating session with registered event handlers for
+        #   additional processing threads
+        self.shard_session_factory = None
+
+        self._shard_queues = []
+        self._shard_threads = []
+        self._shard_sessions = []
+        self._pending_lock = threading.Lock()
+        # Stored date of loaded events by mongo id
+        self._pending_events = {}
+        # Processed mongo ids which were not marked in Mongo yet
+        self._processed_ids = []
+        self._last_flush = 0
+        self._last_cleanup = 0
+        self._last_metrics = 0
+
+        self._metrics = {
+            "stored_events": 0,
+            "pending_events": 0,
+            "processed_events": 0,
+            "lag_seconds": 0.0,
+        }
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
@@ -145,58 +232,224 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def get_metrics(self):
+        """Metrics of event processing.
+
+        Returns:
+            dict[str, Union[int, float]]: Number of events waiting in Mongo
+                ('stored_events', updated in 'metrics_interval'), loaded
+                events which were not processed yet ('pending_events'),
+                processed events since start ('processed_events') and time
+                between storing and processing of last processed event
+                ('lag_seconds').
+        """
+
+        with self._pending_lock:
+            return dict(self._metrics)
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when there is space in processing
+        queues. Handled events are set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
-        while True:
-            try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+        self._start_shard_threads()
+        try:
+            while True:
                 try:
-                    self._handle(event)
+                    self._process_maintenance()
+                except pymongo.errors.AutoReconnect:
+                    self.pypelog.error((
+                        "Mongo server \"{}\" is not responding, exiting."
+                    ).format(os.environ["OPENPYPE_MONGO"]))
+                    sys.exit(0)
 
+                try:
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if not self.load_events():
+                        time.sleep(0.5)
+                else:
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
+                    if mongo_id is not None:
+                        self._dispatch_event(event)
                         continue
 
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
+                    self._handle(event)
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        break
+
+                if duration is not None:
+                    if (time.time() - started) > duration:
+                        break
+        finally:
+            self._stop_shard_threads()
+            try:
+                self._flush_processed()
+            except pymongo.errors.AutoReconnect:
+                pass
+
+    def _start_shard_threads(self):
+        if self._shard_threads:
+            return
+
+        process_workers = self.process_workers
+        if process_workers > 1 and self.shard_session_factory is None:
+            self.pypelog.warning((
+                "Sessions for {} processing threads can't be created."
+                " Events are processed in one thread."
+            ).format(process_workers))
+            process_workers = 1
+
+        for idx in range(process_workers):
+            event_hub = self
+            if idx > 0:
+                shard_session = self.shard_session_factory()
+                self._shard_sessions.append(shard_session)
+                event_hub = shard_session.event_hub
+
+            shard_queue = queue.Queue()
+            thread = threading.Thread(
+                target=self._process_shard,
+                args=(shard_queue, event_hub),
+                name="FtrackEventShard{}".format(idx)
+            )
+            thread.daemon = True
+            thread.start()
+            self._shard_queues.append(shard_queue)
+            self._shard_threads.append(thread)
+
+    def _stop_shard_threads(self):
+        for shard_queue in self._shard_queues:
+            shard_queue.put(None)
+
+        for thread in self._shard_threads:
+            thread.join()
+
+        for shard_session in self._shard_sessions:
+            shard_session.close()
+        self._shard_queues = []
+        self._shard_threads = []
+        self._shard_sessions = []
+
+    def _dispatch_event(self, event):
+        shard_key = get_event_shard_key(event)
+        shard_idx = 0
+        if shard_key is not None:
+            shard_idx = hash(shard_key) % len(self._shard_queues)
+        self._shard_queues[shard_idx].put(event)
+
+    def _process_shard(self, shard_queue, event_hub):
+        while True:
+            event = shard_queue.get()
+            if event is None:
+                break
+
+            try:
+                if event_hub is self:
+                    self._handle(event)
+                else:
+                    # Event hub of shard session is not connected
+                    event_hub._handle(event, synchronous=True)
+            except Exception:
+                self.pypelog.warning(
+                    "Failed to process event {}".format(event["id"]),
+                    exc_info=True
+                )
+
+            mongo_id = event["data"]["_event_mongo_id"]
+            now = datetime.datetime.utcnow()
+            with self._pending_lock:
+                stored = self._pending_events.pop(mongo_id, None)
+                self._processed_ids.append(mongo_id)
+                self._metrics["processed_events"] += 1
+                if stored is not None:
+                    self._metrics["lag_seconds"] = (
+                        (now - stored).total_seconds()
                     )
 
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
+    def _process_maintenance(self):
+        now = time.time()
+        with self._pending_lock:
+            processed_count = len(self._processed_ids)
+
+        if processed_count and (
+            processed_count >= self.max_pending_events
+            or (now - self._last_flush) > self.processed_flush_interval
+        ):
+            self._flush_processed()
+
+        if (now - self._last_cleanup) > self.cleanup_interval:
+            self._last_cleanup = now
+            self.cleanup_processed_events()
+
+        if (now - self._last_metrics) > self.metrics_interval:
+            self._last_metrics = now
+            self._update_metrics()
+
+    def _flush_processed(self):
+        """Mark processed events in Mongo with one request."""
+        self._last_flush = time.time()
+        with self._pending_lock:
+            processed_ids = self._processed_ids
+            self._processed_ids = []
+
+        if not processed_ids:
+            return
 
-            if duration is not None:
-                if (time.time() - started) > duration:
-                    break
+        self.dbcon.bulk_write(
+            [
+                pymongo.UpdateOne(
+                    {"_id": mongo_id},
+                    {"$set": {"pype_data.is_processed": True}}
+                )
+                for mongo_id in processed_ids
+            ],
+            ordered=False
+        )
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+    def cleanup_processed_events(self):
+        """Remove old processed events from Mongo."""
+        ago_date = datetime.datetime.utcnow() - self.cleanup_age
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
-        not_processed_events = self.dbcon.find(
+    def _update_metrics(self):
+        stored_events = self.dbcon.count_documents(
             {"pype_data.is_processed": False}
-        ).sort(
+        )
+        with self._pending_lock:
+            self._metrics["stored_events"] = stored_events
+            self._metrics["pending_events"] = len(self._pending_events)
+            metrics = dict(self._metrics)
+
+        self.pypelog.debug((
+            "Events in queue: {stored_events}, pending: {pending_events},"
+            " processed: {processed_events}, lag: {lag_seconds:.1f}s"
+        ).format(**metrics))
+
+    def load_events(self):
+        """Load not processed events sorted by stored date"""
+        with self._pending_lock:
+            pending_ids = list(self._pending_events.keys())
+            # Processed events which are not yet marked in Mongo
+            skip_ids = pending_ids + self._processed_ids
+
+        limit = self.max_pending_events - len(pending_ids)
+        if limit <= 0:
+            return False
+
+        query = {"pype_data.is_processed": False}
+        if skip_ids:
+            query["_id"] = {"$nin": skip_ids}
+
+        not_processed_events = self.dbcon.find(query).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+        ).limit(limit)
 
         found = False
         for event_data in not_processed_events:
@@ -213,6 +466,10 @@ class ProcessEventHub(SocketBaseEventHub):
                     event_data
                 ))
                 continue
+
+            stored = (event_data.get("pype_data") or {}).get("stored")
+            with self._pending_lock:
+                self._pending_events[event_data["_id"]] = stored
             found = True
             self._event_queue.put(event)
 
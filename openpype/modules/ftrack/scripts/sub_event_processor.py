@@ -48,6 +48,12 @@ def send_status(event):
             ["OpenPype build version", get_build_version() or "N/A"]
         ]
     }
+    metrics = session.event_hub.get_metrics()
+    new_event_data["status_info"].extend([
+        ["Events in queue", str(metrics["stored_events"])],
+        ["Processed events", str(metrics["processed_events"])],
+        ["Processing lag", "{:.1f}s".format(metrics["lag_seconds"])]
+    ])
 
     new_event = ftrack_api.event.base.Event(
         topic="openpype.event.server.status.result",
@@ -91,6 +97,13 @@ def main(args):
         server = FtrackServer(
             ftrack_module.server_event_handlers_paths
         )
+
+        def create_shard_session():
+            shard_session = ftrack_api.Session(auto_connect_event_hub=False)
+            server.set_files(server.handler_paths, shard_session)
+            return shard_session
+
+        session.event_hub.shard_session_factory = create_shard_session
         log.debug("Launched Ftrack Event processor")
         server.run_server(session)
 
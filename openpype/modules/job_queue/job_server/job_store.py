@@ -0,0 +1,121 @@
+import os
+import json
+import sqlite3
+import threading
+
+import appdirs
+
+
+class JobStore:
+    """Storage of jobs which keeps them between server restarts.
+
+    Base implementation does not store anything. Job data are stored as
+    json serializable dictionaries created by 'Job.to_data'.
+    """
+
+    def load_jobs(self):
+        """Stored jobs in order in which they were created.
+
+        Returns:
+            list[dict]: Data of stored jobs.
+        """
+        return []
+
+    def save_job(self, job_data):
+        """Create or update stored job.
+
+        Args:
+            job_data (dict): Data of job from 'Job.to_data'.
+        """
+        pass
+
+    def remove_jobs(self, job_ids):
+        """Remove jobs from storage.
+
+        Args:
+            job_ids (Iterable[str]): Ids of jobs to remove.
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class SQLiteJobStore(JobStore):
+    """Jobs stored in SQLite database file.
+
+    Args:
+        filepath (Optional[str]): Path to database file. Path from
+            'get_default_filepath' is used if not passed.
+    """
+
+    def __init__(self, filepath=None):
+        if filepath is None:
+            filepath = self.get_default_filepath()
+
+        dirpath = os.path.dirname(filepath)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        # Connection is created in main thread but used in server thread
+        self._connection = sqlite3.connect(filepath, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " queue_order INTEGER NOT NULL,"
+            " content TEXT NOT NULL"
+            ")"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def get_default_filepath():
+        """Default path to database file.
+
+        Can be changed with 'OPENPYPE_JOB_QUEUE_DB' environment variable.
+        """
+        filepath = os.environ.get("OPENPYPE_JOB_QUEUE_DB")
+        if filepath:
+            return filepath
+        return os.path.join(
+            appdirs.user_data_dir("openpype", "pypeclub"),
+            "job_queue.sqlite"
+        )
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def load_jobs(self):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT content FROM jobs ORDER BY queue_order"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save_job(self, job_data):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (id, queue_order, content)"
+                " VALUES (?, ?, ?)",
+                (job_data["id"], job_data["queue_order"], json.dumps(job_data))
+            )
+            self._connection.commit()
+
+    def remove_jobs(self, job_ids):
+        job_ids = [(job_id, ) for job_id in job_ids]
+        if not job_ids:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "DELETE FROM jobs WHERE id = ?", job_ids
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
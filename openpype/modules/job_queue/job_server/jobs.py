@@ -1,17 +1,35 @@
+import heapq
 import datetime
 import collections
 from uuid import uuid4
 
+from .job_store import JobStore
+
+
+def _timestamp(value):
+    if value is None:
+        return None
+    return (value - datetime.datetime(1970, 1, 1)).total_seconds()
+
+
+def _from_timestamp(value):
+    if value is None:
+        return None
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=value)
+
 
 class Job:
     """Job related to specific host name.
 
-    Data must contain everything needed to finish the job.
+    Data must contain everything needed to finish the job. Jobs with higher
+    priority are assigned to workers first.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self, host_name, data, job_id=None, created_time=None, priority=0
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
@@ -22,6 +40,9 @@ class Job:
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = priority
+        # Order of job in queue, set by 'JobQueue'
+        self.queue_order = 0
         self._result_data = None
 
         self._started = False
@@ -32,6 +53,46 @@ class Job:
 
         self._worker = None
 
+    def to_data(self):
+        """Json serializable data of job for 'JobStore'."""
+        return {
+            "id": self._id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "priority": self.priority,
+            "queue_order": self.queue_order,
+            "created_time": _timestamp(self._created_time),
+            "done_time": _timestamp(self._done_time),
+            "done": self._done,
+            "errored": self._errored,
+            "message": self._message,
+            "result": self._result_data,
+            "deleted": self._deleted,
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        """Create job from data stored by 'JobStore'.
+
+        Jobs which were not done are restored as waiting.
+        """
+        job = cls(
+            data["host_name"],
+            data["data"],
+            job_id=data["id"],
+            created_time=_from_timestamp(data["created_time"]),
+            priority=data["priority"]
+        )
+        job.queue_order = data["queue_order"]
+        job._deleted = data["deleted"]
+        if data["done"]:
+            job._done = True
+            job._done_time = _from_timestamp(data["done_time"])
+            job._errored = data["errored"]
+            job._message = data["message"]
+            job._result_data = data["result"]
+        return job
+
     def keep_in_memory(self):
         if self._done_time is None:
             return True
@@ -125,18 +186,91 @@ class Job:
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Jobs are assigned by priority and then in
+    order in which they were created. Amount of jobs running at the same
+    time can be limited per host name.
+
+    Args:
+        store (Optional[JobStore]): Storage of jobs, jobs are kept only in
+            memory if not passed.
+        host_concurrency_limits (Optional[dict[str, int]]): Maximum number
+            of jobs running at the same time by host name.
     """
     old_jobs_check_minutes_interval = 30
+    # Jobs of host without workers are not errored during this time after
+    #   start so workers can reconnect after restart of server
+    missing_workers_grace_seconds = 30
 
-    def __init__(self):
-        self._last_old_jobs_check = datetime.datetime.now()
+    def __init__(self, store=None, host_concurrency_limits=None):
+        if store is None:
+            store = JobStore()
+        now = datetime.datetime.now()
+        self._started_time = now
+        self._last_old_jobs_check = now
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        # Heap of (-priority, queue order, job) by host name
+        self._job_queue_by_host_name = collections.defaultdict(list)
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._host_concurrency_limits = dict(host_concurrency_limits or {})
+        self._store = store
+        self._change_callbacks = []
+        self._next_queue_order = 0
+
+        self._restore_jobs()
+
+    def _restore_jobs(self):
+        for job_data in self._store.load_jobs():
+            job = Job.from_data(job_data)
+            self._jobs_by_id[job.id] = job
+            self._next_queue_order = max(
+                self._next_queue_order, job.queue_order + 1
+            )
+            if not job.done and not job.deleted:
+                self._push_job(job)
+
+        if self._jobs_by_id:
+            print("Restored {} jobs".format(len(self._jobs_by_id)))
+
+    def add_change_callback(self, callback):
+        """Callback called when jobs can be assigned to workers.
+
+        It is called when job is created or finished and when worker is
+        added or removed.
+        """
+        self._change_callbacks.append(callback)
+
+    def _notify_change(self):
+        for callback in self._change_callbacks:
+            callback()
+
+    def set_host_concurrency_limit(self, host_name, limit):
+        """Set maximum number of jobs of host running at the same time.
+
+        Args:
+            host_name (str): Name of host.
+            limit (Union[int, None]): Limit, jobs are not limited if is
+                'None' or '0'.
+        """
+        self._host_concurrency_limits[host_name] = limit
+        self._notify_change()
+
+    def _push_job(self, job):
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (-job.priority, job.queue_order, job)
+        )
+
+    def _pop_job(self, host_name):
+        jobs = self._job_queue_by_host_name[host_name]
+        while jobs:
+            job = heapq.heappop(jobs)[-1]
+            if not job.deleted:
+                return job
+        return None
+
+    def _save_job(self, job):
+        self._store.save_job(job.to_data())
 
     def workers(self):
         """All currently registered workers."""
@@ -147,6 +281,7 @@ class JobQueue:
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        self._notify_change()
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
@@ -158,8 +293,9 @@ class JobQueue:
             # Reset job
             job.set_worker(None)
             job.reset()
-            # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            # Add job back to queue, it keeps its original order
+            self._push_job(job)
+            self._save_job(job)
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
@@ -168,6 +304,7 @@ class JobQueue:
             self._workers_by_host_name[host_name].remove(worker)
 
         print("Removed worker for \"{}\"".format(host_name))
+        self._notify_change()
 
     def assign_jobs(self):
         """Try to assign job for each idle worker.
@@ -175,28 +312,43 @@ class JobQueue:
         Error all jobs without needed worker.
         """
         available_host_names = set()
+        running_by_host_name = collections.Counter()
+        for worker in self._workers_by_id.values():
+            if not worker.is_idle():
+                running_by_host_name[worker.host_name] += 1
+
         for worker in self._workers_by_id.values():
             host_name = worker.host_name
             available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
+            if not worker.is_idle():
+                continue
+
+            limit = self._host_concurrency_limits.get(host_name)
+            if limit and running_by_host_name[host_name] >= limit:
+                continue
+
+            job = self._pop_job(host_name)
+            if job is not None:
+                worker.set_current_job(job)
+                running_by_host_name[host_name] += 1
 
+        delta = datetime.datetime.now() - self._started_time
+        if delta.total_seconds() >= self.missing_workers_grace_seconds:
+            self._error_jobs_without_workers(available_host_names)
+        self._remove_old_jobs()
+
+    def _error_jobs_without_workers(self, available_host_names):
         for host_name in tuple(self._job_queue_by_host_name.keys()):
             if host_name in available_host_names:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
-                    job.set_done(False, message)
-        self._remove_old_jobs()
+            while True:
+                job = self._pop_job(host_name)
+                if job is None:
+                    break
+                job.set_done(False, message)
+                self._save_job(job)
 
     def get_jobs(self):
         return self._jobs_by_id.values()
@@ -206,22 +358,46 @@ class JobQueue:
         return self._jobs_by_id.get(job_id)
 
     def create_job(self, host_name, job_data):
-        """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
+        """Create new job from passed data and add it to queue.
+
+        Priority of job can be defined with "priority" key in job data.
+        """
+        job = Job(host_name, job_data, priority=job_data.get("priority") or 0)
+        job.queue_order = self._next_queue_order
+        self._next_queue_order += 1
         self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
+        self._push_job(job)
+        self._save_job(job)
+        self._notify_change()
         return job
 
+    def finish_job(self, worker_id, job_id, success, message, data):
+        """Worker finished job."""
+        worker = self.get_worker(worker_id)
+        if worker is not None:
+            worker.set_current_job(None)
+
+        job = self.get_job(job_id)
+        if job is not None:
+            job.set_done(success, message, data)
+            self._save_job(job)
+        self._notify_change()
+
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        now = datetime.datetime.now()
+        delta = now - self._last_old_jobs_check
+        if delta.total_seconds() < self.old_jobs_check_minutes_interval * 60:
             return
+        self._last_old_jobs_check = now
 
+        removed_job_ids = []
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                removed_job_ids.append(job_id)
+        self._store.remove_jobs(removed_job_ids)
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -231,6 +407,7 @@ class JobQueue:
 
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        self._store.remove_jobs([job.id])
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
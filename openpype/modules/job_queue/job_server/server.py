@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from .jobs import JobQueue
+from .job_store import SQLiteJobStore
 from .job_queue_route import JobQueueResource
 from .workers_rpc_route import WorkerRpc
 
@@ -13,15 +14,23 @@ log = logging.getLogger(__name__)
 
 class WebServerManager:
     """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    def __init__(
+        self, port, host, loop=None, job_store=None,
+        host_concurrency_limits=None
+    ):
         self.port = port
         self.host = host
         self.app = web.Application()
         if loop is None:
             loop = asyncio.new_event_loop()
 
+        if job_store is None:
+            job_store = SQLiteJobStore()
+
         # add route with multiple methods for single "external app"
-        self.webserver_thread = WebServerThread(self, loop)
+        self.webserver_thread = WebServerThread(
+            self, loop, job_store, host_concurrency_limits
+        )
 
     @property
     def url(self):
@@ -61,7 +70,9 @@ class WebServerManager:
 
 class WebServerThread(threading.Thread):
     """ Listener for requests in thread."""
-    def __init__(self, manager, loop):
+    def __init__(
+        self, manager, loop, job_store=None, host_concurrency_limits=None
+    ):
         super(WebServerThread, self).__init__()
 
         self._is_running = False
@@ -71,7 +82,8 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        job_queue = JobQueue(job_store, host_concurrency_limits)
+        self.job_queue = job_queue
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -120,3 +120,8 @@ class Worker:
 
     def set_working(self):
         self._state = WorkerState.JOB_SENT
+
+    def set_not_working(self):
+        """Job was not accepted by worker and should be sent again."""
+        if self._job is not None:
+            self._state = WorkerState.JOB_ASSIGNED
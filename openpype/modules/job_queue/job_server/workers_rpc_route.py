@@ -10,6 +10,12 @@ from .workers import Worker
 
 
 class WorkerRpc(JsonRpc):
+    # Jobs are dispatched immediately when job queue changes, this interval
+    #   is used to check dead connections and jobs sent to busy workers
+    dispatch_interval = 5
+    # Dispatch only each 'dispatch_interval' seconds if disabled
+    event_dispatch = True
+
     def __init__(self, job_queue, manager, **kwargs):
         super().__init__(**kwargs)
 
@@ -17,6 +23,10 @@ class WorkerRpc(JsonRpc):
         self._manager = manager
 
         self._stopped = False
+        # Event is created in server loop
+        self._dispatch_event = None
+        if self.event_dispatch:
+            job_queue.add_change_callback(self._on_job_queue_change)
 
         # Register methods
         self.add_methods(
@@ -35,41 +45,68 @@ class WorkerRpc(JsonRpc):
         self._job_queue.add_worker(worker)
         return worker.id
 
+    def _on_job_queue_change(self):
+        # Changes are made from server loop so event can be set directly
+        if self._dispatch_event is not None:
+            self._dispatch_event.set()
+
     async def _rpc_loop(self):
+        self._dispatch_event = asyncio.Event()
         while self.loop.is_running():
             if self._stopped:
                 break
 
+            self._dispatch_event.clear()
             for worker in tuple(self._job_queue.workers()):
                 if not worker.connection_is_alive():
                     self._job_queue.remove_worker(worker)
             self._job_queue.assign_jobs()
 
             await self.send_jobs()
-            await asyncio.sleep(5)
+            try:
+                await asyncio.wait_for(
+                    self._dispatch_event.wait(), self.dispatch_interval
+                )
+            except asyncio.TimeoutError:
+                pass
 
     async def job_done(self, worker_id, job_id, success, message, data):
-        worker = self._job_queue.get_worker(worker_id)
-        if worker is not None:
-            worker.set_current_job(None)
-
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.finish_job(worker_id, job_id, success, message, data)
         return True
 
-    async def send_jobs(self):
-        invalid_workers = []
-        for worker in self._job_queue.workers():
-            if worker.job_assigned() and not worker.is_working():
-                try:
-                    await worker.send_job()
+    async def _send_job(self, worker):
+        # Mark job as sent so it's not sent again while waiting for response
+        worker.set_working()
+        job = worker.current_job
+        accepted = await worker.send_job()
+        if (
+            not accepted
+            and worker.current_job is job
+            and worker.is_working()
+        ):
+            # Worker is busy, try to send the job again later
+            worker.set_not_working()
 
-                except ConnectionResetError:
-                    invalid_workers.append(worker)
+    async def send_jobs(self):
+        workers = [
+            worker
+            for worker in self._job_queue.workers()
+            if worker.job_assigned() and not worker.is_working()
+        ]
+        if not workers:
+            return
 
-        for worker in invalid_workers:
-            self._job_queue.remove_worker(worker)
+        results = await asyncio.gather(
+            *[self._send_job(worker) for worker in workers],
+            return_exceptions=True
+        )
+        for worker, result in zip(workers, results):
+            if isinstance(result, ConnectionResetError):
+                self._job_queue.remove_worker(worker)
+            elif isinstance(result, Exception):
+                self.logger.warning(
+                    "Failed to send job to worker", exc_info=result
+                )
 
     async def handle_websocket_request(self, http_request):
         """Override this method to catch CLOSING messages."""
@@ -27,6 +27,10 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- maximum number of jobs running at the same time can be limited per host
+    e.g. '--host_limit tvpaint=2'
+- jobs are stored to SQLite database so they are not lost on restart, path
+    to database can be changed with 'OPENPYPE_JOB_QUEUE_DB' env variable
 
 ### start_worker
 - start worker which will process jobs
@@ -164,10 +168,10 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, host_concurrency_limits=None):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, host_concurrency_limits)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -226,8 +230,20 @@ def cli_main():
 )
 @click_wrap.option("--port", help="Server port")
 @click_wrap.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click_wrap.option(
+    "--host_limit",
+    multiple=True,
+    help=(
+        "Maximum number of running jobs of a host e.g. \"tvpaint=2\"."
+        " Can be used multiple times."
+    )
+)
+def cli_start_server(port, host, host_limit):
+    host_concurrency_limits = {}
+    for item in host_limit:
+        host_name, limit = item.split("=", 1)
+        host_concurrency_limits[host_name.strip()] = int(limit)
+    JobQueueModule.start_server(port, host, host_concurrency_limits)
 
 
 @cli_main.command(
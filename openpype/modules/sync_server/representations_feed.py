@@ -0,0 +1,174 @@
+"""Incremental discovery of representations which should be synced."""
+import time
+
+from pymongo.errors import PyMongoError
+
+from openpype.lib import Logger
+
+
+class SyncRepresentationsFeed(object):
+    """
+        Keeps in memory index of representations which should be synced
+        for one project and pair of sites.
+
+        Full scan of the project is done on first call, on demand and
+        periodically each 'full_scan_interval' seconds. Between full scans
+        only these representations are queried:
+            - created or changed in the project, received from Mongo change
+              stream
+            - explicitly invalidated by 'invalidate', e.g. after sync
+              status was changed by this process
+
+        Change streams are available only if database is a replica set.
+        Changes made by other processes can't be detected without them, so
+        full scan is done on each call in that case.
+
+    Args:
+        query_func (callable): Function returning representations which
+            should be synced. Receives additional match filter or None for
+            full scan.
+        collection (pymongo.collection.Collection): Project collection used
+            for change stream.
+        full_scan_interval (int): Seconds between full scans.
+        use_change_stream (bool): Try to use Mongo change stream.
+    """
+    def __init__(self, query_func, collection, full_scan_interval=600,
+                 use_change_stream=True):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._query_func = query_func
+        self._collection = collection
+        self._full_scan_interval = full_scan_interval
+        self._use_change_stream = use_change_stream
+
+        self._representations = {}
+        self._last_full_scan = None
+        self._full_scan_requested = True
+        self._invalidated_ids = set()
+        self._change_stream = None
+
+    def invalidate(self, representation_ids=None):
+        """
+            Mark representations to be queried again on next call.
+
+        Args:
+            representation_ids (Iterable[ObjectId]): Changed representations,
+                full scan is requested if not passed.
+        """
+        if representation_ids is None:
+            self._full_scan_requested = True
+        else:
+            self._invalidated_ids.update(representation_ids)
+
+    def get_representations(self):
+        """
+            Representations which should be synced.
+
+        Returns:
+            (list) of dictionaries sorted by priority and '_id' same as
+                full query
+        """
+        full_scan_needed = (
+            self._full_scan_requested
+            or self._last_full_scan is None
+            # Changes of other processes can be found only by full scan
+            or self._change_stream is None
+            or (
+                time.time() - self._last_full_scan
+                > self._full_scan_interval
+            )
+        )
+        if not full_scan_needed:
+            changed_ids = self._pop_changed_ids()
+            # Change stream failed, changes could be missed
+            if changed_ids is None:
+                full_scan_needed = True
+
+        if full_scan_needed:
+            self._full_scan()
+        else:
+            self._incremental_scan(changed_ids)
+
+        return sorted(
+            self._representations.values(),
+            key=lambda repre: (-repre["priority"], repre["_id"])
+        )
+
+    def _full_scan(self):
+        self._full_scan_requested = False
+        self._invalidated_ids = set()
+        # Open change stream before query so changes made during query
+        #   are not missed
+        self._close_change_stream()
+        self._open_change_stream()
+
+        self._last_full_scan = time.time()
+        self._representations = {
+            repre["_id"]: repre
+            for repre in self._query_func(None)
+        }
+        self.log.debug("Full scan found {} representations".format(
+            len(self._representations)
+        ))
+
+    def _incremental_scan(self, changed_ids):
+        if not changed_ids:
+            return
+
+        for repre_id in changed_ids:
+            self._representations.pop(repre_id, None)
+
+        repres = list(self._query_func({"_id": {"$in": list(changed_ids)}}))
+        for repre in repres:
+            self._representations[repre["_id"]] = repre
+        self.log.debug((
+            "Incremental scan of {} changed representations found {}"
+        ).format(len(changed_ids), len(repres)))
+
+    def _pop_changed_ids(self):
+        """
+            Invalidated representation ids and ids from change stream.
+
+        Returns:
+            (set) of ids or None if change stream failed
+        """
+        changed_ids = self._invalidated_ids
+        self._invalidated_ids = set()
+        try:
+            while True:
+                change = self._change_stream.try_next()
+                if change is None:
+                    break
+                changed_ids.add(change["documentKey"]["_id"])
+
+        except PyMongoError:
+            self.log.debug("Change stream failed", exc_info=True)
+            self._close_change_stream()
+            return None
+        return changed_ids
+
+    def _open_change_stream(self):
+        if not self._use_change_stream:
+            return
+
+        try:
+            self._change_stream = self._collection.watch(
+                [{"$match": {
+                    "operationType": {"$in": ["insert", "update", "replace"]}
+                }}]
+            )
+        except PyMongoError:
+            # Change streams are available only for replica sets
+            self.log.debug(
+                "Change streams are not available, using full scans",
+                exc_info=True
+            )
+            self._use_change_stream = False
+            self._change_stream = None
+
+    def _close_change_stream(self):
+        if self._change_stream is not None:
+            try:
+                self._change_stream.close()
+            except PyMongoError:
+                pass
+            self._change_stream = None
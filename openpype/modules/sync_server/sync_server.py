@@ -1,7 +1,10 @@
 """Python 3 only implementation."""
 import os
 import asyncio
+import itertools
 import threading
+import contextlib
+import collections
 import concurrent.futures
 from time import sleep
 
@@ -43,8 +46,38 @@ async def upload(module, project_name, file, representation, provider_name,
         preset (dictionary): site config ('credentials_url', 'root'...)
 
     """
-    # create ids sequentially, upload file in parallel later
-    with module.lock:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None,
+                                      upload_file,
+                                      module,
+                                      project_name,
+                                      file,
+                                      representation,
+                                      provider_name,
+                                      remote_site_name,
+                                      tree,
+                                      preset,
+                                      module.lock
+                                      )
+
+
+def upload_file(module, project_name, file, representation, provider_name,
+                remote_site_name, tree=None, preset=None, lock=None):
+    """
+        Synchronous implementation of 'upload'.
+
+        Creation of provider and of target folder is done under 'lock', as
+        only single thread can modify structure on 'remote_site'.
+        Upload of file itself can run in parallel.
+
+    Args:
+        lock (threading.Lock): lock guarding structure of 'remote_site'
+        Rest of arguments is same as for 'upload'.
+
+    Returns:
+        (string) - id of uploaded file from provider
+    """
+    with lock or contextlib.nullcontext():
         # this part modifies structure on 'remote_site', only single
         # thread can do that at a time, upload/download to prepared
         # structure should be run in parallel
@@ -68,10 +101,7 @@ async def upload(module, project_name, file, representation, provider_name,
                 format(target_folder)
             raise NotADirectoryError(err)
 
-    loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.upload_file,
-                                         local_file_path,
+    file_id = remote_handler.upload_file(local_file_path,
                                          remote_file_path,
                                          module,
                                          project_name,
@@ -107,7 +137,34 @@ async def download(module, project_name, file, representation, provider_name,
         Returns:
         (string) - 'name' of local file
     """
-    with module.lock:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None,
+                                      download_file,
+                                      module,
+                                      project_name,
+                                      file,
+                                      representation,
+                                      provider_name,
+                                      remote_site_name,
+                                      tree,
+                                      preset,
+                                      module.lock
+                                      )
+
+
+def download_file(module, project_name, file, representation, provider_name,
+                  remote_site_name, tree=None, preset=None, lock=None):
+    """
+        Synchronous implementation of 'download'.
+
+    Args:
+        lock (threading.Lock): lock guarding creation of provider
+        Rest of arguments is same as for 'download'.
+
+    Returns:
+        (string) - 'name' of local file
+    """
+    with lock or contextlib.nullcontext():
         remote_handler = lib.factory.get_provider(provider_name,
                                                   project_name,
                                                   remote_site_name,
@@ -124,18 +181,15 @@ async def download(module, project_name, file, representation, provider_name,
 
     local_site = module.get_active_site(project_name)
 
-    loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.download_file,
-                                         remote_file_path,
-                                         local_file_path,
-                                         module,
-                                         project_name,
-                                         file,
-                                         representation,
-                                         local_site,
-                                         True
-                                         )
+    file_id = remote_handler.download_file(remote_file_path,
+                                           local_file_path,
+                                           module,
+                                           project_name,
+                                           file,
+                                           representation,
+                                           local_site,
+                                           True
+                                           )
 
     module.handle_alternate_site(project_name, representation, local_site,
                                  file["_id"], file_id)
@@ -289,7 +343,22 @@ class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
+
+        Files to sync are found periodically and put to priority queue of
+        remote site. Each site has workers which are continuously
+        transferring files, so slow file does not block others. Results of
+        transfers are stored to DB in bulk.
+
+        Size of site queue is limited by provider batch limit. Queued files
+        of paused or disabled projects and sites are dropped and pause state
+        is checked again before each transfer.
     """
+    # Maximum number of concurrently transferred files per site, could be
+    #   lowered by provider batch limit
+    max_site_transfers = 8
+    # How often are results of transfers stored to DB (in seconds)
+    db_update_interval = 1
+
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -298,8 +367,22 @@ class SyncServerThread(threading.Thread):
         self.loop = None
         self.is_running = False
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        self.transfer_executor = None
         self.timer = None
 
+        # Priority queues of files to transfer by remote site name
+        self._site_queues = {}
+        # Locks guarding structure of remote sites
+        self._site_locks = collections.defaultdict(threading.Lock)
+        # Files queued or transferred which results are not in DB yet
+        #   - (project_name, remote_site, file_path)
+        self._transfer_keys = set()
+        # Projects and remote sites which are synchronized
+        #   - (project_name, remote_site)
+        self._working_sites_keys = set()
+        self._transfer_results = []
+        self._transfer_counter = itertools.count()
+
     def run(self):
         self.is_running = True
 
@@ -311,6 +394,7 @@ class SyncServerThread(threading.Thread):
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
+            asyncio.ensure_future(self.store_results_loop(), loop=self.loop)
             self.log.info("Sync Server Started")
             self.loop.run_forever()
         except Exception:
@@ -328,9 +412,14 @@ class SyncServerThread(threading.Thread):
                     credentials)
                 - for each project_name it looks for representations that
                   should be synced
-                - synchronize found collections
-                - update representations - fills error messages for exceptions
+                - puts files which should be synced to priority queue of
+                  remote site (skips files which are already queued), until
+                  the queue is full
+                - drops queued files of paused or disabled projects and sites
                 - waits X seconds and repeat
+
+            Files are transferred by site workers and results stored to DB
+            by 'store_results_loop'.
         Returns:
 
         """
@@ -340,6 +429,7 @@ class SyncServerThread(threading.Thread):
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
                 project_name = None
+                working_sites_keys = set()
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
                     preset = self.module.sync_project_settings[project_name]
@@ -348,6 +438,7 @@ class SyncServerThread(threading.Thread):
                                                                   preset)
                     if not all([local_site, remote_site]):
                         continue
+                    working_sites_keys.add((project_name, remote_site))
 
                     sync_repres = self.module.get_sync_representations(
                         project_name,
@@ -355,15 +446,6 @@ class SyncServerThread(threading.Thread):
                         remote_site
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
                     site_preset = preset.get('sites')[remote_site]
                     remote_provider = \
                         self.module.get_provider_for_site(site=remote_site)
@@ -371,86 +453,66 @@ class SyncServerThread(threading.Thread):
                                                        project_name,
                                                        remote_site,
                                                        presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
+                    queue = self._get_site_queue(remote_site, remote_provider)
                     # first call to get_provider could be expensive, its
                     # building folder tree structure in memory
                     # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                    queued_count = 0
                     for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
+                        if queue.full():
+                            break
+                        priority = sync.get("priority")
+                        if priority is None:
+                            priority = self.module.DEFAULT_PRIORITY
+                        for file in sync.get("files") or []:
+                            # skip files which are already processed
+                            # multiple representation could have same file
+                            # path (textures), upload process can find
+                            # already uploaded file and reuse same id
+                            file_path = file.get('path', '')
+                            key = (project_name, remote_site, file_path)
+                            if key in self._transfer_keys:
+                                continue
+                            if queue.full():
+                                break
+                            status = self.module.check_status(
+                                file,
+                                local_site,
+                                remote_site,
+                                preset.get('config'))
+                            if status == SyncStatus.DO_UPLOAD:
+                                site = remote_site
+                            elif status == SyncStatus.DO_DOWNLOAD:
+                                site = local_site
+                            else:
+                                continue
+
+                            self._transfer_keys.add(key)
+                            queued_count += 1
+                            # higher priority first, then in order of query
+                            queue.put_nowait((
+                                -priority,
+                                next(self._transfer_counter),
+                                {
+                                    "key": key,
+                                    "status": status,
+                                    "project_name": project_name,
+                                    "file": file,
+                                    "representation": sync,
+                                    "provider_name": remote_provider,
+                                    "remote_site": remote_site,
+                                    "site": site,
+                                    "tree": handler.get_tree(),
+                                    "preset": site_preset,
+                                }
+                            ))
+
+                    self.log.debug("Queued sync tasks count {}".format(
+                        queued_count
                     ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+
+                self._working_sites_keys = working_sites_keys
+                self._drop_paused_transfers()
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -478,6 +540,163 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    def _get_site_queue(self, site_name, provider_name):
+        """
+            Priority queue of files to sync for site, creates it with
+            workers on first call.
+
+        Args:
+            site_name (string): remote site name
+            provider_name (string): 'gdrive', 'local_drive' etc.
+        Returns:
+            (asyncio.PriorityQueue)
+        """
+        queue = self._site_queues.get(site_name)
+        if queue is not None:
+            return queue
+
+        batch_limit = lib.factory.get_provider_batch_limit(provider_name)
+        queue = asyncio.PriorityQueue(maxsize=max(1, batch_limit))
+        self._site_queues[site_name] = queue
+        workers_count = max(1, min(self.max_site_transfers, batch_limit))
+        self.log.debug("Starting {} sync workers for site {}".format(
+            workers_count, site_name
+        ))
+        for _ in range(workers_count):
+            asyncio.ensure_future(self._site_worker(queue))
+        return queue
+
+    def _get_transfer_executor(self):
+        if self.transfer_executor is None:
+            self.transfer_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_site_transfers * 4
+            )
+        return self.transfer_executor
+
+    def _is_transfer_paused(self, transfer):
+        """Server, project or site of transfer is paused or disabled."""
+        project_name = transfer["project_name"]
+        return (
+            not self.is_running
+            or self.module.is_project_paused(project_name, check_parents=True)
+            or (
+                (project_name, transfer["remote_site"])
+                not in self._working_sites_keys
+            )
+        )
+
+    def _drop_paused_transfers(self):
+        """Remove queued files of paused or disabled projects and sites.
+
+        Dropped files are not marked as processed so they are queued again
+        when syncing is resumed.
+        """
+        for site_name, queue in self._site_queues.items():
+            items = []
+            while not queue.empty():
+                items.append(queue.get_nowait())
+                queue.task_done()
+
+            dropped_count = 0
+            for item in items:
+                transfer = item[2]
+                if self._is_transfer_paused(transfer):
+                    self._transfer_keys.discard(transfer["key"])
+                    dropped_count += 1
+                else:
+                    queue.put_nowait(item)
+
+            if dropped_count:
+                self.log.debug(
+                    "Dropped {} queued files of paused site {}".format(
+                        dropped_count, site_name
+                    )
+                )
+
+    async def _site_worker(self, queue):
+        """Transfer files from site queue until server is stopped."""
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, transfer = await queue.get()
+            if self._is_transfer_paused(transfer):
+                self._transfer_keys.discard(transfer["key"])
+                queue.task_done()
+                continue
+
+            file_id = error = None
+            try:
+                file_id = await loop.run_in_executor(
+                    self._get_transfer_executor(),
+                    self._process_transfer,
+                    transfer
+                )
+            except asyncio.exceptions.CancelledError:
+                raise
+            except Exception as exc:
+                error = str(exc)
+            finally:
+                queue.task_done()
+            self._transfer_results.append((transfer, file_id, error))
+
+    def _process_transfer(self, transfer):
+        """Upload or download single file, runs in executor thread."""
+        if transfer["status"] == SyncStatus.DO_UPLOAD:
+            func = upload_file
+        else:
+            func = download_file
+        return func(
+            self.module,
+            transfer["project_name"],
+            transfer["file"],
+            transfer["representation"],
+            transfer["provider_name"],
+            transfer["remote_site"],
+            transfer["tree"],
+            transfer["preset"],
+            self._site_locks[transfer["remote_site"]]
+        )
+
+    async def store_results_loop(self):
+        """Periodically store results of finished transfers to DB."""
+        while self.is_running:
+            await asyncio.sleep(self.db_update_interval)
+            await self.store_results()
+
+    async def store_results(self):
+        """Store results of finished transfers to DB in bulk per project."""
+        results = self._transfer_results
+        if not results:
+            return
+        self._transfer_results = []
+
+        items_by_project = collections.defaultdict(list)
+        for transfer, file_id, error in results:
+            items_by_project[transfer["project_name"]].append({
+                "new_file_id": file_id,
+                "file": transfer["file"],
+                "representation": transfer["representation"],
+                "site": transfer["site"],
+                "error": error,
+            })
+
+        loop = asyncio.get_running_loop()
+        for project_name, items in items_by_project.items():
+            try:
+                await loop.run_in_executor(
+                    None, self.module.update_db_many, project_name, items
+                )
+            except Exception:
+                self.log.warning(
+                    "Failed to store sync results of {} files to DB".format(
+                        len(items)
+                    ),
+                    exc_info=True
+                )
+
+        # Files can be queued again, DB has their current state
+        for transfer, _, _ in results:
+            self._transfer_keys.discard(transfer["key"])
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -494,6 +713,8 @@ class SyncServerThread(threading.Thread):
                 self.log.info("finished long running")
                 self.module.projects_processed.remove(task["project_name"])
             await asyncio.sleep(0.5)
+        # store results of already finished transfers
+        await self.store_results()
         tasks = [task for task in asyncio.all_tasks() if
                  task is not asyncio.current_task()]
         list(map(lambda task: task.cancel(), tasks))  # cancel all the tasks
@@ -503,6 +724,8 @@ class SyncServerThread(threading.Thread):
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
         self.executor.shutdown(wait=True)
+        if self.transfer_executor is not None:
+            self.transfer_executor.shutdown(wait=True)
         await asyncio.sleep(0.07)
         self.loop.stop()
 
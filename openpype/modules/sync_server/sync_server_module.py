@@ -8,6 +8,7 @@ import signal
 from collections import deque, defaultdict
 
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -37,6 +38,7 @@ from openpype.settings.constants import (
 
 from .providers.local_drive import LocalDriveHandler
 from .providers import lib
+from .representations_feed import SyncRepresentationsFeed
 
 from .utils import (
     time_function,
@@ -112,6 +114,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # query only new and changed representations between full scans
+    INCREMENTAL_SYNC_SCAN = True
+    FULL_SYNC_SCAN_INTERVAL = 600  # seconds between full scans
 
     name = "sync_server"
     label = "Sync Queue"
@@ -139,6 +144,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self._anatomies = {}
 
         self._connection = None
+        # incremental feeds of representations to sync
+        self._sync_representations_feeds = {}
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -1696,6 +1703,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             Querying of 'to-be-synched' files is offloaded to Mongod for
             better performance. Goal is to get as few representations as
             possible.
+
+            With 'INCREMENTAL_SYNC_SCAN' full query runs only periodically,
+            otherwise only new and changed representations are queried if
+            database supports change streams (see 'SyncRepresentationsFeed').
         Args:
             project_name (string):
             active_site (string): identifier of current active site (could be
@@ -1707,6 +1718,61 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             (list) of dictionaries
         """
         self.log.debug("Check representations for : {}".format(project_name))
+        if not self.INCREMENTAL_SYNC_SCAN:
+            return self._query_sync_representations(
+                project_name, active_site, remote_site
+            )
+
+        key = (project_name, active_site, remote_site)
+        feed = self._sync_representations_feeds.get(key)
+        if feed is None:
+            def query_func(extra_match):
+                return self._query_sync_representations(
+                    project_name, active_site, remote_site, extra_match
+                )
+
+            feed = SyncRepresentationsFeed(
+                query_func,
+                self.connection.database[project_name],
+                self.FULL_SYNC_SCAN_INTERVAL
+            )
+            self._sync_representations_feeds[key] = feed
+        return feed.get_representations()
+
+    def invalidate_sync_representations(self, project_name,
+                                        representation_ids=None):
+        """
+            Mark representations to be queried again by next sync loop.
+
+        Args:
+            project_name (string):
+            representation_ids (list): of changed representation ids, full
+                scan of project is done if not passed
+        """
+        if representation_ids is not None:
+            representation_ids = [
+                ObjectId(repre_id)
+                for repre_id in representation_ids
+                if repre_id
+            ]
+        for key, feed in tuple(self._sync_representations_feeds.items()):
+            if key[0] == project_name:
+                feed.invalidate(representation_ids)
+
+    def _query_sync_representations(self, project_name, active_site,
+                                    remote_site, extra_match=None):
+        """
+            Query representations that should be synced.
+
+        Args:
+            project_name (string):
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+            extra_match (dict): additional filter of representations
+
+        Returns:
+            (list) of dictionaries
+        """
         self.connection.Session["AVALON_PROJECT"] = project_name
         # retry_cnt - number of attempts to sync specific file before giving up
         retries_arr = self._get_retries_arr(project_name)
@@ -1750,6 +1816,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 ]}
             ]
         }
+        if extra_match:
+            match = {"$and": [match, extra_match]}
 
         aggr = [
             {"$match": match},
@@ -1791,7 +1859,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             active_site, remote_site
         ))
         self.log.debug("query: {}".format(aggr))
-        representations = self.connection.aggregate(aggr)
+        representations = list(self.connection.aggregate(aggr))
 
         return representations
 
@@ -1871,6 +1939,80 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         Returns:
             None
         """
+        query, update, arr_filter = self._prepare_db_update(
+            new_file_id, file, representation, site, error, progress,
+            priority
+        )
+        self.connection.database[project_name].update_one(
+            query,
+            update,
+            upsert=True,
+            array_filters=arr_filter
+        )
+
+        if progress is not None:
+            return
+
+        self.invalidate_sync_representations(project_name, [query["_id"]])
+        if priority is not None:
+            return
+
+        self._log_db_update(new_file_id, file, representation, error)
+
+    def update_db_many(self, project_name, items):
+        """
+            Store results of multiple synced files to DB in one bulk write.
+
+        Args:
+            project_name (string): name of project
+            items (list): of dictionaries with 'new_file_id', 'file',
+                'representation', 'site' and optionally 'error' keys, same
+                as arguments of 'update_db'
+
+        Returns:
+            None
+        """
+        if not items:
+            return
+
+        operations = []
+        for item in items:
+            query, update, arr_filter = self._prepare_db_update(
+                item["new_file_id"],
+                item["file"],
+                item["representation"],
+                item["site"],
+                item.get("error")
+            )
+            operations.append(UpdateOne(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            ))
+
+        self.connection.database[project_name].bulk_write(operations)
+        self.invalidate_sync_representations(
+            project_name,
+            [item["representation"].get("_id") for item in items]
+        )
+
+        for item in items:
+            self._log_db_update(
+                item["new_file_id"],
+                item["file"],
+                item["representation"],
+                item.get("error")
+            )
+
+    def _prepare_db_update(self, new_file_id, file, representation, site,
+                           error=None, progress=None, priority=None):
+        """
+            Prepare query, update and array filters for 'update_db'.
+
+        Returns:
+            (dict, dict, list)
+        """
         representation_id = representation.get("_id")
         file_id = None
         if file:
@@ -1901,16 +2043,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
-
-        if progress is not None or priority is not None:
-            return
+        return query, update, arr_filter
 
+    def _log_db_update(self, new_file_id, file, representation, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -1922,7 +2057,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             (
                 "File for {} - {source_file} process {status} {error_str}"
             ).format(
-                representation_id,
+                representation.get("_id"),
                 status=status,
                 source_file=source_file,
                 error_str=error_str
@@ -2059,6 +2194,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             upsert=True,
             array_filters=arr_filter
         )
+        self.invalidate_sync_representations(project_name, [query["_id"]])
 
     def _reset_site_for_file(self, project_name, representation_id,
                              elem, file_id, site_name):
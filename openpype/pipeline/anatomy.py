@@ -640,6 +640,25 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_to_string(self, data, strict=True):
+        """Format template to string and add 'root' key to data if needed.
+
+        Args:
+            data (dict[str, Any]): Formatting data for template.
+            strict (bool): Raise 'AnatomyTemplateUnsolved' if template can't
+                be solved.
+
+        Returns:
+            str: Filled template.
+        """
+
+        if not data.get("root"):
+            data = dict(data)
+            data["root"] = self.anatomy_templates.anatomy.roots
+        return super(AnatomyStringTemplate, self).format_to_string(
+            data, strict
+        )
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -1,6 +1,10 @@
 import re
 import os
 import json
+import atexit
+import hashlib
+import threading
+import subprocess
 import contextlib
 import functools
 import platform
@@ -8,11 +12,16 @@ import tempfile
 import warnings
 from copy import deepcopy
 
+import six
+import appdirs
+
 from openpype import PACKAGE_DIR
 from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -27,6 +36,8 @@ class CachedData:
     has_compatible_ocio_package = None
     config_version_data = {}
     ocio_config_colorspaces = {}
+    ocio_config_cache_keys = {}
+    ocio_helper_process = None
     allowed_exts = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
     }
@@ -143,6 +154,42 @@ def get_colorspace_name_from_filepath(
     Returns:
         str: name of colorspace
     """
+    return get_colorspace_names_from_filepaths(
+        [filepath], host_name, project_name,
+        config_data=config_data, file_rules=file_rules,
+        project_settings=project_settings,
+        validate=validate
+    ).get(filepath)
+
+
+def get_colorspace_names_from_filepaths(
+    filepaths, host_name, project_name,
+    config_data=None, file_rules=None,
+    project_settings=None,
+    validate=True
+):
+    """Get colorspace names of multiple filepaths
+
+    Same as 'get_colorspace_name_from_filepath' but settings are resolved,
+    rules are compiled and OCIO config is queried only once for all paths.
+
+    Args:
+        filepaths (Iterable[str]): path strings, file rule pattern is
+            tested on them
+        host_name (str): host name
+        project_name (str): project name
+        config_data (Optional[dict]): config path and template in dict.
+                                      Defaults to None.
+        file_rules (Optional[dict]): file rule data from settings.
+                                     Defaults to None.
+        project_settings (Optional[dict]): project settings. Defaults to None.
+        validate (Optional[bool]): should resulting colorspaces be validated
+                                with config file? Defaults to True.
+
+    Returns:
+        dict[str, Union[str, None]]: name of colorspace by filepath
+    """
+    filepaths = list(dict.fromkeys(filepaths))
     project_settings, config_data, file_rules = _get_context_settings(
         host_name, project_name,
         config_data=config_data, file_rules=file_rules,
@@ -151,40 +198,47 @@ def get_colorspace_name_from_filepath(
 
     if not config_data:
         # in case global or host color management is not enabled
-        return None
+        return {filepath: None for filepath in filepaths}
 
     # use ImageIO file rules
-    colorspace_name = get_imageio_file_rules_colorspace_from_filepath(
-        filepath, host_name, project_name,
+    output = get_imageio_file_rules_colorspace_from_filepaths(
+        filepaths, host_name, project_name,
         config_data=config_data, file_rules=file_rules,
         project_settings=project_settings
     )
 
     # try to get colorspace from OCIO v2 file rules
+    missing = [filepath for filepath in filepaths if not output[filepath]]
     if (
-        not colorspace_name
+        missing
         and compatibility_check_config_version(config_data["path"], major=2)
     ):
-        colorspace_name = get_config_file_rules_colorspace_from_filepath(
-            config_data["path"], filepath)
+        output.update(get_config_file_rules_colorspace_from_filepaths(
+            config_data["path"], missing
+        ))
 
     # use parse colorspace from filepath as fallback
-    colorspace_name = colorspace_name or parse_colorspace_from_filepath(
-        filepath, config_path=config_data["path"]
-    )
-
-    if not colorspace_name:
-        log.info("No imageio file rule matched input path: '{}'".format(
-            filepath
+    missing = [filepath for filepath in filepaths if not output[filepath]]
+    if missing:
+        output.update(parse_colorspace_from_filepaths(
+            missing, config_path=config_data["path"]
         ))
-        return None
 
-    # validate matching colorspace with config
+    for filepath in filepaths:
+        if not output[filepath]:
+            log.info("No imageio file rule matched input path: '{}'".format(
+                filepath
+            ))
+            output[filepath] = None
+
+    # validate matching colorspaces with config
     if validate:
-        validate_imageio_colorspace_in_config(
-            config_data["path"], colorspace_name)
+        for colorspace_name in set(output.values()):
+            if colorspace_name:
+                validate_imageio_colorspace_in_config(
+                    config_data["path"], colorspace_name)
 
-    return colorspace_name
+    return output
 
 
 # TODO: remove this in future - backward compatibility
@@ -242,32 +296,81 @@ def get_imageio_file_rules_colorspace_from_filepath(
     Returns:
         str: name of colorspace
     """
+    return get_imageio_file_rules_colorspace_from_filepaths(
+        [filepath], host_name, project_name,
+        config_data=config_data, file_rules=file_rules,
+        project_settings=project_settings
+    )[filepath]
+
+
+def _compile_imageio_file_rules(file_rules):
+    """Compile patterns of ImageIO file rules.
+
+    Args:
+        file_rules (dict): file rule data from settings.
+
+    Returns:
+        list[tuple[re.Pattern, re.Pattern, str]]: extension pattern, file
+            pattern and colorspace of rules in order in which they should
+            be tested, last rule in settings has highest priority.
+    """
+    compiled_rules = [
+        (
+            re.compile(r".*(?=.{})".format(file_rule["ext"])),
+            re.compile(file_rule["pattern"]),
+            file_rule["colorspace"]
+        )
+        for file_rule in file_rules.values()
+    ]
+    compiled_rules.reverse()
+    return compiled_rules
+
+
+def get_imageio_file_rules_colorspace_from_filepaths(
+    filepaths, host_name, project_name,
+    config_data=None, file_rules=None,
+    project_settings=None
+):
+    """Get colorspace names of multiple filepaths
+
+    ImageIO Settings file rules are compiled once and tested for matching
+    rule on each filepath.
+
+    Args:
+        filepaths (Iterable[str]): path strings, file rule pattern is
+            tested on them
+        host_name (str): host name
+        project_name (str): project name
+        config_data (Optional[dict]): config path and template in dict.
+                                      Defaults to None.
+        file_rules (Optional[dict]): file rule data from settings.
+                                     Defaults to None.
+        project_settings (Optional[dict]): project settings. Defaults to None.
+
+    Returns:
+        dict[str, Union[str, None]]: name of colorspace by filepath
+    """
+    filepaths = list(filepaths)
     project_settings, config_data, file_rules = _get_context_settings(
         host_name, project_name,
         config_data=config_data, file_rules=file_rules,
         project_settings=project_settings
     )
 
+    output = {filepath: None for filepath in filepaths}
     if not config_data:
         # in case global or host color management is not enabled
-        return None
+        return output
 
     # match file rule from path
-    colorspace_name = None
-    for file_rule in file_rules.values():
-        pattern = file_rule["pattern"]
-        extension = file_rule["ext"]
-        ext_match = re.match(
-            r".*(?=.{})".format(extension), filepath
-        )
-        file_match = re.search(
-            pattern, filepath
-        )
-
-        if ext_match and file_match:
-            colorspace_name = file_rule["colorspace"]
+    compiled_rules = _compile_imageio_file_rules(file_rules)
+    for filepath in output:
+        for ext_regex, file_regex, colorspace_name in compiled_rules:
+            if ext_regex.match(filepath) and file_regex.search(filepath):
+                output[filepath] = colorspace_name
+                break
 
-    return colorspace_name
+    return output
 
 
 def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
@@ -304,6 +407,36 @@ def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         return result_data[0]
 
 
+def get_config_file_rules_colorspace_from_filepaths(config_path, filepaths):
+    """Get colorspace of multiple file paths with use of OCIO v2 file-rules.
+
+    Config is loaded only once and all paths are resolved by one query of
+    OCIO wrapper, so only one subprocess is used if PyOpenColorIO is not
+    available.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+        filepaths (Iterable[str]): paths leading to files
+
+    Returns:
+        dict[str, Union[str, None]]: matching colorspace name by filepath
+    """
+    filepaths = list(dict.fromkeys(filepaths))
+    if not filepaths:
+        return {}
+
+    result = _run_ocio_queries([{
+        "command": "get_config_file_rules_colorspace_from_filepaths",
+        "config_path": config_path,
+        "kwargs": {"filepaths": filepaths}
+    }])[0]
+    if "error" in result:
+        raise RuntimeError(
+            "OCIO config query failed: {}".format(result["error"])
+        )
+    return dict(zip(filepaths, result["result"]))
+
+
 def parse_colorspace_from_filepath(
     filepath, colorspaces=None, config_path=None
 ):
@@ -330,6 +463,27 @@ def parse_colorspace_from_filepath(
     Returns:
         str: name of colorspace
     """
+    return parse_colorspace_from_filepaths(
+        [filepath], colorspaces=colorspaces, config_path=config_path
+    )[filepath]
+
+
+def parse_colorspace_from_filepaths(
+    filepaths, colorspaces=None, config_path=None
+):
+    """Parse colorspace names from multiple filepaths
+
+    Same as 'parse_colorspace_from_filepath' but match pattern is compiled
+    only once.
+
+    Args:
+        filepaths (Iterable[str]): path strings
+        colorspaces (Optional[dict[str]]): list of colorspaces
+        config_path (Optional[str]): path to config.ocio file
+
+    Returns:
+        dict[str, Union[str, None]]: name of colorspace by filepath
+    """
     def _get_colorspace_match_regex(colorspaces):
         """Return a regex pattern
 
@@ -368,19 +522,24 @@ def parse_colorspace_from_filepath(
     # match colorspace from  filepath
     regex_pattern = _get_colorspace_match_regex(
         list(colorspaces) + list(underscored_colorspaces))
-    match = regex_pattern.search(filepath)
-    colorspace = match.group(0) if match else None
 
-    if colorspace in underscored_colorspaces:
-        return underscored_colorspaces[colorspace]
+    output = {}
+    for filepath in filepaths:
+        match = regex_pattern.search(filepath)
+        colorspace = match.group(0) if match else None
 
-    if colorspace:
-        return colorspace
+        if colorspace in underscored_colorspaces:
+            colorspace = underscored_colorspaces[colorspace]
 
-    log.info("No matching colorspace in config '{}' for path: '{}'".format(
-        config_path, filepath
-    ))
-    return None
+        if not colorspace:
+            log.info(
+                "No matching colorspace in config '{}' for path: '{}'".format(
+                    config_path, filepath
+                )
+            )
+            colorspace = None
+        output[filepath] = colorspace
+    return output
 
 
 def validate_imageio_colorspace_in_config(config_path, colorspace_name):
@@ -455,6 +614,373 @@ def _get_wrapped_with_subprocess(command_group, command, **kwargs):
             return json.load(f_)
 
 
+def get_ocio_cache_dir():
+    """Directory where results of OCIO config introspection are cached.
+
+    Can be changed with 'OPENPYPE_OCIO_CACHE_DIR' environment variable.
+
+    Returns:
+        str: Path to directory.
+    """
+    cache_dir = os.environ.get("OPENPYPE_OCIO_CACHE_DIR")
+    if not cache_dir:
+        cache_dir = os.path.join(
+            appdirs.user_data_dir("openpype", "pypeclub"), "ocio_cache"
+        )
+    return os.path.normpath(cache_dir)
+
+
+def _get_ocio_config_cache_key(config_path):
+    """Cache key of config file based on path, mtime and content hash.
+
+    Content hash is calculated only once for path, mtime and size.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+
+    Returns:
+        Union[str, None]: Cache key or None if file does not exist.
+    """
+    config_path = os.path.abspath(config_path)
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+
+    stat_key = (config_path, stat.st_mtime, stat.st_size)
+    cache_key = CachedData.ocio_config_cache_keys.get(stat_key)
+    if cache_key is None:
+        content_hash = hashlib.sha1()
+        with open(config_path, "rb") as stream:
+            content_hash.update(stream.read())
+
+        cache_key = hashlib.sha1("|".join((
+            config_path,
+            repr(stat.st_mtime),
+            content_hash.hexdigest()
+        )).encode("utf-8")).hexdigest()
+        CachedData.ocio_config_cache_keys[stat_key] = cache_key
+    return cache_key
+
+
+def _get_ocio_query_key(command, kwargs):
+    if not kwargs:
+        return command
+    return "{}|{}".format(command, json.dumps(kwargs, sort_keys=True))
+
+
+def _read_ocio_config_cache(cache_key):
+    cache_path = os.path.join(get_ocio_cache_dir(), cache_key + ".json")
+    if not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, "r") as stream:
+            return json.load(stream)["results"]
+    except Exception:
+        log.debug(
+            "Failed to read OCIO cache file '{}'".format(cache_path),
+            exc_info=True
+        )
+    return {}
+
+
+def _write_ocio_config_cache(cache_key, config_path, results):
+    """Merge results to cache file of config.
+
+    File is written to temporary file first and renamed so other processes
+    never read partially written file.
+    """
+    cache_dir = get_ocio_cache_dir()
+    cache_path = os.path.join(cache_dir, cache_key + ".json")
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        all_results = _read_ocio_config_cache(cache_key)
+        all_results.update(results)
+
+        tmp_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", dir=cache_dir, delete=False
+        )
+        with tmp_file:
+            json.dump(
+                {"config_path": config_path, "results": all_results},
+                tmp_file
+            )
+
+        try:
+            os.rename(tmp_file.name, cache_path)
+        except OSError:
+            # Windows does not allow to rename over existing file
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            os.rename(tmp_file.name, cache_path)
+
+    except (IOError, OSError):
+        log.warning(
+            "Failed to write OCIO cache file '{}'".format(cache_path),
+            exc_info=True
+        )
+
+
+class OCIOHelperProcess(object):
+    """Long-lived process of 'ocio_wrapper.py' answering batched queries.
+
+    Process is started on first query and is stopped on exit of current
+    process. It is started again if it died. Process which does not answer
+    in 'timeout' seconds is killed and helper is disabled for current
+    process.
+    """
+
+    response_prefix = "OCIO_WRAPPER_RESPONSE:"
+    # Seconds to wait for response of helper process
+    timeout = 60
+
+    def __init__(self):
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+        self.disabled = False
+
+    def _start(self):
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "serve"
+        )
+        log.info("Starting OCIO helper: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=clean_envs_for_openpype_process(os.environ),
+            universal_newlines=True
+        )
+        # Output is read in thread so waiting for response can time out
+        self._lines = six.moves.queue.Queue()
+        thread = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout, self._lines)
+        )
+        thread.daemon = True
+        thread.start()
+
+    @staticmethod
+    def _read_output(stdout, lines):
+        for line in iter(stdout.readline, ""):
+            lines.put(line)
+        # Empty string marks end of output
+        lines.put("")
+
+    def _read_response(self):
+        while True:
+            try:
+                line = self._lines.get(timeout=self.timeout)
+            except six.moves.queue.Empty:
+                self.disabled = True
+                raise RuntimeError(
+                    "OCIO helper process did not respond in {} seconds".format(
+                        self.timeout
+                    )
+                )
+            if not line:
+                raise RuntimeError("OCIO helper process ended unexpectedly")
+            if line.startswith(self.response_prefix):
+                return line
+
+    def query(self, queries):
+        """Send queries to helper process and wait for results.
+
+        Args:
+            queries (list[dict]): Queries for 'ocio_wrapper.process_queries'.
+
+        Returns:
+            list[dict]: Result of each query.
+
+        Raises:
+            RuntimeError: Helper process failed, did not respond
+                in 'timeout' seconds or is disabled. Process is killed
+                on failure.
+        """
+        with self._lock:
+            if self.disabled:
+                raise RuntimeError("OCIO helper process is disabled")
+
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+
+            try:
+                self._process.stdin.write(json.dumps(queries) + "\n")
+                self._process.stdin.flush()
+                line = self._read_response()
+
+            except Exception:
+                self._kill()
+                raise
+
+        output = json.loads(line[len(self.response_prefix):])
+        if isinstance(output, dict):
+            raise RuntimeError(output["error"])
+        return output
+
+    def _kill(self):
+        process = self._process
+        self._process = None
+        if process is None or process.poll() is not None:
+            return
+        process.kill()
+        process.wait()
+
+    def _stop(self):
+        process = self._process
+        self._process = None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait()
+        except Exception:
+            process.kill()
+
+    def stop(self):
+        with self._lock:
+            self._stop()
+
+
+def _get_ocio_helper_process():
+    if CachedData.ocio_helper_process is None:
+        CachedData.ocio_helper_process = OCIOHelperProcess()
+        atexit.register(CachedData.ocio_helper_process.stop)
+    return CachedData.ocio_helper_process
+
+
+def _get_batched_with_subprocess(queries):
+    """Process queries in one short-lived subprocess."""
+    with _make_temp_json_file() as tmp_json_path:
+        with _make_temp_json_file() as tmp_queries_path:
+            with open(tmp_queries_path, "w") as stream:
+                json.dump(queries, stream)
+
+            args = [
+                "run", get_ocio_config_script_path(), "batch",
+                "--in_path", tmp_queries_path,
+                "--out_path", tmp_json_path
+            ]
+            log.info("Executing: {}".format(" ".join(args)))
+            run_openpype_process(*args, logger=log)
+
+        with open(tmp_json_path, "r") as stream:
+            return json.load(stream)
+
+
+def _run_ocio_queries(queries):
+    """Process queries with PyOpenColorIO.
+
+    Queries are processed in current process if PyOpenColorIO is available,
+    otherwise by long-lived helper process. Short-lived subprocess is used
+    if helper process fails or does not respond in time.
+
+    Args:
+        queries (list[dict]): Queries for 'ocio_wrapper.process_queries'.
+
+    Returns:
+        list[dict]: Result of each query.
+    """
+    if compatibility_check():
+        from openpype.scripts.ocio_wrapper import process_queries
+
+        return process_queries(queries)
+
+    helper_process = _get_ocio_helper_process()
+    if not helper_process.disabled:
+        try:
+            return helper_process.query(queries)
+        except Exception:
+            log.warning(
+                "OCIO helper process failed, using subprocess", exc_info=True
+            )
+    return _get_batched_with_subprocess(queries)
+
+
+def get_ocio_config_cached_data(config_path, queries):
+    """Get results of config introspection queries using on-disk cache.
+
+    Cache is keyed by config path, its modification time and content
+    hash, so it can be shared by all processes, including Python 2 hosts
+    without PyOpenColorIO. Only queries missing in cache are processed,
+    all of them at once.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+        queries (list[tuple[str, dict]]): Command names of 'ocio_wrapper'
+            with their keyword arguments.
+
+    Raises:
+        RuntimeError: Some of queries failed.
+
+    Returns:
+        list[Any]: Result of each query.
+    """
+    cache_key = _get_ocio_config_cache_key(config_path)
+    cached_results = {}
+    if cache_key is not None:
+        cached_results = _read_ocio_config_cache(cache_key)
+
+    query_keys = [
+        _get_ocio_query_key(command, kwargs)
+        for command, kwargs in queries
+    ]
+    missing = [
+        (query_key, command, kwargs)
+        for query_key, (command, kwargs) in zip(query_keys, queries)
+        if query_key not in cached_results
+    ]
+    if missing:
+        results = _run_ocio_queries([
+            {"command": command, "config_path": config_path, "kwargs": kwargs}
+            for _, command, kwargs in missing
+        ])
+        new_results = {}
+        errors = []
+        for (query_key, _, _), result in zip(missing, results):
+            if "error" in result:
+                errors.append(result["error"])
+            else:
+                new_results[query_key] = result["result"]
+
+        if cache_key is not None and new_results:
+            _write_ocio_config_cache(cache_key, config_path, new_results)
+        if errors:
+            raise RuntimeError(
+                "OCIO config query failed: {}".format("; ".join(errors))
+            )
+        cached_results.update(new_results)
+
+    return [cached_results[query_key] for query_key in query_keys]
+
+
+def _get_ocio_config_cached_item(config_path, command, **kwargs):
+    return get_ocio_config_cached_data(config_path, [(command, kwargs)])[0]
+
+
+def prewarm_ocio_config_cache(config_path):
+    """Store all config introspection data to on-disk cache.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+    """
+    views, _, _ = get_ocio_config_cached_data(
+        config_path,
+        [("get_views", {}), ("get_colorspace", {}), ("get_version", {})]
+    )
+    get_ocio_config_cached_data(config_path, [
+        (
+            "get_display_view_colorspace_name",
+            {"display": view_data["display"], "view": view_data["view"]}
+        )
+        for view_data in views.values()
+    ])
+
+
 # TODO: this should be part of ocio_wrapper.py
 def compatibility_check():
     """Making sure PyOpenColorIO is importable"""
@@ -487,9 +1013,7 @@ def compatibility_check_config_version(config_path, major=1, minor=None):
             # python environment is not compatible with PyOpenColorIO
             # needs to be run in subprocess
             CachedData.config_version_data[config_path] = \
-                _get_wrapped_with_subprocess(
-                    "config", "get_version", config_path=config_path
-            )
+                _get_ocio_config_cached_item(config_path, "get_version")
 
     # check major version
     if CachedData.config_version_data[config_path]["major"] != major:
@@ -520,9 +1044,7 @@ def get_ocio_config_colorspaces(config_path):
             # python environment is not compatible with PyOpenColorIO
             # needs to be run in subprocess
             CachedData.ocio_config_colorspaces[config_path] = \
-                _get_wrapped_with_subprocess(
-                    "config", "get_colorspace", in_path=config_path
-            )
+                _get_ocio_config_cached_item(config_path, "get_colorspace")
         else:
             # TODO: refactor this so it is not imported but part of this file
             from openpype.scripts.ocio_wrapper import _get_colorspace_data
@@ -717,9 +1239,7 @@ def get_ocio_config_views(config_path):
     if not compatibility_check():
         # python environment is not compatible with PyOpenColorIO
         # needs to be run in subprocess
-        return _get_wrapped_with_subprocess(
-            "config", "get_views", in_path=config_path
-        )
+        return _get_ocio_config_cached_item(config_path, "get_views")
 
     # TODO: refactor this so it is not imported but part of this file
     from openpype.scripts.ocio_wrapper import _get_views_data
@@ -1089,15 +1609,43 @@ def set_colorspace_data_to_representation(
         ```
 
     """
+    set_colorspace_data_to_representations(
+        [representation], context_data, colorspace, log
+    )
+
+
+def set_colorspace_data_to_representations(
+    representations, context_data,
+    colorspace=None,
+    log=None
+):
+    """Sets colorspace data to multiple representations.
+
+    Same as 'set_colorspace_data_to_representation' but file rules are
+    resolved for all representations at once.
+
+    Args:
+        representations (list[dict]): publishing representations
+        context_data (publish.Context.data): publishing context data
+        colorspace (str, optional): colorspace name. Defaults to None.
+        log (logging.Logger, optional): logger instance. Defaults to None.
+    """
     log = log or Logger.get_logger(__name__)
 
-    file_ext = representation["ext"]
+    filtered_representations = []
+    for representation in representations:
+        file_ext = representation["ext"]
 
-    # check if `file_ext` in lower case is in CachedData.allowed_exts
-    if file_ext.lstrip(".").lower() not in CachedData.allowed_exts:
-        log.debug(
-            "Extension '{}' is not in allowed extensions.".format(file_ext)
-        )
+        # check if `file_ext` in lower case is in CachedData.allowed_exts
+        if file_ext.lstrip(".").lower() not in CachedData.allowed_exts:
+            log.debug(
+                "Extension '{}' is not in allowed extensions.".format(
+                    file_ext)
+            )
+            continue
+        filtered_representations.append(representation)
+
+    if not filtered_representations:
         return
 
     # get colorspace settings
@@ -1115,28 +1663,39 @@ def set_colorspace_data_to_representation(
     host_name = context_data["hostName"]
     project_settings = context_data["project_settings"]
 
-    # get one filename
-    filename = representation["files"]
-    if isinstance(filename, list):
-        filename = filename[0]
-
-    # get matching colorspace from rules
-    colorspace = colorspace or get_imageio_colorspace_from_filepath(
-        filename, host_name, project_name,
-        config_data=config_data,
-        file_rules=file_rules,
-        project_settings=project_settings
-    )
+    # get one filename of each representation
+    filenames = []
+    for representation in filtered_representations:
+        filename = representation["files"]
+        if isinstance(filename, list):
+            filename = filename[0]
+        filenames.append(filename)
+
+    # get matching colorspaces from rules
+    colorspaces_by_filename = {}
+    if not colorspace:
+        colorspaces_by_filename = (
+            get_imageio_file_rules_colorspace_from_filepaths(
+                filenames, host_name, project_name,
+                config_data=config_data,
+                file_rules=file_rules,
+                project_settings=project_settings
+            )
+        )
 
-    # infuse data to representation
-    if colorspace:
-        colorspace_data = {
-            "colorspace": colorspace,
-            "config": config_data
-        }
+    for representation, filename in zip(filtered_representations, filenames):
+        repre_colorspace = (
+            colorspace or colorspaces_by_filename.get(filename)
+        )
+        # infuse data to representation
+        if repre_colorspace:
+            colorspace_data = {
+                "colorspace": repre_colorspace,
+                "config": config_data
+            }
 
-        # update data key
-        representation["colorspaceData"] = colorspace_data
+            # update data key
+            representation["colorspaceData"] = colorspace_data
 
 
 def get_display_view_colorspace_name(config_path, display, view):
@@ -1154,8 +1713,10 @@ def get_display_view_colorspace_name(config_path, display, view):
     if not compatibility_check():
         # python environment is not compatible with PyOpenColorIO
         # needs to be run in subprocess
-        return get_display_view_colorspace_subprocess(config_path,
-                                                      display, view)
+        return _get_ocio_config_cached_item(
+            config_path, "get_display_view_colorspace_name",
+            display=display, view=view
+        )
 
     from openpype.scripts.ocio_wrapper import _get_display_view_colorspace_name  # noqa
 
@@ -1,32 +1,15 @@
 """Functions useful for delivery of published representations."""
 import os
-import copy
 import shutil
 import glob
+import hashlib
+import logging
 import clique
 import collections
 
 from openpype.lib import create_hard_link
 
 
-def _copy_file(src_path, dst_path):
-    """Hardlink file if possible(to save space), copy if not.
-
-    Because of using hardlinks should not be function used in other parts
-    of pipeline.
-    """
-
-    if os.path.exists(dst_path):
-        return
-    try:
-        create_hard_link(
-            src_path,
-            dst_path
-        )
-    except OSError:
-        shutil.copyfile(src_path, dst_path)
-
-
 def get_format_dict(anatomy, location_path):
     """Returns replaced root values from user provider value.
 
@@ -80,36 +63,594 @@ def check_destination_path(
     anatomy_filled = anatomy.format_all(anatomy_data)
     dest_path = anatomy_filled["delivery"][template_name]
     report_items = collections.defaultdict(list)
+    _add_unsolved_report(report_items, repre_id, template_name, dest_path)
+    return report_items
+
 
-    if not dest_path.solved:
-        msg = (
-            "Missing keys in Representation's context"
-            " for anatomy template \"{}\"."
-        ).format(template_name)
+def _add_unsolved_report(report_items, repre_id, template_name, dest_path):
+    """Add report of unsolved destination path template.
+
+    Args:
+        report_items (Dict[str, List[str]]): Report to add message to.
+        repre_id (str): Representation id.
+        template_name (str): Name of delivery template.
+        dest_path (TemplateResult): Result of template formatting.
 
-        sub_msg = (
-            "Representation: {}<br>"
-        ).format(repre_id)
+    Returns:
+        bool: Template was not solved and report was added.
+    """
 
-        if dest_path.missing_keys:
-            keys = ", ".join(dest_path.missing_keys)
-            sub_msg += (
-                "- Missing keys: \"{}\"<br>"
-            ).format(keys)
+    if dest_path.solved:
+        return False
 
-        if dest_path.invalid_types:
-            items = []
-            for key, value in dest_path.invalid_types.items():
-                items.append("\"{}\" {}".format(key, str(value)))
+    msg = (
+        "Missing keys in Representation's context"
+        " for anatomy template \"{}\"."
+    ).format(template_name)
 
-            keys = ", ".join(items)
-            sub_msg += (
-                "- Invalid value DataType: \"{}\"<br>"
-            ).format(keys)
+    sub_msg = (
+        "Representation: {}<br>"
+    ).format(repre_id)
 
-        report_items[msg].append(sub_msg)
+    if dest_path.missing_keys:
+        keys = ", ".join(dest_path.missing_keys)
+        sub_msg += (
+            "- Missing keys: \"{}\"<br>"
+        ).format(keys)
 
-    return report_items
+    if dest_path.invalid_types:
+        items = []
+        for key, value in dest_path.invalid_types.items():
+            items.append("\"{}\" {}".format(key, str(value)))
+
+        keys = ", ".join(items)
+        sub_msg += (
+            "- Invalid value DataType: \"{}\"<br>"
+        ).format(keys)
+
+    report_items[msg].append(sub_msg)
+    return True
+
+
+def _get_file_hash(path):
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _is_same_file(src_path, dst_path, use_hash=False):
+    """Destination file is identical to source file.
+
+    Files are compared by size and modification time, or by content hash
+    if 'use_hash' is enabled.
+    """
+
+    if os.path.samefile(src_path, dst_path):
+        return True
+
+    src_stat = os.stat(src_path)
+    dst_stat = os.stat(dst_path)
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+
+    if use_hash:
+        return _get_file_hash(src_path) == _get_file_hash(dst_path)
+    return abs(src_stat.st_mtime - dst_stat.st_mtime) < 1
+
+
+# States of file after '_deliver_file'
+DELIVERED = "delivered"
+SKIPPED = "skipped"
+EXISTING = "existing"
+
+
+def _deliver_file(src_path, dst_path, overwrite=False, use_hash=False):
+    """Hardlink file if possible(to save space), copy if not.
+
+    Because of using hardlinks should not be function used in other parts
+    of pipeline.
+
+    Existing destination file is never changed unless 'overwrite' is
+    enabled. Only destination identical to source is considered as
+    already delivered.
+
+    Args:
+        src_path (str): Source file path.
+        dst_path (str): Destination file path.
+        overwrite (Optional[bool]): Replace existing destination file which
+            is not identical to source.
+        use_hash (Optional[bool]): Compare content hash of existing
+            destination instead of size and modification time.
+
+    Returns:
+        str: 'DELIVERED' if file was delivered, 'SKIPPED' when identical
+            file already exists in destination and 'EXISTING' when different
+            file exists in destination and was kept.
+    """
+
+    if os.path.exists(dst_path):
+        if _is_same_file(src_path, dst_path, use_hash):
+            return SKIPPED
+        if not overwrite:
+            return EXISTING
+        os.remove(dst_path)
+
+    try:
+        create_hard_link(src_path, dst_path)
+    except OSError:
+        # Keep modification time so next delivery can skip the file
+        shutil.copy2(src_path, dst_path)
+    return DELIVERED
+
+
+DeliveryItem = collections.namedtuple(
+    "DeliveryItem", ["src_path", "dst_path", "repre_id"]
+)
+
+
+class DeliveryReport(object):
+    """Result of delivery.
+
+    Attributes:
+        delivered (List[DeliveryItem]): Files copied or hardlinked to
+            destination.
+        skipped (List[DeliveryItem]): Files which were already delivered
+            before and are identical.
+        existing (List[DeliveryItem]): Different files which already exist
+            in destination and were kept because overwrite was disabled.
+        failed (List[Tuple[DeliveryItem, str]]): Files which could not be
+            delivered with error message.
+        errors (Dict[str, List[str]]): Messages of problems which happened
+            during planning by title, e.g. missing keys in template.
+    """
+
+    def __init__(self):
+        self.delivered = []
+        self.skipped = []
+        self.existing = []
+        self.failed = []
+        self.errors = collections.defaultdict(list)
+
+    @property
+    def success(self):
+        return not self.failed and not self.errors
+
+    @property
+    def processed_count(self):
+        """Count of files which are in destination."""
+        return len(self.delivered) + len(self.skipped) + len(self.existing)
+
+    def add_error(self, title, message):
+        self.errors[title].append(message)
+
+    def to_report_items(self):
+        """Convert report to messages by title shown in delivery UIs.
+
+        Returns:
+            Dict[str, List[str]]: Messages of errors by title.
+        """
+
+        report_items = collections.defaultdict(list)
+        for title, messages in self.errors.items():
+            report_items[title].extend(messages)
+
+        for item, error in self.failed:
+            report_items["Failed to deliver files"].append(
+                "{} -> {}: {}".format(item.src_path, item.dst_path, error)
+            )
+        return report_items
+
+    def to_data(self):
+        def _items_to_data(items):
+            return [
+                {"src": item.src_path, "dst": item.dst_path}
+                for item in items
+            ]
+
+        return {
+            "delivered": _items_to_data(self.delivered),
+            "skipped": _items_to_data(self.skipped),
+            "existing": _items_to_data(self.existing),
+            "failed": [
+                {"src": item.src_path, "dst": item.dst_path, "error": error}
+                for item, error in self.failed
+            ],
+            "errors": dict(self.errors),
+        }
+
+
+class DeliveryPlanner(object):
+    """Plan delivery of representations and execute it.
+
+    Destination paths of all files are resolved when representations are
+    added, files are copied or hardlinked on 'execute' using a thread pool.
+    Files which are already delivered and are identical are skipped so
+    interrupted delivery can be executed again. Different files existing in
+    destination are kept unless overwrite is enabled on 'execute'.
+
+    Args:
+        anatomy (Anatomy): Project anatomy.
+        template_name (str): Name of delivery template in anatomy.
+        format_dict (Optional[dict]): Root values from 'get_format_dict'.
+        datetime_data (Optional[dict]): Values with actual date.
+        log (Optional[logging.Logger]): Logger used for output.
+    """
+
+    # Amount of threads used to deliver files
+    max_workers = 8
+
+    def __init__(
+        self,
+        anatomy,
+        template_name,
+        format_dict=None,
+        datetime_data=None,
+        log=None
+    ):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+
+        delivery_templates = anatomy.templates.get("delivery") or {}
+        template_obj = None
+        if template_name in delivery_templates:
+            template_obj = anatomy.templates_obj["delivery"][template_name]
+
+        self.log = log
+        self._anatomy = anatomy
+        self._template_name = template_name
+        self._template = delivery_templates.get(template_name)
+        self._template_obj = template_obj
+        self._format_dict = format_dict
+        self._datetime_data = datetime_data
+        self._items = []
+        self._dst_paths = set()
+        self._report = DeliveryReport()
+
+    @property
+    def items(self):
+        """Planned files to deliver.
+
+        Returns:
+            List[DeliveryItem]: Files with resolved destination paths.
+        """
+
+        return list(self._items)
+
+    @property
+    def report(self):
+        return self._report
+
+    def _prepare_data(self, anatomy_data):
+        data = dict(anatomy_data)
+        if self._datetime_data:
+            data.update(self._datetime_data)
+        if self._format_dict:
+            data["root"] = self._format_dict["root"]
+        return data
+
+    def _validate_template(self, repre_id, data):
+        if self._template_obj is None:
+            msg = (
+                "Delivery template \"{}\" in anatomy of project \"{}\""
+                " was not found"
+            ).format(self._template_name, self._anatomy.project_name)
+            self._report.add_error("", msg)
+            return False
+
+        dest_path = self._template_obj.format(data)
+        return not _add_unsolved_report(
+            self._report.errors, repre_id, self._template_name, dest_path
+        )
+
+    def _add_item(self, src_path, dst_path, repre_id):
+        if dst_path in self._dst_paths:
+            self.log.debug(
+                "Skipping duplicated destination {}".format(dst_path)
+            )
+            return
+        self._dst_paths.add(dst_path)
+        self._items.append(DeliveryItem(src_path, dst_path, repre_id))
+
+    def add_files(self, repre, anatomy_data, src_paths_with_frames):
+        """Plan delivery of representation files.
+
+        Destination paths of all files are resolved in one pass.
+
+        Args:
+            repre (dict): Representation document.
+            anatomy_data (dict): Data from representation to fill template.
+            src_paths_with_frames (Iterable[Tuple[str, Union[int, None]]]):
+                Source paths with frame used to fill destination path.
+                Frame in 'anatomy_data' is used if frame is None.
+
+        Returns:
+            int: Count of planned files.
+        """
+
+        repre_id = str(repre["_id"])
+        base_data = self._prepare_data(anatomy_data)
+        src_paths = []
+        data_items = []
+        for src_path, frame in src_paths_with_frames:
+            data = base_data
+            if frame is not None:
+                data = dict(base_data, frame=frame)
+            # Make sure path is valid for all platforms
+            src_paths.append(os.path.normpath(src_path.replace("\\", "/")))
+            data_items.append(data)
+
+        if not data_items:
+            return 0
+
+        if not self._validate_template(repre_id, data_items[0]):
+            return 0
+
+        dst_paths = self._template_obj.format_many(data_items)
+        for src_path, dst_path in zip(src_paths, dst_paths):
+            # Backwards compatibility when extension contained `.`
+            dst_path = dst_path.replace("..", ".")
+            # Make sure path is valid for all platforms
+            dst_path = os.path.normpath(dst_path.replace("\\", "/"))
+            # Remove newlines from the end of the string to avoid OSError
+            #   during copy
+            dst_path = dst_path.rstrip()
+            self._add_item(src_path, dst_path, repre_id)
+        return len(dst_paths)
+
+    def add_file(self, src_path, repre, anatomy_data):
+        """Plan delivery of single file.
+
+        Args:
+            src_path (str): Path of source representation file.
+            repre (dict): Representation document.
+            anatomy_data (dict): Data from representation to fill template.
+
+        Returns:
+            int: Count of planned files.
+        """
+
+        return self.add_files(repre, anatomy_data, [(src_path, None)])
+
+    def add_sequence(
+        self,
+        src_path,
+        repre,
+        anatomy_data,
+        has_renumbered_frame=False,
+        new_frame_start=0
+    ):
+        """Plan delivery of sequence found by listing source directory.
+
+        For Pype2(mainly - works in 3 too) where representation might not
+        contain files.
+
+        Uses listing physical files (not 'files' on repre as a)might not be
+        present, b)might not be reliable for representation and copying them.
+
+        TODO Should be refactored when files are sufficient to drive all
+        representations.
+
+        Args:
+            src_path (str): Path of source representation file with '#'
+                instead of frame.
+            repre (dict): Representation document.
+            anatomy_data (dict): Data from representation to fill template.
+            has_renumbered_frame (Optional[bool]): Renumber frames.
+            new_frame_start (Optional[int]): First frame of renumbered
+                sequence.
+
+        Returns:
+            int: Count of planned files.
+        """
+
+        repre_id = str(repre["_id"])
+        src_path = os.path.normpath(src_path.replace("\\", "/"))
+
+        if not glob.glob(src_path.replace("#", "*")):
+            msg = "{} doesn't exist for {}".format(src_path, repre_id)
+            self._report.add_error("Source file was not found", msg)
+            return 0
+
+        if self._template_obj is None:
+            self._validate_template(repre_id, anatomy_data)
+            return 0
+
+        # Check if 'frame' key is available in template which is required
+        #   for sequence delivery
+        if "{frame" not in self._template:
+            msg = (
+                "Delivery template \"{}\" in anatomy of project \"{}\""
+                "does not contain '{{frame}}' key to fill. Delivery of"
+                " sequence can't be processed."
+            ).format(self._template_name, self._anatomy.project_name)
+            self._report.add_error("", msg)
+            return 0
+
+        dir_path, file_name = os.path.split(str(src_path))
+
+        context = repre["context"]
+        ext = context.get("ext", context.get("representation"))
+
+        if not ext:
+            msg = "Source extension not found, cannot find collection"
+            self._report.add_error(msg, src_path)
+            self.log.warning("{} <{}>".format(msg, context))
+            return 0
+
+        ext = "." + ext
+        # context.representation could be .psd
+        ext = ext.replace("..", ".")
+
+        src_collections, remainder = clique.assemble(os.listdir(dir_path))
+        src_collection = None
+        for col in src_collections:
+            if col.tail != ext:
+                continue
+
+            src_collection = col
+            break
+
+        if src_collection is None:
+            msg = "Source collection of files was not found"
+            self._report.add_error(msg, src_path)
+            self.log.warning("{} <{}>".format(msg, src_path))
+            return 0
+
+        frame_indicator = "@####@"
+
+        data = self._prepare_data(anatomy_data)
+        data["frame"] = frame_indicator
+        if not self._validate_template(repre_id, data):
+            return 0
+        delivery_path = self._template_obj.format_to_string(data)
+
+        delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
+        dst_head, dst_tail = delivery_path.split(frame_indicator)
+        dst_collection = clique.Collection(
+            head=dst_head,
+            tail=dst_tail,
+            padding=src_collection.padding
+        )
+
+        src_head = src_collection.head
+        src_tail = src_collection.tail
+        first_frame = min(src_collection.indexes)
+        items = []
+        for index in src_collection.indexes:
+            src_padding = src_collection.format("{padding}") % index
+            src_file_name = "{}{}{}".format(src_head, src_padding, src_tail)
+            src = os.path.normpath(
+                os.path.join(dir_path, src_file_name)
+            )
+            dst_index = index
+            if has_renumbered_frame:
+                # Calculate offset between first frame and current frame
+                # - '0' for first frame
+                offset = new_frame_start - first_frame
+                # Add offset to new frame start
+                dst_index = index + offset
+                if dst_index < 0:
+                    msg = "Renumber frame has a smaller number than original frame"     # noqa
+                    self._report.add_error(msg, src_file_name)
+                    self.log.warning("{} <{}>".format(msg, context))
+                    return 0
+            dst_padding = dst_collection.format("{padding}") % dst_index
+            dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
+            items.append((src, dst))
+
+        for src, dst in items:
+            self._add_item(src, dst, repre_id)
+        return len(items)
+
+    def _deliver_item(self, item, overwrite, use_hash):
+        self.log.debug("Delivering: {} -> {}".format(
+            item.src_path, item.dst_path
+        ))
+        return _deliver_file(
+            item.src_path, item.dst_path, overwrite, use_hash
+        )
+
+    def _on_item_finished(self, item, state, exc):
+        if exc is None:
+            if state == DELIVERED:
+                self._report.delivered.append(item)
+            elif state == SKIPPED:
+                self._report.skipped.append(item)
+            else:
+                self.log.info(
+                    "Different file already exists, keeping {}".format(
+                        item.dst_path
+                    )
+                )
+                self._report.existing.append(item)
+            return
+
+        if not os.path.exists(item.src_path):
+            msg = "{} doesn't exist for {}".format(
+                item.src_path, item.repre_id
+            )
+            self._report.add_error("Source file was not found", msg)
+            return
+
+        self.log.warning("Failed to deliver {} -> {}: {}".format(
+            item.src_path, item.dst_path, exc
+        ))
+        self._report.failed.append((item, str(exc)))
+
+    def execute(self, max_workers=None, progress_callback=None,
+                use_hash=False, overwrite=False):
+        """Deliver planned files.
+
+        Destination folders are created once before files are delivered.
+
+        Args:
+            max_workers (Optional[int]): Amount of threads used to deliver
+                files. Class attribute 'max_workers' is used if not passed.
+            progress_callback (Optional[Callable[[int, int], None]]):
+                Called after each finished file with count of finished
+                files and count of all files.
+            use_hash (Optional[bool]): Compare content hash of existing
+                destination files instead of size and modification time.
+            overwrite (Optional[bool]): Replace existing destination files
+                which are not identical to source files.
+
+        Returns:
+            DeliveryReport: Report of delivery.
+        """
+
+        if max_workers is None:
+            max_workers = self.max_workers
+
+        items = self._items
+        total = len(items)
+        for dirpath in sorted({os.path.dirname(item.dst_path)
+                               for item in items}):
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+        finished = 0
+        if max_workers <= 1 or total <= 1:
+            for item in items:
+                state = exc = None
+                try:
+                    state = self._deliver_item(item, overwrite, use_hash)
+                except Exception as _exc:
+                    exc = _exc
+                self._on_item_finished(item, state, exc)
+                finished += 1
+                if progress_callback is not None:
+                    progress_callback(finished, total)
+            return self._report
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        self.log.debug("Delivering {} files using {} workers".format(
+            total, max_workers
+        ))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._deliver_item, item, overwrite, use_hash
+                ): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                exc = future.exception()
+                state = None if exc is not None else future.result()
+                self._on_item_finished(futures[future], state, exc)
+                finished += 1
+                if progress_callback is not None:
+                    progress_callback(finished, total)
+        return self._report
+
+
+def _deliver_with_planner(planner, report_items):
+    report = planner.execute(max_workers=1)
+    for title, messages in report.to_report_items().items():
+        report_items[title].extend(messages)
+    return report_items, report.processed_count
 
 
 def deliver_single_file(
@@ -124,6 +665,8 @@ def deliver_single_file(
 ):
     """Copy single file to calculated path based on template
 
+    Use 'DeliveryPlanner' to deliver multiple files.
+
     Args:
         src_path(str): path of source representation file
         repre (dict): full repre, used only in deliver_sequence, here only
@@ -139,35 +682,9 @@ def deliver_single_file(
         (collections.defaultdict, int)
     """
 
-    # Make sure path is valid for all platforms
-    src_path = os.path.normpath(src_path.replace("\\", "/"))
-
-    if not os.path.exists(src_path):
-        msg = "{} doesn't exist for {}".format(src_path, repre["_id"])
-        report_items["Source file was not found"].append(msg)
-        return report_items, 0
-
-    if format_dict:
-        anatomy_data = copy.deepcopy(anatomy_data)
-        anatomy_data["root"] = format_dict["root"]
-    template_obj = anatomy.templates_obj["delivery"][template_name]
-    delivery_path = template_obj.format_strict(anatomy_data)
-
-    # Backwards compatibility when extension contained `.`
-    delivery_path = delivery_path.replace("..", ".")
-    # Make sure path is valid for all platforms
-    delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
-    # Remove newlines from the end of the string to avoid OSError during copy
-    delivery_path = delivery_path.rstrip()
-
-    delivery_folder = os.path.dirname(delivery_path)
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
-    log.debug("Copying single: {} -> {}".format(src_path, delivery_path))
-    _copy_file(src_path, delivery_path)
-
-    return report_items, 1
+    planner = DeliveryPlanner(anatomy, template_name, format_dict, log=log)
+    planner.add_file(src_path, repre, anatomy_data)
+    return _deliver_with_planner(planner, report_items)
 
 
 def deliver_sequence(
@@ -185,11 +702,7 @@ def deliver_sequence(
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
 
-        Uses listing physical files (not 'files' on repre as a)might not be
-         present, b)might not be reliable for representation and copying them.
-
-         TODO Should be refactored when files are sufficient to drive all
-         representations.
+        Use 'DeliveryPlanner' to deliver multiple representations.
 
     Args:
         src_path(str): path of source representation file
@@ -205,121 +718,12 @@ def deliver_sequence(
         (collections.defaultdict, int)
     """
 
-    src_path = os.path.normpath(src_path.replace("\\", "/"))
-
-    def hash_path_exist(myPath):
-        res = myPath.replace('#', '*')
-        glob_search_results = glob.glob(res)
-        if len(glob_search_results) > 0:
-            return True
-        return False
-
-    if not hash_path_exist(src_path):
-        msg = "{} doesn't exist for {}".format(
-            src_path, repre["_id"])
-        report_items["Source file was not found"].append(msg)
-        return report_items, 0
-
-    delivery_templates = anatomy.templates.get("delivery") or {}
-    delivery_template = delivery_templates.get(template_name)
-    if delivery_template is None:
-        msg = (
-            "Delivery template \"{}\" in anatomy of project \"{}\""
-            " was not found"
-        ).format(template_name, anatomy.project_name)
-        report_items[""].append(msg)
-        return report_items, 0
-
-    # Check if 'frame' key is available in template which is required
-    #   for sequence delivery
-    if "{frame" not in delivery_template:
-        msg = (
-            "Delivery template \"{}\" in anatomy of project \"{}\""
-            "does not contain '{{frame}}' key to fill. Delivery of sequence"
-            " can't be processed."
-        ).format(template_name, anatomy.project_name)
-        report_items[""].append(msg)
-        return report_items, 0
-
-    dir_path, file_name = os.path.split(str(src_path))
-
-    context = repre["context"]
-    ext = context.get("ext", context.get("representation"))
-
-    if not ext:
-        msg = "Source extension not found, cannot find collection"
-        report_items[msg].append(src_path)
-        log.warning("{} <{}>".format(msg, context))
-        return report_items, 0
-
-    ext = "." + ext
-    # context.representation could be .psd
-    ext = ext.replace("..", ".")
-
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
-    src_collection = None
-    for col in src_collections:
-        if col.tail != ext:
-            continue
-
-        src_collection = col
-        break
-
-    if src_collection is None:
-        msg = "Source collection of files was not found"
-        report_items[msg].append(src_path)
-        log.warning("{} <{}>".format(msg, src_path))
-        return report_items, 0
-
-    frame_indicator = "@####@"
-
-    anatomy_data = copy.deepcopy(anatomy_data)
-    anatomy_data["frame"] = frame_indicator
-    if format_dict:
-        anatomy_data["root"] = format_dict["root"]
-    template_obj = anatomy.templates_obj["delivery"][template_name]
-    delivery_path = template_obj.format_strict(anatomy_data)
-
-    delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
-    delivery_folder = os.path.dirname(delivery_path)
-    dst_head, dst_tail = delivery_path.split(frame_indicator)
-    dst_padding = src_collection.padding
-    dst_collection = clique.Collection(
-        head=dst_head,
-        tail=dst_tail,
-        padding=dst_padding
+    planner = DeliveryPlanner(anatomy, template_name, format_dict, log=log)
+    planner.add_sequence(
+        src_path,
+        repre,
+        anatomy_data,
+        has_renumbered_frame,
+        new_frame_start
     )
-
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
-    src_head = src_collection.head
-    src_tail = src_collection.tail
-    uploaded = 0
-    first_frame = min(src_collection.indexes)
-    for index in src_collection.indexes:
-        src_padding = src_collection.format("{padding}") % index
-        src_file_name = "{}{}{}".format(src_head, src_padding, src_tail)
-        src = os.path.normpath(
-            os.path.join(dir_path, src_file_name)
-        )
-        dst_index = index
-        if has_renumbered_frame:
-            # Calculate offset between first frame and current frame
-            # - '0' for first frame
-            offset = new_frame_start - first_frame
-            # Add offset to new frame start
-            dst_index = index + offset
-            if dst_index < 0:
-                msg = "Renumber frame has a smaller number than original frame"     # noqa
-                report_items[msg].append(src_file_name)
-                log.warning("{} <{}>".format(msg, context))
-                return report_items, 0
-        dst_padding = dst_collection.format("{padding}") % dst_index
-        dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
-        log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
-
-        uploaded += 1
-
-    return report_items, uploaded
+    return _deliver_with_planner(planner, report_items)
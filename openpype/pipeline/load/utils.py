@@ -17,8 +17,8 @@ from openpype.client import (
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
     get_version_by_name,
-    get_last_versions,
     get_representations,
+    get_representations_last_versions,
     get_representation_by_id,
     get_representation_by_name,
     get_representation_parents
@@ -891,56 +891,11 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
+    # Version and last version of subset for each representation
+    #   - hero versions are considered as latest
+    last_versions_by_repre_id = get_representations_last_versions(
+        project_name, repre_ids
     )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
-    verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
-        #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
-            continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
-
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
-    )
-    # Figure out which versions are outdated
-    outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
-                outdated_version_ids.add(version_id)
 
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
@@ -951,8 +906,8 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
+        repre_item = last_versions_by_repre_id.get(repre_id)
+        if not repre_item:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
@@ -960,17 +915,20 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
-            outdated_containers.append(container)
-
-        elif version_id not in verisons_by_id:
+        version_id = repre_item["version_id"]
+        if version_id is None:
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
             ).format(container_name))
             not_found_containers.append(container)
 
+        elif (
+            repre_item["version_type"] != "hero_version"
+            and version_id != repre_item["last_version_id"]
+        ):
+            outdated_containers.append(container)
+
         else:
             uptodate_containers.append(container)
 
@@ -1,10 +1,12 @@
 import os
+import sys
+import time
 import inspect
 import traceback
 
 from openpype.lib import Logger
 from openpype.lib.python_module_tools import (
-    modules_from_path,
+    import_filepath,
     classes_from_module,
 )
 
@@ -25,6 +27,9 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Time of import in seconds by file path, 'None' if cached module
+        #   was used
+        self.import_times = {}
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -77,6 +82,21 @@ class DiscoverResult:
             for cls in self.duplicated_plugins:
                 lines.append("- {}".format(cls.__name__))
 
+        if full_report:
+            imported_times = [
+                (import_time, path)
+                for path, import_time in self.import_times.items()
+                if import_time is not None
+            ]
+            lines.append(
+                "*** Imported {} files, reused {} cached files".format(
+                    len(imported_times),
+                    len(self.import_times) - len(imported_times)
+                )
+            )
+            for import_time, path in sorted(imported_times, reverse=True):
+                lines.append("- {:.3f}s {}".format(import_time, path))
+
         if self.crashed_file_paths or full_report:
             lines.append("*** Failed to load {} files".format(len(
                 self.crashed_file_paths
@@ -96,12 +116,171 @@ class DiscoverResult:
             log.info(report)
 
 
+class PluginModulesCache(object):
+    """Imported python files from plugin paths.
+
+    File is imported again only if its modification time or size changed,
+    otherwise module imported on previous discover is used. Cache can be
+    disabled with 'OPENPYPE_PLUGIN_DISCOVER_CACHE' environment variable set
+    to '0', then all files are imported on each discover.
+
+    Plugins apply settings by changing attributes of their class (e.g.
+    'LoaderPlugin.apply_settings'). Attributes of classes defined in
+    a reused module are restored to values from import, so settings of
+    previously used project don't leak to the next discover.
+    """
+
+    def __init__(self):
+        self._modules_by_path = {}
+
+    @staticmethod
+    def is_enabled():
+        return os.environ.get("OPENPYPE_PLUGIN_DISCOVER_CACHE") != "0"
+
+    def clear(self):
+        self._modules_by_path = {}
+
+    @staticmethod
+    def _get_classes_attributes(module):
+        """Attributes of classes defined in module.
+
+        Args:
+            module (types.ModuleType): Imported module.
+
+        Returns:
+            list[tuple[type, dict[str, Any]]]: Classes with copy of
+                their attributes.
+        """
+
+        output = []
+        for name in dir(module):
+            obj = getattr(module, name)
+            if (
+                inspect.isclass(obj)
+                and obj.__module__ == module.__name__
+            ):
+                output.append((obj, dict(obj.__dict__)))
+        return output
+
+    @staticmethod
+    def _restore_classes_attributes(classes_attributes):
+        """Restore attributes of classes to values from import.
+
+        Args:
+            classes_attributes (list[tuple[type, dict[str, Any]]]): Classes
+                with their attributes from import.
+        """
+
+        for cls, attributes in classes_attributes:
+            for key in set(cls.__dict__) - set(attributes):
+                delattr(cls, key)
+
+            for key, value in attributes.items():
+                if key in ("__dict__", "__weakref__"):
+                    continue
+                if cls.__dict__.get(key) is not value:
+                    setattr(cls, key, value)
+
+    def modules_from_path(self, folder_path, import_times=None):
+        """Get python scripts as modules from a path.
+
+        Same as 'openpype.lib.python_module_tools.modules_from_path' but
+        modules of unchanged files are reused.
+
+        Args:
+            folder_path (str): Path to folder containing python scripts.
+            import_times (Optional[dict[str, Union[float, None]]]): Time of
+                import by file path is stored here. 'None' if cached
+                module was used.
+
+        Returns:
+            tuple[list, list]: First list contains successfully imported
+                modules and second list contains tuples of path and
+                exception.
+        """
+
+        if import_times is None:
+            import_times = {}
+
+        crashed = []
+        modules = []
+        output = (modules, crashed)
+        # Just skip and return empty list if path is not set
+        if not folder_path:
+            return output
+
+        # Do not allow relative imports
+        if folder_path.startswith("."):
+            log.warning((
+                "BUG: Relative paths are not allowed for security reasons. {}"
+            ).format(folder_path))
+            return output
+
+        folder_path = os.path.normpath(folder_path)
+
+        if not os.path.isdir(folder_path):
+            log.warning("Not a directory path: {}".format(folder_path))
+            return output
+
+        use_cache = self.is_enabled()
+        for filename in os.listdir(folder_path):
+            # Ignore files which start with underscore
+            if filename.startswith("_"):
+                continue
+
+            mod_name, mod_ext = os.path.splitext(filename)
+            if not mod_ext == ".py":
+                continue
+
+            full_path = os.path.join(folder_path, filename)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue
+
+            if not os.path.isfile(full_path):
+                continue
+
+            cache_key = (stat.st_mtime, stat.st_size)
+            cached = self._modules_by_path.get(full_path)
+            if use_cache and cached is not None and cached[0] == cache_key:
+                _, module, classes_attributes = cached
+                self._restore_classes_attributes(classes_attributes)
+                import_times[full_path] = None
+                modules.append((full_path, module))
+                continue
+
+            start = time.time()
+            try:
+                module = import_filepath(full_path, mod_name)
+
+            except Exception:
+                self._modules_by_path.pop(full_path, None)
+                crashed.append((full_path, sys.exc_info()))
+                log.warning(
+                    "Failed to load path: \"{0}\"".format(full_path),
+                    exc_info=True
+                )
+                continue
+
+            import_times[full_path] = time.time() - start
+            if use_cache:
+                self._modules_by_path[full_path] = (
+                    cache_key, module, self._get_classes_attributes(module)
+                )
+            modules.append((full_path, module))
+
+        return output
+
+
 class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
-    Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    Keeps in memory all registered types and their paths. Python files in
+    paths are imported on discover. Modules of files which did not change
+    since previous discover are reused (see 'PluginModulesCache'), so
+    discover calls return the same class objects for unchanged files with
+    attributes restored to values from import.
     """
 
     def __init__(self):
@@ -110,6 +289,7 @@ class PluginDiscoverContext(object):
         self._last_discovered_plugins = {}
         # Store the last result to memory
         self._last_discovered_results = {}
+        self._modules_cache = PluginModulesCache()
 
     def get_last_discovered_plugins(self, superclass):
         """Access last discovered plugin by a subperclass.
@@ -168,7 +348,9 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = self._modules_cache.modules_from_path(
+                path, result.import_times
+            )
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -199,6 +381,20 @@ class PluginDiscoverContext(object):
         self._last_discovered_plugins[superclass] = list(
             result.plugins
         )
+        imported_times = [
+            import_time
+            for import_time in result.import_times.values()
+            if import_time is not None
+        ]
+        log.debug((
+            "Discovered {}: imported {} files in {:.3f}s,"
+            " reused {} cached files"
+        ).format(
+            superclass.__name__,
+            len(imported_times),
+            sum(imported_times),
+            len(result.import_times) - len(imported_times)
+        ))
         result.log_report()
         if return_report:
             return result
@@ -56,7 +56,7 @@ def get_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     return copy.deepcopy(
         project_settings
@@ -91,7 +91,7 @@ def get_hero_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     return copy.deepcopy(
         project_settings
@@ -743,7 +743,9 @@ def get_custom_staging_dir_info(project_name, host_name, family, task_name,
     Raises:
         ValueError - if misconfigured template should be used
     """
-    settings = project_settings or get_project_settings(project_name)
+    settings = project_settings or get_project_settings(
+        project_name, read_only=True
+    )
     custom_staging_dir_profiles = (settings["global"]
                                            ["tools"]
                                            ["publish"]
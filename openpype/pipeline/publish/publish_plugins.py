@@ -14,7 +14,8 @@ from .lib import (
 
 from openpype.pipeline.colorspace import (
     get_colorspace_settings_from_publish_context,
-    set_colorspace_data_to_representation
+    set_colorspace_data_to_representation,
+    set_colorspace_data_to_representations,
 )
 
 
@@ -349,3 +350,23 @@ class ColormanagedPyblishPluginMixin(object):
             colorspace,
             log=self.log
         )
+
+    def set_representations_colorspace(
+        self, representations, context,
+        colorspace=None,
+    ):
+        """Sets colorspace data to multiple representations.
+
+        File rules are resolved for all representations at once.
+
+        Args:
+            representations (list[dict]): publishing representations
+            context (publish.Context): publishing context
+            colorspace (str, optional): colorspace name. Defaults to None.
+        """
+
+        set_colorspace_data_to_representations(
+            representations, context.data,
+            colorspace,
+            log=self.log
+        )
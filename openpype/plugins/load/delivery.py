@@ -1,6 +1,5 @@
 import copy
 import platform
-from collections import defaultdict
 
 from qtpy import QtWidgets, QtCore, QtGui
 
@@ -16,9 +15,7 @@ from openpype.lib import (
 from openpype.pipeline.load import get_representation_path_with_anatomy
 from openpype.pipeline.delivery import (
     get_format_dict,
-    check_destination_path,
-    deliver_single_file,
-    deliver_sequence,
+    DeliveryPlanner,
 )
 
 
@@ -76,7 +73,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.anatomy = Anatomy(project_name)
         self._representations = None
         self.log = log
-        self.currently_uploaded = 0
 
         self._set_representations(project_name, contexts)
 
@@ -184,8 +180,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.btn_delivery.setEnabled(False)
         QtWidgets.QApplication.processEvents()
 
-        report_items = defaultdict(list)
-
         selected_repres = self._get_selected_repres()
 
         datetime_data = get_datetime_data()
@@ -193,6 +187,14 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        planner = DeliveryPlanner(
+            self.anatomy,
+            template_name,
+            format_dict,
+            datetime_data,
+            self.log
+        )
+        report = planner.report
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -202,27 +204,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             )
 
             anatomy_data = copy.deepcopy(repre["context"])
-            new_report_items = check_destination_path(str(repre["_id"]),
-                                                      self.anatomy,
-                                                      anatomy_data,
-                                                      datetime_data,
-                                                      template_name)
-
-            report_items.update(new_report_items)
-            if new_report_items:
-                continue
-
-            args = [
-                repre_path,
-                repre,
-                self.anatomy,
-                template_name,
-                anatomy_data,
-                format_dict,
-                report_items,
-                self.log
-            ]
-
             if repre.get("files"):
                 src_paths = []
                 for repre_file in repre["files"]:
@@ -236,8 +217,8 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 if frames:
                     first_frame = min(frames)
 
+                src_paths_with_frames = []
                 for src_path, frame in sources_and_frames.items():
-                    args[0] = src_path
                     # Renumber frames
                     if renumber_frame and frame is not None:
                         # Calculate offset between
@@ -248,30 +229,30 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                         dst_frame = int(frame) + offset
                         if dst_frame < 0:
                             msg = "Renumber frame has a smaller number than original frame"     # noqa
-                            report_items[msg].append(src_path)
+                            report.add_error(msg, src_path)
                             self.log.warning("{} <{}>".format(
                                 msg, dst_frame))
                             continue
                         frame = dst_frame
+                    src_paths_with_frames.append((src_path, frame))
+
+                planner.add_files(repre, anatomy_data, src_paths_with_frames)
 
-                    if frame is not None:
-                        anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
-                    report_items.update(new_report_items)
-                    self._update_progress(uploaded)
             else:  # fallback for Pype2 and representations without files
                 frame = repre['context'].get('frame')
                 if frame:
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
                 if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    planner.add_file(repre_path, repre, anatomy_data)
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
-                report_items.update(new_report_items)
-                self._update_progress(uploaded)
+                    planner.add_sequence(repre_path, repre, anatomy_data)
+
+        planner.execute(progress_callback=self._update_progress)
 
-        self.text_area.setText(self._format_report(report_items))
+        self.text_area.setText(
+            self._format_report(report.to_report_items())
+        )
         self.text_area.setVisible(True)
 
     def _get_representation_names(self):
@@ -349,12 +330,11 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
-
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+    def _update_progress(self, finished, total):
+        """Update progress bar after each file delivered."""
+        ratio = finished / total
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
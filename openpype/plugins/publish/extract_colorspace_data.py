@@ -37,12 +37,10 @@ class ExtractColorspaceData(publish.Extractor,
         # get colorspace settings
         context = instance.context
 
-        # loop representations
-        for representation in representations:
-            # skip if colorspaceData is already at representation
-            if representation.get("colorspaceData"):
-                continue
-
-            self.set_representation_colorspace(
-                representation, context
-            )
+        # skip if colorspaceData is already at representation
+        representations = [
+            representation
+            for representation in representations
+            if not representation.get("colorspaceData")
+        ]
+        self.set_representations_colorspace(representations, context)
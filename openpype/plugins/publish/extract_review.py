@@ -3,7 +3,9 @@ import re
 import copy
 import json
 import shutil
+import tempfile
 import subprocess
+import multiprocessing
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -12,6 +14,7 @@ import speedcopy
 import pyblish.api
 
 from openpype.lib import (
+    create_hard_link,
     get_ffmpeg_tool_args,
     filter_profiles,
     path_to_subprocess_arg,
@@ -76,6 +79,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Maximum number of output definitions rendered at the same time
+    #   - value lower than 1 means number of CPUs
+    output_max_workers = 1
+    # How gaps in input sequence are filled
+    #   - "link" uses hardlinks or symlinks of nearest existing frames and
+    #       falls back to ffmpeg concat list if links can't be created
+    #   - "concat" uses ffmpeg concat list with frame durations
+    #   - "copy" copies nearest existing frames
+    gap_fill_mode = "link"
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -320,6 +332,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        output_jobs = []
+        files_to_clean = []
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -369,15 +383,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
             if temp_data["input_is_sequence"]:
                 self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
+                added_files = self._fill_output_sequence_gaps(
+                    temp_data, new_repre["stagingDir"]
                 )
+                for filepath in added_files:
+                    if filepath not in files_to_clean:
+                        files_to_clean.append(filepath)
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -414,29 +427,97 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    # Skip remaining output definitions but process
+                    #   already prepared outputs
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+            concat_list_path = temp_data.get("concat_list_path")
+            if concat_list_path:
+                files_to_clean.append(concat_list_path)
+
+            output_jobs.append({
+                "new_repre": new_repre,
+                "output_def": output_def,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "temp_data": temp_data,
+                "ffmpeg_args": ffmpeg_args,
+            })
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        try:
+            self._process_output_jobs(instance, output_jobs)
 
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+            for filepath in files_to_clean:
+                if os.path.exists(filepath):
+                    os.unlink(filepath)
+
+    def _get_output_max_workers(self, jobs_count):
+        """Number of ffmpeg commands which can run at the same time.
+
+        Args:
+            jobs_count (int): Number of commands to run.
+
+        Returns:
+            int: Number of workers.
+        """
+
+        max_workers = self.output_max_workers
+        if max_workers is None or max_workers < 1:
+            max_workers = multiprocessing.cpu_count()
+        return max(1, min(max_workers, jobs_count))
+
+    def _process_output_jobs(self, instance, output_jobs):
+        """Run ffmpeg for prepared outputs and add new representations.
+
+        Representations are added in order of output definitions no matter
+        in which order ffmpeg commands finished.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            output_jobs (list[dict[str, Any]]): Prepared output definitions
+                with ffmpeg arguments.
+        """
+
+        max_workers = self._get_output_max_workers(len(output_jobs))
+        ffmpeg_threads = None
+        if max_workers > 1:
+            # Split available CPUs between concurrently running commands
+            ffmpeg_threads = max(
+                1, multiprocessing.cpu_count() // max_workers
+            )
+
+        commands = []
+        for output_job in output_jobs:
+            ffmpeg_args = output_job["ffmpeg_args"]
+            if ffmpeg_threads is not None and not any(
+                arg.startswith("-threads")
+                for arg in ffmpeg_args
+            ):
+                # Output path is always last argument
+                ffmpeg_args = list(ffmpeg_args)
+                ffmpeg_args.insert(
+                    -1, "-threads {}".format(ffmpeg_threads)
+                )
+            commands.append(" ".join(ffmpeg_args))
+
+        for idx in self._run_ffmpeg_commands(commands, max_workers):
+            output_job = output_jobs[idx]
+            new_repre = output_job["new_repre"]
+            temp_data = output_job["temp_data"]
+            output_name = output_job["output_name"]
+            output_ext = output_job["output_ext"]
 
             new_repre.update({
                 "fps": temp_data["fps"],
                 "name": "{}_{}".format(output_name, output_ext),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": output_job["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                "ffmpeg_cmd": commands[idx]
             })
 
             # Force to pop these key if are in new repre
@@ -452,6 +533,46 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _run_ffmpeg_command(self, subprcs_cmd):
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+        run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+    def _run_ffmpeg_commands(self, commands, max_workers=1):
+        """Run ffmpeg commands, concurrently if more workers are allowed.
+
+        Indexes of finished commands are yielded in order of passed commands.
+        When a command fails, commands which did not start yet are cancelled
+        and the error is raised after running commands are finished.
+
+        Args:
+            commands (list[str]): Commands to run.
+            max_workers (int): Maximum number of running commands.
+
+        Yields:
+            int: Index of successfully finished command.
+        """
+
+        if max_workers <= 1 or len(commands) < 2:
+            for idx, subprcs_cmd in enumerate(commands):
+                self._run_ffmpeg_command(subprcs_cmd)
+                yield idx
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._run_ffmpeg_command, subprcs_cmd)
+                for subprcs_cmd in commands
+            ]
+            try:
+                for idx, future in enumerate(futures):
+                    future.result()
+                    yield idx
+            finally:
+                for future in futures:
+                    future.cancel()
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -647,20 +768,39 @@ class ExtractReview(pyblish.api.InstancePlugin):
             start_number = temp_data["first_sequence_frame"]
             if temp_data["without_handles"] and temp_data["handles_are_set"]:
                 start_number += temp_data["handle_start"]
-            ffmpeg_input_args.extend([
-                "-start_number", str(start_number)
-            ])
 
-            # TODO add fps mapping `{fps: fraction}` ?
-            # - e.g.: {
-            #     "25": "25/1",
-            #     "24": "24/1",
-            #     "23.976": "24000/1001"
-            # }
-            # Add framerate to input when input is sequence
-            ffmpeg_input_args.extend([
-                "-framerate", str(temp_data["fps"])
-            ])
+            if temp_data.get("use_concat_list"):
+                # Gaps are filled by durations of frames in concat list
+                concat_list_path = self._create_sequence_concat_list(
+                    temp_data, start_number, output_frames_len
+                )
+                temp_data["concat_list_path"] = concat_list_path
+                temp_data["full_input_path"] = concat_list_path
+                ffmpeg_input_args.extend(["-f concat", "-safe 0"])
+                # Output framerate is not defined by concat list
+                if not any(
+                    arg.startswith("-r ")
+                    for arg in ffmpeg_output_args
+                ):
+                    ffmpeg_output_args.append(
+                        "-r {}".format(temp_data["fps"])
+                    )
+
+            else:
+                ffmpeg_input_args.extend([
+                    "-start_number", str(start_number)
+                ])
+
+                # TODO add fps mapping `{fps: fraction}` ?
+                # - e.g.: {
+                #     "25": "25/1",
+                #     "24": "24/1",
+                #     "23.976": "24000/1001"
+                # }
+                # Add framerate to input when input is sequence
+                ffmpeg_input_args.extend([
+                    "-framerate", str(temp_data["fps"])
+                ])
             # Add duration of an input sequence if output is video
             if not temp_data["output_is_sequence"]:
                 ffmpeg_input_args.extend([
@@ -842,28 +982,46 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return all_args
 
-    def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
-        # type: (list, str, int, int) -> list
-        """Fill missing files in sequence by duplicating existing ones.
+    def _fill_output_sequence_gaps(self, temp_data, staging_dir):
+        """Fill gaps in input sequence based on 'gap_fill_mode'.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        Key 'use_concat_list' is set to temp data. It is 'True' when gaps
+        should be filled by ffmpeg concat list instead of files.
 
         Args:
-            files (list): List of representation files.
+            temp_data (dict): Base data for successful process.
             staging_dir (str): Path to staging directory.
-            start_frame (int): Sequence start (no matter what files are there)
-            end_frame (int): Sequence end (no matter what files are there)
 
         Returns:
-            list of added files. Those should be cleaned after work
+            list[str]: Added files which should be cleaned after work
                 is done.
-
-        Raises:
-            KnownPublishError: if more than one collection is obtained.
         """
 
+        temp_data["use_concat_list"] = False
+        files = temp_data["origin_repre"]["files"]
+        start_frame = temp_data["frame_start"]
+        end_frame = temp_data["frame_end"]
+        if self.gap_fill_mode != "concat":
+            use_links = self.gap_fill_mode == "link"
+            try:
+                return self.fill_sequence_gaps(
+                    files, staging_dir, start_frame, end_frame, use_links
+                )
+            except OSError:
+                if not use_links:
+                    raise
+                self.log.debug((
+                    "Failed to create links to fill gaps in sequence."
+                    " Using ffmpeg concat list."
+                ), exc_info=True)
+
+        elif not self._get_sequence_gaps(files, start_frame, end_frame)[1]:
+            return []
+
+        temp_data["use_concat_list"] = True
+        return []
+
+    def _get_sequence_gaps(self, files, start_frame, end_frame):
         collections = clique.assemble(files)[0]
         if len(collections) != 1:
             raise KnownPublishError(
@@ -873,7 +1031,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Prepare which hole is filled with what frame
         #   - the frame is filled only with already existing frames
-        prev_frame = next(iter(col.indexes))
+        prev_frame = min(col.indexes)
         hole_frame_to_nearest = {}
         for frame in range(int(start_frame), int(end_frame) + 1):
             if frame in col.indexes:
@@ -881,6 +1039,39 @@ class ExtractReview(pyblish.api.InstancePlugin):
             else:
                 # Use previous frame as source for hole
                 hole_frame_to_nearest[frame] = prev_frame
+        return col, hole_frame_to_nearest
+
+    def fill_sequence_gaps(
+        self, files, staging_dir, start_frame, end_frame, use_links=False
+    ):
+        # type: (list, str, int, int, bool) -> list
+        """Fill missing files in sequence by duplicating existing ones.
+
+        This will take nearest frame file and copy it with so as to fill
+        gaps in sequence. Last existing file there is is used to for the
+        hole ahead.
+
+        Args:
+            files (list): List of representation files.
+            staging_dir (str): Path to staging directory.
+            start_frame (int): Sequence start (no matter what files are there)
+            end_frame (int): Sequence end (no matter what files are there)
+            use_links (bool): Create hardlinks, or symlinks if hardlinks are
+                not supported, instead of copies.
+
+        Returns:
+            list of added files. Those should be cleaned after work
+                is done.
+
+        Raises:
+            KnownPublishError: if more than one collection is obtained.
+            OSError: if links can't be created. Already created links are
+                removed.
+        """
+
+        col, hole_frame_to_nearest = self._get_sequence_gaps(
+            files, start_frame, end_frame
+        )
 
         # Calculate paths
         added_files = []
@@ -892,11 +1083,85 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            if not use_links:
+                speedcopy.copyfile(src_fpath, hole_fpath)
+                added_files.append(hole_fpath)
+                continue
+
+            try:
+                self._link_file(src_fpath, hole_fpath)
+            except OSError:
+                for filepath in added_files:
+                    os.unlink(filepath)
+                raise
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _link_file(self, src_path, dst_path):
+        """Create hardlink of file, or symlink if hardlink is not possible.
+
+        Existing destination file is replaced.
+        """
+
+        if os.path.lexists(dst_path):
+            os.unlink(dst_path)
+
+        try:
+            create_hard_link(src_path, dst_path)
+        except (OSError, NotImplementedError):
+            os.symlink(src_path, dst_path)
+
+    def _create_sequence_concat_list(self, temp_data, start_number, frames):
+        """Create ffmpeg concat list filling gaps with frame durations.
+
+        Missing frames extend duration of previous existing frame, so no
+        image data are duplicated.
+
+        Args:
+            temp_data (dict): Base data for successful process.
+            start_number (int): First frame of input.
+            frames (int): Number of frames in output.
+
+        Returns:
+            str: Path to created concat list file.
+        """
+
+        repre = temp_data["origin_repre"]
+        col = clique.assemble(repre["files"])[0][0]
+        col_format = col.format("{head}{padding}{tail}")
+        input_dir = os.path.dirname(temp_data["full_input_path"])
+
+        # Group following frames using the same source frame
+        entries = []
+        src_frame = min(col.indexes)
+        for frame in range(start_number, start_number + frames):
+            if frame in col.indexes:
+                src_frame = frame
+            if entries and entries[-1][0] == src_frame:
+                entries[-1][1] += 1
+            else:
+                entries.append([src_frame, 1])
+
+        lines = ["ffconcat version 1.0"]
+        for src_frame, count in entries:
+            filepath = os.path.join(input_dir, col_format % src_frame)
+            lines.append("file '{}'".format(
+                filepath.replace("\\", "/").replace("'", "'\\''")
+            ))
+            lines.append("duration {:0.10f}".format(
+                count / temp_data["fps"]
+            ))
+        # Last file must be repeated to apply duration of last entry
+        lines.append(lines[-2])
+
+        fd, concat_list_path = tempfile.mkstemp(
+            prefix="review_concat_", suffix=".txt"
+        )
+        with os.fdopen(fd, "w") as stream:
+            stream.write("\n".join(lines) + "\n")
+        return concat_list_path
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
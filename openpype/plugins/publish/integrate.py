@@ -9,6 +9,7 @@ import six
 from bson.objectid import ObjectId
 import pyblish.api
 
+from openpype import AYON_SERVER_ENABLED
 from openpype.client.operations import (
     OperationsSession,
     new_subset_document,
@@ -24,7 +25,11 @@ from openpype.client import (
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import (
+    source_hash,
+    source_hash_from_stat,
+    FormatObject,
+)
 from openpype.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -57,6 +62,21 @@ def get_frame_padded(frame, padding):
     return "{frame:0{padding}d}".format(padding=padding, frame=frame)
 
 
+class SequenceIndexPlaceholder(FormatObject):
+    """Placeholder of frame or udim index used to fill template only once.
+
+    Formatting specification of the key is ignored so the placeholder is
+    filled into template unchanged and can be replaced with padded indexes
+    afterwards.
+    """
+
+    def __init__(self):
+        self.value = "__OPENPYPE_SEQUENCE_INDEX__"
+
+    def __format__(self, *args, **kwargs):
+        return self.value
+
+
 class IntegrateAsset(pyblish.api.InstancePlugin):
     """Register publish in the database and transfer files to destinations.
 
@@ -146,6 +166,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Fill destination template only once for sequence representations
+    #   and create destination paths of all frames by string substitution
+    use_sequence_template = True
+
+    # Amount of threads used to transfer files, files are transferred
+    #   serially if is set to 1
+    transfer_max_workers = 1
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -176,9 +204,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            progress_callback=self._log_transfer_progress
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -199,6 +231,38 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+        self._register_source_hashes(instance)
+
+    def _register_source_hashes(self, instance):
+        """Add published paths of processed textures to texture hash index.
+
+        Index is used to find already published textures by their source
+        hash, e.g. by maya 'ExtractLook'.
+        """
+        source_hashes = instance.data.get("sourceHashes")
+        if not source_hashes or AYON_SERVER_ENABLED:
+            return
+
+        from openpype.client.mongo import register_texture_hashes
+
+        try:
+            register_texture_hashes(
+                instance.context.data["projectName"], source_hashes
+            )
+        except Exception:
+            # Index is only optimization, publish must not fail because of it
+            self.log.warning(
+                "Failed to register source hashes", exc_info=True
+            )
+
+    def _log_transfer_progress(self, src, dst, finished_count, total):
+        # Log only each 10 percent of transferred files
+        step = max(1, total // 10)
+        if finished_count % step == 0 or finished_count == total:
+            self.log.debug("Transferred {}/{} files".format(
+                finished_count, total
+            ))
+
     def filter_representations(self, instance):
         # Prepare repsentations that should be integrated
         repres = instance.data.get("representations")
@@ -734,23 +798,40 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 padding=destination_padding
             )
 
-            # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
+            index_key = "udim" if is_udim else "frame"
+            sequence_destinations = None
+            if self.use_sequence_template:
+                sequence_destinations = self._get_sequence_destinations(
+                    path_template_obj,
+                    template_data,
+                    index_key,
+                    destination_indexes,
+                    destination_padding
                 )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
+
+            if sequence_destinations is not None:
+                dst_filepaths, repre_context = sequence_destinations
+
+            else:
+                # Construct destination collection from template
+                repre_context = None
+                dst_filepaths = []
+                for index in destination_indexes:
+                    template_data[index_key] = index
+                    template_filled = path_template_obj.format_strict(
+                        template_data
                     )
-                    repre_context = template_filled.used_values
+                    dst_filepaths.append(template_filled)
+                    if repre_context is None:
+                        self.log.debug(
+                            "Template filled: {}".format(str(template_filled))
+                        )
+                        repre_context = template_filled.used_values
+
+                # Update the destination indexes and padding
+                dst_collection = clique.assemble(dst_filepaths)[0][0]
+                dst_collection.padding = destination_padding
+                dst_filepaths = list(dst_collection)
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -758,10 +839,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_udim:
                 repre_context["frame"] = first_index_padded
 
-            # Update the destination indexes and padding
-            dst_collection = clique.assemble(dst_filepaths)[0][0]
-            dst_collection.padding = destination_padding
-            if len(src_collection.indexes) != len(dst_collection.indexes):
+            if len(src_collection.indexes) != len(dst_filepaths):
                 raise KnownPublishError((
                     "This is a bug. Source sequence frames length"
                     " does not match integration frames length"
@@ -769,7 +847,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             # Multiple file transfers
             transfers = []
-            for src_file_name, dst in zip(src_collection, dst_collection):
+            for src_file_name, dst in zip(src_collection, dst_filepaths):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
 
@@ -849,6 +927,68 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "published_files": [transfer[1] for transfer in transfers]
         }
 
+    def _get_sequence_destinations(
+        self,
+        path_template_obj,
+        template_data,
+        index_key,
+        destination_indexes,
+        destination_padding
+    ):
+        """Fill template once and create destination paths of a sequence.
+
+        Template is filled with a placeholder instead of frame (or udim)
+        index, destination paths are created by replacing the placeholder
+        with padded indexes.
+
+        Args:
+            path_template_obj (AnatomyStringTemplate): Path template.
+            template_data (dict[str, Any]): Data used to fill the template.
+            index_key (str): Key of sequence index in template ('frame' or
+                'udim').
+            destination_indexes (list[int]): Destination indexes.
+            destination_padding (int): Padding of destination indexes.
+
+        Returns:
+            Union[tuple[list[str], dict[str, Any]], None]: Destination paths
+                and representation context. None is returned if the template
+                can't be filled this way.
+        """
+
+        placeholder = SequenceIndexPlaceholder()
+        template_data[index_key] = placeholder
+        try:
+            template_filled = path_template_obj.format_strict(template_data)
+        finally:
+            # Keep the last index in data as when template is filled per frame
+            template_data[index_key] = destination_indexes[-1]
+
+        # The index must be in the filename exactly once and must not be
+        #   next to other digits so the output matches sequence assembled
+        #   by 'clique'
+        parts = str(template_filled).split(placeholder.value)
+        if (
+            len(parts) != 2
+            or os.path.sep in parts[1]
+            or "/" in parts[1]
+            or parts[0][-1:].isdigit()
+            or parts[1][:1].isdigit()
+        ):
+            return None
+
+        head, tail = parts
+        self.log.debug("Template filled: {}".format(
+            "{}{}{}".format(head, "#" * destination_padding, tail)
+        ))
+        padding = "%0{}d".format(destination_padding)
+        dst_filepaths = [
+            "{}{}{}".format(head, padding % index, tail)
+            for index in destination_indexes
+        ]
+        repre_context = template_filled.used_values
+        repre_context[index_key] = str(destination_indexes[0])
+        return dst_filepaths, repre_context
+
     def create_version_data(self, instance):
         """Create the data dictionary for the version
 
@@ -967,10 +1107,41 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             in representation
         """
 
+        # Find rootless path only once per directory, sequences are
+        #   usually integrated to a single directory
+        rootless_dirs = {}
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
-            file_infos.append(file_info)
+            dirpath, filename = os.path.split(file_path)
+            if not dirpath:
+                file_info = self.prepare_file_info(
+                    file_path, anatomy, sites=sites
+                )
+                file_infos.append(file_info)
+                continue
+
+            rootless_dir = rootless_dirs.get(dirpath)
+            if rootless_dir is None:
+                rootless_dir = self.get_rootless_path(anatomy, dirpath)
+                if rootless_dir == dirpath:
+                    rootless_dir = False
+                rootless_dirs[dirpath] = rootless_dir
+
+            if rootless_dir is False:
+                rootless_path = file_path
+            else:
+                rootless_path = "/".join([rootless_dir, filename])
+
+            # Single 'stat' call for size and hash
+            stat = os.stat(file_path)
+            file_hash = source_hash_from_stat(file_path, stat)
+            file_infos.append({
+                "_id": ObjectId(),
+                "path": rootless_path,
+                "size": stat.st_size,
+                "hash": file_hash,
+                "sites": sites
+            })
         return file_infos
 
     def prepare_file_info(self, path, anatomy, sites):
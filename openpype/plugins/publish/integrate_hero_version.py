@@ -1,7 +1,6 @@
 import os
 import copy
 import clique
-import errno
 import shutil
 
 import pyblish.api
@@ -19,7 +18,7 @@ from openpype.client.operations import (
     prepare_hero_version_update_data,
     prepare_representation_update_data,
 )
-from openpype.lib import create_hard_link
+from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline import (
     schema
 )
@@ -56,6 +55,10 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
     _default_template_name = "hero"
 
+    # Amount of threads used to copy files, files are copied serially
+    #   if is set to 1
+    transfer_max_workers = 1
+
     def process(self, instance):
         self.log.debug(
             "--- Integration of Hero version for subset `{}` begins.".format(
@@ -458,11 +461,9 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            self.copy_files(
+                list(src_to_dst_file_paths) + list(other_file_paths_mapping)
+            )
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -588,39 +589,41 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             family = instance.data["families"][0]
         return family
 
-    def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
-        dirname = os.path.dirname(dst_path)
+    def copy_files(self, src_to_dst_file_paths):
+        """Hardlink (or copy) files, concurrently if enabled.
 
-        try:
-            os.makedirs(dirname)
-            self.log.debug("Folder(s) created: \"{}\"".format(dirname))
-        except OSError as exc:
-            if exc.errno != errno.EEXIST:
-                self.log.error("An unexpected error occurred.", exc_info=True)
-                raise
+        Transferred files are removed if any transfer fails.
 
-            self.log.debug("Folder already exists: \"{}\"".format(dirname))
+        Args:
+            src_to_dst_file_paths (list[tuple[str, str]]): Source and
+                destination paths.
+        """
 
-        self.log.debug("Copying file \"{}\" to \"{}\"".format(
-            src_path, dst_path
-        ))
+        file_transaction = FileTransaction(
+            log=self.log,
+            allow_queue_replacements=True,
+            max_workers=self.transfer_max_workers,
+            progress_callback=self._log_transfer_progress
+        )
+        for src_path, dst_path in src_to_dst_file_paths:
+            file_transaction.add(
+                src_path, dst_path, FileTransaction.MODE_HARDLINK_OR_COPY
+            )
 
-        # First try hardlink and copy if paths are cross drive
         try:
-            create_hard_link(src_path, dst_path)
-            # Return when successful
-            return
-
-        except OSError as exc:
-            # re-raise exception if different than
-            # EXDEV - cross drive path
-            # EINVAL - wrong format, must be NTFS
-            self.log.debug("Hardlink failed with errno:'{}'".format(exc.errno))
-            if exc.errno not in [errno.EXDEV, errno.EINVAL]:
-                raise
-
-        shutil.copy(src_path, dst_path)
+            file_transaction.process()
+        except Exception:
+            file_transaction.rollback()
+            raise
+        file_transaction.finalize()
+
+    def _log_transfer_progress(self, src, dst, finished_count, total):
+        # Log only each 10 percent of transferred files
+        step = max(1, total // 10)
+        if finished_count % step == 0 or finished_count == total:
+            self.log.debug("Transferred {}/{} files".format(
+                finished_count, total
+            ))
 
     def version_from_representations(self, project_name, repres):
         for repre in repres:
@@ -293,7 +293,7 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath, database_only):
+    def pack_project(self, project_name, dirpath, database_only, codec=None):
         from openpype.lib.project_backpack import pack_project
 
         if database_only and not dirpath:
@@ -303,9 +303,20 @@ class PypeCommands:
                 " to specify directory."
             ))
 
-        pack_project(project_name, dirpath, database_only)
+        pack_project(project_name, dirpath, database_only, codec=codec)
 
     def unpack_project(self, zip_filepath, new_root, database_only):
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def prewarm_ocio_cache(self, paths):
+        from openpype.pipeline.colorspace import (
+            get_ocio_cache_dir,
+            prewarm_ocio_config_cache,
+        )
+
+        for path in paths:
+            prewarm_ocio_config_cache(path)
+            print("Cached OCIO config \"{}\"".format(path))
+        print("OCIO cache directory: \"{}\"".format(get_ocio_cache_dir()))
@@ -17,8 +17,14 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- batch - console command - python 2
+        - processing multiple queries in one process.
+- serve - console command - python 2
+        - long-lived process answering batched queries
+          received on stdin.
 """
 
+import sys
 import click
 import json
 from pathlib import Path
@@ -355,6 +361,39 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     return colorspace
 
 
+def _get_config_file_rules_colorspace_from_filepaths(config_path, filepaths):
+    """Return colorspaces found in v2 file rules for multiple paths.
+
+    Config is loaded only once for all paths.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+        filepaths (list[str]): path strings tested by v2 file rules
+
+    Raises:
+        IOError: Input config does not exist.
+
+    Returns:
+        list[str]: colorspace name for each filepath
+    """
+    config_path = Path(config_path)
+
+    if not config_path.is_file():
+        raise IOError(
+            f"Input path `{config_path}` should be `config.ocio` file")
+
+    config = ocio.Config().CreateFromFile(str(config_path))
+
+    output = []
+    for filepath in filepaths:
+        colorspace = config.getColorSpaceFromFilepath(str(filepath))
+        # Some versions of bindings return also index of matched rule
+        if isinstance(colorspace, (list, tuple)):
+            colorspace = colorspace[0]
+        output.append(colorspace)
+    return output
+
+
 def _get_display_view_colorspace_name(config_path, display, view):
     """Returns the colorspace attribute of the (display, view) pair.
 
@@ -429,5 +468,123 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+# Prefix of response lines of 'serve' command, other output of the process
+#   (e.g. from OpenPype launcher) is ignored by client
+SERVE_RESPONSE_PREFIX = "OCIO_WRAPPER_RESPONSE:"
+
+
+def _get_query_functions():
+    return {
+        "get_colorspace": _get_colorspace_data,
+        "get_views": _get_views_data,
+        "get_version": _get_version_data,
+        "get_display_view_colorspace_name": _get_display_view_colorspace_name,
+        "get_config_file_rules_colorspace_from_filepath": (
+            _get_config_file_rules_colorspace_from_filepath
+        ),
+        "get_config_file_rules_colorspace_from_filepaths": (
+            _get_config_file_rules_colorspace_from_filepaths
+        ),
+    }
+
+
+def process_queries(queries):
+    """Process multiple queries.
+
+    Each query is a dictionary with 'command', 'config_path' and optional
+    'kwargs' keys. Failed query does not affect other queries.
+
+    Args:
+        queries (list[dict]): Queries to process.
+
+    Returns:
+        list[dict]: Result for each query with 'result' key, or with
+            'error' key if query failed.
+    """
+    query_functions = _get_query_functions()
+    output = []
+    for query in queries:
+        command = query["command"]
+        func = query_functions.get(command)
+        if func is None:
+            output.append({"error": f"Unknown command '{command}'"})
+            continue
+
+        try:
+            result = func(query["config_path"], **(query.get("kwargs") or {}))
+            output.append({"result": result})
+
+        except Exception as exc:
+            output.append({"error": str(exc)})
+    return output
+
+
+@main.command(
+    name="batch",
+    help=(
+        "process multiple queries stored in json file "
+        "--in_path input arg is required"
+        "--out_path input arg is required"
+    )
+)
+@click.option("--in_path", required=True,
+              help="path to json file with queries",
+              type=click.Path(exists=True))
+@click.option("--out_path", required=True,
+              help="path where to write output json file",
+              type=click.Path())
+def batch(in_path, out_path):
+    """Process multiple queries in one process.
+
+    Python 2 wrapped console command
+
+    Args:
+        in_path (str): json file with list of queries
+        out_path (str): temp json file path string
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py batch \
+        --in_path=<path> --out_path=<path>
+    """
+    with open(in_path, "r") as f_:
+        queries = json.load(f_)
+
+    out_data = process_queries(queries)
+
+    with open(out_path, "w") as f_:
+        json.dump(out_data, f_)
+
+    print(f"Results of {len(queries)} queries are saved to '{out_path}'")
+
+
+@main.command(
+    name="serve",
+    help=(
+        "answer batched queries received on stdin until stdin is closed"
+    )
+)
+def serve():
+    """Long-lived process answering batched queries.
+
+    Each line on stdin is json list of queries, answer is printed as one
+    line prefixed with 'SERVE_RESPONSE_PREFIX'.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            out_data = process_queries(json.loads(line))
+        except Exception as exc:
+            out_data = {"error": str(exc)}
+
+        sys.stdout.write(SERVE_RESPONSE_PREFIX + json.dumps(out_data) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
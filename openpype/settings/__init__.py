@@ -24,6 +24,8 @@ from .lib import (
     get_current_project_settings,
     get_anatomy_settings,
     get_local_settings,
+    get_settings_cache_stats,
+    clear_settings_cache,
 )
 from .entities import (
     SystemSettings,
@@ -56,6 +58,8 @@ __all__ = (
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_local_settings",
+    "get_settings_cache_stats",
+    "clear_settings_cache",
 
     "SystemSettings",
     "ProjectSettings",
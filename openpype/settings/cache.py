@@ -0,0 +1,186 @@
+"""Cache of resolved settings.
+
+Resolution of settings applies studio, project and local overrides on default
+values, which is expensive to do on each request of settings. Resolved values
+are cached for a revision of stored settings and are frozen so the same object
+can be shared between callers which only read values. Callers which need to
+modify values get a mutable copy.
+"""
+
+
+class ReadOnlyDict(dict):
+    """Dictionary with settings values which can't be modified.
+
+    Copy created with 'copy.deepcopy' is mutable.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "Settings values are read-only. Use 'copy.deepcopy' to get"
+            " mutable copy."
+        )
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw_settings(self)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self), ))
+
+
+class ReadOnlyList(list):
+    """List with settings values which can't be modified.
+
+    Copy created with 'copy.deepcopy' is mutable.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(
+            "Settings values are read-only. Use 'copy.deepcopy' to get"
+            " mutable copy."
+        )
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def copy(self):
+        return list(self)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw_settings(self)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self), ))
+
+
+def freeze_settings(value):
+    """Convert settings values to read-only values.
+
+    Args:
+        value (Any): Settings values.
+
+    Returns:
+        Any: Values where dictionaries and lists are read-only.
+    """
+
+    if isinstance(value, dict):
+        return ReadOnlyDict(
+            (key, freeze_settings(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return ReadOnlyList(freeze_settings(item) for item in value)
+    return value
+
+
+def thaw_settings(value):
+    """Create mutable copy of settings values.
+
+    Faster alternative of 'copy.deepcopy' for json serializable values.
+
+    Args:
+        value (Any): Settings values.
+
+    Returns:
+        Any: Mutable copy of values.
+    """
+
+    if isinstance(value, dict):
+        return {
+            key: thaw_settings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [thaw_settings(item) for item in value]
+    return value
+
+
+class ResolvedSettingsCache(object):
+    """Resolved settings cached for a revision of stored settings.
+
+    Cached values are frozen with 'freeze_settings'. Value is outdated when
+    revision of stored settings changed since it was cached.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, revision):
+        """Cached value for revision of settings.
+
+        Args:
+            key (Hashable): Key of cached value.
+            revision (int): Current revision of stored settings.
+
+        Returns:
+            Union[Any, None]: Cached read-only value or None if value is not
+                cached or is outdated.
+        """
+
+        item = self._items.get(key)
+        if item is not None and item[0] == revision:
+            self.hits += 1
+            return item[1]
+        self.misses += 1
+        return None
+
+    def set(self, key, revision, value):
+        """Cache value for revision of settings.
+
+        Args:
+            key (Hashable): Key of cached value.
+            revision (int): Revision of stored settings used for the value.
+            value (Any): Resolved settings.
+
+        Returns:
+            Any: Cached read-only value.
+        """
+
+        value = freeze_settings(value)
+        self._items[key] = (revision, value)
+        return value
+
+    def clear(self):
+        self._items.clear()
+
+    def get_stats(self):
+        """Statistics of cache usage.
+
+        Returns:
+            dict[str, int]: Number of hits, misses and cached items.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "items": len(self._items),
+        }
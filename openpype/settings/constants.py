@@ -17,6 +17,8 @@ SYSTEM_SETTINGS_KEY = "system_settings"
 PROJECT_SETTINGS_KEY = "project_settings"
 PROJECT_ANATOMY_KEY = "project_anatomy"
 LOCAL_SETTING_KEY = "local_settings"
+# Key of document with revision of settings increased on each save
+SETTINGS_REVISION_KEY = "settings_revision"
 
 LEGACY_SETTINGS_VERSION = "legacy"
 
@@ -40,6 +42,7 @@ __all__ = (
     "PROJECT_SETTINGS_KEY",
     "PROJECT_ANATOMY_KEY",
     "LOCAL_SETTING_KEY",
+    "SETTINGS_REVISION_KEY",
 
     "SCHEMA_KEY_SYSTEM_SETTINGS",
     "SCHEMA_KEY_PROJECT_SETTINGS",
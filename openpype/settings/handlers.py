@@ -1,6 +1,7 @@
 import os
 import json
 import copy
+import time
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -21,6 +22,7 @@ from .constants import (
     PROJECT_SETTINGS_KEY,
     PROJECT_ANATOMY_KEY,
     LOCAL_SETTING_KEY,
+    SETTINGS_REVISION_KEY,
     M_OVERRIDDEN_KEY,
 
     LEGACY_SETTINGS_VERSION
@@ -253,6 +255,18 @@ class SettingsHandler(object):
         """
         pass
 
+    @abstractmethod
+    def get_settings_revision(self):
+        """Revision of stored settings.
+
+        Revision is changed on each save of settings or local settings so
+        it can be used to validate if cached settings are up to date.
+
+        Returns:
+            int: Revision of settings.
+        """
+        pass
+
     @abstractmethod
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
@@ -555,13 +569,86 @@ class LocalSettingsHandler:
         pass
 
 
+# Seconds for which queried revision of settings is reused. Settings saved
+#   by other processes are used after this delay.
+SETTINGS_REVISION_LIFETIME = 2
+# Revision with time of query by database and collection name
+_SETTINGS_REVISIONS = {}
+
+
+def _get_settings_revision_key(collection):
+    return (collection.database.name, collection.name)
+
+
+def get_settings_revision(collection, use_cache=True):
+    """Revision of settings stored in settings collection.
+
+    Queried revision is reused for 'SETTINGS_REVISION_LIFETIME' seconds so
+    consecutive requests of settings don't query database each time.
+
+    Args:
+        collection (pymongo.collection.Collection): Settings collection.
+        use_cache (Optional[bool]): Reuse recently queried revision.
+
+    Returns:
+        int: Revision of settings, 0 if settings were not saved yet.
+    """
+
+    key = _get_settings_revision_key(collection)
+    now = time.time()
+    cached = _SETTINGS_REVISIONS.get(key)
+    if (
+        use_cache
+        and cached is not None
+        and 0 <= now - cached[1] < SETTINGS_REVISION_LIFETIME
+    ):
+        return cached[0]
+
+    doc = collection.find_one(
+        {"type": SETTINGS_REVISION_KEY}, {"revision": True}
+    )
+    revision = 0
+    if doc:
+        revision = doc["revision"]
+    _SETTINGS_REVISIONS[key] = (revision, now)
+    return revision
+
+
+def increase_settings_revision(collection):
+    """Increase revision of settings after save.
+
+    Settings saved by this process are used immediately.
+
+    Args:
+        collection (pymongo.collection.Collection): Settings collection.
+    """
+
+    collection.update_one(
+        {"type": SETTINGS_REVISION_KEY},
+        {"$inc": {"revision": 1}},
+        upsert=True
+    )
+    _SETTINGS_REVISIONS.pop(_get_settings_revision_key(collection), None)
+
+
 class CacheValues:
-    cache_lifetime = 10
+    """Cached values valid for a revision of settings.
 
-    def __init__(self):
+    Cache is outdated when settings revision changed since values were cached.
+    Values which are not stored in settings, e.g. project anatomy stored
+    on project document, can define lifetime in seconds after which they
+    are outdated.
+
+    Args:
+        cache_lifetime (Optional[int]): Lifetime of cached values in seconds.
+    """
+
+    def __init__(self, cache_lifetime=None):
+        self.cache_lifetime = cache_lifetime
         self.data = None
         self.creation_time = None
         self.version = None
+        self.revision = None
         self.last_saved_info = None
 
     def data_copy(self):
@@ -569,15 +656,16 @@ class CacheValues:
             return {}
         return copy.deepcopy(self.data)
 
-    def update_data(self, data, version):
+    def update_data(self, data, version, revision=None):
         self.data = data
         self.creation_time = datetime.datetime.now()
         self.version = version
+        self.revision = revision
 
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
 
-    def update_from_document(self, document, version):
+    def update_from_document(self, document, version, revision=None):
         data = {}
         if document:
             if "data" in document:
@@ -587,26 +675,36 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
-        self.data = data
-        self.version = version
+        self.update_data(data, version, revision)
 
     def to_json_string(self):
         return json.dumps(self.data or {})
 
-    @property
-    def is_outdated(self):
-        if self.creation_time is None:
+    def is_outdated(self, revision):
+        """Cached values are outdated for passed settings revision.
+
+        Args:
+            revision (int): Current revision of settings.
+
+        Returns:
+            bool: Values should be loaded again.
+        """
+
+        if self.creation_time is None or self.revision != revision:
             return True
+        if self.cache_lifetime is None:
+            return False
         delta = (datetime.datetime.now() - self.creation_time).seconds
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
     """Settings handler that use mongo for storing and loading of settings."""
     key_suffix = "_versioned"
+    project_doc_cache_lifetime = 10
     _version_order_key = "versions_order"
     _all_versions_keys = "all_versions"
 
@@ -638,7 +736,11 @@ class MongoSettingsHandler(SettingsHandler):
         self.global_settings_cache = CacheValues()
         self.system_settings_cache = CacheValues()
         self.project_settings_cache = collections.defaultdict(CacheValues)
-        self.project_anatomy_cache = collections.defaultdict(CacheValues)
+        # Anatomy of project is stored on project document which can be
+        #   changed without save of settings
+        self.project_anatomy_cache = collections.defaultdict(
+            lambda: CacheValues(self.project_doc_cache_lifetime)
+        )
 
     def _prepare_project_settings_keys(self):
         from .entities import ProjectSettings
@@ -669,12 +771,18 @@ class MongoSettingsHandler(SettingsHandler):
             self._prepare_project_settings_keys()
         return self._attribute_keys
 
+    def get_settings_revision(self):
+        return get_settings_revision(self.collection)
+
     def get_global_settings_doc(self):
-        if self.global_settings_cache.is_outdated:
+        revision = self.get_settings_revision()
+        if self.global_settings_cache.is_outdated(revision):
             global_settings_doc = self.collection.find_one({
                 "type": GLOBAL_SETTINGS_KEY
             }) or {}
-            self.global_settings_cache.update_data(global_settings_doc, None)
+            self.global_settings_cache.update_data(
+                global_settings_doc, None, revision
+            )
         return self.global_settings_cache.data_copy()
 
     def get_global_settings(self):
@@ -854,6 +962,7 @@ class MongoSettingsHandler(SettingsHandler):
             },
             upsert=True
         )
+        increase_settings_revision(self.collection)
 
     def save_project_settings(self, project_name, overrides):
         """Save studio overrides of project settings.
@@ -888,6 +997,7 @@ class MongoSettingsHandler(SettingsHandler):
             data_cache,
             last_saved_info
         )
+        increase_settings_revision(self.collection)
 
     def save_project_anatomy(self, project_name, anatomy_data):
         """Save studio overrides of project anatomy data.
@@ -915,6 +1025,7 @@ class MongoSettingsHandler(SettingsHandler):
                 data_cache,
                 last_saved_info
             )
+        increase_settings_revision(self.collection)
 
     @classmethod
     def prepare_mongo_update_dict(cls, in_data):
@@ -1346,7 +1457,8 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
-        if self.system_settings_cache.is_outdated:
+        revision = self.get_settings_revision()
+        if self.system_settings_cache.is_outdated(revision):
             globals_document = self.get_global_settings_doc()
             document, version = self._get_system_settings_overrides_doc()
 
@@ -1358,7 +1470,7 @@ class MongoSettingsHandler(SettingsHandler):
             )
 
             self.system_settings_cache.update_from_document(
-                merged_document, version
+                merged_document, version, revision
             )
             self.system_settings_cache.update_last_saved_info(
                 last_saved_info
@@ -1394,12 +1506,13 @@ class MongoSettingsHandler(SettingsHandler):
         return self.system_settings_cache.last_saved_info.copy()
 
     def _get_project_settings_overrides(self, project_name, return_version):
-        if self.project_settings_cache[project_name].is_outdated:
+        revision = self.get_settings_revision()
+        if self.project_settings_cache[project_name].is_outdated(revision):
             document, version = self._get_project_settings_overrides_doc(
                 project_name
             )
             self.project_settings_cache[project_name].update_from_document(
-                document, version
+                document, version, revision
             )
             last_saved_info = SettingsStateInfo.from_document(
                 version, PROJECT_SETTINGS_KEY, document
@@ -1499,7 +1612,8 @@ class MongoSettingsHandler(SettingsHandler):
         return output
 
     def _get_project_anatomy_overrides(self, project_name, return_version):
-        if self.project_anatomy_cache[project_name].is_outdated:
+        revision = self.get_settings_revision()
+        if self.project_anatomy_cache[project_name].is_outdated(revision):
             if project_name is None:
                 document = self._get_project_anatomy_overrides_for_version()
                 if document is None:
@@ -1512,14 +1626,15 @@ class MongoSettingsHandler(SettingsHandler):
                     else:
                         version = LEGACY_SETTINGS_VERSION
                 self.project_anatomy_cache[project_name].update_from_document(
-                    document, version
+                    document, version, revision
                 )
 
             else:
                 project_doc = get_project(project_name)
                 self.project_anatomy_cache[project_name].update_data(
                     self.project_doc_to_anatomy_data(project_doc),
-                    self._current_version
+                    self._current_version,
+                    revision
                 )
 
         cache = self.project_anatomy_cache[project_name]
@@ -1580,6 +1695,7 @@ class MongoSettingsHandler(SettingsHandler):
             "type": self._system_settings_key,
             "version": version
         })
+        increase_settings_revision(self.collection)
 
     def clear_studio_project_settings_overrides_for_version(self, version):
         self.collection.delete_one({
@@ -1587,12 +1703,14 @@ class MongoSettingsHandler(SettingsHandler):
             "version": version,
             "is_default": True
         })
+        increase_settings_revision(self.collection)
 
     def clear_studio_project_anatomy_overrides_for_version(self, version):
         self.collection.delete_one({
             "type": self._project_anatomy_key,
             "version": version
         })
+        increase_settings_revision(self.collection)
 
     def clear_project_settings_overrides_for_version(
         self, version, project_name
@@ -1602,6 +1720,7 @@ class MongoSettingsHandler(SettingsHandler):
             "version": version,
             "project_name": project_name
         })
+        increase_settings_revision(self.collection)
 
     def _sort_versions(self, versions):
         """Sort versions.
@@ -1849,15 +1968,19 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             },
             upsert=True
         )
+        increase_settings_revision(self.collection)
 
     def get_local_settings(self):
         """Local settings for local site id."""
-        if self.local_settings_cache.is_outdated:
+        revision = get_settings_revision(self.collection)
+        if self.local_settings_cache.is_outdated(revision):
             document = self.collection.find_one({
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id
             })
 
-            self.local_settings_cache.update_from_document(document, None)
+            self.local_settings_cache.update_from_document(
+                document, None, revision
+            )
 
         return self.local_settings_cache.data_copy()
@@ -25,6 +25,10 @@ from .ayon_settings import (
     get_ayon_project_settings,
     get_ayon_system_settings
 )
+from .cache import (
+    ResolvedSettingsCache,
+    thaw_settings,
+)
 
 log = logging.getLogger(__name__)
 
@@ -47,6 +51,9 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Cache of resolved system and project settings
+_RESOLVED_SETTINGS_CACHE = ResolvedSettingsCache()
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -116,6 +123,51 @@ def require_local_handler(func):
     return wrapper
 
 
+@require_handler
+def get_settings_revision():
+    """Revision of stored settings changed on each save of settings."""
+    return _SETTINGS_HANDLER.get_settings_revision()
+
+
+@require_local_handler
+def _get_local_site_id():
+    return _LOCAL_SETTINGS_HANDLER.local_site_id
+
+
+def get_settings_cache_stats():
+    """Statistics of resolved settings cache.
+
+    Returns:
+        dict[str, int]: Number of hits, misses and cached items.
+    """
+
+    return _RESOLVED_SETTINGS_CACHE.get_stats()
+
+
+def clear_settings_cache():
+    """Clear cache of resolved system and project settings."""
+    _RESOLVED_SETTINGS_CACHE.clear()
+
+
+def _get_resolved_settings(key, read_only, resolve_func, *args):
+    """Resolved settings from cache or resolved with passed function.
+
+    Revision of settings is queried before settings are resolved so changes
+    saved during resolution outdate the cached value.
+    """
+
+    revision = get_settings_revision()
+    value = _RESOLVED_SETTINGS_CACHE.get(key, revision)
+    if value is None:
+        value = _RESOLVED_SETTINGS_CACHE.set(
+            key, revision, resolve_func(*args)
+        )
+
+    if read_only:
+        return value
+    return thaw_settings(value)
+
+
 @require_handler
 def get_system_last_saved_info():
     return _SETTINGS_HANDLER.get_system_last_saved_info()
@@ -186,6 +238,7 @@ def save_studio_settings(data):
 
     _SETTINGS_HANDLER.save_change_log(None, changes, "system")
     _SETTINGS_HANDLER.save_studio_settings(data)
+    _clear_env_snapshots()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -246,6 +299,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    _clear_env_snapshots(project_name)
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -308,11 +362,25 @@ def save_project_anatomy(project_name, anatomy_data):
 
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "anatomy")
     _SETTINGS_HANDLER.save_project_anatomy(project_name, anatomy_data)
+    _clear_env_snapshots(project_name)
 
     if warnings:
         raise SaveWarningExc(warnings)
 
 
+def _clear_env_snapshots(project_name=None):
+    """Remove farm environment snapshots affected by saved settings.
+
+    Args:
+        project_name (Optional[str]): Name of project which settings were
+            saved. All snapshots are removed if not passed.
+    """
+
+    from openpype.lib.env_snapshots import clear_env_snapshots
+
+    clear_env_snapshots(project_name)
+
+
 def _system_settings_backwards_compatible_conversion(studio_overrides):
     # Backwards compatibility of tools 3.9.1 - 3.9.2 to keep
     #   "tools" environments
@@ -539,6 +607,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _RESOLVED_SETTINGS_CACHE.clear()
 
 
 def _get_default_settings():
@@ -922,8 +991,42 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def _get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
+def _get_system_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """System settings with applied studio overrides.
+
+    Resolved settings are cached until any settings are saved.
+
+    Args:
+        clear_metadata (bool): Remove overrides metadata from settings.
+        exclude_locals (Optional[bool]): Don't apply local settings. Default
+            is based on 'clear_metadata' value.
+        read_only (bool): Return read-only settings shared between calls
+            instead of a mutable copy.
+    """
+
+    # Apply local settings
+    # Default behavior is based on `clear_metadata` value
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    site_id = None
+    if not exclude_locals:
+        site_id = _get_local_site_id()
+
+    return _get_resolved_settings(
+        (
+            SYSTEM_SETTINGS_KEY, None, site_id, clear_metadata, exclude_locals
+        ),
+        read_only,
+        _resolve_system_settings,
+        clear_metadata,
+        exclude_locals
+    )
+
+
+def _resolve_system_settings(clear_metadata, exclude_locals):
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
     result = apply_overrides(default_values, studio_values)
@@ -932,11 +1035,6 @@ def _get_system_settings(clear_metadata=True, exclude_locals=None):
     if clear_metadata:
         clear_metadata_from_settings(result)
 
-    # Apply local settings
-    # Default behavior is based on `clear_metadata` value
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         # TODO local settings may be required to apply for environments
         local_settings = get_local_settings()
@@ -1025,15 +1123,51 @@ def get_anatomy_settings(
 
 
 def _get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
+    project_name, clear_metadata=True, exclude_locals=None, read_only=False
 ):
-    """Project settings with applied studio and project overrides."""
+    """Project settings with applied studio and project overrides.
+
+    Resolved settings are cached until any settings are saved.
+
+    Args:
+        project_name (str): Name of project.
+        clear_metadata (bool): Remove overrides metadata from settings.
+        exclude_locals (Optional[bool]): Don't apply local settings. Default
+            is based on 'clear_metadata' value.
+        read_only (bool): Return read-only settings shared between calls
+            instead of a mutable copy.
+    """
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
+    # Apply local settings
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    site_id = None
+    if not exclude_locals:
+        site_id = _get_local_site_id()
+
+    return _get_resolved_settings(
+        (
+            PROJECT_SETTINGS_KEY,
+            project_name,
+            site_id,
+            clear_metadata,
+            exclude_locals
+        ),
+        read_only,
+        _resolve_project_settings,
+        project_name,
+        clear_metadata,
+        exclude_locals
+    )
+
+
+def _resolve_project_settings(project_name, clear_metadata, exclude_locals):
     studio_overrides = get_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
@@ -1045,10 +1179,6 @@ def _get_project_settings(
     if clear_metadata:
         clear_metadata_from_settings(result)
 
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
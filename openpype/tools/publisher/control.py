@@ -1,6 +1,8 @@
 import os
 import copy
+import time
 import logging
+import threading
 import traceback
 import collections
 import uuid
@@ -55,6 +57,191 @@ class CardMessageTypes:
     error = "error"
 
 
+class ThreadRecordsHandler(logging.Handler):
+    """Collect pyblish log records separately for each thread.
+
+    Replacement of 'pyblish.lib.MessageHandler' used when plugins are
+    processed in multiple threads at once.
+    """
+
+    def __init__(self):
+        super(ThreadRecordsHandler, self).__init__()
+        self._records_by_thread = {}
+
+    def start_capture(self):
+        """Start capturing of records in current thread.
+
+        Returns:
+            list[logging.LogRecord]: List to which are records added.
+        """
+
+        records = []
+        self._records_by_thread[threading.current_thread().ident] = records
+        return records
+
+    def stop_capture(self):
+        self._records_by_thread.pop(threading.current_thread().ident, None)
+
+    def emit(self, record):
+        records = self._records_by_thread.get(record.thread)
+        if records is not None and record.name.startswith("pyblish"):
+            records.append(record)
+
+
+class ThreadedPluginsProcess:
+    """Process thread safe plugins on instances in worker threads.
+
+    Each instance is processed by all plugins in order in one thread,
+    instances are processed at once. Results are collected per instance
+    and plugin so they can be reported on main thread in the same order as
+    if plugins were processed one by one.
+
+    Args:
+        plugins (list[pyblish.api.Plugin]): Plugins to process.
+        instances (list[pyblish.api.Instance]): Instances to process.
+        max_workers (int): Number of worker threads.
+        process_func (Callable): Function processing plugin on instance in
+            worker thread. Receives plugin, instance and records handler
+            and returns result.
+    """
+
+    def __init__(self, plugins, instances, max_workers, process_func):
+        self.plugins = plugins
+        self.instances = instances
+        self._max_workers = max_workers
+        self._process_func = process_func
+
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._items_by_instance = [[] for _ in instances]
+        self._finished_instances = set()
+        self._crash_position = None
+        self._stopped = False
+
+        self._executor = None
+        self._futures = []
+        self._records_handler = ThreadRecordsHandler()
+        self._root_level = None
+
+    def start(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        root_logger = logging.getLogger()
+        self._root_level = root_logger.level
+        root_logger.addHandler(self._records_handler)
+        root_logger.setLevel(logging.DEBUG)
+
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._futures = [
+            self._executor.submit(self._process_instance, instance_idx)
+            for instance_idx in range(len(self.instances))
+        ]
+
+    def stop(self):
+        """Stop processing and restore logging.
+
+        Plugins which are already processed are not interrupted, but their
+        results are not used.
+        """
+
+        if self._executor is None or self._stopped:
+            return
+        self._stopped = True
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._records_handler)
+        root_logger.setLevel(self._root_level)
+
+    def get_item(self, plugin_idx, instance_idx):
+        """Processing information of plugin on instance.
+
+        Returns:
+            Union[tuple[bool, Union[dict, None]], None]: Information if
+                instance matched plugin and result of processing. Result
+                is None if plugin did not process the instance. None is
+                returned if plugin was not processed on instance yet.
+
+        Raises:
+            IndexError: Instance won't be processed by the plugin.
+        """
+
+        items = self._items_by_instance[instance_idx]
+        with self._lock:
+            if len(items) > plugin_idx:
+                return items[plugin_idx]
+            if instance_idx in self._finished_instances:
+                raise IndexError(
+                    "Plugin won't process instance {}".format(instance_idx)
+                )
+        return None
+
+    def wait(self, timeout=None):
+        """Wait until plugin finished processing of an instance.
+
+        Args:
+            timeout (Union[float, None]): Timeout in seconds. Wait until
+                next result when is None.
+        """
+
+        self._changed.wait(timeout)
+        self._changed.clear()
+
+    def _add_item(self, instance_idx, item):
+        with self._lock:
+            self._items_by_instance[instance_idx].append(item)
+        self._changed.set()
+
+    def _process_instance(self, instance_idx):
+        try:
+            self._process_instance_plugins(instance_idx)
+        finally:
+            with self._lock:
+                self._finished_instances.add(instance_idx)
+            self._changed.set()
+
+    def _process_instance_plugins(self, instance_idx):
+        instance = self.instances[instance_idx]
+        for plugin_idx, plugin in enumerate(self.plugins):
+            # Don't process anything that would be processed after crash
+            with self._lock:
+                crash_position = self._crash_position
+            if self._stopped or (
+                crash_position is not None
+                and (plugin_idx, instance_idx) > crash_position
+            ):
+                return
+
+            if not pyblish.logic.instances_by_plugin([instance], plugin):
+                self._add_item(instance_idx, (False, None))
+                continue
+
+            if instance.data.get("publish") is False:
+                self._add_item(instance_idx, (True, None))
+                continue
+
+            result = self._process_func(
+                plugin, instance, self._records_handler
+            )
+            exception = result["error"]
+            crashed = (
+                exception is not None
+                and not isinstance(exception, PublishValidationError)
+            )
+            if crashed:
+                with self._lock:
+                    position = (plugin_idx, instance_idx)
+                    crash_position = self._crash_position
+                    if crash_position is None or position < crash_position:
+                        self._crash_position = position
+            self._add_item(instance_idx, (True, result))
+            if crashed:
+                return
+
+
+
 class MainThreadItem:
     """Callback with args and kwargs."""
 
@@ -1700,12 +1887,29 @@ class PublisherController(BasePublisherController):
 
     _log = None
 
+    # Number of threads processing thread safe instance plugins
+    #   (with 'thread_safe' attribute set to 'True') on multiple instances
+    #   at once. Value '1' processes all plugins one by one, value lower
+    #   than '1' uses number of CPUs.
+    publish_max_workers = 1
+    # Timeout of waiting for results of worker threads in seconds, after
+    #   which is main thread item processed. Wait for next result when is
+    #   'None'.
+    threaded_poll_interval = None
+
     def __init__(self, headless=False):
         super(PublisherController, self).__init__()
 
+        max_workers = os.environ.get("OPENPYPE_PUBLISH_MAX_WORKERS")
+        if max_workers:
+            self.publish_max_workers = int(max_workers)
+
         self._host = registered_host()
         self._headless = headless
 
+        # Processing of thread safe plugins in worker threads
+        self._threaded_process = None
+
         self._create_context = CreateContext(
             self._host, headless=headless, reset=False
         )
@@ -2238,6 +2442,7 @@ class PublisherController(BasePublisherController):
 
     def _reset_publish(self):
         self._reset_attributes()
+        self._stop_threaded_process()
 
         self._publish_up_validation = False
         self._publish_comment_is_set = False
@@ -2373,7 +2578,7 @@ class PublisherController(BasePublisherController):
         self._process_main_thread_item(item)
 
     def _process_main_thread_item(self, item):
-        item()
+        item.process()
 
     def _is_publish_plugin_active(self, plugin):
         """Decide if publish plugin is active.
@@ -2417,7 +2622,12 @@ class PublisherController(BasePublisherController):
         Also stops publishing, if should stop on validation.
         """
 
+        # Index of first plugin after plugins processed in threads
+        skip_until = 0
         for idx, plugin in enumerate(self._publish_plugins):
+            if idx < skip_until:
+                continue
+
             self._publish_progress = idx
 
             # Check if plugin is over validation order
@@ -2438,6 +2648,15 @@ class PublisherController(BasePublisherController):
             ):
                 yield MainThreadItem(self.stop_publish)
 
+            threaded_plugins = self._get_threaded_plugins(idx)
+            if threaded_plugins:
+                skip_until = idx + len(threaded_plugins)
+                for item in self._threaded_plugins_iterator(
+                    idx, threaded_plugins
+                ):
+                    yield item
+                continue
+
             # Add plugin to publish report
             self._publish_report.add_plugin_iter(
                 plugin, self._publish_context)
@@ -2521,7 +2740,11 @@ class PublisherController(BasePublisherController):
         result = pyblish.plugin.process(
             plugin, self._publish_context, instance
         )
+        self._handle_process_result(result)
 
+        self._publish_next_process()
+
+    def _handle_process_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2547,8 +2770,185 @@ class PublisherController(BasePublisherController):
 
         self._publish_report.add_result(result)
 
+    def _is_threaded_plugin(self, plugin):
+        return (
+            plugin.__instanceEnabled__
+            and issubclass(plugin, pyblish.api.InstancePlugin)
+            and getattr(plugin, "thread_safe", False) is True
+            and self._is_publish_plugin_active(plugin)
+        )
+
+    def _get_threaded_plugins(self, idx):
+        """Plugins which can be processed in threads from passed index.
+
+        Consecutive thread safe instance plugins of same order (collection,
+        validation, extraction or integration) are processed together.
+
+        Returns:
+            list[pyblish.api.Plugin]: Plugins to process in threads. Empty
+                if plugin on index is not thread safe or threads are not
+                enabled.
+        """
+
+        if self.publish_max_workers == 1:
+            return []
+
+        plugins = self._publish_plugins
+        stage = int(plugins[idx].order + PLUGIN_ORDER_OFFSET)
+        output = []
+        for plugin in plugins[idx:]:
+            if (
+                int(plugin.order + PLUGIN_ORDER_OFFSET) != stage
+                or not self._is_threaded_plugin(plugin)
+            ):
+                break
+            output.append(plugin)
+        return output
+
+    def _threaded_plugins_iterator(self, start_idx, plugins):
+        """Process thread safe plugins on all instances in threads.
+
+        Processing is started right away and iterator yields items which
+        wait for results of worker threads for 'threaded_poll_interval'
+        and items reporting the results. Results are reported in the same
+        order as if plugins were processed one by one, so UI is updated
+        meanwhile plugins are processed. Results after first crash are
+        ignored.
+        """
+
+        max_workers = self.publish_max_workers
+        if max_workers < 1:
+            max_workers = os.cpu_count()
+
+        instances = list(self._publish_context)
+        process = ThreadedPluginsProcess(
+            plugins, instances, max_workers, self._process_threaded
+        )
+        self._stop_threaded_process()
+        self._threaded_process = process
+        process.start()
+        try:
+            for plugin_idx, plugin in enumerate(plugins):
+                self._publish_progress = start_idx + plugin_idx
+                self._publish_report.add_plugin_iter(
+                    plugin, self._publish_context)
+
+                plugin_label = plugin.__name__
+                if hasattr(plugin, "label") and plugin.label:
+                    plugin_label = plugin.label
+                self._emit_event(
+                    "publish.process.plugin.changed",
+                    {"plugin_label": plugin_label}
+                )
+
+                has_match = False
+                for instance_idx, instance in enumerate(instances):
+                    while True:
+                        try:
+                            item = process.get_item(plugin_idx, instance_idx)
+                        except IndexError:
+                            item = None
+                            break
+                        if item is not None:
+                            break
+                        yield MainThreadItem(
+                            self._wait_threaded_and_continue, process
+                        )
+
+                    if item is None:
+                        continue
+
+                    matched, result = item
+                    has_match = has_match or matched
+                    if result is not None:
+                        yield MainThreadItem(
+                            self._finish_threaded_and_continue,
+                            instance,
+                            result
+                        )
+
+                if not has_match:
+                    self._publish_report.set_plugin_skipped()
+        finally:
+            process.stop()
+            if self._threaded_process is process:
+                self._threaded_process = None
+
+    def _stop_threaded_process(self):
+        if self._threaded_process is not None:
+            self._threaded_process.stop()
+            self._threaded_process = None
+
+    def _wait_threaded_and_continue(self, process):
+        process.wait(self.threaded_poll_interval)
+        self._publish_next_process()
+
+    def _finish_threaded_and_continue(self, instance, result):
+        instance_label = (
+            instance.data.get("label")
+            or instance.data["name"]
+        )
+        self._emit_event(
+            "publish.process.instance.changed",
+            {"instance_label": instance_label}
+        )
+        self._finish_threaded_result(result)
+        self._handle_process_result(result)
+        if self.publish_has_crashed:
+            # Results of plugins which are still processed are not used
+            self._stop_threaded_process()
+
         self._publish_next_process()
 
+    def _process_threaded(self, plugin, instance, records_handler):
+        """Process plugin on instance like 'pyblish.plugin.process'.
+
+        Only processing and capturing of logs happens in worker thread,
+        callbacks and changes of context are done in
+        '_finish_threaded_result' on main thread.
+        """
+
+        result = {
+            "success": False,
+            "plugin": plugin,
+            "instance": instance,
+            "action": None,
+            "error": None,
+            "records": [],
+            "duration": None,
+            "progress": 0,
+            "context": self._publish_context,
+        }
+        records = records_handler.start_capture()
+        start = time.time()
+        try:
+            plugin().process(instance)
+            result["success"] = True
+        except Exception as error:
+            pyblish.lib.extract_traceback(error, plugin.__module__)
+            result["error"] = error
+        finally:
+            records_handler.stop_capture()
+
+        result["duration"] = (time.time() - start) * 1000
+        result["records"].extend(records)
+        return result
+
+    def _finish_threaded_result(self, result):
+        error = result["error"]
+        if error is not None:
+            pyblish.lib.emit(
+                "pluginFailed",
+                plugin=result["plugin"],
+                context=self._publish_context,
+                instance=result["instance"],
+                error=error
+            )
+            pyblish.plugin.log.error(error.formatted_traceback)
+
+        self._publish_context.data.setdefault("results", []).append(result)
+        pyblish.lib.emit("pluginProcessed", result=result)
+
 
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
@@ -70,6 +70,9 @@ class MainThreadProcess(QtCore.QObject):
 
 
 class QtPublisherController(PublisherController):
+    # Don't block UI while waiting for results of worker threads
+    threaded_poll_interval = 0.02
+
     def __init__(self, *args, **kwargs):
         self._main_thread_processor = MainThreadProcess()
 
@@ -6,13 +6,18 @@ from collections import defaultdict
 from qtpy import QtCore, QtGui
 import qtawesome
 
+from openpype import AYON_SERVER_ENABLED
 from openpype.host import ILoadHost
 from openpype.client import (
     get_asset_by_id,
     get_subset_by_id,
     get_version_by_id,
+    get_versions,
     get_last_version_by_subset_id,
     get_representation_by_id,
+    get_representations,
+    get_representations_parents,
+    entities_cache,
 )
 from openpype.pipeline import (
     get_current_project_name,
@@ -331,6 +336,42 @@ class InventoryModel(TreeModel):
         for item in items:
             grouped[item["representation"]]["items"].append(item)
 
+        with entities_cache():
+            self._add_items(project_name, grouped, parent)
+
+        self.endResetModel()
+
+        return self._root_item
+
+    def _prefetch_documents(self, project_name, repre_ids):
+        """Query documents of all representations to entities cache.
+
+        Documents are queried in few bulk queries instead of querying each
+        container's parents one by one.
+        """
+
+        if AYON_SERVER_ENABLED or not repre_ids:
+            return
+
+        repre_docs = list(get_representations(
+            project_name, representation_ids=repre_ids, archived=True
+        ))
+        parents_by_repre_id = get_representations_parents(
+            project_name, repre_docs
+        )
+        hero_source_version_ids = {
+            parents[0]["version_id"]
+            for parents in parents_by_repre_id.values()
+            if parents[0] and parents[0]["type"] == "hero_version"
+        }
+        if hero_source_version_ids:
+            list(get_versions(
+                project_name, version_ids=hero_source_version_ids
+            ))
+
+    def _add_items(self, project_name, grouped, parent):
+        self._prefetch_documents(project_name, list(grouped.keys()))
+
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
@@ -472,10 +513,6 @@ class InventoryModel(TreeModel):
 
                 self.add_child(item_node, parent=group_node)
 
-        self.endResetModel()
-
-        return self._root_item
-
 
 class FilterProxyModel(QtCore.QSortFilterProxyModel):
     """Filter model to where key column's value is in the filtered tags"""
@@ -263,6 +263,10 @@ if "--use-staging" in sys.argv:
     sys.argv.remove("--use-staging")
     os.environ["OPENPYPE_USE_STAGING"] = "1"
 
+if "--deep-verify" in sys.argv:
+    sys.argv.remove("--deep-verify")
+    os.environ["OPENPYPE_DEEP_VERIFY"] = "1"
+
 import igniter  # noqa: E402
 from igniter import BootstrapRepos  # noqa: E402
 from igniter.tools import (
@@ -0,0 +1,125 @@
+"""Benchmark of repeated 'CreateContext.reset' with many creator files.
+
+Creator plugin files are generated to a temp directory and registered as
+creator plugin path. Context is reset multiple times with plugin discover
+cache disabled and enabled. Settings are replaced by empty dictionaries.
+
+Usage:
+    python -m tests.benchmarks.benchmark_create_context_reset
+        [files] [resets]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from openpype.pipeline import register_creator_plugin_path
+from openpype.pipeline.create import CreateContext
+from openpype.pipeline.create import context as create_context_module
+
+CREATOR_CONTENT = '''
+from openpype.lib import BoolDef, NumberDef, TextDef
+from openpype.pipeline.create import Creator
+
+
+class BenchmarkCreator{idx}(Creator):
+    identifier = "benchmark.creator{idx}"
+    family = "benchmark{idx}"
+    label = "Benchmark {idx}"
+
+    def create(self, subset_name, instance_data, pre_create_data):
+        pass
+
+    def collect_instances(self):
+        pass
+
+    def update_instances(self, update_list):
+        pass
+
+    def remove_instances(self, instances):
+        pass
+
+    def get_instance_attr_defs(self):
+        return [
+{attr_defs}
+        ]
+'''
+ATTR_DEF = (
+    '            BoolDef("bool{idx}", label="Bool {idx}"),\n'
+    '            NumberDef("number{idx}", default={idx}),\n'
+    '            TextDef("text{idx}", placeholder="Text {idx}"),'
+)
+
+
+class _BenchmarkHost(object):
+    name = "benchmark"
+
+    def get_context_data(self):
+        return {}
+
+    def update_context_data(self, data, changes):
+        pass
+
+    def get_context_title(self):
+        return "Benchmark"
+
+    def get_current_context(self):
+        return {
+            "project_name": "benchmark",
+            "asset_name": None,
+            "task_name": None
+        }
+
+
+def _create_files(dirpath, files_count):
+    attr_defs = "\n".join(ATTR_DEF.format(idx=idx) for idx in range(20))
+    for idx in range(files_count):
+        filepath = os.path.join(dirpath, "create_{}.py".format(idx))
+        with open(filepath, "w") as stream:
+            stream.write(CREATOR_CONTENT.format(idx=idx, attr_defs=attr_defs))
+
+
+def _benchmark(label, create_context, resets_count):
+    durations = []
+    for _ in range(resets_count):
+        start = time.time()
+        create_context.reset(discover_publish_plugins=False)
+        durations.append(time.time() - start)
+
+    print("  {:<9} first {:>6.3f} s  next avg {:>6.3f} s".format(
+        label,
+        durations[0],
+        sum(durations[1:]) / max(len(durations) - 1, 1)
+    ))
+
+
+def main():
+    files_count = 200
+    resets_count = 5
+    if len(sys.argv) > 1:
+        files_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        resets_count = int(sys.argv[2])
+
+    create_context_module.get_system_settings = lambda: {}
+    create_context_module.get_project_settings = lambda project_name: {}
+
+    tmpdir = tempfile.mkdtemp(prefix="create_context_benchmark")
+    try:
+        _create_files(tmpdir, files_count)
+        register_creator_plugin_path(tmpdir)
+        create_context = CreateContext(
+            _BenchmarkHost(), headless=True, reset=False
+        )
+        print("{} creator files, {} resets".format(files_count, resets_count))
+        os.environ["OPENPYPE_PLUGIN_DISCOVER_CACHE"] = "0"
+        _benchmark("no cache", create_context, resets_count)
+        os.environ["OPENPYPE_PLUGIN_DISCOVER_CACHE"] = "1"
+        _benchmark("cache", create_context, resets_count)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
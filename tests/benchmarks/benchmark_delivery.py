@@ -0,0 +1,101 @@
+"""Benchmark of delivery of representation files.
+
+Sequence of generated files is delivered with 'deliver_single_file' called
+for each file, with 'DeliveryPlanner' using a thread pool and with
+'DeliveryPlanner' again when files were already delivered. Optional latency
+simulates network storage by sleeping on each copy.
+
+Usage:
+    python -m tests.benchmarks.benchmark_delivery [files] [latency_ms]
+"""
+import sys
+import time
+import shutil
+import logging
+import tempfile
+import collections
+from pathlib import Path
+
+from openpype.lib.path_templates import StringTemplate
+from openpype.pipeline import delivery
+
+TEMPLATE = "{root[work]}/{asset}/{asset}.{frame:0>4}.{ext}"
+
+
+class _Anatomy(object):
+    project_name = "benchmark"
+    templates = {"delivery": {"default": TEMPLATE}}
+    templates_obj = {"delivery": {"default": StringTemplate(TEMPLATE)}}
+
+
+def _benchmark(label, func):
+    start = time.perf_counter()
+    count = func()
+    duration = time.perf_counter() - start
+    print("  {:<10} {:>8.3f} s {:>6} files".format(label, duration, count))
+
+
+def main():
+    files_count = 1000
+    latency = 0
+    if len(sys.argv) > 1:
+        files_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        latency = int(sys.argv[2]) / 1000.0
+
+    if latency:
+        create_hard_link = delivery.create_hard_link
+
+        def _slow_create_hard_link(*args):
+            time.sleep(latency)
+            create_hard_link(*args)
+
+        delivery.create_hard_link = _slow_create_hard_link
+
+    log = logging.getLogger("benchmark")
+    anatomy = _Anatomy()
+    repre = {"_id": "repre_id", "context": {}}
+    anatomy_data = {"asset": "sh010", "ext": "exr"}
+    tmp_dir = Path(tempfile.mkdtemp())
+    try:
+        src_paths = []
+        for frame in range(files_count):
+            path = tmp_dir / "publish" / "sh010.{:0>4}.exr".format(frame)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"0" * 1024)
+            src_paths.append((str(path), frame))
+
+        def _per_file():
+            format_dict = {"root": {"work": str(tmp_dir / "per_file")}}
+            report_items = collections.defaultdict(list)
+            count = 0
+            for src_path, frame in src_paths:
+                _, delivered = delivery.deliver_single_file(
+                    src_path, repre, anatomy, "default",
+                    dict(anatomy_data, frame=frame), format_dict,
+                    report_items, log
+                )
+                count += delivered
+            return count
+
+        def _planner():
+            planner = delivery.DeliveryPlanner(
+                anatomy, "default",
+                {"root": {"work": str(tmp_dir / "planner")}}
+            )
+            planner.add_files(repre, anatomy_data, src_paths)
+            report = planner.execute()
+            return len(report.delivered)
+
+        print("{} files, latency {} ms, {} workers".format(
+            files_count, latency * 1000, delivery.DeliveryPlanner.max_workers
+        ))
+        _benchmark("per file", _per_file)
+        _benchmark("planner", _planner)
+        _benchmark("resume", _planner)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark of ExtractReview output definitions rendered concurrently.
+
+Synthetic test clip is generated by ffmpeg and encoded to several outputs
+(h264 review, ProRes delivery, proxy and thumbnail strip) with different
+'output_max_workers' values. When ffmpeg is not available the commands are
+replaced with commands sleeping for passed time, which measures only
+scheduling of the commands.
+
+Usage:
+    python -m tests.benchmarks.benchmark_extract_review [duration_sec]
+        [ffmpeg_executable]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+from openpype.plugins.publish.extract_review import ExtractReview
+
+WORKER_COUNTS = (1, 2, 4, 0)
+OUTPUT_ARGS = {
+    "h264": "-c:v libx264 -pix_fmt yuv420p -crf 18",
+    "prores": "-c:v prores_ks -profile:v 3",
+    "proxy": "-vf scale=960:-2 -c:v libx264 -pix_fmt yuv420p",
+    "strip": "-vf fps=1,scale=320:-2,tile=10x1 -frames:v 1",
+}
+OUTPUT_EXTS = {
+    "h264": "mp4",
+    "prores": "mov",
+    "proxy": "mp4",
+    "strip": "jpg",
+}
+
+
+class _FakeContext(object):
+    def __init__(self):
+        self.data = {"cleanupFullPaths": []}
+
+
+class _FakeInstance(object):
+    def __init__(self):
+        self.data = {"representations": []}
+        self.context = _FakeContext()
+
+
+def _has_ffmpeg(ffmpeg):
+    try:
+        subprocess.check_output([ffmpeg, "-version"])
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def _create_clip(ffmpeg, dirpath, duration):
+    path = os.path.join(dirpath, "source.mov")
+    subprocess.check_output([
+        ffmpeg, "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", "testsrc2=size=1920x1080:rate=24",
+        "-t", str(duration), "-pix_fmt", "yuv420p", path
+    ])
+    return path
+
+
+def _output_jobs(ffmpeg, src_path, dirpath, duration):
+    output_jobs = []
+    for output_name, output_args in OUTPUT_ARGS.items():
+        output_ext = OUTPUT_EXTS[output_name]
+        filename = "{}.{}".format(output_name, output_ext)
+        if ffmpeg:
+            ffmpeg_args = [
+                ffmpeg, "-y", "-loglevel error", "-i", src_path,
+                output_args, os.path.join(dirpath, filename)
+            ]
+        else:
+            # Simulated encode which does not use CPU
+            ffmpeg_args = [
+                sys.executable, "-c",
+                "\"import time; time.sleep({})\"".format(duration),
+                os.path.join(dirpath, filename)
+            ]
+        output_jobs.append({
+            "new_repre": {
+                "files": filename,
+                "stagingDir": dirpath,
+                "tags": [],
+            },
+            "output_def": {"filename_suffix": output_name},
+            "output_name": output_name,
+            "output_ext": output_ext,
+            "temp_data": {
+                "fps": 24,
+                "output_frame_start": 1,
+                "output_frame_end": 24 * duration,
+            },
+            "ffmpeg_args": ffmpeg_args,
+        })
+    return output_jobs
+
+
+def main():
+    duration = 5
+    ffmpeg = "ffmpeg"
+    if len(sys.argv) > 1:
+        duration = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        ffmpeg = sys.argv[2]
+
+    if not _has_ffmpeg(ffmpeg):
+        print("ffmpeg is not available, commands are simulated")
+        ffmpeg = None
+
+    tmpdir = tempfile.mkdtemp(prefix="benchmark_review_")
+    try:
+        src_path = None
+        if ffmpeg:
+            src_path = _create_clip(ffmpeg, tmpdir, duration)
+
+        print("{} outputs of {} seconds long clip, {} CPUs".format(
+            len(OUTPUT_ARGS), duration, os.cpu_count()
+        ))
+        for max_workers in WORKER_COUNTS:
+            plugin = ExtractReview()
+            plugin.output_max_workers = max_workers
+            output_jobs = _output_jobs(ffmpeg, src_path, tmpdir, duration)
+            start = time.time()
+            plugin._process_output_jobs(_FakeInstance(), output_jobs)
+            print("  {:>4} workers {:>9.2f} s".format(
+                max_workers or "auto", time.time() - start
+            ))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of FileTransaction throughput with different worker counts.
+
+Transfers run on a local temp directory (use a tmpfs location through
+TMPDIR to measure memory backed storage) and on a simulated slow storage
+which adds latency to each file operation like network storage does.
+
+Usage:
+    python -m tests.benchmarks.benchmark_file_transaction [files] [size_kb]
+        [latency_ms]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import FileTransaction
+
+WORKER_COUNTS = (1, 4, 8, 16)
+
+
+def _create_sources(dirpath, count, size):
+    content = os.urandom(size)
+    paths = []
+    for idx in range(count):
+        path = os.path.join(dirpath, "file.{:04d}.exr".format(idx))
+        with open(path, "wb") as stream:
+            stream.write(content)
+        paths.append(path)
+    return paths
+
+
+def _run_transaction(src_paths, dst_dir, max_workers):
+    transaction = FileTransaction(max_workers=max_workers)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(dst_dir, os.path.basename(src_path))
+        )
+    start = time.time()
+    transaction.process()
+    duration = time.time() - start
+    transaction.finalize()
+    return duration
+
+
+def _benchmark(label, src_paths, tmpdir, size):
+    print(label)
+    total_mb = len(src_paths) * size / (1024.0 * 1024.0)
+    for max_workers in WORKER_COUNTS:
+        dst_dir = os.path.join(tmpdir, "dst_{}".format(max_workers))
+        duration = _run_transaction(src_paths, dst_dir, max_workers)
+        shutil.rmtree(dst_dir)
+        print((
+            "  {:>2} workers {:>9.2f} ms {:>9.1f} files/s {:>8.1f} MB/s"
+        ).format(
+            max_workers,
+            duration * 1000,
+            len(src_paths) / duration,
+            total_mb / duration
+        ))
+
+
+def main(files=2000, size_kb=256, latency_ms=2):
+    size = size_kb * 1024
+    latency = latency_ms / 1000.0
+    tmpdir = tempfile.mkdtemp()
+    copyfile = file_transaction.copyfile
+    try:
+        src_dir = os.path.join(tmpdir, "src")
+        os.makedirs(src_dir)
+        src_paths = _create_sources(src_dir, files, size)
+
+        _benchmark(
+            "Local storage ({}, {} files of {} KB)".format(
+                tmpdir, files, size_kb
+            ),
+            src_paths, tmpdir, size
+        )
+
+        def _slow_copyfile(src, dst):
+            # Latency of opening source and destination file
+            time.sleep(latency * 2)
+            copyfile(src, dst)
+
+        file_transaction.copyfile = _slow_copyfile
+        _benchmark(
+            "Simulated slow storage ({} ms latency per file open)".format(
+                latency_ms
+            ),
+            src_paths, tmpdir, size
+        )
+
+    finally:
+        file_transaction.copyfile = copyfile
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
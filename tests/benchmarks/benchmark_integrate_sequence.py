@@ -0,0 +1,149 @@
+"""Benchmark of integration of a large sequence representation.
+
+Prepares a synthetic representation with many files and compares
+destination path resolution per frame with sequence template filling and
+file info preparation per file with the bulk preparation.
+
+Usage:
+    python -m tests.benchmarks.benchmark_integrate_sequence [frames]
+        [legacy_frames]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import datetime
+
+import pyblish.api
+
+from openpype.lib import StringTemplate
+from openpype.plugins.publish.integrate import IntegrateAsset
+
+PATH_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+    "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+FOLDER_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}"
+)
+
+
+class BenchmarkAnatomy(object):
+    """Minimal anatomy with single publish template and root."""
+
+    def __init__(self, root):
+        self.root = root.replace("\\", "/")
+        self.templates = {
+            "publish": {
+                "path": PATH_TEMPLATE,
+                "folder": FOLDER_TEMPLATE,
+                "frame_padding": 4,
+            }
+        }
+        self.templates_obj = {
+            "publish": {
+                "path": StringTemplate(PATH_TEMPLATE),
+                "folder": StringTemplate(FOLDER_TEMPLATE),
+            }
+        }
+
+    def find_root_template_from_path(self, path):
+        path = path.replace("\\", "/")
+        if path.startswith(self.root):
+            return True, "{root[work]}" + path[len(self.root):]
+        return False, path
+
+
+def _create_instance(anatomy, staging_dir, frames):
+    context = pyblish.api.Context()
+    context.data["anatomy"] = anatomy
+    instance = context.create_instance("renderMain")
+    instance.data["anatomyData"] = {
+        "root": {"work": anatomy.root},
+        "project": {"name": "Project", "code": "prj"},
+        "hierarchy": "shots/sq01",
+        "asset": "sh010",
+        "family": "render",
+        "subset": "renderMain",
+    }
+    files = ["render.{:04d}.exr".format(frame) for frame in range(frames)]
+    for filename in files:
+        open(os.path.join(staging_dir, filename), "w").close()
+    return instance, files
+
+
+def _prepare(plugin, instance, files, staging_dir):
+    repre = {
+        "name": "exr",
+        "ext": "exr",
+        "files": list(files),
+        "stagingDir": staging_dir,
+        "frameStart": 1001,
+    }
+    instance.data.pop("publishDir", None)
+    return plugin.prepare_representation(
+        repre, "publish", {}, {"_id": None, "name": 1}, staging_dir, instance
+    )
+
+
+def main(frames=10000, legacy_frames=1000):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        staging_dir = os.path.join(tmpdir, "staging")
+        os.makedirs(staging_dir)
+        anatomy = BenchmarkAnatomy(tmpdir)
+        instance, files = _create_instance(anatomy, staging_dir, frames)
+        plugin = IntegrateAsset()
+        sites = [{"name": "studio", "created_dt": datetime.datetime.now()}]
+        # Use staging files as destinations for file info preparation
+        destinations = [
+            os.path.join(staging_dir, filename) for filename in files
+        ]
+
+        # Per frame filling assembles destination paths with 'clique' which
+        #   does not scale well, so it is measured on limited amount of files
+        legacy_files = files[:legacy_frames]
+        results = {}
+        for label, use_sequence_template, repre_files in (
+            ("per frame template", False, legacy_files),
+            ("sequence template", True, legacy_files),
+            ("sequence template", True, files),
+        ):
+            plugin.use_sequence_template = use_sequence_template
+            start = time.time()
+            prepared = _prepare(plugin, instance, repre_files, staging_dir)
+            duration = time.time() - start
+            results.setdefault(len(repre_files), []).append(
+                prepared["transfers"]
+            )
+            print("{:<34} {:>8.2f} ms".format(
+                "{} ({} files)".format(label, len(repre_files)),
+                duration * 1000
+            ))
+
+        legacy_results = results[len(legacy_files)]
+        if legacy_results[0] != legacy_results[1]:
+            raise AssertionError("Transfers of both methods do not match")
+
+        start = time.time()
+        for path in destinations:
+            plugin.prepare_file_info(path, anatomy, sites)
+        duration = time.time() - start
+        print("{:<34} {:>8.2f} ms".format(
+            "file info per file", duration * 1000
+        ))
+
+        start = time.time()
+        plugin.get_files_info(destinations, sites, anatomy)
+        duration = time.time() - start
+        print("{:<34} {:>8.2f} ms".format("bulk file info", duration * 1000))
+
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
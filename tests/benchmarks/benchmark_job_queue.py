@@ -0,0 +1,147 @@
+"""Benchmark of job queue server dispatch latency and throughput.
+
+Job queue server is started on localhost and simulated workers connect to
+it through websockets. Workers finish each job after passed time. Jobs are
+posted through HTTP api and time between posting and receiving the job by
+a worker is measured with periodic dispatch only and with event driven
+dispatch.
+
+Usage:
+    python -m tests.benchmarks.benchmark_job_queue [jobs] [workers]
+        [job_duration_ms]
+"""
+import sys
+import time
+import socket
+import asyncio
+
+import aiohttp
+
+from openpype.modules.job_queue.job_server.server import WebServerManager
+from openpype.modules.job_queue.job_server.job_store import JobStore
+from openpype.modules.job_queue.job_server.workers_rpc_route import (
+    WorkerRpc
+)
+from openpype.modules.job_queue.job_workers.base_worker import WorkerClient
+
+HOST_NAME = "benchmark"
+# Polling interval used for benchmark to keep it short, default of server
+#   is 5 seconds
+POLL_INTERVAL = 1
+
+
+class _SimulatedWorker(WorkerClient):
+    def __init__(self, job_duration, latencies, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._job_duration = job_duration
+        self._latencies = latencies
+
+    async def start_job(self, job_data):
+        accepted = await super().start_job(job_data)
+        if accepted:
+            self._latencies.append(time.time() - job_data["data"]["posted"])
+            self._loop.call_later(
+                self._job_duration, self.finish_job, True, None, None
+            )
+        return accepted
+
+
+def _get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as con:
+        con.bind(("localhost", 0))
+        return con.getsockname()[1]
+
+
+async def _wait_for_jobs(session, url, jobs_count):
+    while True:
+        async with session.get(url + "/api/jobs") as response:
+            statuses = await response.json(content_type=None)
+        if sum(1 for status in statuses if status["done"]) >= jobs_count:
+            return
+        await asyncio.sleep(0.05)
+
+
+async def _run_benchmark(url, jobs_count, workers_count, job_duration):
+    latencies = []
+    workers = []
+    for _ in range(workers_count):
+        worker = _SimulatedWorker(job_duration, latencies)
+        await worker.connect_url(url + "/ws")
+        worker.set_id(await worker.call("register_worker", [HOST_NAME]))
+        workers.append(worker)
+
+    async with aiohttp.ClientSession() as session:
+        start = time.time()
+        for idx in range(jobs_count):
+            await session.post(url + "/api/jobs", json={
+                "host_name": HOST_NAME,
+                "index": idx,
+                "posted": time.time()
+            })
+        await _wait_for_jobs(session, url, jobs_count)
+        duration = time.time() - start
+
+    for worker in workers:
+        await worker.disconnect()
+    return duration, latencies
+
+
+def _benchmark(label, event_dispatch, jobs_count, workers_count,
+               job_duration):
+    WorkerRpc.event_dispatch = event_dispatch
+    WorkerRpc.dispatch_interval = POLL_INTERVAL
+
+    port = _get_free_port()
+    manager = WebServerManager(port, "localhost", job_store=JobStore())
+    manager.start_server()
+    while not manager.is_running:
+        time.sleep(0.01)
+    # Wait for site to start
+    time.sleep(0.3)
+    try:
+        loop = asyncio.new_event_loop()
+        duration, latencies = loop.run_until_complete(_run_benchmark(
+            manager.url, jobs_count, workers_count, job_duration
+        ))
+        loop.close()
+    finally:
+        manager.stop_server()
+        while manager.is_running:
+            time.sleep(0.05)
+
+    latencies.sort()
+    print((
+        "  {:<9} {:>7.2f} s {:>7.1f} jobs/s"
+        " latency avg {:>6.3f} s p95 {:>6.3f} s"
+    ).format(
+        label,
+        duration,
+        jobs_count / duration,
+        sum(latencies) / len(latencies),
+        latencies[int(len(latencies) * 0.95) - 1]
+    ))
+
+
+def main():
+    jobs_count = 40
+    workers_count = 4
+    job_duration = 50
+    if len(sys.argv) > 1:
+        jobs_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        workers_count = int(sys.argv[2])
+    if len(sys.argv) > 3:
+        job_duration = int(sys.argv[3])
+
+    print("{} jobs of {} ms, {} workers, poll interval {} s".format(
+        jobs_count, job_duration, workers_count, POLL_INTERVAL
+    ))
+    for label, event_dispatch in (("polling", False), ("events", True)):
+        _benchmark(
+            label, event_dispatch, jobs_count, workers_count,
+            job_duration / 1000.0
+        )
+
+
+if __name__ == "__main__":
+    main()
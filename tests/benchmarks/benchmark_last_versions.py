@@ -0,0 +1,152 @@
+"""Benchmark of representations last versions query on a real mongo.
+
+Temporary database with a project collection of production size is created
+on mongo server defined by 'OPENPYPE_MONGO' and removed at the end.
+Queries of last versions for loaded representations are compared:
+previous aggregation with '$lookup' sub-pipeline per representation and
+'get_representations_last_versions' using '$in' queries.
+
+Usage:
+    python -m tests.benchmarks.benchmark_last_versions [subsets]
+        [versions] [containers]
+"""
+import os
+import sys
+import time
+import random
+
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import OpenPypeMongoConnection
+from openpype.client.mongo import entities
+from openpype.client.entity_cache import invalidate_last_versions_cache
+
+DATABASE_NAME = "benchmark_last_versions"
+PROJECT_NAME = "benchmark"
+REPRESENTATIONS_PER_VERSION = 3
+
+
+def _create_project(collection, subsets_count, versions_count):
+    asset_id = ObjectId()
+    repre_ids = []
+    docs = [{"_id": asset_id, "type": "asset", "name": "sh010"}]
+    for subset_idx in range(subsets_count):
+        subset_id = ObjectId()
+        docs.append({
+            "_id": subset_id,
+            "type": "subset",
+            "parent": asset_id,
+            "name": "subset{}".format(subset_idx),
+        })
+        for version in range(1, versions_count + 1):
+            version_id = ObjectId()
+            docs.append({
+                "_id": version_id,
+                "type": "version",
+                "parent": subset_id,
+                "name": version,
+            })
+            for repre_idx in range(REPRESENTATIONS_PER_VERSION):
+                repre_id = ObjectId()
+                repre_ids.append(repre_id)
+                docs.append({
+                    "_id": repre_id,
+                    "type": "representation",
+                    "parent": version_id,
+                    "name": "repre{}".format(repre_idx),
+                })
+        if len(docs) > 10000:
+            collection.insert_many(docs)
+            docs = []
+    if docs:
+        collection.insert_many(docs)
+    return repre_ids
+
+
+def _lookup_last_versions(collection, repre_ids):
+    pipeline = [
+        {"$match": {"type": "representation", "_id": {"$in": repre_ids}}},
+        {"$project": {"parent": True}},
+        {"$lookup": {
+            "from": collection.name,
+            "localField": "parent",
+            "foreignField": "_id",
+            "as": "version"
+        }},
+        {"$unwind": {"path": "$version", "preserveNullAndEmptyArrays": True}},
+        {"$project": {
+            "version._id": True,
+            "version.type": True,
+            "version.parent": True
+        }},
+        {"$lookup": {
+            "from": collection.name,
+            "let": {"subset_id": "$version.parent"},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$type", "version"]},
+                    {"$eq": ["$parent", "$$subset_id"]}
+                ]}}},
+                {"$sort": {"name": -1}},
+                {"$limit": 1},
+                {"$project": {"_id": True}}
+            ],
+            "as": "last_version"
+        }}
+    ]
+    return len(list(collection.aggregate(pipeline)))
+
+
+def _in_queries_last_versions(collection, repre_ids):
+    invalidate_last_versions_cache()
+    return len(
+        entities.get_representations_last_versions(PROJECT_NAME, repre_ids)
+    )
+
+
+def _benchmark(label, func, collection, repre_ids):
+    start = time.perf_counter()
+    count = func(collection, repre_ids)
+    duration = time.perf_counter() - start
+    print("  {:<12} {:>8.3f} s {:>6} representations".format(
+        label, duration, count
+    ))
+
+
+def main():
+    if not os.environ.get("OPENPYPE_MONGO"):
+        print("Set 'OPENPYPE_MONGO' to mongo server used for benchmark")
+        return
+
+    subsets_count = 2000
+    versions_count = 20
+    containers_count = 200
+    if len(sys.argv) > 1:
+        subsets_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        versions_count = int(sys.argv[2])
+    if len(sys.argv) > 3:
+        containers_count = int(sys.argv[3])
+
+    client = OpenPypeMongoConnection.get_mongo_client()
+    database = client[DATABASE_NAME]
+    collection = database[PROJECT_NAME]
+    entities.get_project_connection = lambda project_name: collection
+    try:
+        repre_ids = _create_project(
+            collection, subsets_count, versions_count
+        )
+        repre_ids = random.sample(repre_ids, containers_count)
+        print("{} documents, {} loaded representations".format(
+            collection.estimated_document_count(), containers_count
+        ))
+        _benchmark("$lookup", _lookup_last_versions, collection, repre_ids)
+        _benchmark(
+            "$in queries", _in_queries_last_versions, collection, repre_ids
+        )
+    finally:
+        client.drop_database(DATABASE_NAME)
+
+
+if __name__ == "__main__":
+    main()
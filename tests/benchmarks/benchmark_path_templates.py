@@ -0,0 +1,74 @@
+"""Benchmark of template formatting paths.
+
+Compares full formatting through 'TemplatePartResult' (with and without
+parsing of the template per call) with formatting straight to a string.
+
+Usage:
+    python -m tests.benchmarks.benchmark_path_templates [frames]
+"""
+import sys
+import timeit
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    _parse_template_parts,
+)
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}"
+    "/publish/{family}/{subset}/v{version:0>3}"
+    "/{project[code]}_{asset}_{subset}_v{version:0>3}<_{output}><.{frame:0>4}>"
+    ".{ext}"
+)
+
+
+def _get_data_items(frames):
+    return [
+        {
+            "root": {"work": "/mnt/work"},
+            "project": {"name": "Project", "code": "prj"},
+            "hierarchy": "shots/sq01",
+            "asset": "sh010",
+            "family": "render",
+            "subset": "renderMain",
+            "version": 3,
+            "frame": frame,
+            "ext": "exr",
+        }
+        for frame in range(1001, 1001 + frames)
+    ]
+
+
+def main(frames=2000, repeat=5):
+    data_items = _get_data_items(frames)
+    template = StringTemplate(TEMPLATE)
+
+    def parse_and_format():
+        for data in data_items:
+            _parse_template_parts(TEMPLATE)
+            StringTemplate(TEMPLATE).format_strict(data)
+
+    def format_result():
+        for data in data_items:
+            StringTemplate.format_strict_template(TEMPLATE, data)
+
+    def format_to_string():
+        for data in data_items:
+            template.format_to_string(data)
+
+    def format_many():
+        template.format_many(data_items)
+
+    print("Formatting {} frames (best of {})".format(frames, repeat))
+    for label, func in (
+        ("parse + TemplatePartResult", parse_and_format),
+        ("cached + TemplatePartResult", format_result),
+        ("format_to_string", format_to_string),
+        ("format_many", format_many),
+    ):
+        duration = min(timeit.repeat(func, number=1, repeat=repeat))
+        print("{:<30} {:>8.2f} ms".format(label, duration * 1000))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,144 @@
+"""Benchmark of project backpack documents and files packing.
+
+Synthetic project documents are stored and loaded as one json string, the
+same way as previous zip packages did, and streamed as json lines with each
+available codec. Peak of allocated memory is measured with 'tracemalloc'
+when '--memory' is passed, which makes the benchmark considerably slower.
+Generated project files are packed with single thread, with multiple threads
+and again when archives were already packed.
+
+Usage:
+    python -m tests.benchmarks.benchmark_project_backpack [documents]
+        [files] [--memory]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from openpype.client.mongo.mongo import documents_to_json, load_json_file
+from openpype.lib import project_backpack
+
+
+def _create_documents(count):
+    for idx in range(count):
+        yield {
+            "_id": idx,
+            "type": "representation",
+            "parent": idx // 10,
+            "name": "exr",
+            "files": [{
+                "path": "{{root[work]}}/project/sh{:0>4}/file.exr".format(idx),
+                "size": 1024 * idx,
+                "hash": "file_hash_{}".format(idx),
+            }],
+            "context": {
+                "project": {"name": "project", "code": "prj"},
+                "asset": "sh{:0>4}".format(idx),
+                "subset": "renderMain",
+                "version": idx % 50,
+            },
+        }
+
+
+def _create_files(source_dir, count):
+    for idx in range(count):
+        path = source_dir / "sh{:0>3}".format(idx % 100) / "file_{}".format(
+            idx)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(1024) + b"0" * 15 * 1024)
+
+
+def _benchmark(label, func, trace_memory):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    memory = ""
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = "{:>8.1f} MB peak".format(peak / 1024 ** 2)
+    print("  {:<14} {:>8.3f} s {}  {}".format(
+        label, duration, memory, result
+    ))
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--memory"]
+    trace_memory = len(args) != len(sys.argv) - 1
+    docs_count = 100000
+    files_count = 2000
+    if len(args) > 0:
+        docs_count = int(args[0])
+    if len(args) > 1:
+        files_count = int(args[1])
+
+    def _replace_project_documents(project_name, docs, database_name):
+        count = 0
+        for _ in docs:
+            count += 1
+        return count
+
+    project_backpack.iter_project_documents = (
+        lambda project_name, database_name: _create_documents(docs_count)
+    )
+    project_backpack.replace_project_documents = _replace_project_documents
+
+    tmp_dir = Path(tempfile.mkdtemp())
+    try:
+        def _legacy():
+            filepath = tmp_dir / "database.json"
+            content = documents_to_json(list(_create_documents(docs_count)))
+            filepath.write_text(content)
+            docs = load_json_file(str(filepath))
+            assert len(docs) == docs_count
+            return "{:.1f} MB".format(filepath.stat().st_size / 1024 ** 2)
+
+        def _streamed(codec):
+            filepath = tmp_dir / "database.jsonl.{}".format(codec)
+            project_backpack.export_project_documents(
+                "project", str(filepath), codec
+            )
+            project_backpack.import_project_documents(
+                "project", str(filepath), codec
+            )
+            return "{:.1f} MB".format(filepath.stat().st_size / 1024 ** 2)
+
+        print("{} documents".format(docs_count))
+        _benchmark("json", _legacy, trace_memory)
+        for codec in project_backpack.get_available_codecs():
+            _benchmark(
+                "lines " + codec, lambda: _streamed(codec), trace_memory
+            )
+
+        source_dir = tmp_dir / "project"
+        _create_files(source_dir, files_count)
+        files_dir = tmp_dir / "files"
+
+        def _pack(max_workers):
+            result = project_backpack.pack_files(
+                str(source_dir), str(files_dir), max_workers=max_workers
+            )
+            return "{} archives, {} reused".format(
+                len(result["archives"]), result["reused"]
+            )
+
+        print("{} files of 16 KB, codec {}".format(
+            files_count, project_backpack.get_default_codec()
+        ))
+        project_backpack.ARCHIVE_MAX_FILES = 100
+        _benchmark("1 thread", lambda: _pack(1), trace_memory)
+        shutil.rmtree(str(files_dir))
+        _benchmark("threads", lambda: _pack(None), trace_memory)
+        _benchmark("resume", lambda: _pack(None), trace_memory)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
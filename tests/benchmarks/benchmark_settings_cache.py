@@ -0,0 +1,74 @@
+"""Benchmark of project settings resolution.
+
+OpenPype default settings are used with empty studio and project overrides
+from a fake settings handler. Project settings are resolved on each call,
+taken from resolved settings cache as mutable copy and as read-only values.
+
+Usage:
+    python -m tests.benchmarks.benchmark_settings_cache [calls]
+"""
+import sys
+import copy
+import time
+
+from openpype.settings import lib
+
+
+class _SettingsHandler(object):
+    local_site_id = "benchmark"
+
+    def get_settings_revision(self):
+        return 1
+
+    def get_studio_project_settings_overrides(self, return_version):
+        return {}
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        return {}
+
+    def get_local_settings(self):
+        return {}
+
+
+def _benchmark(label, calls, func):
+    lib.clear_settings_cache()
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    duration = time.perf_counter() - start
+    print("  {:<10} {:>8.3f} s {:>8.3f} ms per call".format(
+        label, duration, duration * 1000 / calls
+    ))
+
+
+def main():
+    calls = 100
+    if len(sys.argv) > 1:
+        calls = int(sys.argv[1])
+
+    default_settings = lib.load_openpype_default_settings()
+    lib.get_default_settings = lambda: copy.deepcopy(default_settings)
+    lib._SETTINGS_HANDLER = _SettingsHandler()
+    lib._LOCAL_SETTINGS_HANDLER = _SettingsHandler()
+
+    print("{} calls of 'get_project_settings'".format(calls))
+    _benchmark(
+        "resolve",
+        calls,
+        lambda: lib._resolve_project_settings("project", True, False)
+    )
+    _benchmark(
+        "cached",
+        calls,
+        lambda: lib._get_project_settings("project")
+    )
+    _benchmark(
+        "read-only",
+        calls,
+        lambda: lib._get_project_settings("project", read_only=True)
+    )
+    print("  {}".format(lib.get_settings_cache_stats()))
+
+
+if __name__ == "__main__":
+    main()
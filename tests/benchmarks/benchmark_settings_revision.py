@@ -0,0 +1,87 @@
+"""Benchmark of settings revision lookup on a real mongo.
+
+Temporary database with settings revision document is created on mongo
+server defined by 'OPENPYPE_MONGO' and removed at the end. Read-only project
+settings are taken from resolved settings cache while revision of settings
+is queried on each call and while queried revision is reused for
+'SETTINGS_REVISION_LIFETIME' seconds.
+
+Usage:
+    python -m tests.benchmarks.benchmark_settings_revision [calls]
+"""
+import os
+import sys
+import copy
+import time
+
+from openpype.client.mongo import OpenPypeMongoConnection
+from openpype.settings import lib, handlers
+
+DATABASE_NAME = "benchmark_settings_revision"
+
+
+class _SettingsHandler(object):
+    local_site_id = "benchmark"
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.use_cache = True
+
+    def get_settings_revision(self):
+        return handlers.get_settings_revision(
+            self.collection, self.use_cache
+        )
+
+    def get_studio_project_settings_overrides(self, return_version):
+        return {}
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        return {}
+
+    def get_local_settings(self):
+        return {}
+
+
+def _benchmark(label, calls, handler, use_cache):
+    handler.use_cache = use_cache
+    # Resolve settings before measurement
+    lib._get_project_settings("project", read_only=True)
+    start = time.perf_counter()
+    for _ in range(calls):
+        lib._get_project_settings("project", read_only=True)
+    duration = time.perf_counter() - start
+    print("  {:<10} {:>8.3f} s {:>8.3f} ms per call".format(
+        label, duration, duration * 1000 / calls
+    ))
+
+
+def main():
+    if not os.environ.get("OPENPYPE_MONGO"):
+        print("Set 'OPENPYPE_MONGO' to mongo server used for benchmark")
+        return
+
+    calls = 1000
+    if len(sys.argv) > 1:
+        calls = int(sys.argv[1])
+
+    default_settings = lib.load_openpype_default_settings()
+    lib.get_default_settings = lambda: copy.deepcopy(default_settings)
+
+    client = OpenPypeMongoConnection.get_mongo_client()
+    collection = client[DATABASE_NAME]["settings"]
+    try:
+        handlers.increase_settings_revision(collection)
+        handler = _SettingsHandler(collection)
+        lib._SETTINGS_HANDLER = handler
+        lib._LOCAL_SETTINGS_HANDLER = handler
+
+        print("{} calls of read-only 'get_project_settings'".format(calls))
+        _benchmark("query", calls, handler, False)
+        _benchmark("reused", calls, handler, True)
+        print("  {}".format(lib.get_settings_cache_stats()))
+    finally:
+        client.drop_database(DATABASE_NAME)
+
+
+if __name__ == "__main__":
+    main()
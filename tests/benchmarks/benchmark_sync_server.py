@@ -0,0 +1,154 @@
+"""Benchmark of sync server transfer pipeline throughput.
+
+Many small files are uploaded by 'LocalDriveHandler' between two temp
+directories through site workers of 'SyncServerThread' with different
+'max_site_transfers' values. Database is replaced by object counting
+bulk writes.
+
+Usage:
+    python -m tests.benchmarks.benchmark_sync_server [files] [size_kb]
+"""
+import os
+import sys
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server import sync_server
+from openpype.modules.sync_server.sync_server import SyncServerThread
+from openpype.modules.sync_server.utils import SyncStatus
+
+TRANSFER_COUNTS = (3, 8, 16, 32)
+
+
+class _FakeModule(object):
+    LOG_PROGRESS_SEC = 5
+    DEFAULT_PRIORITY = 50
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bulk_writes = 0
+        self.stored_items = 0
+
+    def get_active_site(self, project_name):
+        return "studio"
+
+    def is_project_paused(self, project_name, check_parents=False):
+        return False
+
+    def handle_alternate_site(self, *args):
+        pass
+
+    def update_db(self, *args, **kwargs):
+        pass
+
+    def update_db_many(self, project_name, items):
+        self.bulk_writes += 1
+        self.stored_items += len(items)
+
+
+def _create_files(dirpath, count, size):
+    content = os.urandom(size)
+    files = []
+    for idx in range(count):
+        filename = "file.{:05d}.exr".format(idx)
+        with open(os.path.join(dirpath, filename), "wb") as stream:
+            stream.write(content)
+        files.append({"_id": ObjectId(), "path": filename})
+    return files
+
+
+async def _run_pipeline(thread, files):
+    queue = thread._get_site_queue("remote", "local_drive")
+    for idx, file in enumerate(files):
+        key = ("benchmark", "remote", file["path"])
+        thread._transfer_keys.add(key)
+        # waits for free place in the queue like next sync loop would
+        await queue.put((-50, idx, {
+            "key": key,
+            "status": SyncStatus.DO_UPLOAD,
+            "project_name": "benchmark",
+            "file": file,
+            "representation": {"_id": ObjectId()},
+            "provider_name": "local_drive",
+            "remote_site": "remote",
+            "site": "remote",
+            "tree": None,
+            "preset": {},
+        }))
+    await queue.join()
+    # Let workers append results of last transfers
+    await asyncio.sleep(0)
+    await thread.store_results()
+
+
+def _benchmark(files, src_dir, dst_root, max_site_transfers):
+    dst_dir = os.path.join(dst_root, str(max_site_transfers))
+    os.makedirs(dst_dir)
+
+    def resolve_paths(module, file_path, *args, **kwargs):
+        return (
+            os.path.join(src_dir, file_path),
+            os.path.join(dst_dir, file_path)
+        )
+
+    sync_server.resolve_paths = resolve_paths
+    module = _FakeModule()
+    thread = SyncServerThread(module)
+    thread.max_site_transfers = max_site_transfers
+    thread.is_running = True
+    thread._working_sites_keys = {("benchmark", "remote")}
+
+    loop = asyncio.new_event_loop()
+    try:
+        start = time.time()
+        loop.run_until_complete(_run_pipeline(thread, files))
+        duration = time.time() - start
+    finally:
+        thread.is_running = False
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+        loop.run_until_complete(asyncio.sleep(0))
+        loop.close()
+        thread.transfer_executor.shutdown(wait=True)
+
+    assert module.stored_items == len(files)
+    print((
+        "  {:>2} transfers {:>7.2f} s {:>7.1f} files/s {:>3} bulk writes"
+    ).format(
+        max_site_transfers,
+        duration,
+        len(files) / duration,
+        module.bulk_writes
+    ))
+
+
+def main():
+    count = 100
+    size = 16
+    if len(sys.argv) > 1:
+        count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        size = int(sys.argv[2])
+
+    tmpdir = tempfile.mkdtemp(prefix="benchmark_sync_server_")
+    try:
+        src_dir = os.path.join(tmpdir, "src")
+        os.makedirs(src_dir)
+        files = _create_files(src_dir, count, size * 1024)
+        print("{} files of {} KB".format(count, size))
+        for max_site_transfers in TRANSFER_COUNTS:
+            _benchmark(
+                files, src_dir, os.path.join(tmpdir, "dst"),
+                max_site_transfers
+            )
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark of event coalescing in ftrack 'SyncToAvalonEvent'.
+
+Events are replayed through 'launch' of the handler with coalescing
+disabled and enabled. Synchronization pass is replaced by sleep which
+simulates rebuild of avalon caches per pass and processing per entity
+change so only number of passes and merged changes is compared.
+
+Events can be loaded from json file with list of events stored by ftrack
+event storer (documents from Mongo). Burst of attribute changes of shots
+in one project, as created by bulk edit in ftrack, is used otherwise.
+
+Usage:
+    python -m tests.benchmarks.benchmark_sync_to_avalon_events
+        [events.json | entities] [changes_per_entity]
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import logging
+import threading
+
+from openpype.modules import load_modules
+from openpype.lib import import_filepath
+
+# Simulated duration of synchronization pass and of one entity change
+PASS_COST = 0.05
+ENTITY_COST = 0.001
+
+
+def _load_handler_class():
+    load_modules()
+    from openpype_modules.ftrack import FTRACK_MODULE_DIR
+
+    module = import_filepath(os.path.join(
+        FTRACK_MODULE_DIR,
+        "event_handlers_server",
+        "event_sync_to_avalon.py"
+    ))
+    return module.SyncToAvalonEvent
+
+
+class _BenchmarkSession(object):
+    def __init__(self):
+        import ftrack_api
+
+        self.event_hub = ftrack_api.event.hub.EventHub(
+            "https://benchmark", "benchmark", "benchmark"
+        )
+
+
+def _create_burst(entities_count, changes_count):
+    project_id = str(uuid.uuid4())
+    parents = [{"entityId": project_id, "entityType": "show"}]
+    entity_ids = [str(uuid.uuid4()) for _ in range(entities_count)]
+    events = []
+    for idx in range(changes_count):
+        for entity_id in entity_ids:
+            events.append({
+                "topic": "ftrack.update",
+                "source": {"user": {"id": "user", "username": "user"}},
+                "data": {"entities": [{
+                    "action": "update",
+                    "entityId": entity_id,
+                    "entityType": "task",
+                    "entity_type": "Shot",
+                    "parents": parents,
+                    "keys": ["frameEnd"],
+                    "changes": {
+                        "frameEnd": {"old": 1000 + idx, "new": 1001 + idx}
+                    }
+                }]}
+            })
+    return events
+
+
+def _load_events(filepath):
+    with open(filepath, "r") as stream:
+        docs = json.load(stream)
+    return [
+        {
+            key: value
+            for key, value in doc.items()
+            if key not in ("_id", "pype_data")
+        }
+        for doc in docs
+    ]
+
+
+def _replay(handler_class, events, coalesce_window):
+    import ftrack_api
+
+    passes = []
+
+    class _ReplaySync(handler_class):
+        def __init__(self):
+            self.log = logging.getLogger("SyncToAvalonEvent")
+            self.process_session = None
+            # No other handlers are subscribed to event hub
+            self._session = _BenchmarkSession()
+            self._pending_events = []
+            self._pending_timer = None
+            self._pending_lock = threading.Lock()
+            self._process_lock = threading.Lock()
+
+        def sync_event(self, session, event):
+            entities_count = len(event["data"]["entities"])
+            passes.append(entities_count)
+            time.sleep(PASS_COST + ENTITY_COST * entities_count)
+            return True
+
+    _ReplaySync.coalesce_window = coalesce_window
+    handler = _ReplaySync()
+    start = time.time()
+    for event_data in events:
+        handler.launch(None, ftrack_api.event.base.Event(**event_data))
+    handler.process_pending_events()
+    return time.time() - start, passes
+
+
+def main():
+    entities_count = 100
+    changes_count = 5
+    events = None
+    if len(sys.argv) > 1:
+        if os.path.exists(sys.argv[1]):
+            events = _load_events(sys.argv[1])
+        else:
+            entities_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        changes_count = int(sys.argv[2])
+    if events is None:
+        events = _create_burst(entities_count, changes_count)
+
+    handler_class = _load_handler_class()
+    print("{} events".format(len(events)))
+    for label, coalesce_window in (("per event", 0), ("coalesced", 0.5)):
+        duration, passes = _replay(handler_class, events, coalesce_window)
+        print("  {:<10} {:>7.2f} s {:>6} passes {:>7} entity changes".format(
+            label, duration, len(passes), sum(passes)
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark of OpenPype version checksum validation.
+
+Version directory with generated files and 'checksums' file is created in
+temp directory and validated with single thread, with multiple threads and
+with validation stamp of previous validation.
+
+Usage:
+    python -m tests.benchmarks.benchmark_version_validation [files]
+        [file_size_kb]
+"""
+import os
+import sys
+import time
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+from igniter import bootstrap_repos
+from igniter.bootstrap_repos import BootstrapRepos
+
+
+def _create_version(version_dir, files_count, file_size):
+    checksums = []
+    for idx in range(files_count):
+        file_name = "openpype/module_{}/file_{}.py".format(idx % 100, idx)
+        content = os.urandom(file_size)
+        file_path = version_dir / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+        checksums.append("{}:{}".format(
+            hashlib.sha256(content).hexdigest(), file_name
+        ))
+    (version_dir / "checksums").write_text("\n".join(checksums) + "\n")
+
+
+def _benchmark(label, bootstrap, version_dir, deep):
+    start = time.perf_counter()
+    valid, message = bootstrap.validate_openpype_version(version_dir, deep)
+    duration = time.perf_counter() - start
+    assert valid, message
+    print("  {:<12} {:>8.3f} s  {}".format(label, duration, message))
+
+
+def main():
+    files_count = 5000
+    file_size = 32
+    if len(sys.argv) > 1:
+        files_count = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        file_size = int(sys.argv[2])
+
+    # Do not create validation key in user data dir
+    bootstrap_repos._get_validation_key = lambda: b"benchmark"
+
+    tmp_dir = Path(tempfile.mkdtemp())
+    try:
+        version_dir = tmp_dir / "openpype-v3.0.0"
+        _create_version(version_dir, files_count, file_size * 1024)
+        bootstrap = BootstrapRepos()
+        bootstrap.data_dir = tmp_dir / "data"
+
+        print("{} files of {} KB".format(files_count, file_size))
+        os.environ["OPENPYPE_VALIDATION_WORKERS"] = "1"
+        _benchmark("sequential", bootstrap, version_dir, True)
+        os.environ.pop("OPENPYPE_VALIDATION_WORKERS")
+        _benchmark("threads", bootstrap, version_dir, True)
+        _benchmark("stamp", bootstrap, version_dir, False)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
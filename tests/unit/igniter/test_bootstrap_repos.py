@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test suite for repos bootstrapping (install)."""
 import os
+import hashlib
 import sys
 from collections import namedtuple
 from pathlib import Path
@@ -10,6 +11,7 @@ from uuid import uuid4
 import appdirs
 import pytest
 
+from igniter import bootstrap_repos
 from igniter.bootstrap_repos import BootstrapRepos
 from igniter.bootstrap_repos import OpenPypeVersion
 from igniter.user_settings import OpenPypeSettingsRegistry
@@ -388,3 +390,75 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def _create_version_files(version_dir):
+    files = {
+        "openpype/version.py": b"__version__ = '3.0.0'",
+        "openpype/lib.py": b"print('lib')",
+        "LICENSE": b"license",
+    }
+    checksums = []
+    for file_name, content in files.items():
+        file_path = version_dir / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+        checksums.append("{}:{}".format(
+            hashlib.sha256(content).hexdigest(), file_name
+        ))
+    (version_dir / "checksums").write_text("\n".join(checksums) + "\n")
+
+
+def test_validate_dir_incremental(fix_bootstrap, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        bootstrap_repos, "_get_validation_key", lambda: b"key"
+    )
+    version_dir = tmp_path / "openpype-v3.0.0"
+    _create_version_files(version_dir)
+
+    assert fix_bootstrap.validate_openpype_version(version_dir) == (
+        True, "All ok"
+    )
+    assert fix_bootstrap.validate_openpype_version(version_dir) == (
+        True, "All ok (validated before)"
+    )
+
+    # Change content but keep size and modification time
+    lib_path = version_dir / "openpype" / "lib.py"
+    lib_stat = lib_path.stat()
+    lib_path.write_bytes(b"print('bad')")
+    os.utime(lib_path, ns=(lib_stat.st_atime_ns, lib_stat.st_mtime_ns))
+    assert fix_bootstrap.validate_openpype_version(version_dir)[0]
+    assert fix_bootstrap.validate_openpype_version(
+        version_dir, deep=True
+    ) == (False, "Invalid checksum on openpype/lib.py")
+
+    # Changed files are checksummed again
+    lib_path.write_bytes(b"print('modified')")
+    assert not fix_bootstrap.validate_openpype_version(version_dir)[0]
+
+
+def test_validate_zip(fix_bootstrap, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        bootstrap_repos, "_get_validation_key", lambda: b"key"
+    )
+    version_dir = tmp_path / "openpype-v3.0.0"
+    _create_version_files(version_dir)
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        for file_path in version_dir.rglob("*"):
+            if file_path.is_file():
+                zip_file.write(
+                    file_path, file_path.relative_to(version_dir).as_posix()
+                )
+
+    assert fix_bootstrap.validate_openpype_version(zip_path) == (
+        True, "All ok"
+    )
+    assert fix_bootstrap.validate_openpype_version(zip_path) == (
+        True, "All ok (validated before)"
+    )
+
+    with ZipFile(zip_path, "a") as zip_file:
+        zip_file.writestr("LICENSE2", b"license")
+    assert not fix_bootstrap.validate_openpype_version(zip_path)[0]
@@ -0,0 +1,155 @@
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities
+from openpype.client.entity_cache import (
+    entities_cache,
+    invalidate_last_versions_cache,
+    project_document_fields,
+)
+
+
+class FakeCollection(object):
+    """Collection supporting only queries used by cached entity functions."""
+
+    name = "test_project"
+
+    def __init__(self, docs, aggregate_result=None):
+        self.docs_by_id = {doc["_id"]: doc for doc in docs}
+        self.queries = []
+        self.aggregate_result = aggregate_result or []
+        self.pipelines = []
+
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        return list(self.aggregate_result)
+
+    def find(self, query_filter, projection=None):
+        self.queries.append(query_filter)
+        ids = query_filter["_id"]["$in"]
+        return [
+            self.docs_by_id[entity_id]
+            for entity_id in ids
+            if entity_id in self.docs_by_id
+        ]
+
+
+def _create_docs():
+    asset_id = ObjectId()
+    subset_id = ObjectId()
+    version_ids = [ObjectId() for _ in range(3)]
+    docs = [
+        {"_id": asset_id, "type": "asset", "name": "sh010"},
+        {
+            "_id": subset_id,
+            "type": "subset",
+            "parent": asset_id,
+            "name": "renderMain",
+            "data": {"family": "render", "subsetGroup": None},
+        },
+    ]
+    for idx, version_id in enumerate(version_ids):
+        docs.append({
+            "_id": version_id,
+            "type": "version",
+            "parent": subset_id,
+            "name": idx + 1,
+        })
+    return docs, version_ids
+
+
+def test_cached_queries(monkeypatch):
+    docs, version_ids = _create_docs()
+    collection = FakeCollection(docs)
+    monkeypatch.setattr(
+        entities, "get_project_connection", lambda _name: collection
+    )
+
+    with entities_cache() as cache:
+        version_docs = entities.get_versions(
+            "test_project", version_ids=version_ids[:2]
+        )
+        assert {doc["_id"] for doc in version_docs} == set(version_ids[:2])
+        assert len(collection.queries) == 1
+
+        # Only the missing version is queried
+        version_docs = entities.get_versions(
+            "test_project", version_ids=version_ids, fields=["name"]
+        )
+        assert len(collection.queries) == 2
+        assert collection.queries[1]["_id"]["$in"] == [version_ids[2]]
+        assert sorted(doc["name"] for doc in version_docs) == [1, 2, 3]
+        assert all(set(doc) == {"_id", "name"} for doc in version_docs)
+
+        # Type of entity is respected
+        subset_doc = entities.get_subset_by_id("test_project", version_ids[0])
+        assert subset_doc is None
+        assert entities.get_version_by_id(
+            "test_project", str(version_ids[0])
+        )["name"] == 1
+        assert len(collection.queries) == 2
+
+        cache.invalidate("test_project", [version_ids[0]])
+        entities.get_version_by_id("test_project", version_ids[0])
+        assert len(collection.queries) == 3
+        assert cache.hits > 0
+
+    assert entities.get_entities_cache() is None
+
+
+def test_project_document_fields():
+    doc = {
+        "_id": 1,
+        "name": "sh010",
+        "data": {"frameStart": 1001, "frameEnd": 1100},
+    }
+    output = project_document_fields(doc, ["data.frameStart", "missing"])
+    assert output == {"_id": 1, "data": {"frameStart": 1001}}
+
+    output = project_document_fields(doc, None)
+    assert output == doc
+    assert output["data"] is not doc["data"]
+
+
+def test_representations_last_versions(monkeypatch):
+    docs, version_ids = _create_docs()
+    subset_id = docs[1]["_id"]
+    repre_ids = [ObjectId() for _ in range(3)]
+    docs.extend([
+        {"_id": repre_ids[0], "type": "representation",
+         "parent": version_ids[0]},
+        {"_id": repre_ids[1], "type": "representation", "parent": ObjectId()},
+    ])
+    aggregate_result = [
+        {"_id": subset_id, "last_version_id": version_ids[-1]},
+    ]
+    collection = FakeCollection(docs, aggregate_result)
+    monkeypatch.setattr(
+        entities, "get_project_connection", lambda _name: collection
+    )
+    invalidate_last_versions_cache()
+
+    result = entities.get_representations_last_versions(
+        "test_project", [str(repre_id) for repre_id in repre_ids]
+    )
+    # Representations and versions are queried by ids, last versions
+    #   by single aggregation
+    assert len(collection.queries) == 2
+    assert len(collection.pipelines) == 1
+    assert set(result) == {str(repre_ids[0]), str(repre_ids[1])}
+    assert result[str(repre_ids[0])] == {
+        "version_id": version_ids[0],
+        "version_type": "version",
+        "subset_id": subset_id,
+        "last_version_id": version_ids[-1],
+    }
+    assert result[str(repre_ids[1])]["version_id"] is None
+
+    # Found representations are cached, missing are queried again
+    entities.get_representations_last_versions("test_project", repre_ids[:2])
+    assert len(collection.queries) == 2
+    entities.get_representations_last_versions("test_project", repre_ids)
+    assert len(collection.queries) == 3
+
+    invalidate_last_versions_cache("test_project")
+    entities.get_representations_last_versions("test_project", repre_ids[:1])
+    assert len(collection.pipelines) == 2
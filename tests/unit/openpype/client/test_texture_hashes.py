@@ -0,0 +1,82 @@
+from openpype.client.mongo import texture_hashes
+
+
+class _Cursor(list):
+    def sort(self, *args, **kwargs):
+        return self
+
+
+class _IndexCollection(object):
+    def __init__(self):
+        self.docs = []
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        return _Cursor(
+            doc for doc in self.docs
+            if doc["project"] == query["project"]
+            and doc["hash"] in query["hash"]["$in"]
+        )
+
+    def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            doc = dict(operation._filter)
+            if doc not in self.docs:
+                self.docs.append(doc)
+
+
+class _ProjectCollection(object):
+    def __init__(self, version_docs):
+        self.version_docs = version_docs
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        return list(self.version_docs)
+
+
+def _setup(monkeypatch, version_docs):
+    index_collection = _IndexCollection()
+    project_collection = _ProjectCollection(version_docs)
+    monkeypatch.setattr(
+        texture_hashes, "get_texture_hashes_collection",
+        lambda: index_collection
+    )
+    monkeypatch.setattr(
+        texture_hashes, "get_project_connection",
+        lambda project_name: project_collection
+    )
+    return index_collection, project_collection
+
+
+def test_find_texture_paths_one_query(monkeypatch):
+    index_collection, project_collection = _setup(monkeypatch, [])
+    texture_hashes.register_texture_hashes("project", {
+        "tex_{}|maketx".format(idx): "/publish/tex_{}.tx".format(idx)
+        for idx in range(500)
+    })
+
+    hashes = ["tex_{}|maketx".format(idx) for idx in range(500)]
+    output = texture_hashes.find_texture_paths_by_hashes("project", hashes)
+
+    assert len(output) == 500
+    assert output["tex_7|maketx"] == ["/publish/tex_7.tx"]
+    assert len(index_collection.queries) == 1
+    assert not project_collection.queries
+
+
+def test_find_texture_paths_legacy_versions(monkeypatch):
+    index_collection, project_collection = _setup(monkeypatch, [
+        {"data": {"sourceHashes": {"old|maketx": "/publish/old.tx"}}},
+    ])
+
+    output = texture_hashes.find_texture_paths_by_hashes(
+        "project", ["old|maketx", "new|maketx"]
+    )
+    assert output == {"old|maketx": ["/publish/old.tx"]}
+    assert len(project_collection.queries) == 1
+    # Legacy paths are added to index
+    assert index_collection.docs == [
+        {"project": "project", "hash": "old|maketx", "path": "/publish/old.tx"}
+    ]
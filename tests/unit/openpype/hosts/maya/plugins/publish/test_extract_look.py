@@ -0,0 +1,156 @@
+"""Test of texture processing in Maya look extractor.
+
+Requires Maya python ('mayapy'), tests are skipped otherwise.
+"""
+import os
+import time
+import threading
+
+import pytest
+
+pytest.importorskip("maya.cmds")
+
+from openpype.lib import source_hash  # noqa: E402
+from openpype.hosts.maya.plugins.publish import extract_look  # noqa: E402
+from openpype.hosts.maya.plugins.publish.extract_look import (  # noqa: E402
+    COPY,
+    HARDLINK,
+    ExtractLook,
+    TextureProcessor,
+    TextureResult,
+)
+
+
+class FakeProcessor(TextureProcessor):
+    extension = ".tx"
+
+    def __init__(self):
+        super(FakeProcessor, self).__init__()
+        self.lock = threading.Lock()
+        self.processed = []
+        self.prepared_count = 0
+
+    def prepare_environment(self, color_management):
+        self.prepared_count += 1
+
+    def get_hashed_result(self, source, colorspace, color_management):
+        # Files with the same name in different folders have same content
+        return TextureResult(
+            path=None,
+            file_hash="hash_" + os.path.basename(source),
+            colorspace=colorspace,
+            transfer_mode=COPY
+        )
+
+    def process(self, source, colorspace, color_management, staging_dir,
+                threads=None):
+        # First files finish last
+        time.sleep(0.05 * int(os.path.basename(source)[0]))
+        with self.lock:
+            self.processed.append((source, colorspace, threads))
+        return TextureResult(
+            path=source + self.extension,
+            file_hash="hash_" + os.path.basename(source),
+            colorspace=colorspace,
+            transfer_mode=COPY
+        )
+
+
+class FakeInstance(object):
+    def __init__(self, resources):
+        self.data = {"resources": resources}
+
+
+def _process_textures(resources, max_workers):
+    plugin = ExtractLook()
+    plugin.reuse_processed_textures = False
+    plugin.texture_max_workers = max_workers
+    processor = FakeProcessor()
+    output = plugin._process_textures(
+        FakeInstance(resources),
+        processors=[processor],
+        staging_dir="staging",
+        force_copy=True,
+        color_management={"enabled": False}
+    )
+    return output, processor
+
+
+def test_process_textures_dedup():
+    paths = [
+        os.path.normpath(path)
+        for path in ("a/3.exr", "b/3.exr", "a/2.exr")
+    ]
+    resources = [
+        {"files": [paths[0], paths[2]], "color_space": "sRGB"},
+        {"files": [paths[2], paths[1]], "color_space": "Raw"},
+    ]
+    output, processor = _process_textures(resources, 1)
+
+    # Each hash is processed once with colorspace of first resource
+    assert processor.processed == [
+        (paths[0], "sRGB", None),
+        (paths[2], "sRGB", None),
+    ]
+    assert processor.prepared_count == 1
+    assert output[paths[1]] is output[paths[0]]
+    assert output[paths[2]].colorspace == "sRGB"
+
+
+def test_process_textures_concurrent_results():
+    paths = [
+        os.path.normpath("textures/{}.exr".format(idx))
+        for idx in range(4, 0, -1)
+    ]
+    resources = [{"files": paths, "color_space": "sRGB"}]
+    output, processor = _process_textures(resources, 4)
+
+    # Results are matched to their sources regardless of finish order
+    assert [item[0] for item in processor.processed] != paths
+    assert set(output) == set(paths)
+    for path in paths:
+        assert output[path].path == path + ".tx"
+    # Threads are passed to each process call
+    assert {item[2] for item in processor.processed} == {
+        max(1, os.cpu_count() // 4)
+    }
+    assert processor.prepared_count == 1
+
+
+def test_process_texture_reuses_published_texture(tmpdir, monkeypatch):
+    filepath = str(tmpdir.join("texture.exr"))
+    published_path = str(tmpdir.join("published.exr"))
+    for path in (filepath, published_path):
+        with open(path, "w") as stream:
+            stream.write("texture")
+
+    texture_hash = source_hash(filepath)
+    queried_hashes = []
+
+    def find_paths_by_hash(value):
+        queried_hashes.append(value)
+        if value == texture_hash:
+            return [published_path]
+        return []
+
+    monkeypatch.setattr(extract_look, "find_paths_by_hash", find_paths_by_hash)
+
+    def process_texture(force_copy):
+        return ExtractLook()._process_texture(
+            filepath,
+            processors=[],
+            staging_dir=str(tmpdir),
+            force_copy=force_copy,
+            color_management={"enabled": False},
+            colorspace="sRGB"
+        )
+
+    # Published texture is found by hash of the source file
+    result = process_texture(force_copy=False)
+    assert queried_hashes == [texture_hash]
+    assert result.transfer_mode == HARDLINK
+    assert result.file_hash == texture_hash
+
+    result = process_texture(force_copy=True)
+    assert queried_hashes == [texture_hash]
+    assert result.transfer_mode == COPY
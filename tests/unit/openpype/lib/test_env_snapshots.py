@@ -0,0 +1,60 @@
+import os
+
+from openpype.lib import env_snapshots
+
+
+class _SavedInfo(object):
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+
+def _setup(monkeypatch, tmpdir, timestamps):
+    monkeypatch.setenv(env_snapshots.ENV_SNAPSHOTS_ROOT_KEY, str(tmpdir))
+    monkeypatch.setattr(
+        env_snapshots, "get_system_last_saved_info",
+        lambda: _SavedInfo(timestamps["system"])
+    )
+    monkeypatch.setattr(
+        env_snapshots, "get_project_last_saved_info",
+        lambda project_name: _SavedInfo(timestamps.get(project_name))
+    )
+
+
+def test_snapshot_dir_changes_with_settings(monkeypatch, tmpdir):
+    timestamps = {"system": "2023-01-01 10:00:00.0", "project": None}
+    _setup(monkeypatch, tmpdir, timestamps)
+
+    context = ("project", "sh010", "comp", "nuke/14-0")
+    snapshot_dir = env_snapshots.get_env_snapshot_dir(*context, "farm")
+    assert snapshot_dir == env_snapshots.get_env_snapshot_dir(
+        *context, "farm"
+    )
+    assert os.path.dirname(snapshot_dir) == str(tmpdir.join("project"))
+    assert snapshot_dir != env_snapshots.get_env_snapshot_dir(*context)
+
+    timestamps["project"] = "2023-01-02 10:00:00.0"
+    assert snapshot_dir != env_snapshots.get_env_snapshot_dir(
+        *context, "farm"
+    )
+
+
+def test_snapshots_disabled_without_root(monkeypatch):
+    monkeypatch.delenv(env_snapshots.ENV_SNAPSHOTS_ROOT_KEY, raising=False)
+    assert env_snapshots.get_env_snapshot_dir(
+        "project", "sh010", "comp", "nuke/14-0"
+    ) is None
+    env_snapshots.clear_env_snapshots()
+
+
+def test_clear_env_snapshots(monkeypatch, tmpdir):
+    _setup(monkeypatch, tmpdir, {"system": None})
+    for project_name in ("first", "second"):
+        tmpdir.join(project_name, "key", "linux.json").write(
+            "{}", ensure=True
+        )
+
+    env_snapshots.clear_env_snapshots("first")
+    assert sorted(os.listdir(str(tmpdir))) == ["second"]
+
+    env_snapshots.clear_env_snapshots()
+    assert not os.listdir(str(tmpdir))
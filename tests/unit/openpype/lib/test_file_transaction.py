@@ -0,0 +1,162 @@
+import os
+import errno
+
+import pytest
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_files(dirpath, count, content="source"):
+    paths = []
+    for idx in range(count):
+        path = os.path.join(dirpath, "file_{}.txt".format(idx))
+        with open(path, "w") as stream:
+            stream.write(content * (idx + 1))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_process_with_backups(tmp_path, max_workers):
+    src_dir = tmp_path / "src"
+    dst_dir = tmp_path / "dst"
+    src_dir.mkdir()
+    dst_dir.mkdir()
+    src_paths = _create_files(str(src_dir), 10)
+    # Existing destination file should be backed up
+    _create_files(str(dst_dir), 1, "existing")
+
+    progress = []
+    transaction = FileTransaction(
+        max_workers=max_workers,
+        progress_callback=lambda *args: progress.append(args)
+    )
+    for src_path in src_paths:
+        transaction.add(
+            src_path, str(dst_dir / "sub" / os.path.basename(src_path))
+        )
+    transaction.add(src_paths[0], str(dst_dir / "file_0.txt"))
+    transaction.process()
+
+    assert len(transaction.transferred) == 11
+    assert transaction.backups == [str(dst_dir / "file_0.txt.bak")]
+    assert sorted(item[2] for item in progress) == list(range(1, 12))
+    assert all(item[3] == 11 for item in progress)
+    for src_path in src_paths:
+        dst_path = dst_dir / "sub" / os.path.basename(src_path)
+        with open(src_path, "r") as stream:
+            assert dst_path.read_text() == stream.read()
+
+    transaction.finalize()
+    assert not os.path.exists(str(dst_dir / "file_0.txt.bak"))
+
+
+def test_concurrent_rollback(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    dst_dir = tmp_path / "dst"
+    src_dir.mkdir()
+    dst_dir.mkdir()
+    src_paths = _create_files(str(src_dir), 10)
+    existing_path = _create_files(str(dst_dir), 1, "existing")[0]
+
+    copyfile = file_transaction.copyfile
+    failing_path = os.path.join(str(dst_dir), "file_5.txt")
+
+    def _copyfile(src, dst):
+        if dst == failing_path:
+            raise OSError("Copy failed")
+        copyfile(src, dst)
+
+    monkeypatch.setattr(file_transaction, "copyfile", _copyfile)
+
+    transaction = FileTransaction(max_workers=4)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(str(dst_dir), os.path.basename(src_path))
+        )
+
+    with pytest.raises(OSError):
+        transaction.process()
+
+    assert failing_path not in transaction.transferred
+    transaction.rollback()
+
+    # Only the backed up original file is left
+    assert os.listdir(str(dst_dir)) == ["file_0.txt"]
+    with open(existing_path, "r") as stream:
+        assert stream.read() == "existing"
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_resume_after_partial_copy(tmp_path, monkeypatch, max_workers):
+    src_dir = tmp_path / "src"
+    dst_dir = tmp_path / "dst"
+    src_dir.mkdir()
+    dst_dir.mkdir()
+    src_paths = _create_files(str(src_dir), 2)
+    dst_path = os.path.join(str(dst_dir), "file_0.txt")
+    with open(dst_path, "w") as stream:
+        stream.write("ORIGINAL")
+
+    def _partial_copyfile(src, dst):
+        with open(dst, "w") as stream:
+            stream.write("PART")
+        raise OSError("Copy failed")
+
+    monkeypatch.setattr(file_transaction, "copyfile", _partial_copyfile)
+
+    transaction = FileTransaction(max_workers=max_workers)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(str(dst_dir), os.path.basename(src_path))
+        )
+
+    # Partial file is left in destination after each failed attempt
+    for _ in range(2):
+        with pytest.raises(OSError):
+            transaction.process()
+
+    assert transaction.backups == [dst_path + ".bak"]
+    transaction.rollback()
+
+    # Original file is restored and partial files are removed
+    with open(dst_path, "r") as stream:
+        assert stream.read() == "ORIGINAL"
+    assert os.listdir(str(dst_dir)) == ["file_0.txt"]
+
+
+def test_hardlink_or_copy(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    src_paths = _create_files(str(src_dir), 2)
+    dst_dir = str(tmp_path / "dst")
+
+    transaction = FileTransaction(max_workers=2)
+    for src_path in src_paths:
+        transaction.add(
+            src_path,
+            os.path.join(dst_dir, os.path.basename(src_path)),
+            FileTransaction.MODE_HARDLINK_OR_COPY
+        )
+    transaction.process()
+    for src_path in src_paths:
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        assert os.path.samefile(src_path, dst_path)
+
+    # Files are copied when hardlink can't be created across drives
+    def _cross_drive_link(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(
+        file_transaction, "create_hard_link", _cross_drive_link
+    )
+    dst_path = os.path.join(dst_dir, "copy.txt")
+    transaction = FileTransaction()
+    transaction.add(
+        src_paths[0], dst_path, FileTransaction.MODE_HARDLINK_OR_COPY
+    )
+    transaction.process()
+    assert not os.path.samefile(src_paths[0], dst_path)
+    with open(dst_path, "r") as stream:
+        assert stream.read() == "source"
@@ -0,0 +1,82 @@
+import logging
+import threading
+
+from openpype.lib import log as log_lib
+from openpype.lib.log import BufferedMongoHandler
+
+
+class _Collection(object):
+    def __init__(self):
+        self.batches = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.started.set()
+        self.release.wait()
+        self.batches.append(documents)
+
+
+def _create_handler(monkeypatch, collection, **kwargs):
+    monkeypatch.setattr(
+        log_lib.Logger, "process_data", {"process_name": "test"}
+    )
+    handler = BufferedMongoHandler("database", "logs", **kwargs)
+    handler.setFormatter(log_lib.MongoFormatter())
+    monkeypatch.setattr(handler, "_get_collection", lambda: collection)
+
+    logger = logging.getLogger("test_buffered_mongo_handler")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [handler]
+    return handler, logger
+
+
+def test_records_written_in_batches(monkeypatch):
+    collection = _Collection()
+    handler, logger = _create_handler(
+        monkeypatch, collection, buffer_size=10, flush_interval=10
+    )
+    for idx in range(25):
+        logger.info("Record %s", idx)
+    # Filtered by level
+    logger.debug("Debug record")
+    handler.flush()
+    handler.close()
+
+    messages = [
+        document["message"]
+        for documents in collection.batches
+        for document in documents
+    ]
+    assert messages == ["Record {}".format(idx) for idx in range(25)]
+    assert [len(documents) for documents in collection.batches] == [10, 10, 5]
+    assert collection.batches[0][0]["process_name"] == "test"
+
+
+def test_records_dropped_when_queue_is_full(monkeypatch):
+    collection = _Collection()
+    collection.release.clear()
+    handler, logger = _create_handler(
+        monkeypatch, collection,
+        buffer_size=1, flush_interval=0.01, max_queue_size=1
+    )
+    logger.info("First")
+    collection.started.wait(5)
+    # Writer is blocked, one record fits to queue
+    for idx in range(5):
+        logger.info("Record %s", idx)
+    collection.release.set()
+    handler.close()
+
+    messages = [
+        document["message"]
+        for documents in collection.batches
+        for document in documents
+    ]
+    assert messages == [
+        "First",
+        "4 log records were dropped because log queue was full",
+        "Record 0",
+    ]
@@ -0,0 +1,67 @@
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+)
+
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}"
+    "/publish/{family}/{subset}/v{version:0>3}"
+    "/{project[code]}_{asset}_{subset}_v{version:0>3}<_{output}><.{frame:0>4}>"
+    ".{ext}"
+)
+
+
+def _get_data(**kwargs):
+    data = {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Project", "code": "prj"},
+        "hierarchy": "shots/sq01",
+        "asset": "sh010",
+        "family": "render",
+        "subset": "renderMain",
+        "version": 3,
+        "ext": "exr",
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_format_to_string_matches_format():
+    template = StringTemplate(TEMPLATE)
+    for data in (
+        _get_data(),
+        _get_data(frame=1001),
+        _get_data(frame=1001, output="beauty"),
+        _get_data(output={"invalid": "type"}),
+    ):
+        assert template.format_to_string(data) == str(template.format(data))
+
+
+def test_format_to_string_unsolved():
+    template = StringTemplate(TEMPLATE)
+    data = _get_data()
+    data.pop("asset")
+    with pytest.raises(TemplateUnsolved):
+        template.format_to_string(data)
+
+    output = template.format_to_string(data, strict=False)
+    assert output == str(template.format(data))
+    assert "{asset}" in output
+
+
+def test_format_many():
+    template = StringTemplate(TEMPLATE)
+    data_items = [_get_data(frame=frame) for frame in range(1001, 1011)]
+    expected = [str(template.format(data)) for data in data_items]
+    assert template.format_many(data_items) == expected
+    assert expected[0].endswith("_v003.1001.exr")
+
+
+def test_parsed_parts_are_shared():
+    StringTemplate.clear_cache()
+    first = StringTemplate(TEMPLATE)
+    second = StringTemplate(TEMPLATE)
+    assert first._parts is second._parts
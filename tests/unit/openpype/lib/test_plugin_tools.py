@@ -0,0 +1,16 @@
+import os
+
+from openpype.lib import source_hash, source_hash_from_stat
+
+
+def test_source_hash_from_stat(tmpdir):
+    filepath = str(tmpdir.join("texture.1001.exr"))
+    with open(filepath, "w") as stream:
+        stream.write("texture")
+
+    file_hash = source_hash(filepath, "maketx")
+    assert file_hash == source_hash_from_stat(
+        filepath, os.stat(filepath), "maketx"
+    )
+    assert file_hash.startswith("texture,1001,exr|")
+    assert "." not in file_hash
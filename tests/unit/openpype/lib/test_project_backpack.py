@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from openpype.lib import project_backpack
+
+
+def _create_files(source_dir, count):
+    for idx in range(count):
+        source_dir.join("shot_{}".format(idx % 3), "file_{}.txt".format(idx))\
+            .write("content {}".format(idx), ensure=True)
+
+
+def _read_files(root_dir):
+    output = {}
+    for root, _, filenames in os.walk(str(root_dir)):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            with open(filepath, "r") as stream:
+                output[os.path.relpath(filepath, str(root_dir))] = (
+                    stream.read()
+                )
+    return output
+
+
+@pytest.mark.parametrize("codec", project_backpack.get_available_codecs())
+def test_pack_and_unpack_files(monkeypatch, tmpdir, codec):
+    monkeypatch.setattr(project_backpack, "ARCHIVE_MAX_FILES", 4)
+    source_dir = tmpdir.join("source")
+    files_dir = str(tmpdir.join("files"))
+    _create_files(source_dir, 10)
+
+    result = project_backpack.pack_files(str(source_dir), files_dir, codec)
+    assert result["files_count"] == 10
+    assert len(result["archives"]) == 3
+    assert result["reused"] == 0
+
+    dst_dir = tmpdir.join("destination")
+    invalid_paths = project_backpack.unpack_files(
+        files_dir, str(dst_dir), result["archives"], codec
+    )
+    assert not invalid_paths
+    assert _read_files(dst_dir) == _read_files(source_dir)
+
+
+def test_pack_files_resume(monkeypatch, tmpdir):
+    monkeypatch.setattr(project_backpack, "ARCHIVE_MAX_FILES", 4)
+    source_dir = tmpdir.join("source")
+    files_dir = str(tmpdir.join("files"))
+    _create_files(source_dir, 10)
+
+    project_backpack.pack_files(str(source_dir), files_dir, "gzip")
+    result = project_backpack.pack_files(str(source_dir), files_dir, "gzip")
+    assert result["reused"] == 3
+
+    # Only archive with changed file is packed again
+    source_dir.join("shot_2", "file_8.txt").write("changed content")
+    result = project_backpack.pack_files(str(source_dir), files_dir, "gzip")
+    assert result["reused"] == 2
+
+    # Archives of removed files are removed from package
+    source_dir.join("shot_2").remove()
+    result = project_backpack.pack_files(str(source_dir), files_dir, "gzip")
+    assert len(result["archives"]) == 2
+    assert sorted(os.listdir(files_dir)) == [
+        "00000.json", "00000.tar.gz", "00001.json", "00001.tar.gz"
+    ]
+
+
+def test_unpack_files_validates_checksums(tmpdir):
+    source_dir = tmpdir.join("source")
+    files_dir = str(tmpdir.join("files"))
+    _create_files(source_dir, 2)
+    result = project_backpack.pack_files(str(source_dir), files_dir, "none")
+
+    manifest_path = os.path.join(files_dir, "00000.json")
+    manifest = project_backpack._read_json(manifest_path)
+    manifest["files"][0]["sha256"] = "invalid"
+    manifest["files"].append(dict(manifest["files"][1], path="missing.txt"))
+    project_backpack._write_json(manifest_path, manifest)
+
+    invalid_paths = project_backpack.unpack_files(
+        files_dir, str(tmpdir.join("destination")), result["archives"], "none"
+    )
+    assert invalid_paths == [manifest["files"][0]["path"], "missing.txt"]
+
+
+def test_export_and_import_documents(monkeypatch, tmpdir):
+    docs = [
+        {"_id": idx, "type": "asset", "data": {"frameStart": idx}}
+        for idx in range(5)
+    ]
+    imported = []
+
+    def _replace_project_documents(project_name, docs, database_name):
+        imported.extend(docs)
+        return len(imported)
+
+    monkeypatch.setattr(
+        project_backpack, "iter_project_documents",
+        lambda project_name, database_name: iter(docs)
+    )
+    monkeypatch.setattr(
+        project_backpack, "replace_project_documents",
+        _replace_project_documents
+    )
+
+    filepath = str(tmpdir.join("database.jsonl.gz"))
+    assert project_backpack.export_project_documents(
+        "project", filepath, "gzip"
+    ) == 5
+    assert project_backpack.import_project_documents(
+        "project", filepath, "gzip"
+    ) == 5
+    assert imported == docs
@@ -0,0 +1,106 @@
+import os
+
+from openpype.lib import transcoding
+
+
+def _fake_input_info():
+    return {
+        "channelnames": ["R", "G", "B", "A"],
+        "attribs": {"compression": "dwaa", "comment": "a\"b"},
+        "subimages": 1,
+    }
+
+
+def test_oiio_info_is_cached(tmp_path, monkeypatch):
+    filepath = str(tmp_path / "image.exr")
+    with open(filepath, "wb") as stream:
+        stream.write(b"data")
+
+    calls = []
+
+    def get_info(path, logger, subimages):
+        calls.append(path)
+        return _fake_input_info()
+
+    monkeypatch.setattr(transcoding, "_get_oiio_info_for_input", get_info)
+    transcoding.clear_oiio_info_cache()
+
+    info = transcoding.get_oiio_info_for_input(filepath)
+    info["attribs"]["compression"] = "none"
+    assert transcoding.get_oiio_info_for_input(filepath) == _fake_input_info()
+    assert len(calls) == 1
+
+    # Changed file is read again
+    with open(filepath, "wb") as stream:
+        stream.write(b"changed data")
+    transcoding.get_oiio_info_for_input(filepath)
+    assert len(calls) == 2
+
+    transcoding.get_oiio_info_for_input(filepath, subimages=True)
+    assert len(calls) == 3
+    transcoding.clear_oiio_info_cache()
+
+
+def test_convert_input_paths_cache(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    input_paths = []
+    for frame in range(1001, 1011):
+        path = str(src_dir / "render.{}.exr".format(frame))
+        with open(path, "wb") as stream:
+            stream.write(b"frame")
+        input_paths.append(path)
+
+    commands = []
+
+    def run_subprocess(args, logger=None):
+        commands.append(args)
+        with open(args[-1], "wb") as stream:
+            stream.write(b"converted")
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args)
+    )
+    monkeypatch.setattr(
+        transcoding,
+        "get_oiio_info_for_input",
+        lambda *args, **kwargs: _fake_input_info()
+    )
+    monkeypatch.setenv(
+        transcoding.TRANSCODE_CACHE_DIR_ENV_KEY, str(tmp_path / "cache")
+    )
+
+    first_output = str(tmp_path / "first")
+    os.makedirs(first_output)
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, first_output, max_workers=4
+    )
+    assert len(commands) == 10
+    assert sorted(os.listdir(first_output)) == sorted(
+        os.path.basename(path) for path in input_paths
+    )
+    cmd = commands[0]
+    assert cmd[cmd.index("--compression") + 1] == "none"
+    assert cmd[cmd.index("--eraseattrib") + 1] == "comment"
+    assert "--threads" in cmd
+
+    # Unchanged inputs are not converted again
+    second_output = str(tmp_path / "second")
+    os.makedirs(second_output)
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, second_output, max_workers=1
+    )
+    assert len(commands) == 10
+    assert len(os.listdir(second_output)) == 10
+
+    # Changed input is converted
+    with open(input_paths[0], "wb") as stream:
+        stream.write(b"changed frame")
+    third_output = str(tmp_path / "third")
+    os.makedirs(third_output)
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, third_output, max_workers=1
+    )
+    assert len(commands) == 11
+    assert "--threads" not in commands[-1]
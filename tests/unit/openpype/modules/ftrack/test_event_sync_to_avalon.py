@@ -0,0 +1,181 @@
+"""Test of merging of ftrack events in 'SyncToAvalonEvent'."""
+import os
+import logging
+import threading
+
+import pytest
+
+ftrack_api = pytest.importorskip("ftrack_api")
+
+from openpype.lib import import_filepath  # noqa: E402
+from openpype.modules import base  # noqa: E402
+
+PROJECT_ID = "project_id"
+PARENTS = [{"entityId": PROJECT_ID, "entityType": "show"}]
+
+
+@pytest.fixture(scope="module")
+def handler():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Dynamic modules dirs are defined in settings stored in database
+        monkeypatch.setattr(base, "get_dynamic_modules_dirs", lambda: [])
+        base.load_modules()
+
+    from openpype_modules.ftrack import FTRACK_MODULE_DIR
+
+    module = import_filepath(os.path.join(
+        FTRACK_MODULE_DIR, "event_handlers_server", "event_sync_to_avalon.py"
+    ))
+    handler_class = module.SyncToAvalonEvent
+    # Merging of events does not use session or caches of handler
+    return handler_class.__new__(handler_class)
+
+
+def _event(action, entity_id, changes=None, entity_type="Shot"):
+    changes = changes or {}
+    return ftrack_api.event.base.Event(
+        topic="ftrack.update",
+        data={"entities": [{
+            "action": action,
+            "entityId": entity_id,
+            "entityType": "task",
+            "entity_type": entity_type,
+            "parents": PARENTS,
+            "keys": list(changes),
+            "changes": changes,
+        }]}
+    )
+
+
+def _merged_entities(handler, events):
+    merged_events = handler.merge_events(events)
+    assert len(merged_events) == 1
+    return merged_events[0]["data"]["entities"]
+
+
+def test_repeated_updates_merged(handler):
+    entities = _merged_entities(handler, [
+        _event("update", "sh010", {"frameEnd": {"old": 1000, "new": 1001}}),
+        _event("update", "sh010", {"frameStart": {"old": 1, "new": 2}}),
+        _event("update", "sh010", {"frameEnd": {"old": 1001, "new": 1002}}),
+    ])
+    assert len(entities) == 1
+    assert entities[0]["keys"] == ["frameEnd", "frameStart"]
+    assert entities[0]["changes"] == {
+        "frameEnd": {"old": 1000, "new": 1002},
+        "frameStart": {"old": 1, "new": 2},
+    }
+
+
+def test_reverted_changes_dropped(handler):
+    entities = _merged_entities(handler, [
+        _event("update", "sh010", {"frameEnd": {"old": 1000, "new": 1001}}),
+        _event("update", "sh010", {"fps": {"old": 24, "new": 25}}),
+        _event("update", "sh010", {"frameEnd": {"old": 1001, "new": 1000}}),
+        _event("update", "sh020", {"fps": {"old": 24, "new": 25}}),
+        _event("update", "sh020", {"fps": {"old": 25, "new": 24}}),
+    ])
+    assert len(entities) == 1
+    assert entities[0]["entityId"] == "sh010"
+    assert entities[0]["keys"] == ["fps"]
+    assert list(entities[0]["changes"]) == ["fps"]
+
+
+def test_changes_of_added_entity_dropped(handler):
+    entities = _merged_entities(handler, [
+        _event("add", "sh010"),
+        _event("update", "sh010", {"frameEnd": {"old": 1000, "new": 1001}}),
+        _event("move", "sh010", {"parent_id": {"old": "sq01", "new": "sq02"}}),
+    ])
+    assert [
+        (ent_info["action"], ent_info["entityId"]) for ent_info in entities
+    ] == [("add", "sh010")]
+
+
+def test_added_and_removed_entity_skipped(handler):
+    entities = _merged_entities(handler, [
+        _event("add", "sh010"),
+        _event("update", "sh020", {"fps": {"old": 24, "new": 25}}),
+        _event("update", "sh010", {"fps": {"old": 24, "new": 25}}),
+        _event("remove", "sh010"),
+    ])
+    assert [ent_info["entityId"] for ent_info in entities] == ["sh020"]
+
+
+def test_move_and_update_split(handler):
+    entities = _merged_entities(handler, [
+        _event("move", "sh010", {
+            "parent_id": {"old": "sq01", "new": "sq02"},
+            "name": {"old": "sh010", "new": "sh011"},
+        }),
+        _event("update", "sh010", {"fps": {"old": 24, "new": 25}}),
+    ])
+    infos_by_action = {
+        ent_info["action"]: ent_info for ent_info in entities
+    }
+    assert set(infos_by_action) == {"move", "update"}
+    move_info = infos_by_action["move"]
+    assert move_info["keys"] == ["parent_id"]
+    assert move_info["changes"] == {
+        "parent_id": {"old": "sq01", "new": "sq02"}
+    }
+    update_info = infos_by_action["update"]
+    assert update_info["keys"] == ["name", "fps"]
+    assert set(update_info["changes"]) == {"name", "fps"}
+
+
+def test_task_changes_kept(handler):
+    entities = _merged_entities(handler, [
+        _event("update", "task", {"name": {"old": "a", "new": "b"}}, "Task"),
+        _event("update", "task", {"name": {"old": "b", "new": "a"}}, "Task"),
+    ])
+    assert len(entities) == 2
+    assert [ent_info["changes"]["name"]["new"] for ent_info in entities] == [
+        "b", "a"
+    ]
+
+
+class _Session(object):
+    def __init__(self):
+        self.event_hub = ftrack_api.event.hub.EventHub(
+            "https://test", "test", "test"
+        )
+
+
+def test_coalesced_events_passed_to_dependent_handlers(handler):
+    calls = []
+    coalescing = type(handler).__new__(type(handler))
+    coalescing.log = logging.getLogger("SyncToAvalonEvent")
+    coalescing.coalesce_window = 60
+    coalescing.process_session = None
+    coalescing._session = _Session()
+    coalescing._pending_events = []
+    coalescing._pending_timer = None
+    coalescing._pending_lock = threading.Lock()
+    coalescing._process_lock = threading.Lock()
+    coalescing.sync_event = lambda session, event: calls.append(
+        ("sync", len(event["data"]["entities"]))
+    )
+
+    event_hub = coalescing.session.event_hub
+    for name, priority in (("before", 90), ("links", 110)):
+        event_hub.subscribe(
+            "topic=ftrack.update",
+            lambda event, name=name: calls.append(
+                (name, event["data"]["entities"][0]["entityId"])
+            ),
+            priority=priority
+        )
+    event_hub.subscribe(
+        "topic=ftrack.update",
+        lambda event: coalescing.launch(None, event),
+        priority=coalescing.priority
+    )
+
+    event_hub._handle(_event("add", "sh010"), synchronous=True)
+    event_hub._handle(_event("add", "sh020"), synchronous=True)
+    assert calls == [("before", "sh010"), ("before", "sh020")]
+
+    # Dependent handlers are called after synchronization
+    coalescing.process_pending_events()
+    assert calls[2:] == [("sync", 2), ("links", "sh010"), ("links", "sh020")]
@@ -0,0 +1,205 @@
+"""Test of loading and processing of stored events by 'ProcessEventHub'."""
+import datetime
+
+import pytest
+
+ftrack_api = pytest.importorskip("ftrack_api")
+
+from openpype.modules import base  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def server_lib():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Dynamic modules dirs are defined in settings stored in database
+        monkeypatch.setattr(base, "get_dynamic_modules_dirs", lambda: [])
+        base.load_modules()
+
+    from openpype_modules.ftrack.ftrack_server import lib
+
+    return lib
+
+
+class FakeCursor(object):
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, key_or_list):
+        (key, _), = key_or_list
+        section, name = key.split(".")
+        self._docs.sort(key=lambda doc: doc[section][name])
+        return self
+
+    def limit(self, limit):
+        self._docs = self._docs[:limit]
+        return self
+
+    def __iter__(self):
+        return iter(self._docs)
+
+
+class FakeCollection(object):
+    """Collection of events stored by event storer."""
+
+    def __init__(self, docs=None):
+        self.docs = docs or []
+        self.queries = []
+        self.bulk_writes = []
+
+    def find(self, query):
+        self.queries.append(query)
+        skip_ids = query.get("_id", {}).get("$nin") or []
+        return FakeCursor([
+            doc
+            for doc in self.docs
+            if not doc["pype_data"]["is_processed"]
+            and doc["_id"] not in skip_ids
+        ])
+
+    def bulk_write(self, requests, ordered=True):
+        self.bulk_writes.append(requests)
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.event_hub = ftrack_api.event.hub.EventHub(
+            "https://test", "test", "test"
+        )
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _event(project_id, idx):
+    return ftrack_api.event.base.Event(
+        topic="ftrack.update",
+        data={
+            "_event_mongo_id": "{}_{}".format(project_id, idx),
+            "entities": [{
+                "entityId": "shot_{}".format(idx),
+                "entityType": "task",
+                "parents": [{"entityId": project_id, "entityType": "show"}],
+            }]
+        }
+    )
+
+
+def _create_event_hub(server_lib, collection=None):
+    event_hub = server_lib.ProcessEventHub(
+        "https://test", "test", "test", sock=None
+    )
+    event_hub.dbcon = collection or FakeCollection()
+    return event_hub
+
+
+def test_event_shard_key(server_lib):
+    get_event_shard_key = server_lib.get_event_shard_key
+    assert get_event_shard_key(_event("project", 0)) == "project"
+    assert get_event_shard_key({"data": {"entities": [
+        {"entityId": "project", "entityType": "show"}
+    ]}}) == "project"
+    assert get_event_shard_key({"data": {"selection": [
+        {"entityId": "shot", "entityType": "task"}
+    ]}}) == "shot"
+    assert get_event_shard_key({"data": {}}) is None
+
+
+def test_shard_ordering(server_lib):
+    event_hub = _create_event_hub(server_lib)
+    event_hub.process_workers = 2
+    shard_sessions = []
+
+    def create_shard_session():
+        session = FakeSession()
+        shard_sessions.append(session)
+        return session
+
+    event_hub.shard_session_factory = create_shard_session
+    event_hub._start_shard_threads()
+
+    processed = []
+    for hub in (event_hub, shard_sessions[0].event_hub):
+        hub.subscribe(
+            "topic=ftrack.update",
+            lambda event, hub=hub: processed.append(
+                (hub, event["data"]["_event_mongo_id"])
+            )
+        )
+
+    project_ids = ["project_{}".format(idx) for idx in range(4)]
+    events = [
+        _event(project_id, idx)
+        for idx in range(5)
+        for project_id in project_ids
+    ]
+    for event in events:
+        event_hub._dispatch_event(event)
+    event_hub._stop_shard_threads()
+
+    assert shard_sessions[0].closed
+    assert sorted(event_hub._processed_ids) == sorted(
+        event["data"]["_event_mongo_id"] for event in events
+    )
+    # Events of a project are processed by the same session in order
+    for project_id in project_ids:
+        project_items = [
+            (hub, mongo_id)
+            for hub, mongo_id in processed
+            if mongo_id.startswith(project_id)
+        ]
+        assert len({hub for hub, _ in project_items}) == 1
+        assert [mongo_id for _, mongo_id in project_items] == [
+            "{}_{}".format(project_id, idx) for idx in range(5)
+        ]
+
+
+def test_shards_without_session_factory(server_lib):
+    event_hub = _create_event_hub(server_lib)
+    event_hub.process_workers = 4
+    event_hub._start_shard_threads()
+    assert len(event_hub._shard_threads) == 1
+    event_hub._stop_shard_threads()
+
+
+def test_flush_processed_in_one_request(server_lib):
+    collection = FakeCollection()
+    event_hub = _create_event_hub(server_lib, collection)
+    event_hub._processed_ids = ["first", "second", "third"]
+    event_hub._flush_processed()
+    event_hub._flush_processed()
+
+    assert len(collection.bulk_writes) == 1
+    assert [
+        request._filter["_id"] for request in collection.bulk_writes[0]
+    ] == ["first", "second", "third"]
+    assert not event_hub._processed_ids
+
+
+def test_load_events_skips_pending_and_processed(server_lib):
+    now = datetime.datetime.utcnow()
+    collection = FakeCollection([
+        {
+            "_id": mongo_id,
+            "topic": "ftrack.update",
+            "data": {},
+            "pype_data": {
+                "stored": now + datetime.timedelta(seconds=idx),
+                "is_processed": False
+            }
+        }
+        for idx, mongo_id in enumerate(("pending", "processed", "new"))
+    ])
+    event_hub = _create_event_hub(server_lib, collection)
+    event_hub._pending_events["pending"] = now
+    # Processed event which was not marked in Mongo yet
+    event_hub._processed_ids.append("processed")
+
+    assert event_hub.load_events()
+    assert collection.queries[-1]["_id"] == {
+        "$nin": ["pending", "processed"]
+    }
+    event = event_hub._event_queue.get_nowait()
+    assert event["data"]["_event_mongo_id"] == "new"
+    assert event_hub._event_queue.empty()
+    assert set(event_hub._pending_events) == {"pending", "new"}
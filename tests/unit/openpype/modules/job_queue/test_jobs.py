@@ -0,0 +1,121 @@
+from uuid import uuid4
+
+from openpype.modules.job_queue.job_server.jobs import JobQueue
+from openpype.modules.job_queue.job_server.job_store import SQLiteJobStore
+
+
+class _Worker(object):
+    def __init__(self, host_name):
+        self.id = str(uuid4())
+        self.host_name = host_name
+        self.current_job = None
+
+    def is_idle(self):
+        return self.current_job is None
+
+    def set_current_job(self, job):
+        if job is self.current_job:
+            return
+        self.current_job = job
+        if job is not None:
+            job.set_worker(self)
+
+
+def _assigned_jobs(workers):
+    return [
+        worker.current_job.data["name"]
+        for worker in workers
+        if worker.current_job is not None
+    ]
+
+
+def test_jobs_assigned_by_priority():
+    job_queue = JobQueue()
+    for name, priority in (("low", None), ("high", 10), ("mid", 5)):
+        job_queue.create_job(
+            "tvpaint", {"name": name, "priority": priority}
+        )
+
+    worker = _Worker("tvpaint")
+    job_queue.add_worker(worker)
+    order = []
+    for _ in range(3):
+        job_queue.assign_jobs()
+        job = worker.current_job
+        order.append(job.data["name"])
+        job_queue.finish_job(worker.id, job.id, True, None, None)
+
+    assert order == ["high", "mid", "low"]
+
+
+def test_host_concurrency_limit():
+    job_queue = JobQueue(host_concurrency_limits={"tvpaint": 2})
+    workers = [_Worker("tvpaint") for _ in range(4)]
+    for worker in workers:
+        job_queue.add_worker(worker)
+    for idx in range(4):
+        job_queue.create_job("tvpaint", {"name": idx})
+
+    job_queue.assign_jobs()
+    assert len(_assigned_jobs(workers)) == 2
+
+    busy_worker = next(w for w in workers if w.current_job is not None)
+    job_queue.finish_job(
+        busy_worker.id, busy_worker.current_job.id, True, None, None
+    )
+    job_queue.assign_jobs()
+    assert len(_assigned_jobs(workers)) == 2
+
+
+def test_change_callbacks():
+    job_queue = JobQueue()
+    changes = []
+    job_queue.add_change_callback(lambda: changes.append(True))
+
+    worker = _Worker("tvpaint")
+    job_queue.add_worker(worker)
+    job = job_queue.create_job("tvpaint", {"name": "job"})
+    job_queue.assign_jobs()
+    job_queue.finish_job(worker.id, job.id, True, None, None)
+
+    assert len(changes) == 3
+
+
+def test_jobs_restored_from_store(tmpdir):
+    filepath = str(tmpdir.join("jobs.sqlite"))
+    job_queue = JobQueue(SQLiteJobStore(filepath))
+    worker = _Worker("tvpaint")
+    job_queue.add_worker(worker)
+    done_job = job_queue.create_job("tvpaint", {"name": "done"})
+    job_queue.assign_jobs()
+    job_queue.finish_job(worker.id, done_job.id, True, "ok", {"out": 1})
+    for name in ("first", "second"):
+        job_queue.create_job("tvpaint", {"name": name})
+    # Job assigned to worker which was not finished is restored too
+    job_queue.assign_jobs()
+
+    restored_queue = JobQueue(SQLiteJobStore(filepath))
+    status = restored_queue.get_job_status(done_job.id)
+    assert status["state"] == "done"
+    assert status["result"] == {"out": 1}
+
+    worker = _Worker("tvpaint")
+    restored_queue.add_worker(worker)
+    order = []
+    for _ in range(2):
+        restored_queue.assign_jobs()
+        job = worker.current_job
+        order.append(job.data["name"])
+        restored_queue.finish_job(worker.id, job.id, True, None, None)
+    assert order == ["first", "second"]
+
+
+def test_jobs_without_workers_errored_after_grace():
+    job_queue = JobQueue()
+    job = job_queue.create_job("tvpaint", {"name": "job"})
+    job_queue.assign_jobs()
+    assert job_queue.get_job_status(job.id)["state"] == "waiting"
+
+    job_queue.missing_workers_grace_seconds = 0
+    job_queue.assign_jobs()
+    assert job_queue.get_job_status(job.id)["state"] == "error"
@@ -0,0 +1,124 @@
+"""Test of incremental discovery of representations to sync."""
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+
+from openpype.modules.sync_server.representations_feed import (
+    SyncRepresentationsFeed
+)
+
+
+class FakeChangeStream(object):
+    def __init__(self, collection):
+        self._collection = collection
+
+    def try_next(self):
+        if self._collection.changes:
+            return {"documentKey": {"_id": self._collection.changes.pop(0)}}
+        return None
+
+    def close(self):
+        pass
+
+
+class FakeCollection(object):
+    """Collection of replica set with change streams."""
+
+    def __init__(self):
+        self.docs = {}
+        self.changes = []
+
+    def save(self, doc):
+        self.docs[doc["_id"]] = doc
+        self.changes.append(doc["_id"])
+
+    def watch(self, pipeline):
+        return FakeChangeStream(self)
+
+
+class StandaloneCollection(FakeCollection):
+    """Collection without change streams (standalone Mongo)."""
+
+    def watch(self, pipeline):
+        raise OperationFailure("Not a replica set")
+
+
+def _create_feed(collection, queries):
+    def query_func(extra_match):
+        queries.append(extra_match)
+        ids = None
+        if extra_match:
+            ids = extra_match["_id"]["$in"]
+        return [
+            {"_id": doc["_id"], "priority": doc["priority"]}
+            for doc in collection.docs.values()
+            if doc["to_sync"] and (ids is None or doc["_id"] in ids)
+        ]
+    return SyncRepresentationsFeed(query_func, collection)
+
+
+def _add_doc(collection, priority, to_sync=True):
+    doc = {"_id": ObjectId(), "priority": priority, "to_sync": to_sync}
+    collection.save(doc)
+    return doc
+
+
+def test_incremental_scan():
+    collection = FakeCollection()
+    queries = []
+    low = _add_doc(collection, 50)
+    _add_doc(collection, 50, to_sync=False)
+    collection.changes = []
+    feed = _create_feed(collection, queries)
+
+    assert feed.get_representations() == [{"_id": low["_id"], "priority": 50}]
+    assert queries == [None]
+
+    # Nothing changed, nothing is queried
+    feed.get_representations()
+    assert len(queries) == 1
+
+    # New representations are found by change stream, even with '_id'
+    #   created by client with lagging clock
+    high = _add_doc(collection, 90)
+    old = {
+        "_id": ObjectId.from_datetime(low["_id"].generation_time),
+        "priority": 70,
+        "to_sync": True,
+    }
+    collection.save(old)
+    repres = feed.get_representations()
+    assert [repre["_id"] for repre in repres] == [
+        high["_id"], old["_id"], low["_id"]
+    ]
+    assert set(queries[-1]["_id"]["$in"]) == {high["_id"], old["_id"]}
+
+    # Representation changed by other process is removed
+    old["to_sync"] = False
+    collection.save(old)
+    # Synced representation is removed after invalidation
+    low["to_sync"] = False
+    feed.invalidate([low["_id"]])
+    repres = feed.get_representations()
+    assert [repre["_id"] for repre in repres] == [high["_id"]]
+    assert set(queries[-1]["_id"]["$in"]) == {low["_id"], old["_id"]}
+
+    # Full scan on demand
+    feed.invalidate()
+    feed.get_representations()
+    assert queries[-1] is None
+
+
+def test_full_scan_without_change_stream():
+    collection = StandaloneCollection()
+    queries = []
+    low = _add_doc(collection, 50)
+    feed = _create_feed(collection, queries)
+    assert feed.get_representations() == [{"_id": low["_id"], "priority": 50}]
+
+    # Changes made by other processes are found on next call
+    low["to_sync"] = False
+    high = _add_doc(collection, 90)
+    assert feed.get_representations() == [
+        {"_id": high["_id"], "priority": 90}
+    ]
+    assert queries == [None, None]
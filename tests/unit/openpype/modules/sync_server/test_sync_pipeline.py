@@ -0,0 +1,130 @@
+"""Test of sync server transfer pipeline without DB and providers."""
+import asyncio
+
+from openpype.modules.sync_server.sync_server import SyncServerThread
+
+
+class FakeModule(object):
+    def __init__(self):
+        self.stored = []
+        self.paused_projects = set()
+
+    def is_project_paused(self, project_name, check_parents=False):
+        return project_name in self.paused_projects
+
+    def update_db_many(self, project_name, items):
+        self.stored.append((project_name, items))
+
+
+def test_transfers_by_priority():
+    module = FakeModule()
+    thread = SyncServerThread(module)
+    thread.is_running = True
+    thread.max_site_transfers = 1
+    thread._working_sites_keys = {("project", "remote")}
+    processed = []
+
+    def process_transfer(transfer):
+        processed.append(transfer["file"]["path"])
+        if transfer["file"]["path"] == "broken":
+            raise ValueError("Failed")
+        return "id_" + transfer["file"]["path"]
+
+    thread._process_transfer = process_transfer
+
+    async def run():
+        queue = thread._get_site_queue("remote", "local_drive")
+        for idx, (priority, path) in enumerate(
+            ((50, "low"), (90, "high"), (50, "broken"), (70, "mid"))
+        ):
+            key = ("project", "remote", path)
+            thread._transfer_keys.add(key)
+            queue.put_nowait((-priority, idx, {
+                "key": key,
+                "project_name": "project",
+                "file": {"path": path},
+                "representation": {},
+                "remote_site": "remote",
+                "site": "remote",
+            }))
+        await queue.join()
+        await asyncio.sleep(0)
+        await thread.store_results()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+        thread.transfer_executor.shutdown(wait=True)
+
+    assert processed == ["high", "mid", "low", "broken"]
+    assert len(module.stored) == 1
+    project_name, items = module.stored[0]
+    assert project_name == "project"
+    results = {
+        item["file"]["path"]: (item["new_file_id"], item["error"])
+        for item in items
+    }
+    assert results["high"] == ("id_high", None)
+    assert results["broken"] == (None, "Failed")
+    assert not thread._transfer_keys
+
+
+def test_paused_transfers_dropped():
+    module = FakeModule()
+    thread = SyncServerThread(module)
+    thread.is_running = True
+    thread._working_sites_keys = {("project", "remote"), ("other", "remote")}
+    processed = []
+
+    def process_transfer(transfer):
+        processed.append(transfer["file"]["path"])
+        return "id"
+
+    thread._process_transfer = process_transfer
+
+    def _put(queue, project_name, path):
+        key = (project_name, "remote", path)
+        thread._transfer_keys.add(key)
+        queue.put_nowait((0, len(thread._transfer_keys), {
+            "key": key,
+            "project_name": project_name,
+            "file": {"path": path},
+            "representation": {},
+            "remote_site": "remote",
+            "site": "remote",
+        }))
+
+    async def run():
+        # local drive allows 50 queued files
+        queue = thread._get_site_queue("remote", "local_drive")
+        assert queue.maxsize == 50
+        _put(queue, "project", "project_file")
+        _put(queue, "other", "other_file")
+        _put(queue, "paused", "paused_file")
+        module.paused_projects.add("paused")
+        # Site of 'other' project is not working anymore
+        thread._working_sites_keys = {("project", "remote")}
+        thread._drop_paused_transfers()
+        assert queue.qsize() == 1
+
+        # Project paused after file was queued
+        _put(queue, "paused", "paused_later")
+        await queue.join()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+        thread.transfer_executor.shutdown(wait=True)
+
+    assert processed == ["project_file"]
+    assert thread._transfer_keys == {("project", "remote", "project_file")}
@@ -0,0 +1,121 @@
+from openpype.pipeline import colorspace
+
+PROJECT_SETTINGS = {"global": {}}
+CONFIG_DATA = {"path": "/path/to/config.ocio", "template": ""}
+FILE_RULES = {
+    "exr": {"pattern": "beauty", "ext": "exr", "colorspace": "ACEScg"},
+    "exr_crypto": {"pattern": "crypto", "ext": "exr", "colorspace": "raw"},
+    "all_crypto": {"pattern": "crypto", "ext": "", "colorspace": "data"},
+}
+
+
+def test_imageio_file_rules_batched():
+    filepaths = [
+        "/render/beauty.1001.exr",
+        "/render/crypto.1001.exr",
+        "/render/beauty.1001.png",
+        "/render/other.1001.exr",
+    ]
+    output = colorspace.get_imageio_file_rules_colorspace_from_filepaths(
+        filepaths, "nuke", "project",
+        config_data=CONFIG_DATA,
+        file_rules=FILE_RULES,
+        project_settings=PROJECT_SETTINGS
+    )
+    # Last matching rule wins
+    assert output == {
+        "/render/beauty.1001.exr": "ACEScg",
+        "/render/crypto.1001.exr": "data",
+        "/render/beauty.1001.png": None,
+        "/render/other.1001.exr": None,
+    }
+    for filepath, colorspace_name in output.items():
+        assert colorspace_name == (
+            colorspace.get_imageio_file_rules_colorspace_from_filepath(
+                filepath, "nuke", "project",
+                config_data=CONFIG_DATA,
+                file_rules=FILE_RULES,
+                project_settings=PROJECT_SETTINGS
+            )
+        )
+
+
+def test_parse_colorspace_batched():
+    colorspaces = {"sRGB": {}, "Output - sRGB": {}, "ACEScg": {}}
+    output = colorspace.parse_colorspace_from_filepaths(
+        [
+            "/render/acescg/ACEScg.exr",
+            "/render/Output_-_sRGB.exr",
+            "/render/unknown.exr",
+        ],
+        colorspaces=colorspaces
+    )
+    assert output == {
+        "/render/acescg/ACEScg.exr": "ACEScg",
+        "/render/Output_-_sRGB.exr": "Output - sRGB",
+        "/render/unknown.exr": None,
+    }
+
+
+def test_config_file_rules_one_query(monkeypatch):
+    calls = []
+
+    def run_queries(queries):
+        calls.append(queries)
+        return [{
+            "result": [
+                "ACEScg" if "aov" in filepath else "Utility - Raw"
+                for filepath in query["kwargs"]["filepaths"]
+            ]
+        } for query in queries]
+
+    monkeypatch.setattr(colorspace, "_run_ocio_queries", run_queries)
+    monkeypatch.setattr(
+        colorspace, "compatibility_check_config_version",
+        lambda *args, **kwargs: True
+    )
+
+    filepaths = [
+        "/render/aov_{}.1001.exr".format(idx)
+        for idx in range(1000)
+    ]
+    filepaths.append("/render/beauty.1001.exr")
+    filepaths.append("/render/raw.1001.exr")
+    output = colorspace.get_colorspace_names_from_filepaths(
+        filepaths, "nuke", "project",
+        config_data=CONFIG_DATA,
+        file_rules=FILE_RULES,
+        project_settings=PROJECT_SETTINGS,
+        validate=False
+    )
+
+    assert len(calls) == 1
+    assert len(calls[0][0]["kwargs"]["filepaths"]) == 1001
+    assert output["/render/beauty.1001.exr"] == "ACEScg"
+    assert output["/render/aov_10.1001.exr"] == "ACEScg"
+    assert output["/render/raw.1001.exr"] == "Utility - Raw"
+
+
+def test_set_colorspace_data_to_representations(monkeypatch):
+    monkeypatch.setattr(
+        colorspace, "get_colorspace_settings_from_publish_context",
+        lambda context_data: (CONFIG_DATA, FILE_RULES)
+    )
+    context_data = {
+        "projectName": "project",
+        "hostName": "nuke",
+        "project_settings": PROJECT_SETTINGS,
+    }
+    representations = [
+        {"ext": "exr", "files": ["beauty.1001.exr", "beauty.1002.exr"]},
+        {"ext": "exr", "files": "other.exr"},
+        {"ext": "abc", "files": "beauty.abc"},
+    ]
+    colorspace.set_colorspace_data_to_representations(
+        representations, context_data
+    )
+    assert representations[0]["colorspaceData"] == {
+        "colorspace": "ACEScg", "config": CONFIG_DATA
+    }
+    assert "colorspaceData" not in representations[1]
+    assert "colorspaceData" not in representations[2]
@@ -0,0 +1,133 @@
+import os
+import sys
+
+from openpype.pipeline import colorspace
+
+
+def _setup(monkeypatch, tmpdir):
+    monkeypatch.setenv("OPENPYPE_OCIO_CACHE_DIR", str(tmpdir.join("cache")))
+    monkeypatch.setattr(
+        colorspace.CachedData, "has_compatible_ocio_package", False
+    )
+    monkeypatch.setattr(colorspace.CachedData, "ocio_config_colorspaces", {})
+    monkeypatch.setattr(colorspace.CachedData, "ocio_config_cache_keys", {})
+
+    calls = []
+
+    def run_queries(queries):
+        calls.append(queries)
+        output = []
+        for query in queries:
+            if query["command"] == "get_views":
+                output.append({"result": {"ACES/sRGB": {
+                    "display": "ACES", "view": "sRGB", "colorspace": "sRGB"
+                }}})
+            elif query["command"] == "fail":
+                output.append({"error": "failed"})
+            else:
+                output.append({"result": [query["command"], query["kwargs"]]})
+        return output
+
+    monkeypatch.setattr(colorspace, "_run_ocio_queries", run_queries)
+
+    config_path = str(tmpdir.join("config.ocio"))
+    with open(config_path, "w") as stream:
+        stream.write("ocio_profile_version: 2\n")
+    return config_path, calls
+
+
+def test_cache_shared_by_processes(monkeypatch, tmpdir):
+    config_path, calls = _setup(monkeypatch, tmpdir)
+
+    result = colorspace.get_ocio_config_views(config_path)
+    assert result["ACES/sRGB"]["colorspace"] == "sRGB"
+    assert colorspace.get_display_view_colorspace_name(
+        config_path, "ACES", "sRGB"
+    ) == [
+        "get_display_view_colorspace_name",
+        {"display": "ACES", "view": "sRGB"}
+    ]
+    assert len(calls) == 2
+
+    # Other process has empty memory cache
+    monkeypatch.setattr(colorspace.CachedData, "ocio_config_cache_keys", {})
+    assert colorspace.get_ocio_config_views(config_path) == result
+    assert len(calls) == 2
+
+
+def test_cache_invalidated_by_content(monkeypatch, tmpdir):
+    config_path, calls = _setup(monkeypatch, tmpdir)
+
+    colorspace.get_ocio_config_views(config_path)
+    stat = os.stat(config_path)
+    with open(config_path, "w") as stream:
+        stream.write("ocio_profile_version: 1\n")
+    # Same mtime and size must not hide changed content on other process
+    os.utime(config_path, (stat.st_atime, stat.st_mtime))
+    monkeypatch.setattr(colorspace.CachedData, "ocio_config_cache_keys", {})
+
+    colorspace.get_ocio_config_views(config_path)
+    assert len(calls) == 2
+
+
+def test_prewarm_batches_queries(monkeypatch, tmpdir):
+    config_path, calls = _setup(monkeypatch, tmpdir)
+
+    colorspace.prewarm_ocio_config_cache(config_path)
+    assert [len(queries) for queries in calls] == [3, 1]
+
+    colorspace.get_ocio_config_colorspaces(config_path)
+    colorspace.get_display_view_colorspace_name(config_path, "ACES", "sRGB")
+    assert len(calls) == 2
+
+
+def test_failed_query_is_not_cached(monkeypatch, tmpdir):
+    config_path, calls = _setup(monkeypatch, tmpdir)
+
+    for _ in range(2):
+        try:
+            colorspace.get_ocio_config_cached_data(
+                config_path, [("get_views", {}), ("fail", {})]
+            )
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("Failed query did not raise")
+
+    assert [len(queries) for queries in calls] == [2, 1]
+
+
+def test_helper_process_timeout(monkeypatch):
+    monkeypatch.setattr(
+        colorspace.CachedData, "has_compatible_ocio_package", False
+    )
+    # Helper process which never responds
+    monkeypatch.setattr(
+        colorspace,
+        "get_openpype_execute_args",
+        lambda *args: [sys.executable, "-c", "import time; time.sleep(60)"]
+    )
+    helper_process = colorspace.OCIOHelperProcess()
+    helper_process.timeout = 0.5
+    monkeypatch.setattr(
+        colorspace.CachedData, "ocio_helper_process", helper_process
+    )
+    calls = []
+
+    def run_subprocess(queries):
+        calls.append(queries)
+        return [{"result": None}]
+
+    monkeypatch.setattr(
+        colorspace, "_get_batched_with_subprocess", run_subprocess
+    )
+
+    queries = [{"command": "get_views", "kwargs": {}}]
+    assert colorspace._run_ocio_queries(queries) == [{"result": None}]
+    assert helper_process.disabled
+    assert helper_process._process is None
+
+    # Disabled helper is not started again
+    colorspace._run_ocio_queries(queries)
+    assert helper_process._process is None
+    assert calls == [queries, queries]
@@ -0,0 +1,122 @@
+import os
+
+from openpype.lib.path_templates import StringTemplate
+from openpype.pipeline.delivery import DeliveryPlanner
+
+
+class _Anatomy(object):
+    project_name = "project"
+
+    def __init__(self, template):
+        self.templates = {"delivery": {"default": template}}
+        self.templates_obj = {
+            "delivery": {"default": StringTemplate(template)}
+        }
+
+
+def _create_files(dirpath, file_names):
+    dirpath.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for file_name in file_names:
+        path = dirpath / file_name
+        path.write_text(file_name)
+        paths.append(str(path))
+    return paths
+
+
+def _get_planner(tmp_path, template):
+    return DeliveryPlanner(
+        _Anatomy(template),
+        "default",
+        {"root": {"work": str(tmp_path / "delivery")}},
+    )
+
+
+def test_deliver_files_and_resume(tmp_path):
+    template = "{root[work]}/{asset}/{asset}.{frame:0>4}.{ext}"
+    src_paths = _create_files(
+        tmp_path / "publish",
+        ["sh010.{}.exr".format(frame) for frame in range(1001, 1011)]
+    )
+    repre = {"_id": "repre_id"}
+    anatomy_data = {"asset": "sh010", "ext": "exr"}
+    src_paths_with_frames = [
+        (path, frame) for frame, path in enumerate(src_paths, start=1)
+    ]
+
+    planner = _get_planner(tmp_path, template)
+    assert planner.add_files(repre, anatomy_data, src_paths_with_frames) == 10
+
+    progress = []
+    report = planner.execute(
+        max_workers=4,
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+    assert report.success
+    assert len(report.delivered) == 10
+    assert progress[-1] == (10, 10)
+    dst_path = tmp_path / "delivery" / "sh010" / "sh010.0001.exr"
+    assert dst_path.read_text() == "sh010.1001.exr"
+
+    # Identical files are skipped and different files are kept
+    os.remove(str(dst_path))
+    dst_path.write_text("changed")
+    planner = _get_planner(tmp_path, template)
+    planner.add_files(repre, anatomy_data, src_paths_with_frames)
+    report = planner.execute()
+    assert len(report.skipped) == 9
+    assert not report.delivered
+    assert [item.dst_path for item in report.existing] == [str(dst_path)]
+    assert report.processed_count == 10
+    assert dst_path.read_text() == "changed"
+
+    # Different files are replaced only with overwrite
+    planner = _get_planner(tmp_path, template)
+    planner.add_files(repre, anatomy_data, src_paths_with_frames)
+    report = planner.execute(overwrite=True)
+    assert len(report.skipped) == 9
+    assert [item.dst_path for item in report.delivered] == [str(dst_path)]
+    assert dst_path.read_text() == "sh010.1001.exr"
+
+
+def test_deliver_sequence_renumbered(tmp_path):
+    template = "{root[work]}/{asset}/{asset}.{frame}.{ext}"
+    _create_files(
+        tmp_path / "publish",
+        ["sh010.{:0>4}.exr".format(frame) for frame in range(1, 4)]
+    )
+    repre = {"_id": "repre_id", "context": {"ext": "exr"}}
+
+    planner = _get_planner(tmp_path, template)
+    src_path = str(tmp_path / "publish" / "sh010.####.exr")
+    planner.add_sequence(
+        src_path, repre, {"asset": "sh010", "ext": "exr"}, True, 101
+    )
+    report = planner.execute()
+
+    assert report.success
+    assert sorted(os.listdir(str(tmp_path / "delivery" / "sh010"))) == [
+        "sh010.0101.exr", "sh010.0102.exr", "sh010.0103.exr"
+    ]
+
+
+def test_deliver_report_errors(tmp_path):
+    template = "{root[work]}/{asset}/{subset}.{ext}"
+    src_path = _create_files(tmp_path / "publish", ["file.exr"])[0]
+
+    planner = _get_planner(tmp_path, template)
+    planner.add_file(src_path, {"_id": "first"}, {"asset": "sh010"})
+    planner.add_file(
+        str(tmp_path / "publish" / "missing.exr"),
+        {"_id": "second"},
+        {"asset": "sh010", "subset": "render", "ext": "exr"}
+    )
+    report = planner.execute()
+
+    assert not report.delivered
+    report_items = report.to_report_items()
+    assert set(report_items) == {
+        "Missing keys in Representation's context"
+        " for anatomy template \"default\".",
+        "Source file was not found",
+    }
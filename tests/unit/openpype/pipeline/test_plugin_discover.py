@@ -0,0 +1,91 @@
+from openpype.pipeline.plugin_discover import PluginDiscoverContext
+from openpype.pipeline.load import LoaderPlugin
+
+PLUGIN_CONTENT = """
+from {module} import BasePlugin
+
+
+class {name}(BasePlugin):
+    pass
+"""
+
+
+class BasePlugin(object):
+    pass
+
+
+def _write_plugin(dirpath, filename, name):
+    dirpath.join(filename).write(
+        PLUGIN_CONTENT.format(module=__name__, name=name)
+    )
+
+
+def test_discover_reuses_unchanged_modules(tmpdir):
+    _write_plugin(tmpdir, "first.py", "First")
+    _write_plugin(tmpdir, "second.py", "Second")
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(BasePlugin, str(tmpdir))
+    result = context.discover(BasePlugin, return_report=True)
+    plugins_by_name = {plugin.__name__: plugin for plugin in result}
+    assert set(plugins_by_name) == {"First", "Second"}
+    assert all(
+        import_time is not None
+        for import_time in result.import_times.values()
+    )
+
+    _write_plugin(tmpdir, "second.py", "SecondChanged")
+    result = context.discover(BasePlugin, return_report=True)
+    new_plugins_by_name = {plugin.__name__: plugin for plugin in result}
+    assert set(new_plugins_by_name) == {"First", "SecondChanged"}
+    assert new_plugins_by_name["First"] is plugins_by_name["First"]
+    assert result.import_times[str(tmpdir.join("first.py"))] is None
+    assert result.import_times[str(tmpdir.join("second.py"))] is not None
+
+
+def test_discover_cache_disabled(tmpdir, monkeypatch):
+    monkeypatch.setenv("OPENPYPE_PLUGIN_DISCOVER_CACHE", "0")
+    _write_plugin(tmpdir, "first.py", "First")
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(BasePlugin, str(tmpdir))
+    first = context.discover(BasePlugin)
+    second = context.discover(BasePlugin)
+    assert first[0] is not second[0]
+
+
+def test_discover_restores_settings_of_reused_classes(tmpdir, monkeypatch):
+    monkeypatch.setenv("AVALON_APP", "maya")
+    tmpdir.join("loader.py").write(
+        "from openpype.pipeline.load import LoaderPlugin\n\n\n"
+        "class ReferenceLoader(LoaderPlugin):\n"
+        "    families = [\"model\"]\n"
+    )
+    project_settings_by_name = {
+        "first": {"maya": {"load": {"ReferenceLoader": {
+            "enabled": False,
+            "families": ["rig"],
+            "color": "red",
+        }}}},
+        "second": {},
+    }
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(LoaderPlugin, str(tmpdir))
+
+    def _discover(project_name):
+        plugins = context.discover(LoaderPlugin)
+        for plugin in plugins:
+            plugin.apply_settings(project_settings_by_name[project_name], {})
+        return plugins[0]
+
+    plugin = _discover("first")
+    assert plugin.enabled is False
+    assert plugin.families == ["rig"]
+
+    # Same class object without settings of previous project
+    second_plugin = _discover("second")
+    assert second_plugin is plugin
+    assert plugin.enabled is True
+    assert plugin.families == ["model"]
+    assert not hasattr(plugin, "color")
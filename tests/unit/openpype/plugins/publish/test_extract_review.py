@@ -1,3 +1,9 @@
+import os
+import time
+
+import pytest
+
+from openpype.plugins.publish import extract_review
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +33,158 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+class _FakeContext(object):
+    def __init__(self):
+        self.data = {"cleanupFullPaths": []}
+
+
+class _FakeInstance(object):
+    def __init__(self):
+        self.data = {"representations": []}
+        self.context = _FakeContext()
+
+
+def _output_jobs(count):
+    output_jobs = []
+    for idx in range(count):
+        output_name = "out{}".format(idx)
+        output_jobs.append({
+            "new_repre": {
+                "files": "{}.mov".format(output_name),
+                "stagingDir": "/tmp",
+                "tags": [],
+            },
+            "output_def": {"filename_suffix": output_name},
+            "output_name": output_name,
+            "output_ext": "mov",
+            "temp_data": {
+                "fps": 25,
+                "output_frame_start": 1,
+                "output_frame_end": 10,
+            },
+            "ffmpeg_args": ["ffmpeg", "-i input.mov", output_name],
+        })
+    return output_jobs
+
+
+def test_process_output_jobs_concurrently(monkeypatch):
+    executed = []
+
+    def run_subprocess(cmd, **kwargs):
+        # Make first command finish last
+        if cmd.endswith("out0"):
+            time.sleep(0.05)
+        executed.append(cmd)
+
+    monkeypatch.setattr(extract_review, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(
+        extract_review.multiprocessing, "cpu_count", lambda: 8
+    )
+
+    plugin = ExtractReview()
+    plugin.output_max_workers = 4
+    instance = _FakeInstance()
+    plugin._process_output_jobs(instance, _output_jobs(4))
+
+    assert len(executed) == 4
+    assert executed[-1].endswith("out0")
+    # Representations are added in order of output definitions
+    repres = instance.data["representations"]
+    assert [repre["outputName"] for repre in repres] == [
+        "out0", "out1", "out2", "out3"
+    ]
+    # CPUs are split between running commands
+    assert repres[0]["ffmpeg_cmd"] == "ffmpeg -i input.mov -threads 2 out0"
+
+
+def test_process_output_jobs_failure(monkeypatch):
+    def run_subprocess(cmd, **kwargs):
+        if cmd.endswith("out1"):
+            raise RuntimeError("ffmpeg failed")
+
+    monkeypatch.setattr(extract_review, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(
+        extract_review.multiprocessing, "cpu_count", lambda: 2
+    )
+
+    plugin = ExtractReview()
+    plugin.output_max_workers = 2
+    instance = _FakeInstance()
+    with pytest.raises(RuntimeError):
+        plugin._process_output_jobs(instance, _output_jobs(3))
+
+    # Outputs before failed output are added as in serial processing
+    repres = instance.data["representations"]
+    assert [repre["outputName"] for repre in repres] == ["out0"]
+    assert repres[0]["ffmpeg_cmd"] == "ffmpeg -i input.mov -threads 1 out0"
+
+
+def _create_sparse_sequence(dirpath, frames):
+    files = []
+    for frame in frames:
+        filename = "render.{:04d}.exr".format(frame)
+        with open(os.path.join(dirpath, filename), "wb") as stream:
+            stream.write(b"frame")
+        files.append(filename)
+    return files
+
+
+def test_fill_sequence_gaps_with_links(tmp_path):
+    staging_dir = str(tmp_path)
+    files = _create_sparse_sequence(staging_dir, [1001, 1005])
+
+    plugin = ExtractReview()
+    added_files = plugin.fill_sequence_gaps(
+        files, staging_dir, 1001, 1006, use_links=True
+    )
+    assert len(added_files) == 4
+    src_stat = os.stat(os.path.join(staging_dir, "render.1001.exr"))
+    link_stat = os.stat(os.path.join(staging_dir, "render.1004.exr"))
+    assert src_stat.st_ino == link_stat.st_ino
+    last_stat = os.stat(os.path.join(staging_dir, "render.1006.exr"))
+    assert last_stat.st_ino == os.stat(added_files[-1]).st_ino
+
+
+def test_fill_gaps_concat_fallback(tmp_path, monkeypatch):
+    staging_dir = str(tmp_path)
+    files = _create_sparse_sequence(staging_dir, [1001, 1003])
+
+    def fail_link(*args):
+        raise OSError("Links are not supported")
+
+    monkeypatch.setattr(extract_review, "create_hard_link", fail_link)
+    monkeypatch.setattr(extract_review.os, "symlink", fail_link)
+
+    plugin = ExtractReview()
+    temp_data = {
+        "origin_repre": {"files": files, "stagingDir": staging_dir},
+        "frame_start": 1001,
+        "frame_end": 1004,
+        "fps": 25.0,
+        "full_input_path": os.path.join(staging_dir, "render.%04d.exr"),
+    }
+    assert plugin._fill_output_sequence_gaps(temp_data, staging_dir) == []
+    assert temp_data["use_concat_list"] is True
+    assert sorted(os.listdir(staging_dir)) == sorted(files)
+
+    concat_list_path = plugin._create_sequence_concat_list(
+        temp_data, 1001, 4
+    )
+    try:
+        with open(concat_list_path, "r") as stream:
+            lines = stream.read().splitlines()
+    finally:
+        os.remove(concat_list_path)
+
+    first_path = os.path.join(staging_dir, "render.1001.exr")
+    last_path = os.path.join(staging_dir, "render.1003.exr")
+    assert lines == [
+        "ffconcat version 1.0",
+        "file '{}'".format(first_path),
+        "duration 0.0800000000",
+        "file '{}'".format(last_path),
+        "duration 0.0800000000",
+        "file '{}'".format(last_path),
+    ]
@@ -0,0 +1,133 @@
+import copy
+import json
+import datetime
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.cache import (
+    ResolvedSettingsCache,
+    freeze_settings,
+)
+from openpype.settings import handlers
+from openpype.settings.handlers import CacheValues
+
+
+def test_frozen_settings_are_read_only():
+    settings = freeze_settings({"publish": {"families": ["render"]}})
+
+    assert isinstance(settings, dict)
+    assert isinstance(settings["publish"]["families"], list)
+    with pytest.raises(TypeError):
+        settings["publish"]["enabled"] = False
+    with pytest.raises(TypeError):
+        settings["publish"]["families"].append("review")
+
+    mutable_settings = copy.deepcopy(settings)
+    mutable_settings["publish"]["families"].append("review")
+    assert type(mutable_settings["publish"]) is dict
+    assert settings["publish"]["families"] == ["render"]
+    assert json.loads(json.dumps(settings)) == {
+        "publish": {"families": ["render"]}
+    }
+
+
+def test_project_settings_cached_for_revision(monkeypatch):
+    state = {"revision": 1, "resolved": 0}
+
+    def _resolve_project_settings(
+        project_name, clear_metadata, exclude_locals
+    ):
+        state["resolved"] += 1
+        return {"project": project_name, "families": ["render"]}
+
+    monkeypatch.setattr(
+        lib, "_RESOLVED_SETTINGS_CACHE", ResolvedSettingsCache()
+    )
+    monkeypatch.setattr(
+        lib, "get_settings_revision", lambda: state["revision"]
+    )
+    monkeypatch.setattr(lib, "_get_local_site_id", lambda: "site")
+    monkeypatch.setattr(
+        lib, "_resolve_project_settings", _resolve_project_settings
+    )
+
+    settings = lib._get_project_settings("project")
+    settings["families"].append("review")
+    assert lib._get_project_settings("project")["families"] == ["render"]
+    assert lib._get_project_settings(
+        "project", read_only=True
+    ) is lib._get_project_settings("project", read_only=True)
+    assert state["resolved"] == 1
+
+    lib._get_project_settings("other_project")
+    lib._get_project_settings("project", exclude_locals=True)
+    assert state["resolved"] == 3
+
+    # Saved settings outdate cached settings
+    state["revision"] += 1
+    lib._get_project_settings("project")
+    assert state["resolved"] == 4
+    assert lib.get_settings_cache_stats() == {
+        "hits": 3, "misses": 4, "items": 3
+    }
+
+
+def test_cache_values_outdated_by_revision():
+    cache = CacheValues()
+    assert cache.is_outdated(1)
+
+    cache.update_from_document({"data": {"key": "value"}}, "3.0.0", 1)
+    assert not cache.is_outdated(1)
+    assert cache.is_outdated(2)
+
+    cache.set_outdated()
+    assert cache.is_outdated(1)
+
+    cache = CacheValues(cache_lifetime=10)
+    cache.update_data({}, "3.0.0", 1)
+    assert not cache.is_outdated(1)
+    cache.creation_time -= datetime.timedelta(seconds=11)
+    assert cache.is_outdated(1)
+
+
+class _Collection(object):
+    name = "settings"
+
+    class database(object):
+        name = "openpype"
+
+    def __init__(self):
+        self.revision = 1
+        self.queries = 0
+
+    def find_one(self, query_filter, projection):
+        self.queries += 1
+        return {"revision": self.revision}
+
+    def update_one(self, query_filter, update, upsert):
+        self.revision += 1
+
+
+def test_settings_revision_reused(monkeypatch):
+    state = {"time": 100.0}
+    monkeypatch.setattr(handlers, "_SETTINGS_REVISIONS", {})
+    monkeypatch.setattr(handlers.time, "time", lambda: state["time"])
+    collection = _Collection()
+
+    assert handlers.get_settings_revision(collection) == 1
+    assert handlers.get_settings_revision(collection) == 1
+    assert collection.queries == 1
+
+    # Saved by other process, used after lifetime
+    collection.revision = 2
+    assert handlers.get_settings_revision(collection) == 1
+    state["time"] += handlers.SETTINGS_REVISION_LIFETIME
+    assert handlers.get_settings_revision(collection) == 2
+    assert collection.queries == 2
+
+    # Saved by this process, used immediately
+    handlers.increase_settings_revision(collection)
+    assert handlers.get_settings_revision(collection) == 3
+    assert handlers.get_settings_revision(collection, use_cache=False) == 3
+    assert collection.queries == 4
@@ -0,0 +1,173 @@
+import threading
+import collections
+
+import pyblish.api
+
+from openpype.tools.publisher import control
+
+
+class _Controller(control.PublisherController):
+    """Controller without host and create context."""
+
+    def __init__(self, plugins, max_workers):
+        control.BasePublisherController.__init__(self)
+        self.publish_max_workers = max_workers
+        self._threaded_process = None
+        self._plugins = plugins
+        self._publish_report = control.PublishReportMaker(self)
+        self._publish_validation_errors = control.PublishValidationErrors()
+        self._publish_up_validation = False
+        self._validation_order = (
+            pyblish.api.ValidatorOrder + control.PLUGIN_ORDER_OFFSET
+        )
+        self._main_thread_iter = self._publish_iterator()
+        self._publish_context = pyblish.api.Context()
+        for idx in range(6):
+            instance = self._publish_context.create_instance(
+                "plate{}".format(idx)
+            )
+            instance.data["family"] = "plate"
+        self.events = []
+
+    @property
+    def _publish_plugins(self):
+        return self._plugins
+
+    def _emit_event(self, topic, data=None):
+        self.events.append((topic, data))
+
+
+class _QueuedController(_Controller):
+    """Controller processing main thread items from queue like Qt UI."""
+
+    threaded_poll_interval = 0.01
+
+    def __init__(self, *args, **kwargs):
+        super(_QueuedController, self).__init__(*args, **kwargs)
+        self.items = collections.deque()
+
+    def _process_main_thread_item(self, item):
+        self.items.append(item)
+
+
+RELEASE_EVENT = threading.Event()
+
+
+class ExtractA(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    families = ["plate"]
+    thread_safe = True
+
+    def process(self, instance):
+        self.log.info("A {}".format(instance.name))
+
+
+class ExtractB(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder + 0.1
+    families = ["plate"]
+    thread_safe = True
+
+    def process(self, instance):
+        self.log.info("B {}".format(instance.name))
+        if instance.name == "plate3":
+            raise ValueError("Failed")
+
+
+class ExtractSkipped(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder + 0.2
+    families = ["render"]
+    thread_safe = True
+
+    def process(self, instance):
+        pass
+
+
+class ExtractWait(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder + 0.1
+    families = ["plate"]
+    thread_safe = True
+
+    def process(self, instance):
+        RELEASE_EVENT.wait(10)
+
+
+class Integrate(pyblish.api.InstancePlugin):
+    order = pyblish.api.IntegratorOrder
+    families = ["plate"]
+
+    def process(self, instance):
+        self.log.info("Integrate {}".format(instance.name))
+
+
+def _publish(plugins, max_workers):
+    controller = _Controller(plugins, max_workers)
+    controller._publish_next_process()
+    plugins_data = controller._publish_report._plugin_data_by_id.values()
+    report = [
+        (
+            plugin_data["name"],
+            plugin_data["skipped"],
+            [
+                [log_item["msg"] for log_item in instance_data["logs"]]
+                for instance_data in plugin_data["instances_data"]
+            ]
+        )
+        for plugin_data in plugins_data
+    ]
+    results = [
+        (result["plugin"].__name__, result["instance"].name)
+        for result in controller._publish_context.data["results"]
+    ]
+    return controller, report, results
+
+
+def test_threaded_publish_matches_sequential():
+    plugins = [ExtractA, ExtractSkipped, Integrate]
+    controller, report, results = _publish(plugins, 1)
+    t_controller, t_report, t_results = _publish(plugins, 4)
+
+    assert t_report == report
+    assert t_results == results
+    assert t_controller.events == controller.events
+    assert t_controller.publish_has_finished
+
+
+def test_threaded_publish_crash_matches_sequential():
+    plugins = [ExtractA, ExtractB, Integrate]
+    controller, report, results = _publish(plugins, 1)
+    t_controller, t_report, t_results = _publish(plugins, 4)
+
+    assert controller.publish_has_crashed
+    assert t_controller.publish_has_crashed
+    assert t_report == report
+    assert t_results == results
+    assert results[-1] == ("ExtractB", "plate3")
+
+
+def test_threaded_publish_does_not_block():
+    RELEASE_EVENT.clear()
+    plugins = [ExtractA, ExtractWait, Integrate]
+    controller = _QueuedController(plugins, 6)
+    controller._publish_next_process()
+
+    # Results are reported meanwhile plugins are processed in threads
+    results = []
+    for _ in range(1000):
+        controller.items.popleft().process()
+        results = controller._publish_context.data.get("results") or []
+        if len(results) == 6:
+            break
+    assert [result["plugin"] for result in results] == [ExtractA] * 6
+    assert controller.items
+    assert not controller.publish_has_finished
+
+    RELEASE_EVENT.set()
+    while controller.items:
+        controller.items.popleft().process()
+
+    _, _, expected_results = _publish(plugins, 1)
+    assert controller.publish_has_finished
+    assert [
+        (result["plugin"].__name__, result["instance"].name)
+        for result in controller._publish_context.data["results"]
+    ] == expected_results